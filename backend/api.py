@@ -7,19 +7,37 @@ import os
 import sys
 import json
 import traceback
+import time
 import subprocess
 import tempfile
+import threading
 from flask import Blueprint, request, jsonify
 from datetime import datetime
 
+from services import metrics
+
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# 동시에 실행하는 셀 프로세스 수 제한 (초과 요청은 대기, 대기 시간은 실행 기록에 남김)
+_max_executions = int(os.getenv('MAX_CONCURRENT_EXECUTIONS', os.cpu_count() or 4))
+_execution_slots = threading.BoundedSemaphore(_max_executions)
+metrics.EXECUTION_SLOTS.set(_max_executions)
+
+# 세션별 설정 (셀이 바꾼 성능 모드/연산 백엔드, 다음 셀 프로세스에 환경 변수로 전달)
+# 브라우저는 응답으로 받은 설정을 다음 요청에 다시 보내므로 워커가 바뀌어도 유지됨 (이 사전은 설정을 보내지 않는 클라이언트용)
+_session_settings = {}
+_SETTING_ENV = {
+    'compute_backend': 'JUPPELIN_COMPUTE_BACKEND',
+    'performance_mode': 'JUPPELIN_PERFORMANCE_MODE',
+}
+
 @api_bp.route('/execute', methods=['POST'])
 def execute_code():
     """코드 실행 API"""
     try:
         data = request.get_json()
         cell_id = data.get('cell_id')
+        session_id = data.get('session_id')
         code = data.get('code', '').strip()
         cell_type = data.get('cell_type', 'code')
         
@@ -35,15 +53,60 @@ def execute_code():
                 'error_message': '코드 셀만 실행할 수 있습니다.'
             })
         
-        # 현재는 간단한 Python 코드 실행 (임시)
-        result = execute_python_code(code)
+        from services.execution_history import get_execution_history
+        history = get_execution_history()
+        # 클라이언트가 화면에 표시한 번호를 우선 (서버 재시작/멀티 워커에서도 셀 번호와 기록이 일치)
+        execution_count = data.get('execution_count')
+        if not isinstance(execution_count, int) or isinstance(execution_count, bool) or execution_count < 1:
+            execution_count = history.next_execution_count(session_id)
+        settings = data.get('settings')
+        if not isinstance(settings, dict):
+            settings = _session_settings.get(session_id)
+        
+        queued_at = time.perf_counter()
+        metrics.EXECUTIONS_WAITING.inc()
+        with _execution_slots:
+            queue_wait = time.perf_counter() - queued_at
+            metrics.EXECUTIONS_WAITING.dec()
+            metrics.EXECUTIONS_IN_PROGRESS.inc()
+            try:
+                result = execute_python_code(code, settings)
+            finally:
+                metrics.EXECUTIONS_IN_PROGRESS.dec()
+        
+        # 기록은 큐에 넣기만 하고 백그라운드 스레드가 묶어서 저장
+        stats = result.get('stats', {})
+        metrics.EXECUTIONS.labels(result['status']).inc()
+        metrics.EXECUTION_QUEUE_WAIT.observe(queue_wait)
+        if stats.get('execution_time') is not None:
+            metrics.EXECUTION_LATENCY.observe(stats['execution_time'])
+        metrics.registry.merge(stats.get('metrics'))
+        # 해당 모듈을 쓰지 않은 셀은 그 설정을 보고하지 않으므로 덮어쓰지 않고 합침
+        settings = {**(settings or {}), **(stats.get('settings') or {})}
+        if session_id and settings:
+            _session_settings[session_id] = settings
+        history.record(
+            session_id=session_id,
+            cell_id=cell_id,
+            code=code,
+            status=result['status'],
+            execution_count=execution_count,
+            execution_time=stats.get('execution_time'),
+            exec_time=stats.get('exec_time'),
+            cpu_time=stats.get('cpu_time'),
+            peak_rss=stats.get('peak_rss'),
+            output_bytes=stats.get('output_bytes'),
+            queue_wait=queue_wait,
+            functions=stats.get('functions')
+        )
         
         return jsonify({
             'cell_id': cell_id,
-            'execution_count': 1,
+            'execution_count': execution_count,
             'status': result['status'],
             'outputs': result.get('outputs', []),
-            'error_message': result.get('error_message')
+            'error_message': result.get('error_message'),
+            'settings': settings
         })
         
     except Exception as e:
@@ -52,8 +115,8 @@ def execute_code():
             'error_message': f'API 오류: {str(e)}'
         }), 500
 
-def execute_python_code(code):
-    """Python 코드 실행 (임시 구현)"""
+def execute_python_code(code, settings=None):
+    """Python 코드 실행 (settings: 세션 설정, 셀 프로세스 환경 변수로 전달)"""
     try:
         backend_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(backend_dir)
@@ -63,6 +126,10 @@ def execute_python_code(code):
         exec_script = os.path.join(backend_dir, 'execute_with_result.py')
         env = os.environ.copy()
         env['PYTHONPATH'] = shared_dir + os.pathsep + backend_dir + os.pathsep + project_root
+        for key, value in (settings or {}).items():
+            if key in _SETTING_ENV and value is not None:
+                env[_SETTING_ENV[key]] = ('1' if value else '0') if isinstance(value, bool) else str(value)
+        started = time.perf_counter()
         result = subprocess.run(
             [str(venv_python), exec_script, code],
             capture_output=True,
@@ -72,20 +139,29 @@ def execute_python_code(code):
             timeout=30,
             env=env
         )
+        execution_time = time.perf_counter() - started
         outputs = []
+        # 실행 지표 추출 (출력에서 제거)
+        stats, stdout = _extract_marked(result.stdout or '', '__EXEC_STATS_START__', '__EXEC_STATS_END__')
+        stats = stats or {}
+        stats['execution_time'] = execution_time
+        stats['output_bytes'] = len(stdout.encode('utf-8', errors='replace')) + len((result.stderr or '').encode('utf-8', errors='replace'))
+        # %%prun/%%timeit/%%flame 프로파일 결과 추출
+        profile, stdout = _extract_marked(stdout, '__PROFILE_JSON_START__', '__PROFILE_JSON_END__')
         # DataFrame JSON 결과 추출
         df_json = None
-        if result.stdout:
-            out = result.stdout
+        if stdout:
+            out = stdout
             if '__DF_JSON_START__' in out and '__DF_JSON_END__' in out:
                 start = out.index('__DF_JSON_START__') + len('__DF_JSON_START__')
                 end = out.index('__DF_JSON_END__')
+                metrics.record_payload('dataframe', len(out[start:end].encode('utf-8', errors='replace')))
                 try:
                     df_json = json.loads(out[start:end])
                 except Exception:
                     df_json = None
                 # 표준 출력에서 DataFrame JSON 부분 제거
-                out = out.replace(result.stdout[start-len('__DF_JSON_START__'):end+len('__DF_JSON_END__')], '')
+                out = out.replace(stdout[start-len('__DF_JSON_START__'):end+len('__DF_JSON_END__')], '')
             if out.strip():
                 outputs.append({
                     'output_type': 'stream',
@@ -103,22 +179,31 @@ def execute_python_code(code):
                 'output_type': 'dataframe',
                 'data': df_json
             })
+        if profile:
+            metrics.record_payload('profile', len(json.dumps(profile)))
+            outputs.append({
+                'output_type': 'profile',
+                'data': profile
+            })
         if result.returncode == 0:
             return {
                 'status': 'success',
-                'outputs': outputs
+                'outputs': outputs,
+                'stats': stats
             }
         else:
             return {
                 'status': 'error',
                 'error_message': result.stderr or '실행 중 오류가 발생했습니다.',
-                'outputs': outputs
+                'outputs': outputs,
+                'stats': stats
             }
     except subprocess.TimeoutExpired:
         return {
             'status': 'error',
             'error_message': '코드 실행 시간이 초과되었습니다 (30초 제한).',
-            'outputs': []
+            'outputs': [],
+            'stats': {'execution_time': time.perf_counter() - started}
         }
     except Exception as e:
         return {
@@ -127,6 +212,18 @@ def execute_python_code(code):
             'outputs': []
         }
 
+def _extract_marked(text, start_marker, end_marker):
+    """출력에서 마커로 감싼 JSON을 분리 (JSON 또는 None, 마커를 제거한 출력) 반환"""
+    start = text.rfind(start_marker)
+    end = text.rfind(end_marker)
+    if start == -1 or end < start:
+        return None, text
+    try:
+        payload = json.loads(text[start + len(start_marker):end])
+    except Exception:
+        payload = None
+    return payload, text[:start] + text[end + len(end_marker):]
+
 def get_venv_python():
     """가상환경의 Python 실행 파일 경로 반환"""
     if os.name == 'nt':  # Windows
@@ -138,17 +235,12 @@ def get_venv_python():
 def get_storage_usage():
     """로컬 저장소 사용량 조회"""
     try:
-        total_size = 0
-        local_data_path = 'local_data'
-        
-        if os.path.exists(local_data_path):
-            for dirpath, dirnames, filenames in os.walk(local_data_path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except OSError:
-                        pass
+        from services.data_catalog import get_catalog
+        
+        # 파일 시스템 순회 대신 카탈로그 합계 사용
+        catalog = get_catalog('local_data')
+        storage = catalog.storage_usage()
+        total_size = storage['bytes']
         
         # 크기를 읽기 쉬운 형태로 변환
         if total_size < 1024:
@@ -162,7 +254,12 @@ def get_storage_usage():
         
         return jsonify({
             'usage': usage,
-            'bytes': total_size
+            'bytes': total_size,
+            'files': storage['files'],
+            'directories': storage['directories'],
+            'symbols': storage['symbols'],
+            'file_types': storage['file_types'],
+            'quota': catalog.quota.status() if catalog.quota is not None else None
         })
         
     except Exception as e:
@@ -179,7 +276,8 @@ def list_data_files():
         data_service = DataCollectionService()
         
         directory = request.args.get('directory', 'raw_data')
-        file_info = data_service.list_local_files(directory)
+        limit = request.args.get('limit', type=int)
+        file_info = data_service.list_local_files(directory, limit=limit)
         
         return jsonify(file_info)
         
@@ -191,6 +289,56 @@ def list_data_files():
             'files': []
         }), 500
 
+@api_bp.route('/data/coverage', methods=['GET'])
+def get_data_coverage():
+    """심볼/간격별 로컬 데이터 보유 기간 조회"""
+    try:
+        from services.data_catalog import get_catalog
+        
+        coverage = get_catalog('local_data').coverage(
+            symbol=request.args.get('symbol'),
+            interval=request.args.get('interval')
+        )
+        return jsonify({'series': coverage})
+        
+    except Exception as e:
+        return jsonify({'error': str(e), 'series': []}), 500
+
+@api_bp.route('/execution/stats', methods=['GET'])
+def get_execution_stats():
+    """실행 지표 p50/p95 조회 (group: session, function, cell)"""
+    try:
+        from services.execution_history import get_execution_history
+        
+        stats = get_execution_history().stats(
+            group=request.args.get('group', 'session'),
+            session_id=request.args.get('session_id'),
+            since=request.args.get('since'),
+            hours=request.args.get('hours', type=float),
+            limit=request.args.get('limit', 50, type=int)
+        )
+        return jsonify({'group': request.args.get('group', 'session'), 'stats': stats})
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api_bp.route('/execution/history', methods=['GET'])
+def get_execution_records():
+    """최근 실행 기록 조회"""
+    try:
+        from services.execution_history import get_execution_history
+        
+        records = get_execution_history().history(
+            session_id=request.args.get('session_id'),
+            limit=request.args.get('limit', 100, type=int)
+        )
+        return jsonify({'history': records})
+        
+    except Exception as e:
+        return jsonify({'error': str(e), 'history': []}), 500
+
 @api_bp.route('/data/collect', methods=['POST'])
 def collect_data():
     """데이터 수집 API"""
@@ -231,15 +379,21 @@ def collect_data():
 
 @api_bp.route('/symbols', methods=['GET'])
 def get_symbols():
-    """사용 가능한 심볼 목록 조회"""
+    """사용 가능한 심볼 목록 조회 (limit=0이면 전체, offset/quote로 페이지/견적 자산 필터)"""
     try:
-        from services.binance_client import BinanceClient
-        client = BinanceClient()
+        from services.screener import get_screener
         
-        symbols = client.get_available_symbols()
+        limit = request.args.get('limit', 100, type=int)
+        offset = request.args.get('offset', 0, type=int)
+        quote = request.args.get('quote')
+        
+        # 거래소 정보는 스크리너 캐시(SYMBOLS_TTL) 재사용
+        symbols = get_screener().trading_symbols(quote)
         
         # 인기 심볼들을 앞쪽에 배치
         popular_symbols = ['BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'ADAUSDT', 'XRPUSDT', 'DOTUSDT', 'LINKUSDT', 'LTCUSDT']
+        listed = set(symbols)
+        popular_symbols = [s for s in popular_symbols if s in listed]
         other_symbols = [s for s in symbols if s not in popular_symbols]
         
         ordered_symbols = popular_symbols + other_symbols
@@ -247,7 +401,8 @@ def get_symbols():
         return jsonify({
             'total': len(symbols),
             'popular': popular_symbols,
-            'symbols': ordered_symbols[:100]  # 처음 100개만 반환
+            'offset': offset,
+            'symbols': ordered_symbols[offset:offset + limit] if limit > 0 else ordered_symbols[offset:]
         })
         
     except Exception as e:
@@ -255,3 +410,277 @@ def get_symbols():
             'error': str(e),
             'symbols': ['BTCUSDT', 'ETHUSDT', 'BNBUSDT']  # 기본값
         }), 500
+
+@api_bp.route('/screener/scan', methods=['POST'])
+def screener_scan():
+    """
+    전체 심볼 스크리너 실행
+    
+    묶음마다 지금까지의 순위를 SocketIO screener_update 이벤트로 보내고, 응답은 최종 순위입니다.
+    """
+    try:
+        from flask import current_app
+        from services.screener import get_screener
+        
+        data = request.get_json() or {}
+        scan_id = data.get('scan_id') or f"scan-{int(time.time() * 1000)}"
+        socketio = current_app.socketio
+        
+        def records(ranked):
+            return json.loads(ranked.reset_index().to_json(orient='records', date_format='iso'))
+        
+        def emit_partial(ranked, done, total):
+            payload = {'scan_id': scan_id, 'done': done, 'total': total, 'results': records(ranked)}
+            metrics.record_payload('screener_update', len(json.dumps(payload)))
+            socketio.emit('screener_update', payload)
+        
+        started = time.perf_counter()
+        ranked = get_screener().scan(
+            expression=data.get('expression'),
+            interval=data.get('interval', '1h'),
+            rank_by=data.get('rank_by'),
+            ascending=bool(data.get('ascending', False)),
+            limit=data.get('limit', 50),
+            quote=data.get('quote'),
+            symbols=data.get('symbols'),
+            refresh=bool(data.get('refresh', True)),
+            on_batch=emit_partial
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'scan_id': scan_id,
+            'elapsed': round(time.perf_counter() - started, 3),
+            'results': records(ranked)
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'status': 'error',
+            'error_message': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error_message': str(e)
+        }), 500
+
+# 차트 세션 (출력별 피겨 상태, 갱신은 SocketIO chart_figure/chart_delta로 전송)
+_chart_sessions = None
+
+def get_chart_sessions():
+    """차트 세션 관리자 반환 (첫 사용 시 생성)"""
+    global _chart_sessions
+    if _chart_sessions is None:
+        from flask import current_app
+        from services.chart_session import ChartSessionManager
+        from services.visualization import VisualizationService
+
+        socketio = current_app.socketio
+
+        def emit_chart(event, message):
+            metrics.record_payload(event, len(json.dumps(message)))
+            socketio.emit(event, message)
+
+        _chart_sessions = ChartSessionManager(
+            emit=emit_chart,
+            candle_points=VisualizationService().candle_points,
+            max_sessions=int(os.getenv('MAX_CHART_SESSIONS', 64))
+        )
+    return _chart_sessions
+
+# 실시간 시세 스트림 (서버 프로세스당 하나의 수집 서비스)
+_market_stream = None
+
+def _stream_chart(sessions, stream, payload):
+    """kline 갱신을 스트림 차트 세션에 반영 (첫 갱신에 버퍼로 피겨를 만들고 이후에는 델타만)"""
+    from services.visualization import VisualizationService
+
+    chart_id = f"stream:{payload['symbol']}:{payload['interval']}"
+    if sessions.get(chart_id) is None:
+        candles = stream.get_candles(payload['symbol'], payload['interval'], include_current=True)
+        figure = VisualizationService().create_candlestick_chart(candles, title=payload['title'])
+        sessions.open(chart_id, figure, max_points=stream.buffer_size)
+        return
+    candle = dict(payload['candle'])
+    candles = {'x': [candle.pop('timestamp')], **{column: [value] for column, value in candle.items()}}
+    sessions.apply(chart_id, 'candles', candles=candles)
+
+def _stream_trades(sessions, stream, payload):
+    """체결을 심볼별 체결가 차트 세션에 추가 (같은 시각 체결도 모두 남도록 merge 대신 extend)"""
+    from services.visualization import VisualizationService
+
+    chart_id = f"trades:{payload['symbol']}"
+    if sessions.get(chart_id) is None:
+        trades = stream.get_trades(payload['symbol']).rename(columns={'price': '체결가'})
+        figure = VisualizationService().create_line_chart(trades, ['체결가'], title=payload['title'])
+        sessions.open(chart_id, figure, max_points=stream.buffer_size)
+        return
+    trade = payload['trade']
+    sessions.apply(chart_id, 'extend', points={'체결가': {'x': [trade['timestamp']], 'y': [trade['price']]}})
+
+def get_market_stream():
+    """시세 스트림 서비스 반환 (첫 사용 시 생성, 캔들/체결은 심볼별 차트 세션 델타로 전송)"""
+    global _market_stream
+    if _market_stream is None:
+        from services.market_stream import MarketStreamService
+
+        sessions = get_chart_sessions()
+
+        def emit_chart_update(payload):
+            # 갱신마다 차트를 새로 붙이지 않고 같은 차트에 델타로 반영
+            if payload.get('type') == 'kline':
+                _stream_chart(sessions, _market_stream, payload)
+            elif payload.get('type') == 'trade':
+                _stream_trades(sessions, _market_stream, payload)
+
+        _market_stream = MarketStreamService(on_update=emit_chart_update)
+    return _market_stream
+
+@api_bp.route('/stream/subscribe', methods=['POST'])
+def subscribe_stream():
+    """실시간 시세 스트림 구독"""
+    try:
+        data = request.get_json() or {}
+        symbol = data.get('symbol', 'BTCUSDT')
+        interval = data.get('interval', '1m')
+        trades = bool(data.get('trades', False))
+
+        stream = get_market_stream()
+        streams = stream.subscribe(symbol, interval, trades=trades)
+        stream.start()
+
+        return jsonify({
+            'status': 'success',
+            'message': f'{symbol} {interval} 스트림 구독',
+            'streams': streams
+        })
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error_message': str(e)
+        }), 500
+
+@api_bp.route('/stream/unsubscribe', methods=['POST'])
+def unsubscribe_stream():
+    """실시간 시세 스트림 구독 해제"""
+    try:
+        data = request.get_json() or {}
+        symbol = data.get('symbol', 'BTCUSDT')
+        interval = data.get('interval', '1m')
+        trades = bool(data.get('trades', False))
+
+        streams = get_market_stream().unsubscribe(symbol, interval, trades=trades)
+
+        return jsonify({
+            'status': 'success',
+            'streams': streams
+        })
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error_message': str(e)
+        }), 500
+
+@api_bp.route('/stream/status', methods=['GET'])
+def stream_status():
+    """실시간 시세 스트림 상태 조회"""
+    return jsonify(get_market_stream().status())
+
+@api_bp.route('/stream/candles', methods=['GET'])
+def stream_candles():
+    """실시간 시세 버퍼의 최근 캔들 조회"""
+    try:
+        symbol = request.args.get('symbol', 'BTCUSDT')
+        interval = request.args.get('interval', '1m')
+        limit = request.args.get('limit', type=int)
+        include_current = request.args.get('include_current', 'false').lower() == 'true'
+
+        df = get_market_stream().get_candles(symbol, interval, limit, include_current)
+
+        return jsonify({
+            'symbol': symbol.upper(),
+            'interval': interval,
+            'rows': len(df),
+            'candles': json.loads(df.reset_index().to_json(orient='records', date_format='iso'))
+        })
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error_message': str(e)
+        }), 500
+
+@api_bp.route('/charts', methods=['GET'])
+def list_charts():
+    """열린 차트 세션 목록"""
+    sessions = get_chart_sessions()
+    return jsonify({
+        'charts': [
+            {'chart_id': chart_id, 'version': sessions.get(chart_id).version}
+            for chart_id in sessions.ids() if sessions.get(chart_id) is not None
+        ]
+    })
+
+@api_bp.route('/charts/<path:chart_id>', methods=['GET'])
+def get_chart(chart_id):
+    """차트 세션의 현재 피겨 (재동기화용)"""
+    snapshot = get_chart_sessions().snapshot(chart_id)
+    if snapshot is None:
+        return jsonify({'status': 'error', 'error_message': f'열린 차트가 없습니다: {chart_id}'}), 404
+    return jsonify(snapshot)
+
+@api_bp.route('/charts/<path:chart_id>', methods=['POST'])
+def open_chart(chart_id):
+    """차트 세션 열기/피겨 교체 (chart_figure 전송)"""
+    try:
+        data = request.get_json() or {}
+        if 'figure' not in data:
+            return jsonify({'status': 'error', 'error_message': 'figure가 필요합니다'}), 400
+
+        message = get_chart_sessions().open(chart_id, data['figure'], data.get('max_points'))
+
+        return jsonify({'status': 'success', 'chart_id': chart_id, 'version': message['version']})
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error_message': str(e)
+        }), 500
+
+@api_bp.route('/charts/<path:chart_id>/delta', methods=['POST'])
+def chart_delta(chart_id):
+    """
+    차트 델타 적용 (chart_delta 전송)
+
+    본문: {"op": "merge" | "candles" | "extend" | "replace_last" | "truncate" | "restyle" | "relayout"
+           | "add_traces" | "overlay" | "delete_traces", ...인자}
+    """
+    try:
+        data = dict(request.get_json() or {})
+        op = data.pop('op', None)
+        deltas = get_chart_sessions().apply(chart_id, op, **data)
+
+        return jsonify({
+            'status': 'success',
+            'chart_id': chart_id,
+            'version': deltas[-1]['version'] if deltas else None,
+            'deltas': len(deltas)
+        })
+
+    except KeyError as e:
+        return jsonify({'status': 'error', 'error_message': str(e.args[0])}), 404
+    except (ValueError, TypeError) as e:
+        return jsonify({'status': 'error', 'error_message': str(e)}), 400
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error_message': str(e)
+        }), 500
+
+@api_bp.route('/charts/<path:chart_id>', methods=['DELETE'])
+def close_chart(chart_id):
+    """차트 세션 닫기 (chart_closed 전송)"""
+    return jsonify({'status': 'success', 'closed': get_chart_sessions().close(chart_id)})
@@ -4,8 +4,11 @@ Juppelin Main Application
 """
 
 import os
+import atexit
 import logging
-from flask import Flask, request, jsonify, render_template
+import logging.handlers
+from queue import Queue
+from flask import Flask, Response, request, jsonify, render_template
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 from dotenv import load_dotenv
@@ -25,7 +28,15 @@ def create_app():
     CORS(app)
     
     # SocketIO 설정 (실시간 통신)
-    socketio = SocketIO(app, cors_allowed_origins="*")
+    # 프로덕션 멀티 워커에서는 메시지 큐(예: redis://)로 워커 간 이벤트를 전달하고 웹소켓 전송만 허용
+    transports = [t.strip() for t in os.getenv('SOCKETIO_TRANSPORTS', 'polling,websocket').split(',') if t.strip()]
+    socketio = SocketIO(
+        app,
+        cors_allowed_origins="*",
+        async_mode=os.getenv('SOCKETIO_ASYNC_MODE') or None,
+        message_queue=os.getenv('SOCKETIO_MESSAGE_QUEUE') or None,
+        transports=transports
+    )
     
     # 로깅 설정
     setup_logging()
@@ -41,7 +52,7 @@ def create_app():
     @app.route('/')
     def index():
         """메인 페이지"""
-        return render_template('index.html')
+        return render_template('index.html', socket_transports=transports)
     
     @app.route('/api/health')
     def health_check():
@@ -52,6 +63,12 @@ def create_app():
             'version': '1.0.0'
         })
     
+    @app.route('/metrics')
+    def metrics():
+        """Prometheus 지표 (바이낸스 요청, 셀 실행, 캐시, 전송량, 저장소)"""
+        from services.metrics import registry, CONTENT_TYPE
+        return Response(registry.render(), content_type=CONTENT_TYPE)
+    
     @app.route('/api/config')
     def get_config():
         """클라이언트 설정 정보 반환"""
@@ -76,6 +93,21 @@ def create_app():
     def on_connect():
         logging.info('Client connected')
         emit('status', {'message': 'Connected to Juppelin server'})
+        # 새로 연결한 클라이언트는 열린 차트를 전체 피겨로 받고 이후 델타만 받음
+        from api import get_chart_sessions
+        sessions = get_chart_sessions()
+        for chart_id in sessions.ids():
+            snapshot = sessions.snapshot(chart_id)
+            if snapshot is not None:
+                emit('chart_figure', snapshot)
+    
+    @socketio.on('chart_resync')
+    def on_chart_resync(data):
+        """클라이언트가 델타 버전을 놓쳤을 때 전체 피겨 재전송 (요청한 클라이언트에만)"""
+        from api import get_chart_sessions
+        snapshot = get_chart_sessions().snapshot((data or {}).get('chart_id', ''))
+        if snapshot is not None:
+            emit('chart_figure', snapshot)
     
     @socketio.on('disconnect')
     def on_disconnect():
@@ -92,14 +124,26 @@ def setup_logging():
     # 로그 디렉토리 생성
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
     
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    root_logger = logging.getLogger()
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root_logger.handlers):
+        return  # 이미 설정됨 (앱 팩토리 재호출)
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(log_file, encoding='utf-8'),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # 요청 처리 스레드는 큐에 레코드만 넣고, 파일/콘솔 I/O는 리스너 스레드가 처리 (논블로킹)
+    log_queue = Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(getattr(logging, log_level))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
     
     # Flask 로그 레벨 조정
     logging.getLogger('werkzeug').setLevel(logging.WARNING)
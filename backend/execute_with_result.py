@@ -1,10 +1,18 @@
 import sys
 import os
 import json
+import time
+import atexit
+import functools
 import traceback
 import pandas as pd
 from io import StringIO
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # shared 폴더의 user_functions 경로 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
 shared_dir = os.path.join(current_dir, '..', 'shared')
@@ -13,15 +21,68 @@ sys.path.insert(0, shared_dir)
 global_ns = {}
 local_ns = {}
 
+# 사용자 함수별 호출 수/누적 시간 (실행 기록의 함수별 p50/p95 집계용)
+function_stats = {}
+
+def timed_function(name, func):
+    """사용자 함수 호출 시간을 function_stats에 누적하는 래퍼"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats = function_stats.setdefault(name, {'calls': 0, 'wall_time': 0.0})
+            stats['calls'] += 1
+            stats['wall_time'] += time.perf_counter() - started
+    return wrapper
+
+def emit_execution_stats(started):
+    """실행 지표를 표준 출력 마커로 전달 (api.py가 출력에서 분리해 기록)"""
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu_time = usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime
+        # ru_maxrss 단위: Linux KB, macOS bytes
+        scale = 1 if sys.platform == 'darwin' else 1024
+        peak_rss = max(usage.ru_maxrss, children.ru_maxrss) * scale
+    else:
+        cpu_time = time.process_time()
+        peak_rss = None
+
+    # 셀 안에서 쌓인 지표 (바이낸스 요청, 캐시 등)는 서버 /metrics에 합산
+    metrics = sys.modules.get('services.metrics')
+    # 셀에서 바꾼 세션 설정 (성능 모드, 연산 백엔드는 쓴 셀만)
+    settings = {}
+    shared_functions = sys.modules.get('user_functions')
+    if shared_functions is not None:
+        settings.update(shared_functions._session_settings())
+    compute_backend = sys.modules.get('services.compute_backend')
+    if compute_backend is not None:
+        settings.update(compute_backend.session_settings())
+
+    sys.stdout.flush()
+    print("__EXEC_STATS_START__" + json.dumps({
+        'exec_time': time.perf_counter() - started,
+        'cpu_time': cpu_time,
+        'peak_rss': peak_rss,
+        'functions': function_stats,
+        'metrics': metrics.registry.export() if metrics else None,
+        'settings': settings or None
+    }) + "__EXEC_STATS_END__")
+
 try:
     from user_functions import *
     
     # 전역 네임스페이스에 모든 user_functions 추가
     import user_functions
+    exported = set(getattr(user_functions, '__all__', ()))
     for name in dir(user_functions):
         if not name.startswith('_'):
             obj = getattr(user_functions, name)
             if callable(obj):
+                if name in exported:
+                    obj = timed_function(name, obj)
                 global_ns[name] = obj
                 local_ns[name] = obj
     
@@ -37,8 +98,6 @@ except Exception as e:
     # Silently fail user functions import
     pass
 
-code = sys.argv[1]
-
 # DataFrame 결과를 잡기 위한 헬퍼
 class DFResultCatcher:
     def __init__(self):
@@ -55,67 +114,64 @@ class DFResultCatcher:
             self.df_result = None
             self.df_type = None
 
-catcher = DFResultCatcher()
-
-# 마지막 줄 결과를 잡기 위한 코드 래핑
-user_code = code.strip()
+def run_cell(user_code, catcher):
+    """셀 코드 실행 (마지막 줄이 DataFrame/Series면 catcher에 저장)"""
+    # DataFrame 할당 감지를 위한 변수
+    last_df_assignment = None
 
-# DataFrame 할당 감지를 위한 변수
-last_df_assignment = None
-
-if '\n' in user_code:
-    lines = user_code.split('\n')
-    last = lines[-1].strip()
+    if '\n' in user_code:
+        lines = user_code.split('\n')
+        last = lines[-1].strip()
     
-    # 전체 코드 실행
-    exec('\n'.join(lines[:-1]), global_ns, local_ns)
+        # 전체 코드 실행
+        exec('\n'.join(lines[:-1]), global_ns, local_ns)
     
-    # 마지막 줄이 변수명만 있는 경우 (예: "data")
-    if last and not ('=' in last or '(' in last or '[' in last):
-        # 단순 변수 출력인 경우에만 DataFrame 체크
-        try:
-            result = eval(last, global_ns, local_ns)
-            if isinstance(result, (pd.DataFrame, pd.Series)):
-                catcher.set(result)
-            else:
-                # DataFrame이 아닌 경우 일반 실행
+        # 마지막 줄이 변수명만 있는 경우 (예: "data")
+        if last and not ('=' in last or '(' in last or '[' in last):
+            # 단순 변수 출력인 경우에만 DataFrame 체크
+            try:
+                result = eval(last, global_ns, local_ns)
+                if isinstance(result, (pd.DataFrame, pd.Series)):
+                    catcher.set(result)
+                else:
+                    # DataFrame이 아닌 경우 일반 실행
+                    exec(last, global_ns, local_ns)
+            except Exception:
+                exec(last, global_ns, local_ns)
+        else:
+            # 복잡한 표현식인 경우 일반 실행
+            try:
+                result = eval(last, global_ns, local_ns)
+                # DataFrame 할당이 아닌 경우에만 출력 체크
+                if '=' not in last:
+                    catcher.set(result)
+            except Exception:
                 exec(last, global_ns, local_ns)
-        except Exception:
-            exec(last, global_ns, local_ns)
     else:
-        # 복잡한 표현식인 경우 일반 실행
-        try:
-            result = eval(last, global_ns, local_ns)
-            # DataFrame 할당이 아닌 경우에만 출력 체크
-            if '=' not in last:
+        # 한 줄 코드인 경우
+        # 할당문인지 확인
+        if '=' in user_code and not ('==' in user_code or '!=' in user_code or '<=' in user_code or '>=' in user_code):
+            # 할당문이면 실행만 하고 DataFrame 추출 안함
+            exec(user_code, global_ns, local_ns)
+        else:
+            # 일반 표현식이면 결과 확인
+            try:
+                result = eval(user_code, global_ns, local_ns)
                 catcher.set(result)
-        except Exception:
-            exec(last, global_ns, local_ns)
-else:
-    # 한 줄 코드인 경우
-    # 할당문인지 확인
-    if '=' in user_code and not ('==' in user_code or '!=' in user_code or '<=' in user_code or '>=' in user_code):
-        # 할당문이면 실행만 하고 DataFrame 추출 안함
-        exec(user_code, global_ns, local_ns)
-    else:
-        # 일반 표현식이면 결과 확인
-        try:
-            result = eval(user_code, global_ns, local_ns)
-            catcher.set(result)
-        except Exception:
+            except Exception:
+                exec(user_code, global_ns, local_ns)
             exec(user_code, global_ns, local_ns)
-        exec(user_code, global_ns, local_ns)
 
-# DataFrame/Series 결과가 있으면 JSON으로 출력
-if catcher.df_type == 'dataframe':
+def dataframe_payload(df):
+    """DataFrame 결과 → 프론트엔드 표 출력용 JSON 직렬화 가능 딕셔너리 (상위 100행)"""
     # DataFrame을 JSON 직렬화 가능하도록 변환
-    df_copy = catcher.df_result.head(100).copy()
-    
+    df_copy = df.head(100).copy()
+
     # 날짜/시간 컬럼을 문자열로 변환
     for col in df_copy.columns:
         if df_copy[col].dtype.name.startswith('datetime') or 'timestamp' in str(df_copy[col].dtype).lower():
             df_copy[col] = df_copy[col].astype(str)
-    
+
     # 인덱스 처리 - 항상 문자열로 변환하고 이름 포함
     index_name = df_copy.index.name or 'Index'
     index_list = []
@@ -124,10 +180,10 @@ if catcher.df_type == 'dataframe':
             index_list.append(str(idx))
         else:
             index_list.append(str(idx))
-    
+
     # to_dict 변환 시 JSON 직렬화 가능한 형태로
     data_dict = df_copy.to_dict(orient='split')
-    
+
     # 데이터 내의 모든 값을 JSON 직렬화 가능하도록 변환
     clean_data = []
     for row in data_dict['data']:
@@ -145,8 +201,8 @@ if catcher.df_type == 'dataframe':
             else:
                 clean_row.append(val)
         clean_data.append(clean_row)
-    
-    print("__DF_JSON_START__" + json.dumps({
+
+    return {
         'type': 'dataframe',
         'columns': list(df_copy.columns),
         'index_name': index_name,
@@ -155,13 +211,14 @@ if catcher.df_type == 'dataframe':
             'index': index_list,
             'data': clean_data
         }
-    }) + "__DF_JSON_END__")
-elif catcher.df_type == 'series':
-    # Series도 동일하게 처리
-    series_copy = catcher.df_result.head(100).copy()
+    }
+
+def series_payload(series):
+    """Series 결과 → JSON 직렬화 가능 딕셔너리 (상위 100개)"""
+    series_copy = series.head(100).copy()
     if series_copy.dtype.name.startswith('datetime') or 'timestamp' in str(series_copy.dtype).lower():
         series_copy = series_copy.astype(str)
-    
+
     # 인덱스 이름 포함
     index_name = series_copy.index.name or 'Index'
     clean_dict = {}
@@ -174,9 +231,35 @@ elif catcher.df_type == 'series':
             clean_dict[str(k)] = v.item()
         else:
             clean_dict[str(k)] = v
-    
-    print("__DF_JSON_START__" + json.dumps({
+
+    return {
         'type': 'series',
         'index_name': index_name,
         'data': clean_dict
-    }) + "__DF_JSON_END__")
+    }
+
+# 멀티프로세스(spawn) 워커가 이 스크립트를 다시 임포트할 때 셀 코드가 재실행되지 않도록 보호
+if __name__ == '__main__':
+    code = sys.argv[1]
+
+    # 예외로 끝나도 지표가 전달되도록 종료 시 출력
+    atexit.register(emit_execution_stats, time.perf_counter())
+
+    catcher = DFResultCatcher()
+
+    # 마지막 줄 결과를 잡기 위한 코드 래핑
+    user_code = code.strip()
+
+    if user_code.startswith('%%'):
+        # 프로파일링 모드 (%%prun, %%timeit, %%flame), 매직이 없으면 프로파일러를 임포트하지 않음
+        from services.cell_profiler import parse_magic, run_profiled
+        mode, options, user_code = parse_magic(user_code)
+        run_profiled(mode, options, lambda: run_cell(user_code, catcher), user_code, global_ns, local_ns)
+    else:
+        run_cell(user_code, catcher)
+
+    # DataFrame/Series 결과가 있으면 JSON으로 출력
+    if catcher.df_type == 'dataframe':
+        print("__DF_JSON_START__" + json.dumps(dataframe_payload(catcher.df_result)) + "__DF_JSON_END__")
+    elif catcher.df_type == 'series':
+        print("__DF_JSON_START__" + json.dumps(series_payload(catcher.df_result)) + "__DF_JSON_END__")
@@ -0,0 +1,133 @@
+"""
+Juppelin Production Server
+eventlet/gevent 워커 기반 프로덕션 서버 진입점
+
+개발 서버(Werkzeug) 대신 비동기 워커 모델로 Flask-SocketIO 앱을 실행합니다.
+- POSIX: gunicorn + eventlet/gevent 워커 (워커 수 설정, 그레이스풀 드레인)
+- Windows: gunicorn을 사용할 수 없으므로 eventlet/gevent 단일 프로세스 서버
+"""
+
+import os
+import sys
+import argparse
+
+# 워커 클래스별 gunicorn 워커 경로 (gevent는 웹소켓 지원 워커 사용)
+WORKER_CLASSES = {
+    'eventlet': 'eventlet',
+    'gevent': 'geventwebsocket.gunicorn.workers.GeventWebSocketWorker'
+}
+
+def get_server_options(argv=None) -> dict:
+    """명령행 인자와 환경 변수에서 프로덕션 서버 옵션 구성"""
+    parser = argparse.ArgumentParser(description='Juppelin 프로덕션 서버')
+    parser.add_argument('--host', default=os.getenv('FLASK_HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('FLASK_PORT', 8888)))
+    parser.add_argument('--workers', type=int, default=int(os.getenv('JUPPELIN_WORKERS', 1)),
+                        help='워커 프로세스 수 (2 이상이면 SOCKETIO_MESSAGE_QUEUE 필요, 차트 세션/실시간 스트림은 1 권장)')
+    parser.add_argument('--worker-class', choices=sorted(WORKER_CLASSES),
+                        default=os.getenv('JUPPELIN_WORKER_CLASS', 'eventlet'))
+    parser.add_argument('--graceful-timeout', type=int,
+                        default=int(os.getenv('JUPPELIN_GRACEFUL_TIMEOUT', 30)),
+                        help='재시작/종료 시 진행 중인 요청을 마무리할 최대 시간(초)')
+    parser.add_argument('--message-queue', default=os.getenv('SOCKETIO_MESSAGE_QUEUE'),
+                        help='워커 간 SocketIO 이벤트 전달용 메시지 큐 URL (예: redis://localhost:6379/0)')
+    args = parser.parse_args(argv)
+
+    return {
+        'host': args.host,
+        'port': args.port,
+        'workers': max(1, args.workers),
+        'worker_class': args.worker_class,
+        'graceful_timeout': args.graceful_timeout,
+        'message_queue': args.message_queue
+    }
+
+def configure_environment(options: dict):
+    """create_app()이 읽는 SocketIO 환경 변수 설정 (워커 로드 전에 호출)"""
+    os.environ['SOCKETIO_ASYNC_MODE'] = options['worker_class']
+    os.environ['FLASK_DEBUG'] = 'False'
+    if options['workers'] > 1:
+        # 폴링 요청은 매번 다른 워커로 갈 수 있어(스티키 세션 없음) 핸드셰이크가 400으로 실패하므로 웹소켓만 허용
+        os.environ['SOCKETIO_TRANSPORTS'] = 'websocket'
+        # 차트 세션과 실시간 스트림은 연 워커의 메모리에만 있음 (다른 워커로 간 델타/재동기화/중지 요청은 찾지 못함)
+        print("⚠️ 워커가 2개 이상이면 차트 세션(open_chart/update_chart)과 실시간 스트림은 요청이 같은 워커로 "
+              "가지 않을 때 404가 되거나 갱신되지 않습니다. 이 기능은 --workers 1로 실행하세요.", file=sys.stderr)
+    if options['message_queue']:
+        os.environ['SOCKETIO_MESSAGE_QUEUE'] = options['message_queue']
+    elif options['workers'] > 1:
+        # 로깅 설정(create_app) 이전이므로 stderr로 직접 출력
+        print("⚠️ 워커가 2개 이상이지만 SOCKETIO_MESSAGE_QUEUE가 설정되지 않았습니다. "
+              "다른 워커에 연결된 클라이언트에는 SocketIO 이벤트가 전달되지 않습니다.", file=sys.stderr)
+
+def run_gunicorn(options: dict):
+    """gunicorn으로 멀티 워커 서버 실행"""
+    from gunicorn.app.base import BaseApplication
+
+    class JuppelinApplication(BaseApplication):
+        """앱 팩토리를 워커마다 로드하는 gunicorn 애플리케이션"""
+
+        def __init__(self, config: dict):
+            self.config = config
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.config.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            # 워커 프로세스에서 몽키 패치 이후에 앱 생성
+            from app import create_app
+            return create_app()
+
+    config = {
+        'bind': f"{options['host']}:{options['port']}",
+        'workers': options['workers'],
+        'worker_class': WORKER_CLASSES[options['worker_class']],
+        # HUP 재시작/TERM 종료 시 기존 워커는 새 연결을 받지 않고 진행 중인 요청을 마무리
+        'graceful_timeout': options['graceful_timeout'],
+        'timeout': 120,
+        'keepalive': 5,
+        'preload_app': False,
+        'accesslog': '-',
+        'errorlog': '-'
+    }
+    JuppelinApplication(config).run()
+
+def run_standalone(options: dict):
+    """gunicorn을 사용할 수 없는 환경(Windows)에서 단일 프로세스 비동기 서버 실행"""
+    if options['worker_class'] == 'eventlet':
+        import eventlet
+        eventlet.monkey_patch()
+    else:
+        from gevent import monkey
+        monkey.patch_all()
+
+    if options['workers'] > 1:
+        print("⚠️ 이 플랫폼에서는 멀티 워커를 지원하지 않아 단일 프로세스로 실행합니다.", file=sys.stderr)
+
+    from app import create_app
+    app = create_app()
+    app.socketio.run(app, host=options['host'], port=options['port'])
+
+def main(argv=None) -> int:
+    """프로덕션 서버 실행"""
+    # app 모듈 임포트를 위해 backend 디렉토리를 경로에 추가
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+
+    options = get_server_options(argv)
+    configure_environment(options)
+
+    print(f"Starting Juppelin production server on {options['host']}:{options['port']} "
+          f"({options['worker_class']} x {options['workers']})")
+
+    if os.name == 'nt':
+        run_standalone(options)
+    else:
+        run_gunicorn(options)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""
+Archive Import Service
+바이낸스 공개 데이터 아카이브(data.binance.vision) kline zip CSV 일괄 임포트 서비스
+"""
+
+import os
+import re
+import hashlib
+import zipfile
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union, Iterable
+import logging
+
+from .resampling import INTERVAL_MS
+
+logger = logging.getLogger(__name__)
+
+# 아카이브 kline CSV 컬럼 (get_klines 응답과 같은 순서)
+KLINE_COLUMNS = [
+    'open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time',
+    'quote_asset_volume', 'number_of_trades', 'taker_buy_base_asset_volume',
+    'taker_buy_quote_asset_volume', 'ignore'
+]
+
+# 고정 dtype (추론 없이 C 파서가 바로 변환)
+KLINE_DTYPES = {
+    'open_time': np.int64,
+    'open': np.float64,
+    'high': np.float64,
+    'low': np.float64,
+    'close': np.float64,
+    'volume': np.float64
+}
+
+# 예: BTCUSDT-1m-2024-01.zip (월별), BTCUSDT-1m-2024-01-15.zip (일별)
+ARCHIVE_PATTERN = re.compile(r'^(?P<symbol>[A-Z0-9]+)-(?P<interval>\d+[smhdwM])-(?P<period>\d{4}-\d{2}(?:-\d{2})?)\.zip$')
+
+def parse_archive_name(path: Union[str, Path]) -> Optional[Dict[str, str]]:
+    """아카이브 파일명에서 심볼/간격/기간 추출 (형식이 다르면 None)"""
+    match = ARCHIVE_PATTERN.match(Path(path).name)
+    return match.groupdict() if match else None
+
+def verify_checksum(path: Union[str, Path]) -> Optional[bool]:
+    """같은 위치의 .CHECKSUM(sha256) 파일로 무결성 확인 (체크섬 파일이 없으면 None)"""
+    checksum_path = Path(f"{path}.CHECKSUM")
+    if not checksum_path.exists():
+        return None
+
+    expected = checksum_path.read_text().split()[0].lower()
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest() == expected
+
+def decode_archive(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    kline 아카이브 zip 하나를 OHLCV DataFrame으로 디코딩 (프로세스 풀 작업 단위)
+
+    Returns:
+        timestamp 인덱스, open/high/low/close/volume 컬럼의 DataFrame
+    """
+    with zipfile.ZipFile(path) as archive:
+        member = archive.namelist()[0]
+        with archive.open(member) as f:
+            # 2022년 이후 일부 아카이브는 헤더 행이 있음
+            has_header = not f.readline()[:1].isdigit()
+        with archive.open(member) as f:
+            df = pd.read_csv(
+                f,
+                header=0 if has_header else None,
+                names=KLINE_COLUMNS,
+                usecols=list(KLINE_DTYPES),
+                dtype=KLINE_DTYPES,
+                engine='c'
+            )
+
+    open_time = df.pop('open_time').to_numpy()
+    # 2025년부터 현물 아카이브 시각은 마이크로초
+    unit = 'us' if len(open_time) and open_time.max() > 10 ** 14 else 'ms'
+    df.index = pd.DatetimeIndex(pd.to_datetime(open_time, unit=unit), name='timestamp')
+    return df
+
+def check_continuity(index: pd.DatetimeIndex, interval: str) -> Dict[str, Any]:
+    """
+    봉 간격 기준 연속성 검사
+
+    Returns:
+        rows, expected_rows, missing_rows, gaps(누락 구간 리스트) 딕셔너리
+    """
+    step_ms = INTERVAL_MS.get(interval)
+    if step_ms is None or len(index) < 2:
+        # 월봉(1M)처럼 간격이 일정하지 않으면 검사 생략
+        return {'rows': len(index), 'expected_rows': len(index), 'missing_rows': 0, 'gaps': []}
+
+    step = pd.Timedelta(milliseconds=step_ms)
+    diffs = index[1:] - index[:-1]
+    gap_positions = np.flatnonzero(diffs != step)
+
+    gaps = []
+    for position in gap_positions:
+        start, end = index[position], index[position + 1]
+        gaps.append({
+            'after': str(start),
+            'before': str(end),
+            'missing': int((end - start) / step) - 1
+        })
+
+    expected = int((index[-1] - index[0]) / step) + 1
+    return {
+        'rows': len(index),
+        'expected_rows': expected,
+        'missing_rows': expected - len(index),
+        'gaps': gaps
+    }
+
+class ArchiveImporter:
+    """바이낸스 kline 아카이브 일괄 임포트 (프로세스 풀 디코딩 → 연속성 검사 → 로컬 저장소 기록)"""
+
+    def __init__(self, max_workers: Optional[int] = None, data_service=None):
+        """
+        Args:
+            max_workers: 디코딩 프로세스 수 (기본값: CPU 코어 수)
+            data_service: 저장에 사용할 DataCollectionService (기본값: 새로 생성)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._data_service = data_service
+
+    @property
+    def data_service(self):
+        if self._data_service is None:
+            from .data_collection import DataCollectionService
+            self._data_service = DataCollectionService()
+        return self._data_service
+
+    @staticmethod
+    def find_archives(source: Union[str, Path, Iterable[Union[str, Path]]]) -> List[Path]:
+        """디렉토리(재귀), 단일 파일 또는 파일 목록에서 kline 아카이브 수집"""
+        if isinstance(source, (str, Path)):
+            source = Path(source)
+            paths = sorted(source.rglob('*.zip')) if source.is_dir() else [source]
+        else:
+            paths = [Path(p) for p in source]
+        return [p for p in paths if parse_archive_name(p)]
+
+    def decode_all(self, paths: List[Path]) -> List[pd.DataFrame]:
+        """아카이브 목록을 병렬 디코딩 (입력 순서 유지)"""
+        workers = min(self.max_workers, len(paths))
+        if workers <= 1:
+            return [decode_archive(p) for p in paths]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(decode_archive, paths))
+
+    def import_archives(
+        self,
+        source: Union[str, Path, Iterable[Union[str, Path]]],
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None,
+        save_file: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        아카이브를 (심볼, 간격)별로 합쳐 로컬 OHLCV 저장소에 기록
+
+        Args:
+            source: 아카이브 디렉토리, 파일 경로 또는 경로 목록
+            symbol: 특정 심볼만 임포트
+            interval: 특정 간격만 임포트
+            save_file: raw_data/binance에 CSV로 저장할지 여부
+
+        Returns:
+            '{심볼}_{간격}' → {data, file_path, archives, duplicates, continuity, checksum_failures}
+        """
+        try:
+            groups: Dict[tuple, List[Path]] = {}
+            for path in self.find_archives(source):
+                info = parse_archive_name(path)
+                if symbol and info['symbol'] != symbol.upper():
+                    continue
+                if interval and info['interval'] != interval:
+                    continue
+                groups.setdefault((info['symbol'], info['interval']), []).append(path)
+
+            if not groups:
+                raise FileNotFoundError(f"임포트할 kline 아카이브가 없습니다: {source}")
+
+            checksum_failures = {}
+            for key, paths in groups.items():
+                paths.sort(key=lambda p: parse_archive_name(p)['period'])
+                failed = [p for p in paths if verify_checksum(p) is False]
+                if failed:
+                    logger.warning(f"체크섬 불일치 아카이브 제외: {', '.join(p.name for p in failed)}")
+                    groups[key] = [p for p in paths if p not in failed]
+                checksum_failures[key] = [p.name for p in failed]
+
+            # 모든 시리즈의 아카이브를 한 프로세스 풀에서 디코딩
+            all_paths = [p for paths in groups.values() for p in paths]
+            logger.info(f"아카이브 디코딩: {len(all_paths)}개 파일, 워커 {min(self.max_workers, len(all_paths))}개")
+            decoded = dict(zip(all_paths, self.decode_all(all_paths)))
+
+            results = {}
+            for (group_symbol, group_interval), paths in sorted(groups.items()):
+                if not paths:
+                    continue
+
+                df = pd.concat([decoded.pop(p) for p in paths])
+                if not df.index.is_monotonic_increasing:
+                    df = df.sort_index(kind='stable')
+                duplicated = df.index.duplicated(keep='last')
+                duplicates = int(duplicated.sum())
+                if duplicates:
+                    df = df[~duplicated].copy()
+
+                continuity = check_continuity(df.index, group_interval)
+                if continuity['gaps']:
+                    logger.warning(
+                        f"{group_symbol} {group_interval} 누락 구간 {len(continuity['gaps'])}개 "
+                        f"({continuity['missing_rows']}개 봉)"
+                    )
+
+                df['symbol'] = group_symbol
+                df['interval'] = group_interval
+
+                file_path = None
+                if save_file:
+                    file_path = str(self.data_service.save_raw_data(df, group_symbol, group_interval))
+
+                results[f"{group_symbol}_{group_interval}"] = {
+                    'data': df,
+                    'file_path': file_path,
+                    'archives': len(paths),
+                    'duplicates': duplicates,
+                    'continuity': continuity,
+                    'checksum_failures': checksum_failures[(group_symbol, group_interval)]
+                }
+
+            logger.info(f"아카이브 임포트 완료: {len(results)}개 시리즈")
+            return results
+
+        except Exception as e:
+            logger.error(f"아카이브 임포트 실패: {e}")
+            raise
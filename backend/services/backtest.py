@@ -0,0 +1,298 @@
+"""
+Backtest Engine
+기술 지표 시그널 기반 벡터화 백테스트 엔진
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Optional
+import logging
+
+from .technical_indicators import TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
+# 암호화폐 시장은 24시간/365일 거래
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+class BacktestEngine:
+    """
+    벡터화 백테스트 엔진 (바 단위 파이썬 루프 없음)
+
+    체결 모델:
+        - 바 t의 종가로 계산된 목표 포지션은 바 t의 종가에 체결되고, 바 t+1 수익률부터 반영
+        - 포지션은 자본 대비 비율 (1 = 전액 롱, -1 = 전액 숏, 0 = 현금)
+        - 수수료와 슬리피지는 포지션 변화량(|Δ포지션|)에 비례해 체결 시점 자본에서 차감
+    """
+
+    def __init__(
+        self,
+        fee_rate: float = 0.001,
+        slippage: float = 0.0005,
+        initial_capital: float = 10000.0
+    ):
+        self.fee_rate = fee_rate
+        self.slippage = slippage
+        self.initial_capital = initial_capital
+
+    # 시그널 → 포지션 변환
+
+    @staticmethod
+    def forward_fill(values: np.ndarray, fill_value: float = 0.0) -> np.ndarray:
+        """NaN을 직전 유효값으로 채움 (앞쪽 NaN은 fill_value)"""
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        last_valid = np.where(valid, np.arange(len(values)), 0)
+        np.maximum.accumulate(last_valid, out=last_valid)
+        filled = values[last_valid]
+        filled[np.isnan(filled)] = fill_value
+        return filled
+
+    @staticmethod
+    def crossover(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """a가 b를 상향 돌파하는 바에서 True"""
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        above = a > b
+        crossed = np.zeros(len(a), dtype=bool)
+        crossed[1:] = above[1:] & (a[:-1] <= b[:-1])
+        return crossed
+
+    @staticmethod
+    def signals_to_positions(
+        entries: np.ndarray,
+        exits: np.ndarray,
+        allow_short: bool = False
+    ) -> np.ndarray:
+        """
+        진입/청산 시그널을 목표 포지션 배열로 변환
+
+        Args:
+            entries: 롱 진입 시그널 (bool 배열)
+            exits: 청산 시그널 (bool 배열, allow_short=True면 숏 진입)
+            allow_short: 청산 시그널에서 숏 포지션 진입 여부
+
+        Returns:
+            바별 목표 포지션 배열 (같은 바에 두 시그널이 모두 있으면 이전 포지션 유지)
+        """
+        entries = np.asarray(entries, dtype=bool)
+        exits = np.asarray(exits, dtype=bool)
+
+        state = np.full(len(entries), np.nan)
+        state[entries & ~exits] = 1.0
+        state[exits & ~entries] = -1.0 if allow_short else 0.0
+        return BacktestEngine.forward_fill(state)
+
+    @staticmethod
+    def build_positions(
+        data: pd.DataFrame,
+        strategy: str = 'macd',
+        allow_short: bool = False,
+        price_column: str = 'close',
+        **params
+    ) -> np.ndarray:
+        """
+        내장 전략으로 OHLCV 데이터에서 목표 포지션 생성
+
+        전략:
+            - 'macd': MACD가 시그널선을 상향 돌파 시 진입, 하향 돌파 시 청산
+              (fast_period, slow_period, signal_period)
+            - 'rsi': RSI가 lower 미만이면 진입, upper 초과면 청산 (period, lower, upper)
+            - 'sma_cross': 단기 SMA가 장기 SMA 위에 있는 동안 보유 (fast_period, slow_period)
+        """
+        price = data[price_column]
+        strategy = strategy.lower()
+
+        if strategy == 'macd':
+            macd = TechnicalIndicators.calculate_macd(
+                price,
+                params.get('fast_period', 12),
+                params.get('slow_period', 26),
+                params.get('signal_period', 9)
+            )
+            macd_line = macd['macd'].to_numpy()
+            signal_line = macd['signal'].to_numpy()
+            entries = BacktestEngine.crossover(macd_line, signal_line)
+            exits = BacktestEngine.crossover(signal_line, macd_line)
+        elif strategy == 'rsi':
+            rsi = TechnicalIndicators.calculate_rsi(price, params.get('period', 14)).to_numpy()
+            entries = rsi < params.get('lower', 30)
+            exits = rsi > params.get('upper', 70)
+        elif strategy == 'sma_cross':
+            fast = TechnicalIndicators.calculate_sma(price, params.get('fast_period', 20)).to_numpy()
+            slow = TechnicalIndicators.calculate_sma(price, params.get('slow_period', 50)).to_numpy()
+            entries = fast > slow
+            exits = fast < slow
+        else:
+            raise ValueError(f"지원하지 않는 전략: {strategy}")
+
+        return BacktestEngine.signals_to_positions(entries, exits, allow_short)
+
+    # 백테스트 실행
+
+    def run(self, close: np.ndarray, positions: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        목표 포지션 배열로 백테스트 실행
+
+        Args:
+            close: 종가 배열 (NaN은 직전 종가로 채워 그 바의 수익률을 0으로 처리)
+            positions: 바별 목표 포지션 배열 (NaN은 직전 포지션 유지)
+
+        Returns:
+            바별 결과 배열 딕셔너리 (returns, position, turnover, fees, slippage,
+            strategy_returns, equity, drawdown, fill_price)
+        """
+        close = np.asarray(close, dtype=np.float64)
+        if np.isnan(close).any():
+            # 결측 종가 하나가 이후 자본 곡선 전체를 NaN으로 만들지 않도록 직전 종가로 채움
+            close = self.forward_fill(close, fill_value=np.nan)
+        positions = self.forward_fill(positions)
+        n = len(close)
+
+        if len(positions) != n:
+            raise ValueError(f"가격({n})과 포지션({len(positions)}) 길이가 다릅니다.")
+
+        # 바 수익률 (첫 바는 0)
+        returns = np.zeros(n)
+        np.divide(close[1:], close[:-1], out=returns[1:])
+        returns[1:] -= 1.0
+        # 첫 유효 종가 이전(앞쪽 NaN) 구간은 수익률 0
+        np.nan_to_num(returns, copy=False, nan=0.0)
+
+        # 직전 바의 포지션이 이번 바 수익률을 받음
+        prev_positions = np.zeros(n)
+        prev_positions[1:] = positions[:-1]
+        turnover = np.abs(positions - prev_positions)
+
+        # 자본 곱셈 인자: 보유 수익 × (1 - 거래 비용)
+        gross = 1.0 + prev_positions * returns
+        net = gross * (1.0 - turnover * (self.fee_rate + self.slippage))
+        equity = np.cumprod(net)
+        equity *= self.initial_capital
+
+        # 체결 직전 자본 기준 비용 금액
+        equity_before = np.empty(n)
+        equity_before[0] = self.initial_capital
+        equity_before[1:] = equity[:-1]
+        equity_before *= gross
+        traded_value = equity_before * turnover
+
+        # 체결가: 매수는 불리하게 높게, 매도는 낮게
+        direction = np.sign(positions - prev_positions)
+        fill_price = np.where(turnover > 0, close * (1.0 + direction * self.slippage), np.nan)
+
+        running_max = np.maximum.accumulate(equity)
+
+        return {
+            'close': close,
+            'returns': returns,
+            'position': positions,
+            'turnover': turnover,
+            'fill_price': fill_price,
+            'fees': traded_value * self.fee_rate,
+            'slippage': traded_value * self.slippage,
+            'strategy_returns': net - 1.0,
+            'equity': equity,
+            'drawdown': equity / running_max - 1.0
+        }
+
+    @staticmethod
+    def infer_periods_per_year(index) -> float:
+        """인덱스 간격으로 연간 바 개수 추정 (DatetimeIndex가 아니면 일봉 기준)"""
+        if isinstance(index, pd.DatetimeIndex) and len(index) > 1:
+            step = (index[1:] - index[:-1]).median().total_seconds()
+            if step > 0:
+                return SECONDS_PER_YEAR / step
+        return 365.0
+
+    @staticmethod
+    def compute_stats(result: Dict[str, np.ndarray], periods_per_year: float = 365.0) -> Dict[str, float]:
+        """백테스트 결과 배열로 성과 지표 계산"""
+        strategy_returns = result['strategy_returns']
+        equity = result['equity']
+        n = len(equity)
+
+        if n == 0:
+            return {}
+
+        std = strategy_returns.std()
+        sharpe = strategy_returns.mean() / std * np.sqrt(periods_per_year) if std > 0 else 0.0
+        initial = equity[0] / (1.0 + strategy_returns[0])
+        total_return = equity[-1] / initial - 1.0
+        years = n / periods_per_year
+        with np.errstate(over='ignore'):
+            # 짧은 구간에서는 연율화 값이 발산할 수 있음 (inf)
+            cagr = (1.0 + total_return) ** (1.0 / years) - 1.0 if years > 0 and total_return > -1 else -1.0
+
+        return {
+            'total_return': float(total_return),
+            'cagr': float(cagr),
+            'sharpe': float(sharpe),
+            'max_drawdown': float(result['drawdown'].min()),
+            'volatility': float(std * np.sqrt(periods_per_year)),
+            'num_trades': int(np.count_nonzero(result['turnover'])),
+            'turnover': float(result['turnover'].sum()),
+            'exposure': float(np.count_nonzero(result['position']) / n),
+            'total_fees': float(result['fees'].sum() + result['slippage'].sum()),
+            'final_equity': float(equity[-1])
+        }
+
+    def backtest(
+        self,
+        data: pd.DataFrame,
+        positions: Optional[np.ndarray] = None,
+        strategy: str = 'macd',
+        allow_short: bool = False,
+        price_column: str = 'close',
+        **params
+    ) -> Dict[str, Any]:
+        """
+        OHLCV DataFrame 백테스트
+
+        Args:
+            data: OHLCV 데이터
+            positions: 목표 포지션 (없으면 strategy로 생성)
+            strategy: 내장 전략명 ('macd', 'rsi', 'sma_cross')
+            allow_short: 숏 포지션 허용 여부
+            price_column: 가격 컬럼명
+            **params: 전략 파라미터
+
+        Returns:
+            equity(바별 결과 DataFrame), trades(체결 내역 DataFrame), stats(성과 지표) 딕셔너리
+        """
+        try:
+            # 빈 데이터는 성과 지표를 계산할 수 없으므로 빈 stats 대신 바로 알림
+            if data.empty:
+                raise ValueError("백테스트할 데이터가 없습니다.")
+            if price_column not in data.columns:
+                raise ValueError(f"가격 컬럼이 없습니다: {price_column}")
+            if not data[price_column].notna().any():
+                raise ValueError(f"가격 컬럼에 유효한 값이 없습니다 (모두 NaN): {price_column}")
+
+            if positions is None:
+                positions = self.build_positions(data, strategy, allow_short, price_column, **params)
+            elif isinstance(positions, pd.Series):
+                positions = positions.reindex(data.index).to_numpy(dtype=np.float64)
+
+            result = self.run(data[price_column].to_numpy(), positions)
+            stats = self.compute_stats(result, self.infer_periods_per_year(data.index))
+
+            equity_df = pd.DataFrame(result, index=data.index)
+
+            fill_idx = np.flatnonzero(result['turnover'])
+            position_change = result['position'][fill_idx] - np.concatenate(([0.0], result['position']))[fill_idx]
+            trades_df = pd.DataFrame({
+                'side': np.where(position_change > 0, 'buy', 'sell'),
+                'position_change': position_change,
+                'position': result['position'][fill_idx],
+                'fill_price': result['fill_price'][fill_idx],
+                'fee': result['fees'][fill_idx],
+                'slippage': result['slippage'][fill_idx]
+            }, index=data.index[fill_idx])
+
+            logger.info(f"백테스트 완료: {len(data)}개 바, {stats.get('num_trades', 0)}회 체결")
+            return {'equity': equity_df, 'trades': trades_df, 'stats': stats}
+
+        except Exception as e:
+            logger.error(f"백테스트 실패: {e}")
+            raise
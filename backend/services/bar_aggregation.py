@@ -0,0 +1,376 @@
+"""
+Bar Aggregation Service
+체결(trade/aggTrade) 데이터를 틱/거래량/거래대금/렌코 바로 집계하는 서비스
+"""
+
+import zipfile
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Iterator, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 바이낸스 공개 데이터 아카이브 체결 CSV 컬럼 (헤더가 없는 파일 기준)
+AGG_TRADE_COLUMNS = [
+    'agg_trade_id', 'price', 'quantity', 'first_trade_id', 'last_trade_id',
+    'transact_time', 'is_buyer_maker', 'is_best_match'
+]
+TRADE_COLUMNS = ['id', 'price', 'quantity', 'quote_quantity', 'transact_time', 'is_buyer_maker', 'is_best_match']
+
+BAR_TYPES = ('tick', 'volume', 'dollar', 'renko')
+
+# 출력 컬럼 (OHLCV는 get_ohlcv_dataframe과 같아 TechnicalIndicators/시각화에 바로 사용)
+BAR_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'dollar_volume', 'trades', 'close_time']
+
+class BarAggregator:
+    """
+    체결 데이터 → 사용자 정의 바 집계기
+
+    청크 단위로 update()를 호출하면 완성된 바만 반환하고, 미완성 바는 집계값(시가/고가/저가/
+    거래량 등)으로만 보관해 다음 청크에 이어 붙입니다. 원본 체결을 쌓아두지 않으므로
+    수 GB 체결 파일도 청크 크기만큼의 메모리로 처리됩니다.
+
+    바 종류:
+        - 'tick': 체결 threshold건마다 바 생성
+        - 'volume': 누적 거래량(기준 자산)이 threshold 배수를 넘을 때 바 마감
+        - 'dollar': 누적 거래대금(가격 × 수량)이 threshold 배수를 넘을 때 바 마감
+        - 'renko': 마지막 벽돌 종가에서 threshold(가격 폭) 이상 움직일 때마다 벽돌 생성
+
+    거래량/거래대금 바는 누적합 기준으로 마감하므로 큰 체결 하나가 기준을 넘긴 초과분은
+    다음 바로 이월됩니다.
+    """
+
+    def __init__(self, bar_type: str = 'volume', threshold: float = 100.0):
+        """
+        Args:
+            bar_type: 바 종류 ('tick', 'volume', 'dollar', 'renko')
+            threshold: 바 기준값 (체결 수, 거래량, 거래대금 또는 렌코 벽돌 크기)
+        """
+        bar_type = bar_type.lower()
+        if bar_type not in BAR_TYPES:
+            raise ValueError(f"지원하지 않는 바 종류: {bar_type} (지원: {', '.join(BAR_TYPES)})")
+        if threshold <= 0:
+            raise ValueError(f"기준값은 0보다 커야 합니다: {threshold}")
+
+        self.bar_type = bar_type
+        self.threshold = float(threshold)
+        self.reset()
+
+    def reset(self):
+        """집계 상태 초기화"""
+        # 누적합 바: 현재 바에 쌓인 측정값 / 렌코: 기준 가격과 현재 벽돌 위치
+        self._cumulative = 0.0
+        self._anchor = None
+        self._level = 0
+        self._last_floor = None
+        self._last_ceil = None
+        self._partial: Optional[Dict[str, Any]] = None
+        self.trades_processed = 0
+
+    # 입력 정규화
+
+    @staticmethod
+    def _normalize(trades: pd.DataFrame):
+        """체결 DataFrame → (시각 ns int64, 가격, 수량) 배열"""
+        if 'transact_time' in trades.columns:
+            times = trades['transact_time'].to_numpy()
+        elif 'timestamp' in trades.columns:
+            times = trades['timestamp'].to_numpy()
+        elif 'time' in trades.columns:
+            times = trades['time'].to_numpy()
+        elif isinstance(trades.index, pd.DatetimeIndex):
+            times = trades.index.to_numpy()
+        else:
+            raise ValueError("체결 시각 컬럼(transact_time/timestamp/time) 또는 DatetimeIndex가 필요합니다.")
+
+        if np.issubdtype(times.dtype, np.datetime64):
+            times_ns = times.astype('datetime64[ns]').view(np.int64)
+        else:
+            times = times.astype(np.int64)
+            # 2025년부터 현물 아카이브는 마이크로초, 그 이전과 스트림은 밀리초
+            scale = 1_000 if len(times) and times.max() > 10 ** 14 else 1_000_000
+            times_ns = times * scale
+
+        quantity_column = 'quantity' if 'quantity' in trades.columns else 'qty'
+        price = trades['price'].to_numpy(dtype=np.float64)
+        quantity = trades[quantity_column].to_numpy(dtype=np.float64)
+        return times_ns, price, quantity
+
+    # 집계
+
+    def update(self, trades: pd.DataFrame) -> pd.DataFrame:
+        """
+        체결 청크를 집계해 이번 청크에서 완성된 바 반환
+
+        Args:
+            trades: price, quantity(또는 qty), 체결 시각 컬럼을 가진 시간순 체결 DataFrame
+
+        Returns:
+            timestamp(바 시작 시각) 인덱스와 BAR_COLUMNS 컬럼의 DataFrame
+        """
+        times, price, quantity = self._normalize(trades)
+        if len(price) == 0:
+            return self._frame(None)
+
+        self.trades_processed += len(price)
+        if self.bar_type == 'renko':
+            bars = self._update_renko(times, price, quantity)
+        else:
+            bars = self._update_threshold(times, price, quantity)
+        return self._frame(bars)
+
+    def flush(self) -> pd.DataFrame:
+        """미완성 바를 반환하고 비움 (마지막 청크 처리 후 호출)"""
+        partial, self._partial = self._partial, None
+        self._cumulative = 0.0
+        if partial is None or self.bar_type == 'renko':
+            # 렌코는 가격 폭을 채우지 못한 구간을 바로 만들지 않음
+            return self._frame(None)
+        return self._frame({key: np.array([value]) for key, value in partial.items()})
+
+    def _update_threshold(self, times: np.ndarray, price: np.ndarray, quantity: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+        """틱/거래량/거래대금 바: 누적합이 기준값 배수를 넘는 체결에서 바 마감"""
+        dollar = price * quantity
+        if self.bar_type == 'tick':
+            measure = np.ones(len(price))
+        elif self.bar_type == 'volume':
+            measure = quantity
+        else:
+            measure = dollar
+
+        total = np.cumsum(measure)
+        total += self._cumulative
+        # 체결 직전 누적값으로 바 번호 결정 (0 = 이전 청크에서 이어지는 바)
+        bar_ids = np.floor((total - measure) / self.threshold).astype(np.int64)
+        final_id = int(np.floor(total[-1] / self.threshold))
+
+        starts = np.flatnonzero(np.diff(bar_ids, prepend=-1))
+        ends = np.append(starts[1:], len(price)) - 1
+
+        bars = {
+            'timestamp': times[starts],
+            'open': price[starts],
+            'high': np.maximum.reduceat(price, starts),
+            'low': np.minimum.reduceat(price, starts),
+            'close': price[ends],
+            'volume': np.add.reduceat(quantity, starts),
+            'dollar_volume': np.add.reduceat(dollar, starts),
+            'trades': np.diff(np.append(starts, len(price))),
+            'close_time': times[ends]
+        }
+
+        # 이전 청크의 미완성 바를 첫 바에 병합
+        if self._partial is not None and bar_ids[0] == 0:
+            self._merge_partial(bars)
+        self._partial = None
+
+        # 마지막 바는 마지막 체결이 기준을 넘기지 않았다면 미완성
+        if final_id == bar_ids[-1]:
+            self._partial = {key: values[-1] for key, values in bars.items()}
+            bars = {key: values[:-1] for key, values in bars.items()}
+        self._cumulative = float(total[-1] - final_id * self.threshold)
+
+        return bars
+
+    def _merge_partial(self, bars: Dict[str, np.ndarray]):
+        partial = self._partial
+        bars['timestamp'][0] = partial['timestamp']
+        bars['open'][0] = partial['open']
+        bars['high'][0] = max(bars['high'][0], partial['high'])
+        bars['low'][0] = min(bars['low'][0], partial['low'])
+        bars['volume'][0] += partial['volume']
+        bars['dollar_volume'][0] += partial['dollar_volume']
+        bars['trades'][0] += partial['trades']
+
+    def _update_renko(self, times: np.ndarray, price: np.ndarray, quantity: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+        """
+        렌코 벽돌: 벽돌 경계는 첫 체결 가격 기준 threshold 간격의 격자
+
+        격자선을 지나는 체결만 벡터 연산으로 골라낸 뒤 그 체결들에서만 벽돌 상태를 갱신
+        (격자선을 지나지 않으면 벽돌이 생길 수 없으므로 전체 체결을 순회하지 않음)
+        """
+        if self._anchor is None:
+            self._anchor = float(price[0])
+            self._last_floor = 0.0
+            self._last_ceil = 0.0
+
+        position = (price - self._anchor) / self.threshold
+        floor = np.floor(position)
+        ceil = np.ceil(position)
+        crossed = (floor != np.append(self._last_floor, floor[:-1])) | (ceil != np.append(self._last_ceil, ceil[:-1]))
+        self._last_floor = floor[-1]
+        self._last_ceil = ceil[-1]
+
+        cum_volume = np.cumsum(quantity)
+        cum_dollar = np.cumsum(price * quantity)
+
+        partial = self._partial or {'timestamp': None, 'volume': 0.0, 'dollar_volume': 0.0, 'trades': 0}
+        if partial['timestamp'] is None:
+            partial['timestamp'] = times[0]
+        rows = []
+        last = -1
+        level = self._level
+
+        for i in np.flatnonzero(crossed):
+            if position[i] >= level + 1:
+                steps, direction = int(floor[i]) - level, 1
+            elif position[i] <= level - 1:
+                steps, direction = level - int(ceil[i]), -1
+            else:
+                continue
+
+            start_time = times[last + 1] if last >= 0 else partial['timestamp']
+            volume = cum_volume[i] - (cum_volume[last] if last >= 0 else -partial['volume'])
+            dollar = cum_dollar[i] - (cum_dollar[last] if last >= 0 else -partial['dollar_volume'])
+            count = i - last + (partial['trades'] if last < 0 else 0)
+
+            # 한 체결에 여러 벽돌이 생기면 거래량은 첫 벽돌에만 배정
+            for step in range(steps):
+                open_level = level + direction * step
+                rows.append((
+                    start_time if step == 0 else times[i],
+                    open_level, open_level + direction,
+                    volume if step == 0 else 0.0,
+                    dollar if step == 0 else 0.0,
+                    count if step == 0 else 0,
+                    times[i]
+                ))
+            level += direction * steps
+            last = i
+
+        self._level = level
+        if last >= 0:
+            # 마지막 체결에서 벽돌이 생겼다면 다음 벽돌 시작 시각은 다음 청크 첫 체결
+            partial = {'timestamp': times[last + 1] if last + 1 < len(times) else None,
+                       'volume': 0.0, 'dollar_volume': 0.0, 'trades': 0}
+        partial['volume'] += cum_volume[-1] - (cum_volume[last] if last >= 0 else 0.0)
+        partial['dollar_volume'] += cum_dollar[-1] - (cum_dollar[last] if last >= 0 else 0.0)
+        partial['trades'] += len(price) - 1 - last
+        self._partial = partial
+
+        if not rows:
+            return None
+
+        start_time, open_level, close_level, volume, dollar, count, close_time = map(np.array, zip(*rows))
+        open_price = self._anchor + open_level * self.threshold
+        close_price = self._anchor + close_level * self.threshold
+        return {
+            'timestamp': start_time,
+            'open': open_price,
+            'high': np.maximum(open_price, close_price),
+            'low': np.minimum(open_price, close_price),
+            'close': close_price,
+            'volume': volume,
+            'dollar_volume': dollar,
+            'trades': count,
+            'close_time': close_time
+        }
+
+    @staticmethod
+    def _frame(bars: Optional[Dict[str, np.ndarray]]) -> pd.DataFrame:
+        """집계 배열 → timestamp 인덱스 DataFrame"""
+        if bars is None:
+            bars = {key: np.array([], dtype=np.int64 if key in ('timestamp', 'trades', 'close_time') else np.float64)
+                    for key in ['timestamp'] + BAR_COLUMNS}
+
+        df = pd.DataFrame({key: bars[key] for key in BAR_COLUMNS})
+        df['trades'] = df['trades'].astype(np.int64)
+        df['close_time'] = pd.to_datetime(np.asarray(bars['close_time'], dtype=np.int64), unit='ns')
+        df.index = pd.DatetimeIndex(pd.to_datetime(np.asarray(bars['timestamp'], dtype=np.int64), unit='ns'), name='timestamp')
+        return df
+
+    # 일괄 처리
+
+    def iter_bars(self, chunks: Iterable[pd.DataFrame], include_partial: bool = False) -> Iterator[pd.DataFrame]:
+        """체결 청크를 순서대로 집계하며 완성된 바 묶음을 스트리밍"""
+        for chunk in chunks:
+            bars = self.update(chunk)
+            if len(bars):
+                yield bars
+        if include_partial:
+            bars = self.flush()
+            if len(bars):
+                yield bars
+
+    def aggregate(self, chunks: Iterable[pd.DataFrame], include_partial: bool = False) -> pd.DataFrame:
+        """체결 청크 전체를 집계해 하나의 바 DataFrame으로 반환"""
+        frames = list(self.iter_bars(chunks, include_partial))
+        if not frames:
+            return self._frame(None)
+        bars = pd.concat(frames)
+        logger.info(f"{self.bar_type} 바 집계 완료: 체결 {self.trades_processed:,}건 → 바 {len(bars):,}개")
+        return bars
+
+def _has_header(path: Path) -> bool:
+    """CSV 첫 줄이 헤더인지 확인 (아카이브 파일은 시기에 따라 헤더 유무가 다름)"""
+    if path.suffix == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            with archive.open(archive.namelist()[0]) as f:
+                first = f.readline()
+    else:
+        with open(path, 'rb') as f:
+            first = f.readline()
+    return not first[:1].isdigit()
+
+def read_trades(
+    path: Union[str, Path],
+    kind: str = 'aggTrades',
+    chunksize: int = 1_000_000
+) -> Iterator[pd.DataFrame]:
+    """
+    바이낸스 체결 아카이브(zip 또는 csv)를 청크 단위로 읽기
+
+    Args:
+        path: 파일 경로 (예: BTCUSDT-aggTrades-2024-01.zip)
+        kind: 'aggTrades' 또는 'trades'
+        chunksize: 청크당 행 수
+
+    Yields:
+        price, quantity, transact_time 컬럼의 DataFrame
+    """
+    path = Path(path)
+    columns = AGG_TRADE_COLUMNS if kind == 'aggTrades' else TRADE_COLUMNS
+
+    reader = pd.read_csv(
+        path,
+        header=0 if _has_header(path) else None,
+        names=columns,
+        usecols=['price', 'quantity', 'transact_time'],
+        dtype={'price': np.float64, 'quantity': np.float64, 'transact_time': np.int64},
+        chunksize=chunksize
+    )
+    with reader:
+        yield from reader
+
+def build_bars(
+    trades: Union[pd.DataFrame, str, Path, Iterable[pd.DataFrame]],
+    bar_type: str = 'volume',
+    threshold: float = 100.0,
+    chunksize: int = 1_000_000,
+    include_partial: bool = False,
+    kind: str = 'aggTrades'
+) -> pd.DataFrame:
+    """
+    체결 DataFrame, 아카이브 파일 또는 청크 이터러블로 사용자 정의 바 생성
+
+    Args:
+        trades: 체결 DataFrame / 파일 경로 / DataFrame 청크 이터러블
+        bar_type: 'tick', 'volume', 'dollar', 'renko'
+        threshold: 바 기준값
+        chunksize: 청크당 행 수 (DataFrame·파일 입력 시)
+        include_partial: 마지막 미완성 바 포함 여부
+        kind: 파일 입력 시 아카이브 종류 ('aggTrades' 또는 'trades')
+
+    Returns:
+        OHLCV + dollar_volume/trades/close_time 컬럼의 바 DataFrame
+    """
+    if isinstance(trades, (str, Path)):
+        chunks = read_trades(trades, kind, chunksize)
+    elif isinstance(trades, pd.DataFrame):
+        chunks = (trades.iloc[i:i + chunksize] for i in range(0, len(trades), chunksize))
+    else:
+        chunks = trades
+
+    return BarAggregator(bar_type, threshold).aggregate(chunks, include_partial)
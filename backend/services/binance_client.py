@@ -4,14 +4,25 @@ Binance API Client
 """
 
 import os
+import time
 import requests
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union, Iterable
 import logging
 
+from .metrics import BINANCE_REQUESTS, BINANCE_LATENCY, BINANCE_WEIGHT
+from .kline_decoder import KlineBuffer
+from .resampling import INTERVAL_MS
+
 logger = logging.getLogger(__name__)
 
+# klines 요청당 최대 개수 (바이낸스 API 제한)
+KLINES_PAGE_LIMIT = 1000
+
+# 예상 행 수가 이보다 크면 이만큼만 먼저 할당하고 필요할 때 늘림
+MAX_PREALLOCATED_ROWS = 10_000_000
+
 class BinanceClient:
     """바이낸스 API 클라이언트"""
     
@@ -25,6 +36,21 @@ class BinanceClient:
         if self.api_key:
             self.session.headers.update({'X-MBX-APIKEY': self.api_key})
     
+    def _get(self, path: str, params: Optional[Dict] = None) -> requests.Response:
+        """GET 요청 (엔드포인트별 요청 수/지연 시간, 사용 가중치 지표 기록)"""
+        started = time.perf_counter()
+        status = 'error'
+        try:
+            response = self.session.get(f"{self.base_url}/{path}", params=params)
+            status = str(response.status_code)
+            weight = response.headers.get('X-MBX-USED-WEIGHT-1M')
+            if weight is not None:
+                BINANCE_WEIGHT.set(float(weight))
+            return response
+        finally:
+            BINANCE_LATENCY.labels(path).observe(time.perf_counter() - started)
+            BINANCE_REQUESTS.labels(path, status).inc()
+    
     def get_klines(
         self,
         symbol: str,
@@ -46,8 +72,6 @@ class BinanceClient:
         Returns:
             캔들스틱 데이터 리스트
         """
-        endpoint = f"{self.base_url}/klines"
-        
         params = {
             'symbol': symbol.upper(),
             'interval': interval,
@@ -61,7 +85,7 @@ class BinanceClient:
             params['endTime'] = int(end_time.timestamp() * 1000)
         
         try:
-            response = self.session.get(endpoint, params=params)
+            response = self._get('klines', params)
             response.raise_for_status()
             
             klines_data = response.json()
@@ -73,21 +97,72 @@ class BinanceClient:
             logger.error(f"바이낸스 API 요청 실패: {e}")
             raise Exception(f"바이낸스 데이터 조회 실패: {str(e)}")
     
+    def _klines_page(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> bytes:
+        """klines 한 페이지 응답 본문 (디코딩은 호출자가 필요한 필드만)"""
+        params = {
+            'symbol': symbol.upper(),
+            'interval': interval,
+            'startTime': start_ms,
+            'endTime': end_ms,
+            'limit': KLINES_PAGE_LIMIT
+        }
+        try:
+            response = self._get('klines', params)
+            response.raise_for_status()
+            return response.content
+        except requests.exceptions.RequestException as e:
+            logger.error(f"바이낸스 API 요청 실패: {e}")
+            raise Exception(f"바이낸스 데이터 조회 실패: {str(e)}")
+    
+    def get_ohlcv_range(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        extra_fields: Union[bool, Iterable[str]] = False
+    ) -> pd.DataFrame:
+        """
+        [start_ms, end_ms] 구간(봉 시작 시각 기준) OHLCV DataFrame (없으면 빈 DataFrame)
+        
+        예상 행 수만큼 numpy 컬럼을 미리 할당하고 페이지 응답을 이어서 디코딩합니다.
+        """
+        # 예상 행 수만큼 미리 할당 (월봉처럼 길이가 일정하지 않으면 한 페이지 크기로 시작)
+        step = INTERVAL_MS.get(interval)
+        expected = (end_ms - start_ms) // step + 1 if step else KLINES_PAGE_LIMIT
+        buffer = KlineBuffer(min(max(expected, 1), MAX_PREALLOCATED_ROWS), extra_fields=extra_fields)
+        
+        # 캔들스틱 데이터 조회 (마지막 페이지가 가득 차지 않을 때까지)
+        cursor = start_ms
+        while cursor <= end_ms:
+            added = buffer.extend(self._klines_page(symbol, interval, cursor, end_ms))
+            if added < KLINES_PAGE_LIMIT:
+                break
+            cursor = buffer.last_timestamp() + 1
+        
+        return buffer.to_frame()
+    
     def get_ohlcv_dataframe(
         self,
         symbol: str,
         interval: str = '1d',
         start_date: Optional[str] = None,
-        days: int = 30
+        days: int = 30,
+        extra_fields: Union[bool, Iterable[str]] = False
     ) -> pd.DataFrame:
         """
         OHLCV 데이터를 DataFrame으로 반환
         
+        기간이 한 번의 요청(1000개)보다 길면 페이지를 이어 요청하고, 응답 바이트를 필요한 필드만
+        미리 할당한 numpy 컬럼으로 바로 디코딩합니다.
+        
         Args:
             symbol: 거래 쌍
             interval: 봉 간격
             start_date: 시작 날짜 (YYYY-MM-DD)
             days: 수집할 일수
+            extra_fields: True면 quote_asset_volume, number_of_trades, taker_buy_base_asset_volume,
+                          taker_buy_quote_asset_volume 컬럼도 포함 (필드명 목록으로 지정 가능)
         
         Returns:
             OHLCV DataFrame
@@ -99,32 +174,14 @@ class BinanceClient:
             start_time = datetime.now() - timedelta(days=days)
         
         end_time = start_time + timedelta(days=days)
+        start_ms = int(start_time.timestamp() * 1000)
+        end_ms = int(end_time.timestamp() * 1000)
         
-        # 캔들스틱 데이터 조회
-        klines = self.get_klines(symbol, interval, start_time, end_time)
+        df = self.get_ohlcv_range(symbol, interval, start_ms, end_ms, extra_fields=extra_fields)
         
-        if not klines:
+        if df.empty:
             raise Exception("데이터를 가져올 수 없습니다.")
         
-        # DataFrame 생성
-        df = pd.DataFrame(klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # 데이터 타입 변환
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df['open'] = df['open'].astype(float)
-        df['high'] = df['high'].astype(float)
-        df['low'] = df['low'].astype(float)
-        df['close'] = df['close'].astype(float)
-        df['volume'] = df['volume'].astype(float)
-        
-        # 필요한 컬럼만 선택
-        df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-        df.set_index('timestamp', inplace=True)
-        
         # 심볼과 간격 정보 추가
         df['symbol'] = symbol
         df['interval'] = interval
@@ -134,23 +191,30 @@ class BinanceClient:
     
     def get_24hr_ticker(self, symbol: str) -> Dict:
         """24시간 통계 조회"""
-        endpoint = f"{self.base_url}/ticker/24hr"
         params = {'symbol': symbol.upper()}
         
         try:
-            response = self.session.get(endpoint, params=params)
+            response = self._get('ticker/24hr', params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"24시간 통계 조회 실패: {e}")
             raise Exception(f"24시간 통계 조회 실패: {str(e)}")
     
+    def get_24hr_tickers(self) -> List[Dict]:
+        """전체 심볼 24시간 통계 (한 번의 요청, 요청 가중치 80)"""
+        try:
+            response = self._get('ticker/24hr')
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"24시간 통계 일괄 조회 실패: {e}")
+            raise Exception(f"24시간 통계 일괄 조회 실패: {str(e)}")
+    
     def get_exchange_info(self) -> Dict:
         """거래소 정보 조회"""
-        endpoint = f"{self.base_url}/exchangeInfo"
-        
         try:
-            response = self.session.get(endpoint)
+            response = self._get('exchangeInfo')
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,199 @@
+"""
+Candle Ring Buffer
+고정 용량 OHLCV 캔들 저장소 (사전 할당 NumPy 배열, DataFrame 뷰 제공)
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+# get_ohlcv_dataframe과 같은 가격/거래량 컬럼
+CANDLE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# 기본 여유분 행 수 (용량과 무관한 고정값, 용량이 더 작으면 용량만큼)
+DEFAULT_SLACK = 256
+
+class CandleRing:
+    """
+    최근 N개 캔들을 보관하는 고정 용량 버퍼
+
+    레이아웃:
+        - 시각은 datetime64[ns] 배열, OHLCV는 (행, 5) float64 블록에 저장
+        - 용량 + 여유분(slack) 행을 한 번만 할당하고 head 위치에 이어서 기록
+        - head가 끝에 닿으면 최근 capacity-1개 행을 앞으로 한 번에 옮김
+          (slack번 추가마다 최근 행 블록 복사 1회로 상각되어 append는 O(1))
+        - 최근 구간이 항상 연속된 행이므로 시간순 DataFrame 뷰를 복사 없이 반환
+
+    메모리: (capacity + slack) × 48 bytes 고정 (예: 10,000개 캔들 ≈ 0.49MB)
+    """
+
+    __slots__ = ('capacity', '_slack', '_timestamps', '_values', '_head', '_size')
+
+    def __init__(self, capacity: int, slack: Optional[int] = None):
+        """
+        Args:
+            capacity: 보관할 최대 캔들 수
+            slack: 추가 할당 행 수 (기본값: min(DEFAULT_SLACK, capacity), 클수록 옮기는 빈도가 줄고 메모리 증가)
+        """
+        if capacity < 1:
+            raise ValueError(f"용량은 1 이상이어야 합니다: {capacity}")
+
+        self.capacity = capacity
+        self._slack = max(1, min(DEFAULT_SLACK, capacity) if slack is None else slack)
+        rows = capacity + self._slack
+        self._timestamps = np.zeros(rows, dtype='datetime64[ns]')
+        self._values = np.zeros((rows, len(CANDLE_COLUMNS)), dtype=np.float64)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"CandleRing(size={self._size}, capacity={self.capacity})"
+
+    @property
+    def nbytes(self) -> int:
+        """할당된 배열 메모리 크기 (bytes)"""
+        return self._timestamps.nbytes + self._values.nbytes
+
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        """마지막 캔들 시각"""
+        if self._size == 0:
+            return None
+        return pd.Timestamp(self._timestamps[self._head - 1])
+
+    def append(
+        self,
+        timestamp,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ) -> bool:
+        """
+        캔들 추가 (마지막 캔들과 시각이 같으면 덮어쓰고, 이전 시각이면 무시)
+
+        Args:
+            timestamp: 캔들 시작 시각 (밀리초 정수 또는 datetime 계열)
+            open, high, low, close, volume: 캔들 값
+
+        Returns:
+            기록 여부 (이전 시각이라 무시된 경우 False)
+        """
+        if isinstance(timestamp, (int, np.integer)):
+            timestamp = np.datetime64(int(timestamp), 'ms')
+        timestamp = np.datetime64(timestamp, 'ns')
+
+        if self._size:
+            last = self._timestamps[self._head - 1]
+            if timestamp < last:
+                return False
+            if timestamp == last:
+                # 재연결 등으로 같은 캔들이 다시 들어온 경우
+                self._values[self._head - 1] = (open, high, low, close, volume)
+                return True
+
+        if self._head == len(self._timestamps):
+            self._compact()
+
+        self._timestamps[self._head] = timestamp
+        self._values[self._head] = (open, high, low, close, volume)
+        self._head += 1
+        self._size = min(self._size + 1, self.capacity)
+        return True
+
+    def extend(self, data: pd.DataFrame) -> int:
+        """
+        OHLCV DataFrame(시각 인덱스) 일괄 추가 (행 단위 루프 없이 블록 복사)
+
+        Returns:
+            기록된 행 수 (마지막 캔들보다 이전 시각인 행은 무시)
+        """
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
+        timestamps = pd.DatetimeIndex(data.index).as_unit('ns').to_numpy()
+        values = data[CANDLE_COLUMNS].to_numpy(dtype=np.float64)
+
+        written = 0
+        if self._size:
+            last = self._timestamps[self._head - 1]
+            same = timestamps == last
+            if same.any():
+                self._values[self._head - 1] = values[same][-1]
+                written += 1
+            newer = timestamps > last
+            timestamps, values = timestamps[newer], values[newer]
+
+        # 용량을 넘는 앞부분은 어차피 밀려나므로 건너뜀
+        timestamps, values = timestamps[-self.capacity:], values[-self.capacity:]
+        n = len(timestamps)
+        if n == 0:
+            return written
+
+        if self._head + n > len(self._timestamps):
+            self._compact(n)
+
+        self._timestamps[self._head:self._head + n] = timestamps
+        self._values[self._head:self._head + n] = values
+        self._head += n
+        self._size = min(self._size + n, self.capacity)
+        return written + n
+
+    def _compact(self, incoming: int = 1):
+        """새 행 incoming개 자리를 남기고 유지할 최근 행을 배열 앞으로 이동"""
+        keep = min(self._size, self.capacity - incoming)
+        start = self._head - keep
+        if keep:
+            self._timestamps[:keep] = self._timestamps[start:self._head]
+            self._values[:keep] = self._values[start:self._head]
+        self._head = keep
+        self._size = keep
+
+    def to_dataframe(self, copy: bool = False, last: Optional[int] = None) -> pd.DataFrame:
+        """
+        시간순 OHLCV DataFrame 반환
+
+        Args:
+            copy: False면 내부 배열을 공유하는 뷰 (다음 append 전까지만 유효),
+                  True면 독립된 복사본
+            last: 최근 N개만 반환
+
+        Returns:
+            timestamp 인덱스, open/high/low/close/volume 컬럼의 DataFrame
+        """
+        size = self._size if last is None else max(0, min(last, self._size))
+        start = self._head - size
+
+        timestamps = self._timestamps[start:self._head]
+        values = self._values[start:self._head]
+        if copy:
+            timestamps = timestamps.copy()
+            values = values.copy()
+
+        index = pd.DatetimeIndex(timestamps, name='timestamp', copy=False)
+        return pd.DataFrame(values, index=index, columns=CANDLE_COLUMNS, copy=False)
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼 배열 뷰 (시간순, 지표 계산용)"""
+        return self._values[self._head - self._size:self._head, CANDLE_COLUMNS.index(name)]
+
+    def clear(self):
+        """버퍼 비우기 (할당 메모리는 유지)"""
+        self._head = 0
+        self._size = 0
+
+    @classmethod
+    def from_dataframe(cls, data: pd.DataFrame, capacity: Optional[int] = None) -> 'CandleRing':
+        """OHLCV DataFrame으로 버퍼 생성 (capacity 생략 시 데이터 길이)"""
+        ring = cls(capacity or max(1, len(data)))
+        ring.extend(data)
+        return ring
+
+    @staticmethod
+    def estimate_nbytes(capacity: int, count: int = 1, slack: Optional[int] = None) -> int:
+        """버퍼 count개의 예상 메모리 (예: 500개 심볼 × 10,000개 캔들)"""
+        slack = max(1, min(DEFAULT_SLACK, capacity) if slack is None else slack)
+        return (capacity + slack) * (8 + 8 * len(CANDLE_COLUMNS)) * count
@@ -0,0 +1,274 @@
+"""
+Cell Profiler
+셀 프로파일링 모드 (%%prun, %%timeit, %%flame) 실행 및 결과 페이로드 생성
+
+셀 첫 줄에 매직을 쓰면 execute_with_result.py가 이 모듈을 임포트해 실행합니다.
+매직이 없는 셀은 이 모듈을 임포트하지 않으므로 추가 비용이 없습니다.
+
+    %%prun -s tottime -l 30     # cProfile 결정적 프로파일, 상위 함수 표
+    %%timeit -n 100 -r 7        # 반복 실행 시간 (-n 생략 시 0.2초 이상 걸리도록 자동 결정)
+    %%flame -i 5                # 샘플링 프로파일 (간격 ms), 플레임 그래프
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shlex
+import timeit
+import sysconfig
+import cProfile
+import pstats
+import threading
+import statistics
+from collections import Counter
+from typing import Optional, Dict, Any, Callable, Tuple
+
+PROFILE_START = '__PROFILE_JSON_START__'
+PROFILE_END = '__PROFILE_JSON_END__'
+
+# 매직별 옵션: 플래그 → (옵션명, 변환 함수, 기본값)
+MAGIC_OPTIONS = {
+    'prun': {'-s': ('sort', str, 'cumulative'), '-l': ('limit', int, 25)},
+    'timeit': {'-n': ('number', int, None), '-r': ('repeat', int, 7)},
+    'flame': {'-i': ('interval_ms', float, 5.0), '-d': ('max_depth', int, 64)}
+}
+
+# -s 정렬 기준 → pstats 항목 (cc, nc, tt, ct) 인덱스
+SORT_KEYS = {'cumulative': 3, 'cumtime': 3, 'tottime': 2, 'time': 2, 'ncalls': 1, 'calls': 1}
+
+# 셀 코드는 exec로 실행되므로 코드 객체 파일명이 '<string>'
+CELL_FILENAME = '<string>'
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_STDLIB = sysconfig.get_paths()['stdlib']
+
+# 셀 실행 스크립트/프로파일러 자체 프레임 (사용자 함수 시간 측정 래퍼 포함)은 결과에서 제외
+_RUNNER_FILES = ('execute_with_result.py', os.path.basename(__file__))
+
+def _is_runner(filename: str) -> bool:
+    return filename.endswith(_RUNNER_FILES)
+
+def parse_magic(code: str) -> Tuple[str, Dict[str, Any], str]:
+    """
+    셀 첫 줄의 매직 해석
+
+    Returns:
+        (모드, 옵션 딕셔너리, 매직 줄을 제외한 셀 코드)
+    """
+    first, _, body = code.partition('\n')
+    tokens = shlex.split(first[2:])
+    if not tokens or tokens[0] not in MAGIC_OPTIONS:
+        raise ValueError(f"지원하지 않는 셀 매직: {first.strip()} (사용 가능: %%prun, %%timeit, %%flame)")
+
+    mode, args = tokens[0], tokens[1:]
+    spec = MAGIC_OPTIONS[mode]
+    options = {name: default for name, _, default in spec.values()}
+    for flag, value in zip(args[::2], args[1::2]):
+        if flag not in spec:
+            raise ValueError(f"%%{mode}에서 지원하지 않는 옵션: {flag} (사용 가능: {', '.join(spec)})")
+        name, convert, _ = spec[flag]
+        options[name] = convert(value)
+    if len(args) % 2:
+        raise ValueError(f"%%{mode} 옵션 값이 없습니다: {args[-1]}")
+
+    if mode == 'prun' and options['sort'] not in SORT_KEYS:
+        raise ValueError(f"지원하지 않는 정렬 기준: {options['sort']} (사용 가능: {', '.join(SORT_KEYS)})")
+    if not body.strip():
+        raise ValueError(f"%%{mode} 아래에 실행할 코드가 없습니다.")
+    return mode, options, body.strip()
+
+def emit_profile(payload: Dict[str, Any]):
+    """프로파일 결과를 표준 출력 마커로 전달 (api.py가 'profile' 출력으로 변환)"""
+    sys.stdout.flush()
+    print(PROFILE_START + json.dumps(payload) + PROFILE_END)
+
+def _short_path(filename: str) -> str:
+    if filename == CELL_FILENAME:
+        return '<cell>'
+    for marker in ('site-packages' + os.sep, 'dist-packages' + os.sep):
+        if marker in filename:
+            return filename.split(marker, 1)[1]
+    if filename.startswith(_PROJECT_ROOT):
+        return os.path.relpath(filename, _PROJECT_ROOT)
+    if filename.startswith(_STDLIB):
+        return os.path.relpath(filename, _STDLIB)
+    return filename
+
+def _function_label(filename: str, line: int, name: str) -> str:
+    if filename == '~':  # 내장 함수
+        return name
+    return f"{name} ({_short_path(filename)}:{line})"
+
+def profile_deterministic(run: Callable[[], Any], sort: str = 'cumulative', limit: int = 25) -> None:
+    """
+    cProfile로 셀 실행 (%%prun)
+
+    출력 페이로드 (emit_profile):
+        mode, total_time, total_calls, sort, functions(상위 함수 리스트) 페이로드
+    """
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        run()
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - started
+
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        index = SORT_KEYS[sort]
+        entries = [
+            (key, value) for key, value in stats.stats.items()
+            if not (key[0] == '~' and '_lsprof.Profiler' in key[2]) and not _is_runner(key[0])
+        ]
+        entries.sort(key=lambda item: item[1][index], reverse=True)
+
+        functions = []
+        for (filename, line, name), (primitive, calls, tottime, cumtime, _) in entries[:limit]:
+            functions.append({
+                'function': _function_label(filename, line, name),
+                'ncalls': calls if calls == primitive else f"{calls}/{primitive}",
+                'tottime': round(tottime, 6),
+                'percall_tottime': round(tottime / calls, 9) if calls else 0.0,
+                'cumtime': round(cumtime, 6),
+                'percall_cumtime': round(cumtime / primitive, 9) if primitive else 0.0
+            })
+
+        emit_profile({
+            'mode': 'prun',
+            'total_time': round(elapsed, 6),
+            'total_calls': stats.total_calls,
+            'primitive_calls': stats.prim_calls,
+            'sort': sort,
+            'functions': functions
+        })
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+def time_repeated(code: str, global_ns: dict, local_ns: dict, number: Optional[int] = None, repeat: int = 7) -> None:
+    """
+    셀 코드를 반복 실행해 시간 측정 (%%timeit, 측정 중 출력은 버림)
+
+    출력 페이로드 (emit_profile):
+        mode, number, repeat, best, mean, stdev, worst, runs(회당 시간 리스트), summary 페이로드
+    """
+    compiled = compile(code, CELL_FILENAME, 'exec')
+    timer = timeit.Timer(lambda: exec(compiled, global_ns, local_ns))
+
+    with open(os.devnull, 'w') as devnull:
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            if number is None:
+                number, _ = timer.autorange()
+            runs = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+        finally:
+            sys.stdout = stdout
+
+    mean = statistics.fmean(runs)
+    stdev = statistics.stdev(runs) if len(runs) > 1 else 0.0
+    emit_profile({
+        'mode': 'timeit',
+        'number': number,
+        'repeat': repeat,
+        'best': min(runs),
+        'mean': mean,
+        'stdev': stdev,
+        'worst': max(runs),
+        'runs': runs,
+        'summary': (
+            f"{_format_seconds(mean)} ± {_format_seconds(stdev)} per loop "
+            f"(mean ± std. dev. of {repeat} runs, {number:,} loops each)"
+        )
+    })
+
+def _flame_tree(counts: Counter, min_fraction: float = 0.005) -> Dict[str, list]:
+    """
+    접힌 스택 카운트 → 플레임 그래프 노드 (Plotly icicle의 ids/labels/parents/values 형식)
+
+    전체 샘플의 min_fraction 미만인 노드는 제외해 페이로드 크기를 제한
+    """
+    total = sum(counts.values())
+    node_values: Counter = Counter()
+    for stack, count in counts.items():
+        for depth in range(1, len(stack) + 1):
+            node_values[stack[:depth]] += count
+
+    ids, labels, parents, values = ['0'], ['all'], [''], [total]
+    node_ids = {(): '0'}
+    threshold = total * min_fraction
+    for path in sorted(node_values, key=len):
+        value = node_values[path]
+        if value < threshold or path[:-1] not in node_ids:
+            continue
+        node_ids[path] = str(len(ids))
+        ids.append(node_ids[path])
+        labels.append(path[-1])
+        parents.append(node_ids[path[:-1]])
+        values.append(value)
+
+    return {'ids': ids, 'labels': labels, 'parents': parents, 'values': values}
+
+def profile_sampling(run: Callable[[], Any], interval_ms: float = 5.0, max_depth: int = 64) -> None:
+    """
+    샘플링 프로파일 (%%flame): 별도 스레드가 interval_ms마다 실행 중인 스택을 기록
+
+    출력 페이로드 (emit_profile):
+        mode, interval_ms, samples, elapsed, 플레임 그래프 노드, folded(접힌 스택 상위 항목) 페이로드
+    """
+    target = threading.get_ident()
+    counts: Counter = Counter()
+    stop = threading.Event()
+    interval = interval_ms / 1000
+
+    def sample():
+        while not stop.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            stack.reverse()
+
+            # 셀 코드 바깥(실행 스크립트, 프로파일러) 프레임은 제외
+            cell_start = next((i for i, f in enumerate(stack) if f[0] == CELL_FILENAME), None)
+            if cell_start is None:
+                continue
+            stack = [f for f in stack[cell_start:] if not _is_runner(f[0])][:max_depth]
+            counts[tuple(_function_label(*f) for f in stack)] += 1
+
+    sampler = threading.Thread(target=sample, name='cell-sampler', daemon=True)
+    started = time.perf_counter()
+    sampler.start()
+    try:
+        run()
+    finally:
+        stop.set()
+        sampler.join()
+        elapsed = time.perf_counter() - started
+
+        payload = {
+            'mode': 'flame',
+            'interval_ms': interval_ms,
+            'samples': sum(counts.values()),
+            'elapsed': round(elapsed, 6),
+            'folded': [f"{';'.join(stack)} {count}" for stack, count in counts.most_common(500)]
+        }
+        payload.update(_flame_tree(counts))
+        emit_profile(payload)
+
+def run_profiled(mode: str, options: Dict[str, Any], run: Callable[[], Any], code: str, global_ns: dict, local_ns: dict):
+    """매직 모드에 맞춰 셀 실행 (결과 페이로드는 표준 출력 마커로 전달)"""
+    if mode == 'prun':
+        profile_deterministic(run, **options)
+    elif mode == 'timeit':
+        time_repeated(code, global_ns, local_ns, **options)
+    elif mode == 'flame':
+        profile_sampling(run, **options)
@@ -0,0 +1,419 @@
+"""
+Chart Session
+출력(차트)별 Plotly 피겨 상태를 서버에 보관하고, 바뀐 부분만 델타로 전송
+
+프로토콜 (SocketIO):
+    chart_figure  {chart_id, version, figure}               → Plotly.react (처음/재동기화)
+    chart_delta   {chart_id, version, op, ...}              → op별 Plotly 호출
+        extend        traces, update{속성: [[트레이스별 새 값]]}, max_points → Plotly.extendTraces
+        replace_last  traces, update{속성: [트레이스별 값]}                → 마지막 점 교체 후 Plotly.redraw
+        truncate      traces, count                                       → 끝의 x/y 점 count개 제거 후 Plotly.redraw
+        restyle       traces, update                                      → Plotly.restyle
+        relayout      update                                              → Plotly.relayout
+        add_traces    traces[트레이스 dict]                                → Plotly.addTraces
+        delete_traces traces[인덱스]                                       → Plotly.deleteTraces
+    chart_closed  {chart_id}                                 (닫기/오래 쓰지 않은 세션 정리)
+
+merge(x 기준 병합), overlay(지표 트레이스 추가/병합), candles(OHLCV 행 → 피겨의 캔들 표현에 맞춘 merge)는
+서버 쪽 연산이며 위 델타로 바뀌어 전송됩니다.
+
+선분 트레이스(WebGL 캔들처럼 x, x, None을 반복하는 트레이스)는 merge에 {x, start, end}를 넘기면
+캔들 하나를 선분 하나로 병합합니다 (start/end가 None이면 해당 x의 선분을 지움).
+
+version은 차트마다 1씩 증가하며, 클라이언트는 빠진 버전이 있으면 chart_resync로 전체 피겨를 다시 받습니다.
+전송량은 피겨 전체가 아니라 바뀐 점/속성 크기에 비례합니다.
+"""
+
+import base64
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TraceRef = Union[int, str]
+
+def to_plotly_values(values) -> list:
+    """Series/배열/리스트 → JSON 직렬화 가능한 리스트 (시각은 ISO 문자열, NaN은 None)"""
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy()
+    array = np.asarray(values)
+    if array.dtype.kind == 'M':
+        return [None if pd.isna(v) else pd.Timestamp(v).isoformat() for v in array]
+    if array.dtype.kind == 'f':
+        return [None if v != v else v for v in array.tolist()]
+    if array.dtype.kind == 'O':
+        return [
+            None if v is None or (isinstance(v, float) and v != v)
+            else v.isoformat() if isinstance(v, (datetime, date, pd.Timestamp)) else v
+            for v in array.tolist()
+        ]
+    return array.tolist()
+
+def _decode_typed_arrays(value):
+    """plotly 6 to_json의 {dtype, bdata} 배열을 리스트로 (델타를 이어 붙일 수 있게)"""
+    if isinstance(value, dict):
+        if 'bdata' in value and 'dtype' in value:
+            array = np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype'])
+            if 'shape' in value:
+                shape = value['shape']
+                array = array.reshape([int(s) for s in shape.split(',')] if isinstance(shape, str) else shape)
+            return array.tolist()
+        return {k: _decode_typed_arrays(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_typed_arrays(v) for v in value]
+    return value
+
+def _get_path(trace: Dict[str, Any], path: str, default=None):
+    node = trace
+    for key in path.split('.'):
+        if not isinstance(node, dict) or key not in node:
+            return default
+        node = node[key]
+    return node
+
+def _set_path(trace: Dict[str, Any], path: str, value):
+    keys = path.split('.')
+    node = trace
+    for key in keys[:-1]:
+        node = node.setdefault(key, {})
+    node[keys[-1]] = value
+
+def _x_key(value):
+    """x 값 비교용 키 (시각 문자열은 epoch ms로 바꿔 형식 차이와 숫자 x(대용량 트레이스)를 함께 비교)"""
+    if isinstance(value, str):
+        try:
+            return pd.Timestamp(value).value // 1_000_000
+        except ValueError:
+            return value
+    return value
+
+class ChartSession:
+    """차트 하나의 피겨 상태와 버전"""
+
+    def __init__(self, chart_id: str, figure: Dict[str, Any], max_points: Optional[int] = None):
+        """
+        Args:
+            chart_id: 차트 ID (출력/스트림 단위)
+            figure: Plotly 피겨 dict (fig.to_json 결과 등)
+            max_points: 트레이스별 최대 점 수 (extend 시 앞쪽을 버림, None이면 제한 없음)
+        """
+        figure = _decode_typed_arrays(figure)
+        self.chart_id = chart_id
+        self.figure = {'data': list(figure.get('data', [])), 'layout': figure.get('layout', {})}
+        self.max_points = max_points
+        self.version = 0
+        self.lock = threading.RLock()
+
+    @property
+    def traces(self) -> List[Dict[str, Any]]:
+        return self.figure['data']
+
+    def trace_index(self, ref: TraceRef) -> int:
+        """인덱스 또는 트레이스 name → 인덱스"""
+        if isinstance(ref, (int, np.integer)):
+            if not 0 <= ref < len(self.traces):
+                raise ValueError(f"트레이스 인덱스 범위 밖: {ref} (트레이스 {len(self.traces)}개)")
+            return int(ref)
+        for i, trace in enumerate(self.traces):
+            if trace.get('name') == ref:
+                return i
+        # JSON 객체 키로 온 인덱스 ("0")
+        if isinstance(ref, str) and ref.isdigit():
+            return self.trace_index(int(ref))
+        raise ValueError(f"트레이스를 찾을 수 없습니다: {ref}")
+
+    @property
+    def candle_options(self) -> Dict[str, Any]:
+        """피겨를 만들 때 정해진 캔들 표현 (layout.meta['candles'], VisualizationService.candle_points 인자)"""
+        meta = self.figure['layout'].get('meta')
+        options = meta.get('candles') if isinstance(meta, dict) else None
+        return dict(options) if isinstance(options, dict) else {}
+
+    def has_trace(self, name: str) -> bool:
+        return any(trace.get('name') == name for trace in self.traces)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'chart_id': self.chart_id, 'version': self.version, 'figure': self.figure}
+
+    def _delta(self, op: str, **fields) -> Dict[str, Any]:
+        self.version += 1
+        return {'chart_id': self.chart_id, 'version': self.version, 'op': op, **fields}
+
+    # 델타 생성 (상태를 먼저 바꾸고 같은 내용을 메시지로 반환)
+
+    def extend(self, points: Dict[TraceRef, Dict[str, Sequence]], max_points: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        트레이스 끝에 점 추가 (Plotly.extendTraces)
+
+        Args:
+            points: {트레이스: {속성 경로: 새 값들}} (예: {0: {'x': [...], 'close': [...]}})
+            max_points: 이번 호출의 최대 점 수 (생략 시 세션 기본값)
+        """
+        max_points = max_points or self.max_points
+        # extendTraces는 한 번에 같은 속성 집합만 받으므로 속성 집합별로 나눔
+        groups: Dict[tuple, List[tuple]] = {}
+        for ref, columns in points.items():
+            columns = {attr: to_plotly_values(values) for attr, values in columns.items()}
+            if not columns or not len(next(iter(columns.values()))):
+                continue
+            groups.setdefault(tuple(sorted(columns)), []).append((self.trace_index(ref), columns))
+
+        deltas = []
+        for attrs, items in groups.items():
+            for index, columns in items:
+                trace = self.traces[index]
+                for attr, values in columns.items():
+                    merged = list(_get_path(trace, attr, None) or []) + values
+                    _set_path(trace, attr, merged[-max_points:] if max_points else merged)
+            deltas.append(self._delta(
+                'extend',
+                traces=[index for index, _ in items],
+                update={attr: [columns[attr] for _, columns in items] for attr in attrs},
+                max_points=max_points
+            ))
+        return deltas
+
+    def replace_last(self, points: Dict[TraceRef, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """트레이스 마지막 점의 값 교체 (마감 전 캔들 갱신 등)"""
+        groups: Dict[tuple, List[tuple]] = {}
+        for ref, values in points.items():
+            index = self.trace_index(ref)
+            trace = self.traces[index]
+            values = {attr: to_plotly_values([value])[0] for attr, value in values.items()}
+            for attr, value in values.items():
+                current = _get_path(trace, attr)
+                if not current:
+                    raise ValueError(f"교체할 점이 없습니다: {ref}.{attr}")
+                current[-1] = value
+            if values:
+                groups.setdefault(tuple(sorted(values)), []).append((index, values))
+        return [
+            self._delta(
+                'replace_last',
+                traces=[index for index, _ in items],
+                update={attr: [values[attr] for _, values in items] for attr in attrs}
+            )
+            for attrs, items in groups.items()
+        ]
+
+    def truncate(self, points: Dict[TraceRef, int]) -> List[Dict[str, Any]]:
+        """트레이스 끝의 x/y 점 제거 ({트레이스: 개수}, 선분 트레이스의 마지막 선분 교체 등)"""
+        groups: Dict[int, List[int]] = {}
+        for ref, count in points.items():
+            index = self.trace_index(ref)
+            if count <= 0:
+                continue
+            for attr in ('x', 'y'):
+                values = self.traces[index].get(attr)
+                if values:
+                    del values[-count:]
+            groups.setdefault(int(count), []).append(index)
+        return [self._delta('truncate', traces=indices, count=count) for count, indices in groups.items()]
+
+    def _segment_tail(self, index: int, columns: Dict[str, list]) -> tuple:
+        """선분 트레이스 병합: (끝에서 지울 점 수, 추가할 {x, y})"""
+        existing = _get_path(self.traces[index], 'x') or []
+        last = next((_x_key(x) for x in reversed(existing) if x is not None), None)
+        drop, x, y = 0, [], []
+        for value, start, end in zip(columns['x'], columns['start'], columns['end']):
+            key = _x_key(value)
+            if last is not None and key < last:
+                continue
+            if key == last:
+                # 마지막 선분(x, x, None)은 지우고 새 값으로 다시 추가 (방향이 바뀌었으면 지우기만)
+                drop = 3
+            if start is not None and end is not None:
+                x += [value, value, None]
+                y += [start, end, None]
+        return drop, {'x': x, 'y': y}
+
+    def merge(self, points: Dict[TraceRef, Dict[str, Sequence]], max_points: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        x 기준으로 새 점 병합: 마지막 점 이전 x는 버리고, 같은 x는 교체, 이후 x는 추가
+
+        실시간 캔들(마감 전 갱신 → 마감 → 다음 캔들)이나 다시 계산한 지표 꼬리를 그대로 넘기면 됩니다.
+        {x, start, end}를 넘긴 트레이스는 선분 트레이스로 병합하며, max_points는 선분 수로 셉니다.
+        """
+        replace, extend, drop, segments = {}, {}, {}, {}
+        for ref, columns in points.items():
+            index = self.trace_index(ref)
+            if 'x' not in columns:
+                raise ValueError(f"merge에는 x 값이 필요합니다: {ref}")
+            columns = {attr: to_plotly_values(values) for attr, values in columns.items()}
+            if 'start' in columns or 'end' in columns:
+                drop[index], tail = self._segment_tail(index, columns)
+                if tail['x']:
+                    segments[index] = tail
+                continue
+            existing = _get_path(self.traces[index], 'x') or []
+            last = _x_key(existing[-1]) if existing else None
+            keys = [_x_key(x) for x in columns['x']]
+            start = 0
+            if last is not None:
+                while start < len(keys) and keys[start] < last:
+                    start += 1
+                if start < len(keys) and keys[start] == last:
+                    replace[index] = {attr: values[start] for attr, values in columns.items() if attr != 'x'}
+                    start += 1
+            if start < len(keys):
+                extend[index] = {attr: values[start:] for attr, values in columns.items()}
+        deltas = self.replace_last(replace) if replace else []
+        deltas += self.extend(extend, max_points) if extend else []
+        if any(drop.values()):
+            deltas += self.truncate(drop)
+        if segments:
+            max_points = max_points or self.max_points
+            deltas += self.extend(segments, max_points * 3 if max_points else None)
+        return deltas
+
+    def candles(self, candles: Dict[str, Sequence], candle_points: Callable[..., Dict[TraceRef, Dict[str, Sequence]]],
+                max_points: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        OHLCV 행을 피겨의 캔들 표현(candle_options)에 맞는 점으로 바꿔 merge
+
+        Args:
+            candles: {'x': 시각(ISO 문자열 또는 epoch ms), 'open', 'high', 'low', 'close', 'volume': 값들}
+            candle_points: (DataFrame, **candle_options) → merge 입력 (VisualizationService.candle_points)
+            max_points: merge와 같음
+        """
+        if 'x' not in candles:
+            raise ValueError("candles에는 x 값이 필요합니다")
+        columns = {key: values for key, values in candles.items() if key != 'x'}
+        x = pd.Index(candles['x'])
+        index = pd.to_datetime(x, unit='ms') if x.dtype.kind in 'iuf' else pd.to_datetime(x)
+        data = pd.DataFrame(columns, index=index.rename('timestamp'))
+        return self.merge(candle_points(data, **self.candle_options), max_points)
+
+    def restyle(self, update: Dict[str, Any], traces: Optional[Sequence[TraceRef]] = None) -> List[Dict[str, Any]]:
+        """트레이스 속성 변경 (Plotly.restyle과 같이 리스트 값은 트레이스별 값)"""
+        indices = [self.trace_index(ref) for ref in traces] if traces is not None else list(range(len(self.traces)))
+        for position, index in enumerate(indices):
+            for attr, value in update.items():
+                _set_path(self.traces[index], attr, value[position % len(value)] if isinstance(value, list) else value)
+        return [self._delta('restyle', traces=indices, update=update)]
+
+    def relayout(self, update: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """레이아웃 변경 (Plotly.relayout)"""
+        for attr, value in update.items():
+            _set_path(self.figure['layout'], attr, value)
+        return [self._delta('relayout', update=update)]
+
+    def add_traces(self, traces: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """트레이스 추가 (지표 오버레이 등, Plotly.addTraces)"""
+        traces = [_decode_typed_arrays(trace) for trace in traces]
+        self.traces.extend(traces)
+        return [self._delta('add_traces', traces=traces)]
+
+    def overlay(self, trace: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """같은 이름의 트레이스가 있으면 x/y를 merge, 없으면 add_traces (지표 오버레이 갱신)"""
+        name = trace.get('name')
+        if name is None or not self.has_trace(name):
+            return self.add_traces([trace])
+        return self.merge({name: {'x': trace['x'], 'y': trace['y']}})
+
+    def delete_traces(self, traces: Sequence[TraceRef]) -> List[Dict[str, Any]]:
+        """트레이스 삭제 (Plotly.deleteTraces)"""
+        indices = sorted({self.trace_index(ref) for ref in traces}, reverse=True)
+        for index in indices:
+            del self.traces[index]
+        return [self._delta('delete_traces', traces=indices)]
+
+class ChartSessionManager:
+    """차트 세션 모음 (열기/델타 적용/재동기화, emit으로 클라이언트에 전송)"""
+
+    OPERATIONS = ('extend', 'replace_last', 'truncate', 'merge', 'candles', 'restyle', 'relayout',
+                  'add_traces', 'overlay', 'delete_traces')
+
+    def __init__(self, emit: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                 candle_points: Optional[Callable[..., Dict[TraceRef, Dict[str, Sequence]]]] = None,
+                 max_sessions: int = 64):
+        """
+        Args:
+            emit: (이벤트 이름, 메시지) 전송 함수 (예: socketio.emit), 없으면 메시지만 반환
+            candle_points: candles 연산의 OHLCV → 점 변환 (VisualizationService().candle_points)
+            max_sessions: 보관할 최대 세션 수 (넘으면 가장 오래 쓰지 않은 세션부터 닫음)
+        """
+        self.emit = emit
+        self.candle_points = candle_points
+        self.max_sessions = max(1, int(max_sessions))
+        # 최근 사용 순서 (열기/델타/스냅샷 시 끝으로 이동)
+        self._sessions: 'OrderedDict[str, ChartSession]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _send(self, event: str, message: Dict[str, Any]):
+        if self.emit is None:
+            return
+        try:
+            self.emit(event, message)
+        except Exception as e:
+            logger.error(f"차트 {event} 전송 실패: {e}")
+
+    def get(self, chart_id: str) -> Optional[ChartSession]:
+        with self._lock:
+            session = self._sessions.get(chart_id)
+            if session is not None:
+                self._sessions.move_to_end(chart_id)
+            return session
+
+    def ids(self) -> List[str]:
+        with self._lock:
+            return list(self._sessions)
+
+    def open(self, chart_id: str, figure: Dict[str, Any], max_points: Optional[int] = None) -> Dict[str, Any]:
+        """차트를 열거나 피겨 전체를 교체하고 chart_figure 전송 (버전은 이어서 증가)"""
+        session = ChartSession(chart_id, figure, max_points)
+        with self._lock:
+            previous = self._sessions.pop(chart_id, None)
+            if previous is not None:
+                session.version = previous.version + 1
+            self._sessions[chart_id] = session
+            evicted = []
+            while len(self._sessions) > self.max_sessions:
+                evicted.append(self._sessions.popitem(last=False)[0])
+        for evicted_id in evicted:
+            logger.info(f"차트 세션 정리 (최대 {self.max_sessions}개): {evicted_id}")
+            self._send('chart_closed', {'chart_id': evicted_id})
+        with session.lock:
+            message = session.snapshot()
+            self._send('chart_figure', message)
+        return message
+
+    def apply(self, chart_id: str, op: str, **kwargs) -> List[Dict[str, Any]]:
+        """델타 연산 적용 후 chart_delta 전송 (op: OPERATIONS 중 하나, 인자는 같은 이름의 ChartSession 메서드)"""
+        if op not in self.OPERATIONS:
+            raise ValueError(f"지원하지 않는 차트 연산: {op} (사용 가능: {', '.join(self.OPERATIONS)})")
+        session = self.get(chart_id)
+        if session is None:
+            raise KeyError(f"열린 차트가 없습니다: {chart_id}")
+        if op == 'candles':
+            if self.candle_points is None:
+                raise ValueError("candles 연산에 필요한 candle_points 변환 함수가 없습니다")
+            kwargs['candle_points'] = self.candle_points
+        # 버전 순서와 전송 순서가 같도록 세션 잠금 안에서 전송
+        with session.lock:
+            deltas = getattr(session, op)(**kwargs)
+            for delta in deltas:
+                self._send('chart_delta', delta)
+        return deltas
+
+    def snapshot(self, chart_id: str) -> Optional[Dict[str, Any]]:
+        session = self.get(chart_id)
+        if session is None:
+            return None
+        with session.lock:
+            # 잠금 밖에서 직렬화해도 바뀌지 않도록 복사
+            return json.loads(json.dumps(session.snapshot()))
+
+    def close(self, chart_id: str) -> bool:
+        with self._lock:
+            closed = self._sessions.pop(chart_id, None) is not None
+        if closed:
+            self._send('chart_closed', {'chart_id': chart_id})
+        return closed
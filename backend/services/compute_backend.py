@@ -0,0 +1,149 @@
+"""
+Compute Backend
+컬럼 연산(롤링/EWM 윈도우, 상관계수) 실행 백엔드 선택
+
+기본은 pandas이고, polars가 설치되어 있으면 세션별로 polars 백엔드를 선택할 수 있습니다.
+입력과 결과는 항상 pandas 객체이며 경계에서만 변환합니다. float64 numpy 배열은 복사 없이
+polars Series로 감싸고(NaN이 있으면 null 변환을 위해 한 번 복사), 여러 롤링 연산은 하나의
+LazyFrame으로 묶어 polars 스레드 풀에서 함께 실행합니다.
+
+    JUPPELIN_COMPUTE_BACKEND=polars   # 프로세스 기본값 (셀에서는 set_compute_backend)
+"""
+
+import os
+from typing import Optional, Dict, Any, List, Tuple, Sequence
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ROLLING_AGGREGATIONS = ('mean', 'std', 'min', 'max', 'sum')
+
+class PandasBackend:
+    """pandas 구현 (기본값, 기존 계산과 동일)"""
+
+    name = 'pandas'
+
+    def rolling(self, data: pd.Series, window: int, aggregation: str) -> pd.Series:
+        """롤링 윈도우 집계 (min_periods=window)"""
+        return getattr(data.rolling(window=window), aggregation)()
+
+    def rolling_many(self, specs: Sequence[Tuple[pd.Series, int, str]]) -> List[pd.Series]:
+        """(Series, window, 집계) 목록을 한 번에 계산"""
+        return [self.rolling(data, window, aggregation) for data, window, aggregation in specs]
+
+    def ewm_mean(self, data: pd.Series, span: Optional[float] = None, alpha: Optional[float] = None) -> pd.Series:
+        """지수 가중 이동평균 (adjust=True)"""
+        return data.ewm(span=span, alpha=alpha).mean()
+
+    def corr(self, data: pd.DataFrame) -> pd.DataFrame:
+        """숫자형 컬럼 피어슨 상관계수 행렬"""
+        return data.corr()
+
+class PolarsBackend(PandasBackend):
+    """polars 구현 (멀티스레드, NaN은 null로 바꿔 pandas의 결측 처리와 맞춤)"""
+
+    name = 'polars'
+
+    def __init__(self):
+        import polars
+        self.pl = polars
+
+    def _series(self, data: pd.Series, name: str = 'x'):
+        values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+        # NaN이 없으면 numpy 버퍼를 그대로 사용
+        return self.pl.Series(name, values, nan_to_null=bool(np.isnan(values).any()))
+
+    @staticmethod
+    def _pandas(values, index: pd.Index, name) -> pd.Series:
+        return pd.Series(values, index=index, name=name)
+
+    def _expression(self, column: str, window: int, aggregation: str):
+        if aggregation not in ROLLING_AGGREGATIONS:
+            raise ValueError(f"지원하지 않는 롤링 집계: {aggregation}")
+        expr = self.pl.col(column)
+        return getattr(expr, f"rolling_{aggregation}")(window_size=window, min_samples=window)
+
+    def rolling(self, data: pd.Series, window: int, aggregation: str) -> pd.Series:
+        return self.rolling_many([(data, window, aggregation)])[0]
+
+    def rolling_many(self, specs: Sequence[Tuple[pd.Series, int, str]]) -> List[pd.Series]:
+        pl = self.pl
+        # 같은 Series는 한 번만 변환
+        inputs: Dict[int, str] = {}
+        columns = {}
+        for data, _, _ in specs:
+            if id(data) not in inputs:
+                inputs[id(data)] = f"c{len(inputs)}"
+                columns[inputs[id(data)]] = self._series(data, inputs[id(data)])
+
+        lazy = pl.DataFrame(columns).lazy()
+        result = lazy.select([
+            self._expression(inputs[id(data)], window, aggregation).alias(f"r{i}")
+            for i, (data, window, aggregation) in enumerate(specs)
+        ]).collect()
+        return [
+            self._pandas(result[f"r{i}"].to_numpy(), data.index, data.name)
+            for i, (data, _, _) in enumerate(specs)
+        ]
+
+    def ewm_mean(self, data: pd.Series, span: Optional[float] = None, alpha: Optional[float] = None) -> pd.Series:
+        series = self._series(data)
+        # pandas는 결측 위치에 직전 평균을 채움
+        result = series.ewm_mean(span=span, alpha=alpha, adjust=True, min_samples=1, ignore_nulls=False).forward_fill()
+        return self._pandas(result.to_numpy(), data.index, data.name)
+
+    def corr(self, data: pd.DataFrame) -> pd.DataFrame:
+        # polars corr는 결측을 쌍별로 제외하지 않으므로 결측이 있으면 pandas로 계산
+        if data.isna().to_numpy().any() or data.shape[1] < 2:
+            return super().corr(data)
+        frame = self.pl.DataFrame({str(i): data[c].to_numpy(dtype=np.float64) for i, c in enumerate(data.columns)})
+        return pd.DataFrame(frame.corr().to_numpy(), index=data.columns, columns=data.columns)
+
+_BACKENDS = {'pandas': PandasBackend, 'polars': PolarsBackend}
+
+_backend = None
+
+def available_backends() -> Dict[str, bool]:
+    """백엔드별 사용 가능 여부"""
+    result = {}
+    for name, cls in _BACKENDS.items():
+        try:
+            cls()
+            result[name] = True
+        except ImportError:
+            result[name] = False
+    return result
+
+def set_backend(name: str):
+    """
+    현재 프로세스(노트북 세션)의 연산 백엔드 변경
+
+    Returns:
+        새 백엔드 인스턴스
+    """
+    global _backend
+    key = (name or 'pandas').lower()
+    if key not in _BACKENDS:
+        raise ValueError(f"지원하지 않는 연산 백엔드: {name} (사용 가능: {', '.join(_BACKENDS)})")
+    try:
+        _backend = _BACKENDS[key]()
+    except ImportError:
+        raise ImportError(f"{key} 백엔드에는 {key} 패키지가 필요합니다 (pip install {key})")
+    return _backend
+
+def get_backend():
+    """현재 연산 백엔드 (처음에는 JUPPELIN_COMPUTE_BACKEND, 없으면 pandas)"""
+    if _backend is None:
+        try:
+            set_backend(os.getenv('JUPPELIN_COMPUTE_BACKEND', 'pandas'))
+        except (ImportError, ValueError) as e:
+            logger.warning(f"연산 백엔드 설정 무시, pandas 사용: {e}")
+            set_backend('pandas')
+    return _backend
+
+def session_settings() -> Dict[str, Any]:
+    """다음 셀 실행에 이어 줄 설정 (execute_with_result가 실행 지표와 함께 전달)"""
+    return {'compute_backend': get_backend().name}
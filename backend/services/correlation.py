@@ -0,0 +1,377 @@
+"""
+Correlation Service
+여러 심볼 수익률의 상관계수 행렬 / 롤링 상관계수 / 상위 상관 쌍 계산
+
+전체 행렬은 컬럼 블록(타일)끼리의 행렬 곱으로 쌍별 결측을 제외한 합(n, Σx, Σy, Σx², Σy², Σxy)을
+한 번에 구하고, 롤링 상관계수는 같은 합을 누적합 차이로 구해 윈도우마다 다시 계산하지 않습니다.
+큰 유니버스(N개 심볼)는 block_size 단위 타일로 나눠 계산하므로 N×N 행렬 외에 T×N 크기의 곱
+배열을 통째로 만들지 않고, top_pairs는 타일마다 후보만 남겨 N×N 행렬도 만들지 않습니다.
+
+Spearman은 컬럼별 순위(동률은 평균 순위)의 Pearson 상관계수입니다. 결측이 있으면 pandas와 달리
+쌍마다 다시 순위를 매기지 않고 컬럼 전체 순위를 사용합니다.
+"""
+
+import heapq
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+METHODS = ('pearson', 'spearman')
+
+# 타일 한 변의 컬럼 수 (T×블록 곱 배열 크기 제한)
+DEFAULT_BLOCK_SIZE = 256
+
+# 누적합을 이 행 수마다 새로 시작해 긴 시계열에서 부동소수점 오차가 쌓이지 않게 함
+WINDOW_CHUNK_ROWS = 65_536
+
+# 롤링 Spearman에서 한 번에 순위를 매기는 (윈도우 수 × 컬럼 수 × 윈도우 길이) 원소 수
+RANK_BLOCK_ELEMENTS = 4_000_000
+
+# 분산이 Σx² 대비 이보다 작으면 상수 컬럼으로 보고 NaN (pandas와 동일하게)
+VARIANCE_EPSILON = 1e-12
+
+def _check_method(method: str) -> str:
+    method = (method or 'pearson').lower()
+    if method not in METHODS:
+        raise ValueError(f"지원하지 않는 상관계수 방식: {method} (사용 가능: {', '.join(METHODS)})")
+    return method
+
+def price_panel(
+    frames: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+    column: str = 'close'
+) -> pd.DataFrame:
+    """
+    심볼별 OHLCV → 심볼을 컬럼으로 하는 가격 패널
+
+    Args:
+        frames: {심볼: OHLCV DataFrame} 또는 이미 심볼별 컬럼인 DataFrame
+        column: 사용할 가격 컬럼 (기본값: 'close')
+    """
+    if isinstance(frames, pd.DataFrame):
+        return frames.select_dtypes(include=[np.number])
+    panel = pd.concat({symbol: frame[column] for symbol, frame in frames.items()}, axis=1, sort=True)
+    return panel.astype(np.float64)
+
+def log_returns(prices: Union[pd.DataFrame, Dict[str, pd.DataFrame]], periods: int = 1) -> pd.DataFrame:
+    """
+    로그 수익률 ln(p_t / p_{t-periods}) (0 이하 가격은 결측, 첫 periods 행 제외)
+
+    Args:
+        prices: 심볼별 가격 컬럼 DataFrame 또는 {심볼: OHLCV DataFrame}
+        periods: 수익률 간격 (봉 수)
+    """
+    panel = price_panel(prices)
+    values = panel.to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        logs = np.log(np.where(values > 0, values, np.nan))
+    result = np.full_like(logs, np.nan)
+    result[periods:] = logs[periods:] - logs[:-periods]
+    return pd.DataFrame(result[periods:], index=panel.index[periods:], columns=panel.columns)
+
+def _ranks(values: np.ndarray, axis: int = 0) -> np.ndarray:
+    """axis 방향 평균 순위 (1부터, 동률은 평균, NaN은 NaN 유지)"""
+    values = np.moveaxis(values, axis, -1)
+    length = values.shape[-1]
+    order = np.argsort(values, axis=-1, kind='stable')
+    ordered = np.take_along_axis(values, order, axis=-1)
+
+    positions = np.broadcast_to(np.arange(length), ordered.shape)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[..., 1:] = ordered[..., 1:] != ordered[..., :-1]
+    ends = np.ones(ordered.shape, dtype=bool)
+    ends[..., :-1] = starts[..., 1:]
+    # 동률 구간의 첫/마지막 위치를 각 원소로 전파
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=-1)
+    last = np.flip(np.minimum.accumulate(np.flip(np.where(ends, positions, length), axis=-1), axis=-1), axis=-1)
+
+    ranks = np.empty(ordered.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=-1)
+    ranks[np.isnan(values)] = np.nan
+    return np.moveaxis(ranks, -1, axis)
+
+def _prepare(returns: pd.DataFrame, method: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(결측을 0으로 둔 중심화 값, 유효 마스크) - 공분산은 평행 이동과 무관하므로 평균을 빼 정밀도 확보"""
+    values = returns.to_numpy(dtype=np.float64)
+    if method == 'spearman':
+        values = _ranks(values)
+    valid = ~np.isnan(values)
+    means = np.where(valid, values, 0.0).sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+    centered = np.where(valid, values - means, 0.0)
+    return centered, valid
+
+def _pearson_from_sums(n, sx, sy, sxx, syy, sxy, min_periods: int) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        cov = sxy - sx * sy / n
+        result = cov / np.sqrt(var_x * var_y)
+    degenerate = (var_x <= VARIANCE_EPSILON * sxx) | (var_y <= VARIANCE_EPSILON * syy)
+    result[(n < max(min_periods, 2)) | degenerate] = np.nan
+    return np.clip(result, -1.0, 1.0, out=result)
+
+def _tile(centered, valid, rows: slice, cols: slice, min_periods: int, complete: bool) -> np.ndarray:
+    x, y = centered[:, rows], centered[:, cols]
+    if complete:
+        # 결측이 없으면 n과 합이 모든 쌍에서 같음
+        n = float(len(x))
+        sx, sy = x.sum(axis=0)[:, None], y.sum(axis=0)[None, :]
+        sxx, syy = (x * x).sum(axis=0)[:, None], (y * y).sum(axis=0)[None, :]
+        return _pearson_from_sums(
+            np.full((x.shape[1], y.shape[1]), n), sx, sy, sxx, syy, x.T @ y, min_periods
+        )
+    mx, my = valid[:, rows].astype(np.float64), valid[:, cols].astype(np.float64)
+    return _pearson_from_sums(
+        mx.T @ my,        # 쌍별 유효 행 수
+        x.T @ my,         # y도 유효한 행의 Σx
+        mx.T @ y,         # x도 유효한 행의 Σy
+        (x * x).T @ my,
+        mx.T @ (y * y),
+        x.T @ y,
+        min_periods
+    )
+
+def iter_correlation_tiles(
+    returns: pd.DataFrame,
+    method: str = 'pearson',
+    min_periods: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+    """
+    상관계수 행렬의 위쪽 삼각 타일을 차례로 생성 ((행 slice, 열 slice, 타일 배열))
+
+    행렬 전체를 만들지 않고 타일 단위로 소비할 때 사용합니다 (top_pairs 참고).
+    """
+    method = _check_method(method)
+    centered, valid = _prepare(returns, method)
+    complete = bool(valid.all())
+    count = centered.shape[1]
+    block_size = max(1, block_size)
+    for row_start in range(0, count, block_size):
+        rows = slice(row_start, min(row_start + block_size, count))
+        for col_start in range(row_start, count, block_size):
+            cols = slice(col_start, min(col_start + block_size, count))
+            yield rows, cols, _tile(centered, valid, rows, cols, min_periods, complete)
+
+def correlation_matrix(
+    returns: pd.DataFrame,
+    method: str = 'pearson',
+    min_periods: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> pd.DataFrame:
+    """
+    쌍별 결측을 제외한 상관계수 행렬 (DataFrame.corr와 같은 결과)
+
+    Args:
+        returns: 심볼별 수익률 컬럼 DataFrame (log_returns 결과 등)
+        method: 'pearson' 또는 'spearman'
+        min_periods: 쌍별 최소 유효 행 수
+        block_size: 타일 한 변의 컬럼 수
+    """
+    count = returns.shape[1]
+    matrix = np.empty((count, count), dtype=np.float64)
+    for rows, cols, tile in iter_correlation_tiles(returns, method, min_periods, block_size):
+        matrix[rows, cols] = tile
+        matrix[cols, rows] = tile.T
+    diagonal = np.diagonal(matrix)
+    np.fill_diagonal(matrix, np.where(np.isnan(diagonal), np.nan, 1.0))
+    return pd.DataFrame(matrix, index=returns.columns, columns=returns.columns)
+
+def top_pairs(
+    data: pd.DataFrame,
+    k: int = 10,
+    method: str = 'pearson',
+    absolute: bool = True,
+    ascending: bool = False,
+    min_periods: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    is_matrix: bool = False
+) -> pd.DataFrame:
+    """
+    상관계수 상위 k개 쌍 (자기 자신 제외)
+
+    Args:
+        data: 수익률 DataFrame (타일 단위로 계산) 또는 is_matrix=True면 상관계수 행렬
+        k: 쌍 개수
+        absolute: 절댓값 기준 순위 (음의 상관도 포함)
+        ascending: True면 가장 낮은(상관이 약한/음의) 쌍부터
+        is_matrix: data가 이미 상관계수 행렬인지
+
+    Returns:
+        symbol_a, symbol_b, correlation 컬럼 DataFrame
+    """
+    labels = list(data.columns)
+    if is_matrix:
+        tiles = [(slice(0, len(labels)), slice(0, len(labels)), data.to_numpy(dtype=np.float64))]
+    else:
+        tiles = iter_correlation_tiles(data, method, min_periods, block_size)
+
+    sign = 1.0 if ascending else -1.0
+    best: List[Tuple[float, int, int, float]] = []
+    for rows, cols, tile in tiles:
+        i, j = np.indices(tile.shape)
+        i, j = i.ravel() + rows.start, j.ravel() + cols.start
+        values = tile.ravel()
+        keep = (i < j) & ~np.isnan(values)
+        i, j, values = i[keep], j[keep], values[keep]
+        keys = sign * (np.abs(values) if absolute else values)
+        if len(keys) > k:
+            # 타일마다 후보 k개만 남김
+            candidates = np.argpartition(keys, k)[:k]
+            i, j, values, keys = i[candidates], j[candidates], values[candidates], keys[candidates]
+        best = heapq.nsmallest(k, best + list(zip(keys.tolist(), i.tolist(), j.tolist(), values.tolist())))
+
+    return pd.DataFrame(
+        [(labels[a], labels[b], value) for _, a, b, value in best],
+        columns=['symbol_a', 'symbol_b', 'correlation']
+    )
+
+def _window_sums(values: np.ndarray, window: int, chunk_rows: int = WINDOW_CHUNK_ROWS) -> np.ndarray:
+    """행 방향 윈도우 합 (앞쪽 window-1 행은 부분 합), chunk_rows마다 누적합을 새로 시작"""
+    total = len(values)
+    result = np.empty_like(values)
+    for start in range(0, total, chunk_rows):
+        stop = min(start + chunk_rows, total)
+        base = max(0, start - window + 1)
+        cumulative = np.zeros((stop - base + 1,) + values.shape[1:], dtype=values.dtype)
+        np.cumsum(values[base:stop], axis=0, out=cumulative[1:])
+        # 행 t의 합 = cumulative[t - base + 1] - cumulative[max(t - window + 1, 0) - base]
+        full = min(max(start, window - 1), stop)
+        result[start:full] = cumulative[start - base + 1:full - base + 1]
+        result[full:stop] = cumulative[full - base + 1:] - cumulative[full - window + 1 - base:stop - window + 1 - base]
+    return result
+
+def _resolve_pairs(columns: pd.Index, pairs: Optional[Sequence[Tuple[str, str]]]) -> Tuple[np.ndarray, np.ndarray]:
+    if pairs is None:
+        a, b = np.triu_indices(len(columns), k=1)
+        return a, b
+    positions = {column: i for i, column in enumerate(columns)}
+    missing = [symbol for pair in pairs for symbol in pair if symbol not in positions]
+    if missing:
+        raise KeyError(f"수익률에 없는 심볼: {sorted(set(missing))}")
+    return (np.array([positions[a] for a, _ in pairs], dtype=np.intp),
+            np.array([positions[b] for _, b in pairs], dtype=np.intp))
+
+def _rolling_pearson(centered, valid, a, b, window: int, min_periods: int, block_size: int) -> np.ndarray:
+    result = np.empty((len(centered), len(a)), dtype=np.float64)
+    complete = bool(valid.all())
+    if complete:
+        # 결측이 없으면 n, Σx, Σx²는 컬럼마다 한 번만 계산하고 쌍마다 Σxy만 구함
+        n = _window_sums(np.ones((len(centered), 1)), window)
+        sums, squares = _window_sums(centered, window), _window_sums(centered * centered, window)
+    for start in range(0, len(a), block_size):
+        block = slice(start, start + block_size)
+        ia, ib = a[block], b[block]
+        if complete:
+            result[:, block] = _pearson_from_sums(
+                n, sums[:, ia], sums[:, ib], squares[:, ia], squares[:, ib],
+                _window_sums(centered[:, ia] * centered[:, ib], window), min_periods
+            )
+            continue
+        both = (valid[:, ia] & valid[:, ib]).astype(np.float64)
+        x, y = centered[:, ia] * both, centered[:, ib] * both
+        result[:, block] = _pearson_from_sums(
+            _window_sums(both, window),
+            _window_sums(x, window),
+            _window_sums(y, window),
+            _window_sums(x * x, window),
+            _window_sums(y * y, window),
+            _window_sums(x * y, window),
+            min_periods
+        )
+    return result
+
+def _rolling_spearman(values: np.ndarray, a, b, window: int) -> np.ndarray:
+    """윈도우마다 순위를 다시 매긴 상관계수 (윈도우 안에 결측이 있으면 NaN)"""
+    total, count = values.shape
+    result = np.full((total, len(a)), np.nan)
+    if total < window:
+        return result
+    windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)  # (T-w+1, N, w)
+    step = max(1, RANK_BLOCK_ELEMENTS // max(1, count * window))
+    for start in range(0, len(windows), step):
+        ranks = _ranks(windows[start:start + step], axis=-1)
+        ranks -= ranks.mean(axis=-1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ranks /= np.sqrt((ranks * ranks).sum(axis=-1, keepdims=True))
+        rows = slice(start + window - 1, start + window - 1 + len(ranks))
+        # 쌍 인덱싱 복사본도 순위 블록 크기를 넘지 않도록 쌍을 N개씩 나눔
+        for pair_start in range(0, len(a), count):
+            pairs = slice(pair_start, pair_start + count)
+            result[rows, pairs] = np.einsum('tpw,tpw->tp', ranks[:, a[pairs]], ranks[:, b[pairs]])
+    return np.clip(result, -1.0, 1.0, out=result)
+
+def rolling_correlation(
+    returns: pd.DataFrame,
+    window: int,
+    method: str = 'pearson',
+    pairs: Optional[Sequence[Tuple[str, str]]] = None,
+    min_periods: Optional[int] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> pd.DataFrame:
+    """
+    쌍별 롤링 상관계수 (Pearson은 rolling(window).corr()와 같은 결과)
+
+    Pearson은 쌍마다 Σx, Σy, Σx², Σy², Σxy, n의 누적합 차이로 모든 윈도우를 한 번에 계산합니다.
+    Spearman은 윈도우마다 순위를 매기므로 더 느리고, 윈도우 안에 결측이 있으면 NaN입니다.
+
+    Args:
+        returns: 심볼별 수익률 컬럼 DataFrame
+        window: 윈도우 길이 (행 수)
+        method: 'pearson' 또는 'spearman'
+        pairs: [(심볼a, 심볼b), ...] (생략 시 모든 쌍, N(N-1)/2개 컬럼이므로 큰 N에서는 지정 권장)
+        min_periods: 윈도우 안 최소 유효 행 수 (기본값: window, Pearson만 적용)
+        block_size: 한 번에 계산할 쌍 개수
+
+    Returns:
+        (symbol_a, symbol_b) MultiIndex 컬럼 DataFrame
+    """
+    method = _check_method(method)
+    if window < 2:
+        raise ValueError(f"window는 2 이상이어야 합니다: {window}")
+    a, b = _resolve_pairs(returns.columns, pairs)
+
+    if method == 'pearson':
+        centered, valid = _prepare(returns, method)
+        values = _rolling_pearson(centered, valid, a, b, window, min_periods or window, max(1, block_size))
+    else:
+        values = _rolling_spearman(returns.to_numpy(dtype=np.float64), a, b, window)
+
+    columns = pd.MultiIndex.from_arrays(
+        [returns.columns[a], returns.columns[b]], names=['symbol_a', 'symbol_b']
+    )
+    logger.info(f"롤링 상관계수 계산 완료: {len(columns)}쌍 x {len(returns)}행 ({method}, window={window})")
+    return pd.DataFrame(values, index=returns.index, columns=columns)
+
+def cluster_order(matrix: pd.DataFrame) -> List:
+    """
+    비슷한 심볼끼리 모이도록 한 컬럼 순서 (히트맵 정렬용)
+
+    scipy가 있으면 1 - 상관계수 거리의 평균 연결 계층 군집 잎 순서, 없으면 유사도 행렬의
+    피들러 벡터(라플라시안 두 번째 고유벡터) 순서를 사용합니다.
+    """
+    labels = list(matrix.columns)
+    if len(labels) < 3:
+        return labels
+    similarity = np.nan_to_num(matrix.to_numpy(dtype=np.float64), nan=0.0)
+    try:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+        distance = np.clip(1.0 - similarity, 0.0, 2.0)
+        np.fill_diagonal(distance, 0.0)
+        order = leaves_list(linkage(squareform(distance, checks=False), method='average'))
+    except ImportError:
+        weights = (similarity + 1.0) / 2.0
+        np.fill_diagonal(weights, 0.0)
+        laplacian = np.diag(weights.sum(axis=1)) - weights
+        _, vectors = np.linalg.eigh(laplacian)
+        order = np.argsort(vectors[:, 1], kind='stable')
+    return [labels[i] for i in order]
+
+def reorder(matrix: pd.DataFrame, order: Optional[Sequence] = None) -> pd.DataFrame:
+    """상관계수 행렬 행/열을 같은 순서로 재배열 (order 생략 시 cluster_order)"""
+    order = list(order) if order is not None else cluster_order(matrix)
+    return matrix.loc[order, order]
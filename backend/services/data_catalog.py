@@ -0,0 +1,563 @@
+"""
+Data Catalog Service
+local_data 파일 메타데이터 SQLite 인덱스 (목록/기간/저장 용량 조회)
+"""
+
+import os
+import re
+import time
+import sqlite3
+import threading
+import contextlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# WAL/journal 파일 생성·삭제가 root 디렉토리 mtime을 바꾸지 않도록 별도 폴더에 둠
+CATALOG_DIR = '.catalog'
+CATALOG_FILENAME = 'catalog.sqlite3'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS data_files (
+    id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL,
+    file_path TEXT NOT NULL UNIQUE,
+    directory TEXT NOT NULL,
+    file_type TEXT,
+    symbol TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    interval TEXT,
+    file_size INTEGER NOT NULL,
+    modified REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    accessed REAL
+);
+CREATE INDEX IF NOT EXISTS idx_data_files_series ON data_files (symbol, interval, start_date, end_date);
+CREATE INDEX IF NOT EXISTS idx_data_files_filename ON data_files (filename);
+CREATE INDEX IF NOT EXISTS idx_data_files_directory ON data_files (directory);
+CREATE INDEX IF NOT EXISTS idx_data_files_modified ON data_files (modified);
+
+CREATE TABLE IF NOT EXISTS catalog_directories (
+    directory TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+# 디렉토리/심볼/파일 형식별 용량 합계 (data_files 변경 시 트리거로 증감, 조회는 합계 행만 읽음)
+TOTALS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS storage_totals (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    bytes INTEGER NOT NULL DEFAULT 0,
+    files INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (scope, key)
+);
+
+CREATE TRIGGER IF NOT EXISTS data_files_totals_insert AFTER INSERT ON data_files BEGIN
+    INSERT INTO storage_totals (scope, key, bytes, files) VALUES
+        ('directory', NEW.directory, NEW.file_size, 1),
+        ('symbol', COALESCE(NEW.symbol, ''), NEW.file_size, 1),
+        ('file_type', COALESCE(NEW.file_type, ''), NEW.file_size, 1)
+    ON CONFLICT (scope, key) DO UPDATE SET bytes = bytes + excluded.bytes, files = files + excluded.files;
+END;
+
+CREATE TRIGGER IF NOT EXISTS data_files_totals_delete AFTER DELETE ON data_files BEGIN
+    UPDATE storage_totals SET bytes = bytes - OLD.file_size, files = files - 1
+    WHERE (scope = 'directory' AND key = OLD.directory)
+       OR (scope = 'symbol' AND key = COALESCE(OLD.symbol, ''))
+       OR (scope = 'file_type' AND key = COALESCE(OLD.file_type, ''));
+END;
+
+CREATE TRIGGER IF NOT EXISTS data_files_totals_update AFTER UPDATE OF file_size, directory, symbol, file_type ON data_files BEGIN
+    UPDATE storage_totals SET bytes = bytes - OLD.file_size, files = files - 1
+    WHERE (scope = 'directory' AND key = OLD.directory)
+       OR (scope = 'symbol' AND key = COALESCE(OLD.symbol, ''))
+       OR (scope = 'file_type' AND key = COALESCE(OLD.file_type, ''));
+    INSERT INTO storage_totals (scope, key, bytes, files) VALUES
+        ('directory', NEW.directory, NEW.file_size, 1),
+        ('symbol', COALESCE(NEW.symbol, ''), NEW.file_size, 1),
+        ('file_type', COALESCE(NEW.file_type, ''), NEW.file_size, 1)
+    ON CONFLICT (scope, key) DO UPDATE SET bytes = bytes + excluded.bytes, files = files + excluded.files;
+END;
+"""
+
+REBUILD_TOTALS = """
+DELETE FROM storage_totals;
+INSERT INTO storage_totals (scope, key, bytes, files)
+    SELECT 'directory', directory, SUM(file_size), COUNT(*) FROM data_files GROUP BY directory;
+INSERT INTO storage_totals (scope, key, bytes, files)
+    SELECT 'symbol', COALESCE(symbol, ''), SUM(file_size), COUNT(*) FROM data_files GROUP BY COALESCE(symbol, '');
+INSERT INTO storage_totals (scope, key, bytes, files)
+    SELECT 'file_type', COALESCE(file_type, ''), SUM(file_size), COUNT(*) FROM data_files GROUP BY COALESCE(file_type, '');
+"""
+
+# 예: BTCUSDT_1h_2024-01-01_to_2024-01-31.csv, BTCUSDT_1m_stream.csv,
+#     BTCUSDT_1m_2024-01-01_to_2024-01-31__4h.csv (롤업), BTCUSDT-1m-2024-01.zip (아카이브)
+_SERIES_PATTERN = re.compile(
+    r'^(?P<symbol>[A-Z0-9]+)[_-](?P<interval>\d+[smhdwM])'
+    r'(?:[_-](?P<start>\d{4}-\d{2}(?:-\d{2})?)(?:_to_(?P<end>\d{4}-\d{2}-\d{2}))?)?'
+    r'(?:_[a-z]+)?(?:__(?P<rollup>\d+(?:mo|[smhdw]))(?:__[\w-]+)?)?$'
+)
+
+def parse_series_name(filename: str) -> Dict[str, Optional[str]]:
+    """파일명에서 심볼/간격/기간 추출 (형식이 다르면 값이 None)"""
+    match = _SERIES_PATTERN.match(Path(filename).stem)
+    if not match:
+        return {'symbol': None, 'interval': None, 'start_date': None, 'end_date': None}
+
+    interval = match['interval']
+    if match['rollup']:
+        interval = match['rollup'].replace('mo', 'M')
+    return {
+        'symbol': match['symbol'],
+        'interval': interval,
+        'start_date': match['start'],
+        'end_date': match['end'] or match['start']
+    }
+
+class DataCatalog:
+    """
+    local_data 아래 파일 메타데이터 인덱스
+
+    파일을 쓰는 서비스가 record()로 바로 갱신하고, 외부에서 추가/삭제된 파일은
+    reconcile()이 디렉토리 mtime이 바뀐 폴더만 다시 읽어 맞춥니다. 목록, 기간,
+    용량 조회는 파일 시스템을 순회하지 않고 인덱스에서 바로 답합니다.
+    """
+
+    # 같은 프로세스에서 여러 인스턴스가 만들어져도 스키마 생성/동기화는 공유
+    _initialized = set()
+    _last_reconcile: Dict[str, float] = {}
+    _reconcile_lock = threading.Lock()
+
+    def __init__(self, root: Union[str, Path] = 'local_data', db_path: Optional[Union[str, Path]] = None, reconcile_interval: float = 2.0):
+        """
+        Args:
+            root: 인덱싱할 최상위 디렉토리
+            db_path: 카탈로그 DB 경로 (기본값: root/.catalog/catalog.sqlite3)
+            reconcile_interval: 조회 시 자동 동기화 최소 간격(초)
+        """
+        self.root = Path(root)
+        self.db_path = Path(db_path) if db_path else self.root / CATALOG_DIR / CATALOG_FILENAME
+        self.reconcile_interval = reconcile_interval
+        # 쓰기 후 용량 제한 확인 (get_catalog가 환경 변수 설정으로 연결)
+        self.quota = None
+
+        key = str(self.db_path.resolve())
+        if key not in self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.executescript(SCHEMA)
+                columns = {r['name'] for r in conn.execute('PRAGMA table_info(data_files)')}
+                if 'accessed' not in columns:
+                    conn.execute('ALTER TABLE data_files ADD COLUMN accessed REAL')
+                has_totals = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'storage_totals'"
+                ).fetchone()
+                conn.executescript(TOTALS_SCHEMA)
+                if not has_totals:
+                    # 합계 테이블 이전에 만든 카탈로그는 한 번 전체 합산
+                    conn.executescript(REBUILD_TOTALS)
+            self._initialized.add(key)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # 연결은 작업마다 새로 열어 스레드/셀 실행 프로세스 간에 공유하지 않음
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _relative(self, path: Union[str, Path]) -> str:
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _row(self, relative: str, size: int, mtime: float, start: Optional[str] = None, end: Optional[str] = None) -> tuple:
+        name = relative.rsplit('/', 1)[-1]
+        directory = relative.rsplit('/', 1)[0] if '/' in relative else ''
+        series = parse_series_name(name)
+        return (
+            name, relative, directory, Path(name).suffix.lower().lstrip('.'),
+            series['symbol'], start or series['start_date'], end or series['end_date'], series['interval'],
+            size, mtime, datetime.now().isoformat()
+        )
+
+    _UPSERT = """
+        INSERT INTO data_files (filename, file_path, directory, file_type, symbol, start_date, end_date, interval, file_size, modified, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(file_path) DO UPDATE SET
+            file_size = excluded.file_size,
+            modified = excluded.modified,
+            start_date = CASE WHEN data_files.start_date IS NULL OR excluded.start_date < data_files.start_date
+                              THEN excluded.start_date ELSE data_files.start_date END,
+            end_date = CASE WHEN data_files.end_date IS NULL OR excluded.end_date > data_files.end_date
+                            THEN excluded.end_date ELSE data_files.end_date END
+    """
+
+    def record(self, path: Union[str, Path], start: Optional[str] = None, end: Optional[str] = None, append: bool = False):
+        """
+        파일 저장 직후 카탈로그 갱신
+
+        Args:
+            path: 저장한 파일 경로
+            start: 데이터 시작 시각 (생략 시 파일명의 기간)
+            end: 데이터 종료 시각
+            append: 기존 파일에 행을 추가한 경우 (기록된 기간을 넓히기만 함)
+        """
+        try:
+            stat = os.stat(path)
+            row = self._row(self._relative(path), stat.st_size, stat.st_mtime, start, end)
+            with self._connect() as conn:
+                if append:
+                    conn.execute(self._UPSERT, row)
+                else:
+                    conn.execute('DELETE FROM data_files WHERE file_path = ?', (row[1],))
+                    conn.execute(self._UPSERT, row)
+        except Exception as e:
+            # 카탈로그 실패가 데이터 저장을 막지 않도록 (다음 reconcile에서 복구)
+            logger.warning(f"카탈로그 갱신 실패: {path} ({e})")
+            return
+
+        if self.quota is not None:
+            self.quota.maybe_enforce()
+
+    def touch(self, path: Union[str, Path]):
+        """파일을 읽었음을 기록 (파생 데이터 LRU 정리 순서)"""
+        try:
+            with self._connect() as conn:
+                conn.execute('UPDATE data_files SET accessed = ? WHERE file_path = ?', (time.time(), self._relative(path)))
+        except Exception as e:
+            logger.warning(f"카탈로그 접근 기록 실패: {path} ({e})")
+
+    def forget(self, path: Union[str, Path]):
+        """삭제한 파일을 카탈로그에서 제거"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM data_files WHERE file_path = ?', (self._relative(path),))
+
+    def least_recently_used(self, directories: List[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        디렉토리(하위 포함) 파일을 마지막 접근(없으면 수정) 시각이 오래된 순으로 조회
+
+        Returns:
+            file_path, directory, filename, file_size, last_used 딕셔너리 리스트
+        """
+        conditions, params = [], []
+        for directory in directories:
+            conditions.append('(directory = ? OR directory LIKE ?)')
+            params.extend([directory, f"{directory}/%"])
+        if not conditions:
+            return []
+        query = (
+            'SELECT file_path, directory, filename, file_size, COALESCE(accessed, modified) AS last_used '
+            f"FROM data_files WHERE {' OR '.join(conditions)} ORDER BY last_used"
+        )
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        with self._connect() as conn:
+            return [dict(r) for r in conn.execute(query, params)]
+
+    def _scan_directory(self, conn, relative: str, known_dirs: Dict[str, int]) -> List[str]:
+        """디렉토리 하나를 다시 읽어 파일 행 갱신, 새로 발견한 하위 디렉토리 반환"""
+        path = self.root / relative if relative else self.root
+        prefix = f"{relative}/" if relative else ''
+        seen, rows, subdirs = set(), [], []
+
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if relative == '' and entry.name == CATALOG_DIR:
+                        continue
+                    child = f"{prefix}{entry.name}"
+                    if child not in known_dirs:
+                        subdirs.append(child)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    seen.add(f"{prefix}{entry.name}")
+                    rows.append(self._row(f"{prefix}{entry.name}", stat.st_size, stat.st_mtime))
+
+        conn.executemany(self._UPSERT, rows)
+        stored = [r[0] for r in conn.execute('SELECT file_path FROM data_files WHERE directory = ?', (relative,))]
+        removed = [(p,) for p in stored if p not in seen]
+        conn.executemany('DELETE FROM data_files WHERE file_path = ?', removed)
+        conn.execute(
+            'INSERT OR REPLACE INTO catalog_directories (directory, mtime_ns) VALUES (?, ?)',
+            (relative, os.stat(path).st_mtime_ns)
+        )
+        return subdirs
+
+    def reconcile(self, force: bool = False, full: bool = False) -> int:
+        """
+        파일 시스템과 카탈로그 동기화 (mtime이 바뀐 디렉토리만 다시 읽음)
+
+        디렉토리 mtime은 파일 추가/삭제/이름 변경 때만 바뀌므로 기존 파일을 제자리에서
+        수정한 경우는 record()로 반영합니다. full=True면 모든 디렉토리를 다시 읽습니다.
+
+        Args:
+            force: 자동 동기화 간격과 관계없이 실행
+            full: 모든 디렉토리 재스캔
+
+        Returns:
+            다시 읽은 디렉토리 수
+        """
+        key = str(self.db_path)
+        now = time.monotonic()
+        if not (force or full) and now - self._last_reconcile.get(key, float('-inf')) < self.reconcile_interval:
+            return 0
+
+        with self._reconcile_lock:
+            if not self.root.exists():
+                return 0
+
+            scanned = 0
+            with self._connect() as conn:
+                known = {r['directory']: r['mtime_ns'] for r in conn.execute('SELECT directory, mtime_ns FROM catalog_directories')}
+                queue = [] if known and not full else ['']
+
+                for directory, mtime_ns in known.items():
+                    path = self.root / directory if directory else self.root
+                    try:
+                        current = os.stat(path).st_mtime_ns
+                    except FileNotFoundError:
+                        conn.execute('DELETE FROM data_files WHERE directory = ?', (directory,))
+                        conn.execute('DELETE FROM catalog_directories WHERE directory = ?', (directory,))
+                        continue
+                    if full or current != mtime_ns:
+                        queue.append(directory)
+
+                queued = set(queue)
+                while queue:
+                    directory = queue.pop()
+                    try:
+                        subdirs = self._scan_directory(conn, directory, known if not full else {})
+                    except FileNotFoundError:
+                        continue
+                    scanned += 1
+                    for child in subdirs:
+                        if child not in queued:
+                            queued.add(child)
+                            queue.append(child)
+
+            self._last_reconcile[key] = time.monotonic()
+            if scanned:
+                logger.info(f"카탈로그 동기화: 디렉토리 {scanned}개 재스캔")
+            return scanned
+
+    def _directory_filter(self, directory: Union[str, Path]):
+        relative = self._relative(directory) if str(directory) not in ('', '.') else ''
+        if relative in ('', '.'):
+            return '', '1 = 1', []
+        return relative, '(directory = ? OR directory LIKE ?)', [relative, f"{relative}/%"]
+
+    def count_files(self, directory: Union[str, Path] = '', include_hidden: bool = False) -> int:
+        """디렉토리(하위 포함) 파일 수"""
+        self.reconcile()
+        _, condition, params = self._directory_filter(directory)
+        if not include_hidden:
+            condition += " AND filename NOT LIKE '.%'"
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM data_files WHERE {condition}", params).fetchone()[0]
+
+    def list_files(self, directory: Union[str, Path] = '', include_hidden: bool = False, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        디렉토리(하위 포함) 파일 목록, 최근 수정 순
+
+        Args:
+            directory: 디렉토리 경로
+            include_hidden: '.'으로 시작하는 파일 포함
+            limit: 최대 개수 (최근 수정 순)
+
+        Returns:
+            name, path(directory 기준 상대 경로), size, modified, extension 딕셔너리 리스트
+        """
+        self.reconcile()
+        relative, condition, params = self._directory_filter(directory)
+        if not include_hidden:
+            condition += " AND filename NOT LIKE '.%'"
+        query = f"SELECT filename, file_path, file_size, modified, file_type FROM data_files WHERE {condition} ORDER BY modified DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        offset = len(relative) + 1 if relative else 0
+        return [
+            {
+                'name': name,
+                'path': file_path[offset:],
+                'size': size,
+                'modified': datetime.fromtimestamp(modified).isoformat(),
+                'extension': f".{file_type}" if file_type else ''
+            }
+            for name, file_path, size, modified, file_type in rows
+        ]
+
+    def find(self, filename: str, directories: Optional[List[Union[str, Path]]] = None) -> Optional[Path]:
+        """
+        파일명으로 경로 조회
+
+        Args:
+            filename: 파일명
+            directories: 우선순위 순 디렉토리 목록 (생략 시 아무 위치)
+
+        Returns:
+            실제로 존재하는 파일 경로, 없으면 None
+        """
+        self.reconcile()
+        with self._connect() as conn:
+            rows = conn.execute('SELECT file_path, directory FROM data_files WHERE filename = ?', (Path(filename).name,)).fetchall()
+
+        if directories is not None:
+            order = {self._relative(d): i for i, d in enumerate(directories)}
+            rows = sorted((r for r in rows if r['directory'] in order), key=lambda r: order[r['directory']])
+
+        for row in rows:
+            path = self.root / row['file_path']
+            if path.exists():
+                return path
+        return None
+
+    def find_series(
+        self,
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        directory: Optional[Union[str, Path]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        심볼/간격/기간 조건으로 데이터 파일 조회
+
+        Args:
+            symbol: 거래 쌍
+            interval: 봉 간격
+            start: 이 시각 이후 데이터가 있는 파일
+            end: 이 시각 이전 데이터가 있는 파일
+            directory: 디렉토리 (하위 포함)
+
+        Returns:
+            data_files 행 딕셔너리 리스트 (시작일 순)
+        """
+        self.reconcile()
+        conditions, params = ['symbol IS NOT NULL'], []
+        if symbol:
+            conditions.append('symbol = ?')
+            params.append(symbol.upper())
+        if interval:
+            conditions.append('interval = ?')
+            params.append(interval)
+        if start:
+            conditions.append('(end_date IS NULL OR end_date >= ?)')
+            params.append(start)
+        if end:
+            conditions.append('(start_date IS NULL OR start_date <= ?)')
+            params.append(end)
+        if directory:
+            _, condition, directory_params = self._directory_filter(directory)
+            conditions.append(condition)
+            params.extend(directory_params)
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM data_files WHERE {' AND '.join(conditions)} ORDER BY symbol, interval, start_date",
+                params
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def coverage(self, symbol: Optional[str] = None, interval: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        (심볼, 간격)별 로컬 데이터 보유 기간 (겹치거나 이어지는 파일 기간은 합침)
+
+        Returns:
+            symbol, interval, ranges([start, end] 리스트), files, bytes 딕셔너리 리스트
+        """
+        result = {}
+        for row in self.find_series(symbol, interval):
+            if not row['interval'] or not row['start_date']:
+                continue
+            entry = result.setdefault((row['symbol'], row['interval']), {
+                'symbol': row['symbol'], 'interval': row['interval'], 'ranges': [], 'files': 0, 'bytes': 0
+            })
+            entry['files'] += 1
+            entry['bytes'] += row['file_size']
+
+            start, end = row['start_date'][:10], (row['end_date'] or row['start_date'])[:10]
+            ranges = entry['ranges']
+            # 시작일 순으로 오므로 마지막 구간과만 비교 (다음 날 시작이면 이어진 것으로 봄)
+            if ranges and start <= _next_day(ranges[-1][1]):
+                ranges[-1][1] = max(ranges[-1][1], end)
+            else:
+                ranges.append([start, end])
+
+        return list(result.values())
+
+    def usage_totals(self, reconcile: bool = True) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        범위(directory, symbol, file_type)별 용량 합계 행 (트리거로 유지되는 합계 테이블만 읽음)
+
+        Returns:
+            {범위: {키: {bytes, files}}} 딕셔너리 (directory는 하위 디렉토리 단위)
+        """
+        if reconcile:
+            self.reconcile()
+        with self._connect() as conn:
+            rows = conn.execute('SELECT scope, key, bytes, files FROM storage_totals WHERE files > 0').fetchall()
+
+        totals = {'directory': {}, 'symbol': {}, 'file_type': {}}
+        for row in rows:
+            totals.setdefault(row['scope'], {})[row['key']] = {'bytes': row['bytes'], 'files': row['files']}
+        return totals
+
+    def storage_usage(self) -> Dict[str, Any]:
+        """
+        저장 용량 합계 (최상위 디렉토리, 심볼, 파일 형식별 포함)
+
+        Returns:
+            bytes, files, directories, symbols, file_types({키: {bytes, files}}) 딕셔너리
+        """
+        totals = self.usage_totals()
+
+        directories, total_bytes, total_files = {}, 0, 0
+        for directory, entry in totals['directory'].items():
+            top = directory.split('/', 1)[0] or '.'
+            target = directories.setdefault(top, {'bytes': 0, 'files': 0})
+            target['bytes'] += entry['bytes']
+            target['files'] += entry['files']
+            total_bytes += entry['bytes']
+            total_files += entry['files']
+
+        return {
+            'bytes': total_bytes,
+            'files': total_files,
+            'directories': directories,
+            'symbols': {k or '(none)': v for k, v in totals['symbol'].items()},
+            'file_types': {k or '(none)': v for k, v in totals['file_type'].items()}
+        }
+
+def _next_day(date: str) -> str:
+    try:
+        return (datetime.strptime(date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+    except ValueError:
+        return date
+
+_catalogs: Dict[str, DataCatalog] = {}
+
+def get_catalog(root: Union[str, Path] = 'local_data') -> DataCatalog:
+    """프로세스 공용 카탈로그 인스턴스"""
+    key = str(Path(root).resolve())
+    if key not in _catalogs:
+        catalog = DataCatalog(root)
+        from .storage_quota import StorageQuota
+        catalog.quota = StorageQuota.from_env(catalog)
+        _catalogs[key] = catalog
+    return _catalogs[key]
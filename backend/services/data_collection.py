@@ -8,9 +8,11 @@ import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union, Iterable
 
-from .binance_client import BinanceClient
+from .storage_formats import (
+    DEFAULT_CHUNK_ROWS, DEFAULT_EXTENSIONS, choose_format, normalize_format, read_frame, write_frame
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +20,8 @@ class DataCollectionService:
     """데이터 수집 서비스"""
     
     def __init__(self):
-        self.binance_client = BinanceClient()
+        self._binance_client = None
+        self._catalog = None
         self.raw_data_path = Path('local_data/raw_data')
         self.processed_data_path = Path('local_data/processed_data')
         
@@ -26,6 +29,22 @@ class DataCollectionService:
         self.raw_data_path.mkdir(parents=True, exist_ok=True)
         self.processed_data_path.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def binance_client(self):
+        """바이낸스 클라이언트 (로컬 데이터만 다룰 때 requests 임포트를 피하도록 첫 사용 시 생성)"""
+        if self._binance_client is None:
+            from .binance_client import BinanceClient
+            self._binance_client = BinanceClient()
+        return self._binance_client
+    
+    @property
+    def catalog(self):
+        """local_data 파일 카탈로그 (목록/조회 시 파일 시스템 순회 대신 사용)"""
+        if self._catalog is None:
+            from .data_catalog import get_catalog
+            self._catalog = get_catalog(self.raw_data_path.parent)
+        return self._catalog
+    
     def collect_binance_data(
         self,
         symbol: str,
@@ -33,7 +52,8 @@ class DataCollectionService:
         days: int,
         interval: str = '1d',
         save_file: bool = True,
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        extra_fields: Union[bool, Iterable[str]] = False
     ) -> pd.DataFrame:
         """
         바이낸스에서 데이터 수집
@@ -45,6 +65,7 @@ class DataCollectionService:
             interval: 봉 간격
             save_file: 파일 저장 여부
             filename: 저장할 파일명 (자동 생성 가능)
+            extra_fields: 거래대금/체결 수/테이커 거래량 컬럼 포함 (BinanceClient.get_ohlcv_dataframe 참고)
         
         Returns:
             수집된 DataFrame
@@ -57,7 +78,8 @@ class DataCollectionService:
                 symbol=symbol,
                 interval=interval,
                 start_date=start_date,
-                days=days
+                days=days,
+                extra_fields=extra_fields
             )
             
             if df.empty:
@@ -70,11 +92,7 @@ class DataCollectionService:
                     end_date = datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=days)
                     filename = f"{symbol}_{interval}_{start_date}_to_{end_date.strftime('%Y-%m-%d')}.csv"
                 
-                file_path = self.raw_data_path / 'binance' / filename
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                df.to_csv(file_path, encoding='utf-8')
-                logger.info(f"데이터 저장 완료: {file_path}")
+                self.save_raw_data(df, symbol, interval, filename)
             
             return df
             
@@ -82,36 +100,105 @@ class DataCollectionService:
             logger.error(f"바이낸스 데이터 수집 실패: {e}")
             raise
     
+    def save_raw_data(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        interval: str,
+        filename: Optional[str] = None
+    ) -> Path:
+        """
+        OHLCV 데이터를 raw_data/binance 저장소에 저장
+        
+        Args:
+            df: timestamp 인덱스의 OHLCV DataFrame
+            symbol: 거래 쌍
+            interval: 봉 간격
+            filename: 파일명 (생략 시 데이터 기간으로 생성)
+        
+        Returns:
+            저장된 파일 경로
+        """
+        if not filename:
+            start = df.index.min().strftime('%Y-%m-%d')
+            end = df.index.max().strftime('%Y-%m-%d')
+            filename = f"{symbol}_{interval}_{start}_to_{end}.csv"
+        
+        file_path = self.raw_data_path / 'binance' / filename
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        df.to_csv(file_path, encoding='utf-8')
+        self.catalog.record(file_path, start=str(df.index.min()), end=str(df.index.max()))
+        logger.info(f"데이터 저장 완료: {file_path}")
+        return file_path
+    
+    def find_local_file(self, filename: str) -> Path:
+        """저장소 폴더들에서 파일 경로 찾기"""
+        # 직접 경로
+        path = Path(filename)
+        if path.exists():
+            return path
+        
+        search_dirs = [
+            self.raw_data_path,  # raw_data 폴더
+            self.raw_data_path / 'binance',  # binance 폴더
+            self.processed_data_path,  # processed_data 폴더
+        ]
+        
+        if path.name == filename:
+            # 파일명만 주어지면 카탈로그에서 먼저 조회 (폴더마다 stat하지 않음)
+            found = self.catalog.find(filename, search_dirs)
+            if found is not None:
+                return found
+        
+        # 카탈로그에 아직 없는 파일 (reconcile 주기 사이에 폴더에 직접 넣은 파일 등)
+        for directory in search_dirs:
+            candidate = directory / filename
+            if candidate.exists():
+                if path.name == filename and self._in_catalog(candidate):
+                    self.catalog.record(candidate)
+                return candidate
+        
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filename}")
+
+    def find_local_files(self, pattern: str) -> list:
+        """
+        glob 패턴(예: 'binance/*_1m_*.csv')에 맞는 파일 경로 목록 (이름순)
+
+        패턴이 아니면 find_local_file과 같은 방식으로 파일 하나를 찾습니다.
+        """
+        if not any(ch in pattern for ch in '*?['):
+            return [self.find_local_file(pattern)]
+
+        path = Path(pattern)
+        if path.is_absolute():
+            candidates = Path(path.anchor).glob(str(path.relative_to(path.anchor)))
+        else:
+            candidates = [
+                p for directory in (Path('.'), self.raw_data_path, self.raw_data_path / 'binance', self.processed_data_path)
+                for p in directory.glob(pattern)
+            ]
+
+        found, seen = [], set()
+        for p in candidates:
+            resolved = p.resolve()
+            if p.is_file() and not p.name.startswith('.') and resolved not in seen:
+                seen.add(resolved)
+                found.append(p)
+        if not found:
+            raise FileNotFoundError(f"패턴에 맞는 파일이 없습니다: {pattern}")
+        return sorted(found, key=lambda p: (p.parent.as_posix(), p.name))
+
     def load_local_data(self, filename: str) -> pd.DataFrame:
         """로컬 저장된 데이터 로드"""
         try:
-            # 다양한 경로에서 파일 찾기
-            possible_paths = [
-                Path(filename),  # 직접 경로
-                self.raw_data_path / filename,  # raw_data 폴더
-                self.raw_data_path / 'binance' / filename,  # binance 폴더
-                self.processed_data_path / filename,  # processed_data 폴더
-            ]
+            file_path = self.find_local_file(filename)
             
-            file_path = None
-            for path in possible_paths:
-                if path.exists():
-                    file_path = path
-                    break
-            
-            if not file_path:
-                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filename}")
-            
-            # 파일 확장자에 따른 로딩
-            if file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path, index_col=0, parse_dates=True)
-            elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path, index_col=0, parse_dates=True)
-            elif file_path.suffix.lower() == '.parquet':
-                df = pd.read_parquet(file_path)
-            else:
-                raise ValueError(f"지원하지 않는 파일 형식: {file_path.suffix}")
+            # 파일 확장자에 따른 로딩 (csv, xlsx, parquet, feather, h5)
+            df = read_frame(file_path)
             
+            if self._in_catalog(file_path):
+                self.catalog.touch(file_path)
             logger.info(f"로컬 데이터 로드 완료: {file_path} ({len(df)}행)")
             return df
             
@@ -123,36 +210,53 @@ class DataCollectionService:
         self,
         data: pd.DataFrame,
         filename: str,
-        file_format: str = 'csv'
+        file_format: str = 'csv',
+        purpose: str = 'auto',
+        append: bool = False,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS
     ) -> str:
-        """분석 결과 저장"""
+        """
+        분석 결과 저장 (청크 단위로 임시 파일에 쓴 뒤 이름 바꿔 교체)
+        
+        Args:
+            data: 저장할 데이터
+            filename: 파일명 (확장자 생략 가능)
+            file_format: 'csv', 'xlsx', 'parquet', 'feather', 'hdf5' 또는 'auto' (purpose와 데이터 크기로 선택)
+            purpose: file_format='auto'일 때 용도 ('reload', 'archive', 'exchange', 'spreadsheet', 'auto')
+            append: 같은 파일이 있으면 뒤에 행 추가
+            chunk_rows: 청크(Parquet row group) 행 수
+        """
         try:
+            if file_format.lower() == 'auto':
+                file_format = choose_format(data, purpose)
+            file_format = normalize_format(file_format)
+            
             # 확장자 자동 추가
-            if not filename.endswith(f'.{file_format}'):
-                filename = f"{filename}.{file_format}"
+            extension = DEFAULT_EXTENSIONS[file_format]
+            if Path(filename).suffix.lower().lstrip('.') not in (extension, file_format):
+                filename = f"{filename}.{extension}"
             
             file_path = self.processed_data_path / 'analysis_results' / filename
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # 형식에 따른 저장
-            if file_format.lower() == 'csv':
-                data.to_csv(file_path, encoding='utf-8')
-            elif file_format.lower() in ['xlsx', 'xls']:
-                data.to_excel(file_path)
-            elif file_format.lower() == 'parquet':
-                data.to_parquet(file_path)
-            else:
-                raise ValueError(f"지원하지 않는 파일 형식: {file_format}")
+            write_frame(data, file_path, file_format, append=append, chunk_rows=chunk_rows)
             
-            logger.info(f"분석 결과 저장 완료: {file_path}")
+            self.catalog.record(file_path, append=append)
+            logger.info(f"분석 결과 저장 완료: {file_path} ({file_format}{', 추가' if append else ''})")
             return str(file_path)
             
         except Exception as e:
             logger.error(f"분석 결과 저장 실패: {e}")
             raise
     
-    def list_local_files(self, directory: str = 'raw_data') -> Dict[str, Any]:
-        """로컬 파일 목록 조회"""
+    def _in_catalog(self, path: Path) -> bool:
+        """카탈로그가 관리하는 local_data 아래 경로인지"""
+        try:
+            path.resolve().relative_to(self.catalog.root.resolve())
+            return True
+        except ValueError:
+            return False
+    
+    def list_local_files(self, directory: str = 'raw_data', limit: Optional[int] = None) -> Dict[str, Any]:
+        """로컬 파일 목록 조회 (limit: 최근 수정 순 최대 개수, total_files는 전체 개수)"""
         try:
             if directory == 'raw_data':
                 search_path = self.raw_data_path
@@ -162,7 +266,13 @@ class DataCollectionService:
                 search_path = Path(directory)
             
             files = []
-            if search_path.exists():
+            if self._in_catalog(search_path):
+                return {
+                    'directory': directory,
+                    'total_files': self.catalog.count_files(search_path),
+                    'files': self.catalog.list_files(search_path, limit=limit)
+                }
+            elif search_path.exists():
                 for file_path in search_path.rglob('*'):
                     if file_path.is_file() and not file_path.name.startswith('.'):
                         relative_path = file_path.relative_to(search_path)
@@ -178,7 +288,7 @@ class DataCollectionService:
             return {
                 'directory': directory,
                 'total_files': len(files),
-                'files': sorted(files, key=lambda x: x['modified'], reverse=True)
+                'files': sorted(files, key=lambda x: x['modified'], reverse=True)[:limit]
             }
             
         except Exception as e:
@@ -188,22 +298,7 @@ class DataCollectionService:
     def get_file_info(self, filename: str) -> Dict[str, Any]:
         """파일 정보 조회"""
         try:
-            # 파일 찾기
-            possible_paths = [
-                Path(filename),
-                self.raw_data_path / filename,
-                self.raw_data_path / 'binance' / filename,
-                self.processed_data_path / filename,
-            ]
-            
-            file_path = None
-            for path in possible_paths:
-                if path.exists():
-                    file_path = path
-                    break
-            
-            if not file_path:
-                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filename}")
+            file_path = self.find_local_file(filename)
             
             stat = file_path.stat()
             
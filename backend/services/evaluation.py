@@ -0,0 +1,394 @@
+"""
+Strategy Evaluation Service
+지표 기반 전략의 워크포워드 / 몬테카를로(부트스트랩) 강건성 평가 서비스
+"""
+
+import os
+import sys
+import math
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable
+import logging
+
+from . import optimization
+from .optimization import GridOptimizer, expand_grid, shared_frame
+
+logger = logging.getLogger(__name__)
+
+# 분포 요약에 사용할 백분위수
+SUMMARY_PERCENTILES = [5, 25, 50, 75, 95]
+
+# 워크포워드 분할 하나의 바당 작업 메모리 (포지션/엔진 결과/지표 임시 배열, 측정 최대 float64 약 10개 + 여유)
+WALK_FORWARD_ROW_BYTES = 16 * 8
+
+# 몬테카를로 워커 전역 상태
+_worker_returns = None
+
+def walk_forward_splits(
+    n_bars: int,
+    train_size: int,
+    test_size: int,
+    step: Optional[int] = None,
+    anchored: bool = False
+) -> List[Tuple[int, int, int, int]]:
+    """
+    워크포워드 분할 구간 생성
+
+    Args:
+        n_bars: 전체 바 개수
+        train_size: 학습 구간 길이
+        test_size: 검증 구간 길이
+        step: 분할 간 이동 간격 (기본값: test_size)
+        anchored: True면 학습 구간 시작을 0에 고정 (확장 윈도우)
+
+    Returns:
+        (train_start, train_end, test_start, test_end) 튜플 리스트
+    """
+    step = step or test_size
+    splits = []
+    train_start = 0
+    train_end = train_size
+    while train_end + test_size <= n_bars:
+        splits.append((0 if anchored else train_start, train_end, train_end, train_end + test_size))
+        train_start += step
+        train_end += step
+    return splits
+
+def _run_walk_forward_split(split: Tuple[int, int, int, int], param_list: List[Dict[str, Any]], rank_by: str) -> Dict[str, Any]:
+    """워커에서 한 분할의 학습 구간 그리드 탐색 후 최적 파라미터로 검증 구간 평가"""
+    data = optimization._worker_data
+    config = optimization._worker_config
+    engine = optimization._worker_engine(config)
+
+    train_start, train_end, test_start, test_end = split
+    train_len = train_end - train_start
+    # 지표 워밍업을 위해 학습+검증 구간 전체로 시그널 계산 (뷰, 복사 없음)
+    window = data.iloc[train_start:test_end]
+    close = window[config['price_column']].to_numpy()
+
+    best_score, best_params, best_stats, best_positions = -math.inf, None, None, None
+    for params in param_list:
+        positions = np.asarray(optimization._build_positions(engine, window, config, params), dtype=np.float64)
+        stats = engine.compute_stats(engine.run(close[:train_len], positions[:train_len]), config['periods_per_year'])
+        score = stats.get(rank_by, math.nan)
+        score = -math.inf if math.isnan(score) else score
+        if best_params is None or score > best_score:
+            best_score, best_params, best_stats, best_positions = score, params, stats, positions
+
+    test_stats = engine.compute_stats(
+        engine.run(close[train_len:], best_positions[train_len:]), config['periods_per_year']
+    )
+
+    row = {'train_start': train_start, 'train_end': train_end, 'test_start': test_start, 'test_end': test_end}
+    row.update(best_params)
+    row[f'train_{rank_by}'] = best_stats[rank_by]
+    for key in ('total_return', 'sharpe', 'max_drawdown', 'num_trades'):
+        row[f'test_{key}'] = test_stats[key]
+    return row
+
+def _init_resample_worker(returns: np.ndarray):
+    """몬테카를로 워커 초기화 (전략 수익률 배열은 워커당 한 번만 전달)"""
+    global _worker_returns
+    _worker_returns = returns
+
+def _resample_row_bytes(n: int, block_size: int) -> int:
+    """_simulate_chunks의 리샘플 한 행당 작업 메모리 (청크 크기 계산용)"""
+    n_blocks = -(-n // block_size)
+    width = n_blocks * block_size
+    arrays = (
+        n_blocks                                # rng.integers 블록 시작 위치 (청크마다 새로 할당)
+        + (width if block_size > 1 else 0)      # 블록 인덱스 (block_size=1이면 시작 위치를 그대로 사용)
+        + width                                 # 수익률/로그 자본 경로
+        + n                                     # 누적 최대값/낙폭
+    )
+    return arrays * 8
+
+def _simulate_chunks(
+    returns: np.ndarray,
+    chunk_sizes: List[int],
+    seeds: List[np.random.SeedSequence],
+    block_size: int,
+    periods_per_year: float
+) -> np.ndarray:
+    """
+    부트스트랩 리샘플을 청크 단위로 시뮬레이션 (작업 배열은 최대 청크 크기로 한 번만 할당해 재사용)
+
+    모든 연산은 out 인자로 작업 배열에 기록하고 입력과 출력이 겹치는 누적 연산은 피하므로
+    (numpy가 입력을 임시 복사함) 행당 메모리는 _resample_row_bytes와 같습니다.
+
+    Returns:
+        (리샘플 수, 3) 배열 - total_return, sharpe, max_drawdown
+    """
+    n = len(returns)
+    max_rows = max(chunk_sizes)
+    n_blocks = -(-n // block_size)
+    width = n_blocks * block_size
+
+    # 사전 할당 작업 배열 (경로는 블록 길이에 맞춘 width로 잡아 take가 연속 인덱스/출력을 쓰게 함)
+    indices = np.empty((max_rows, width), dtype=np.int64) if block_size > 1 else None
+    path = np.empty((max_rows, width), dtype=np.float64)
+    scratch = np.empty((max_rows, n), dtype=np.float64)
+    offsets = np.arange(block_size, dtype=np.int64)
+
+    metrics = np.empty((sum(chunk_sizes), 3), dtype=np.float64)
+    row = 0
+    for rows, seed in zip(chunk_sizes, seeds):
+        rng = np.random.default_rng(seed)
+        tmp = scratch[:rows]
+
+        # 1. 리샘플 인덱스 (블록 부트스트랩, block_size=1이면 iid)
+        starts = rng.integers(0, n, size=(rows, n_blocks), dtype=np.int64)
+        if indices is None:
+            idx = starts
+        else:
+            idx = indices[:rows]
+            np.add(starts.reshape(rows, n_blocks, 1), offsets, out=idx.reshape(rows, n_blocks, block_size))
+        del starts
+
+        # 2. 수익률 경로 (끝을 넘는 블록은 처음으로 순환, wrap 모드는 out에 직접 기록)
+        np.take(returns, idx, out=path[:rows], mode='wrap')
+        del idx
+        p = path[:rows, :n]
+
+        # 3. 샤프 (임시 배열 없이 제곱합으로 분산 계산)
+        mean = p.sum(axis=1) / n
+        np.square(p, out=tmp)
+        var = np.maximum(tmp.sum(axis=1) / n - mean * mean, 0.0)
+        std = np.sqrt(var)
+        sharpe = np.divide(mean, std, out=np.zeros(rows), where=std > 0) * np.sqrt(periods_per_year)
+
+        # 4. 로그 자본 곡선(tmp)과 최대 낙폭 (누적 연산은 입력과 다른 배열에 기록)
+        np.log1p(p, out=p)
+        np.cumsum(p, axis=1, out=tmp)
+        np.maximum.accumulate(tmp, axis=1, out=p)
+        np.maximum(p, 0.0, out=p)  # 초기 자본(로그 0)도 고점에 포함
+        np.subtract(tmp, p, out=p)
+
+        metrics[row:row + rows, 0] = np.expm1(tmp[:, -1])
+        metrics[row:row + rows, 1] = sharpe
+        metrics[row:row + rows, 2] = np.expm1(p.min(axis=1))
+        row += rows
+
+    return metrics
+
+def _run_resample_task(chunk_sizes: List[int], seeds: List[np.random.SeedSequence], block_size: int, periods_per_year: float) -> np.ndarray:
+    """워커에서 할당된 청크 묶음 시뮬레이션"""
+    return _simulate_chunks(_worker_returns, chunk_sizes, seeds, block_size, periods_per_year)
+
+def _peak_rss_mb() -> Optional[float]:
+    """현재 프로세스와 자식 프로세스 중 최대 RSS(MB) (resource 모듈이 없는 Windows는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024  # macOS는 바이트, Linux는 KB 단위
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    return round(peak / divisor, 1)
+
+class StrategyEvaluator:
+    """워크포워드 / 몬테카를로 전략 평가 (메모리 제한 청크 실행)"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        memory_budget_mb: float = 256.0,
+        fee_rate: float = 0.001,
+        slippage: float = 0.0005,
+        initial_capital: float = 10000.0,
+        allow_short: bool = False,
+        price_column: str = 'close'
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.memory_budget_mb = memory_budget_mb
+        self.optimizer = GridOptimizer(
+            max_workers=self.max_workers,
+            fee_rate=fee_rate,
+            slippage=slippage,
+            initial_capital=initial_capital,
+            allow_short=allow_short,
+            price_column=price_column
+        )
+
+    def walk_forward(
+        self,
+        strategy: Union[str, Callable],
+        data: pd.DataFrame,
+        grid: Dict[str, List[Any]],
+        train_size: int,
+        test_size: int,
+        step: Optional[int] = None,
+        anchored: bool = False,
+        rank_by: str = 'sharpe'
+    ) -> pd.DataFrame:
+        """
+        워크포워드 평가: 분할마다 학습 구간에서 최적 파라미터를 찾고 이후 검증 구간에서 성과 측정
+
+        Args:
+            strategy: 내장 전략명 또는 포지션 생성 함수
+            data: OHLCV 데이터 (공유 메모리로 워커에 전달)
+            grid: 파라미터 그리드
+            train_size: 학습 구간 바 수
+            test_size: 검증 구간 바 수
+            step: 분할 이동 간격 (기본값: test_size)
+            anchored: 학습 구간 시작 고정 여부
+            rank_by: 학습 구간 최적화 기준 지표 (클수록 좋음)
+
+        Returns:
+            분할별 최적 파라미터와 학습/검증 성과 DataFrame
+        """
+        try:
+            splits = walk_forward_splits(len(data), train_size, test_size, step, anchored)
+            if not splits:
+                raise ValueError("데이터가 학습+검증 구간보다 짧습니다.")
+
+            param_list = expand_grid(grid)
+            config = self.optimizer.build_config(strategy, data)
+
+            # 동시에 실행되는 분할 수를 메모리 예산으로 제한 (데이터는 공유 메모리라 워커 수와 무관)
+            split_bytes = max(test_end - train_start for train_start, _, _, test_end in splits) * WALK_FORWARD_ROW_BYTES
+            budget_workers = int(self.memory_budget_mb * 1024 * 1024 // split_bytes)
+            if budget_workers < 1:
+                logger.warning(
+                    f"분할 하나의 작업 메모리({split_bytes / 1024 / 1024:.0f}MB)가 예산"
+                    f"({self.memory_budget_mb:.0f}MB)보다 큽니다. 워커 1개로 실행합니다."
+                )
+            workers = max(1, min(self.max_workers, len(splits), budget_workers))
+
+            logger.info(f"워크포워드 평가 시작: {len(splits)}개 분할, {len(param_list)}개 조합, 워커 {workers}개")
+
+            rows = []
+            with shared_frame(data) as (shm_name, shape, columns, extras):
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=optimization._init_worker,
+                    initargs=(shm_name, shape, columns, extras, config)
+                ) as executor:
+                    futures = [
+                        executor.submit(_run_walk_forward_split, split, param_list, rank_by)
+                        for split in splits
+                    ]
+                    for future in as_completed(futures):
+                        rows.append(future.result())
+
+            results = pd.DataFrame(rows).sort_values('train_start').reset_index(drop=True)
+            results.insert(0, 'split', np.arange(1, len(results) + 1))
+
+            # 바 위치를 실제 인덱스 값(시간)으로 변환
+            for column in ('train_start', 'test_start'):
+                results[column] = data.index[results[column].to_numpy()]
+            for column in ('train_end', 'test_end'):
+                results[column] = data.index[results[column].to_numpy() - 1]
+
+            logger.info(f"워크포워드 평가 완료: {len(results)}개 분할")
+            return results
+
+        except Exception as e:
+            logger.error(f"워크포워드 평가 실패: {e}")
+            raise
+
+    def monte_carlo(
+        self,
+        data: pd.DataFrame,
+        strategy: Union[str, Callable] = 'macd',
+        n_resamples: int = 1000,
+        block_size: int = 1,
+        seed: Optional[int] = None,
+        **params
+    ) -> Dict[str, Any]:
+        """
+        몬테카를로 평가: 전략 바 수익률을 부트스트랩 리샘플링해 성과 분포 추정
+
+        리샘플은 memory_budget_mb에 맞춘 청크 크기로 나누어 사전 할당 배열에서 처리하므로
+        리샘플 수와 관계없이 워커당 작업 메모리가 예산/워커 수 이내로 유지됩니다.
+
+        Args:
+            data: OHLCV 데이터
+            strategy: 내장 전략명 또는 포지션 생성 함수
+            n_resamples: 리샘플 수
+            block_size: 블록 부트스트랩 블록 길이 (1이면 iid, 자기상관 보존 시 20~100 권장)
+            seed: 난수 시드 (재현용)
+            **params: 전략 파라미터
+
+        Returns:
+            summary(지표별 분포 통계 DataFrame), samples(리샘플별 지표 DataFrame),
+            original(원래 백테스트 성과), chunk_size, peak_rss_mb 딕셔너리
+        """
+        try:
+            config = self.optimizer.build_config(strategy, data)
+            engine = optimization._worker_engine(config)
+            positions = optimization._build_positions(engine, data, config, params)
+            result = engine.run(data[config['price_column']].to_numpy(), positions)
+            original = engine.compute_stats(result, config['periods_per_year'])
+            returns = np.ascontiguousarray(result['strategy_returns'])
+            del result, positions
+
+            n = len(returns)
+            block_size = max(1, min(block_size, n))
+            workers = max(1, min(self.max_workers, n_resamples))
+
+            # 워커당 메모리 예산으로 청크 크기 결정
+            budget_bytes = self.memory_budget_mb * 1024 * 1024 / workers
+            chunk_size = int(max(1, min(n_resamples, budget_bytes // _resample_row_bytes(n, block_size))))
+
+            chunk_sizes = [chunk_size] * (n_resamples // chunk_size)
+            if n_resamples % chunk_size:
+                chunk_sizes.append(n_resamples % chunk_size)
+            seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+            logger.info(
+                f"몬테카를로 평가 시작: {n_resamples}회 리샘플, 청크 {chunk_size}행 x {len(chunk_sizes)}개, 워커 {workers}개"
+            )
+
+            # 결과 배열 사전 할당 후 완료되는 순서대로 채움
+            samples = np.empty((n_resamples, 3), dtype=np.float64)
+            if workers == 1:
+                samples[:] = _simulate_chunks(returns, chunk_sizes, seeds, block_size, config['periods_per_year'])
+            else:
+                # 청크를 워커 수만큼 연속 구간으로 나누어 배분
+                bounds = np.linspace(0, len(chunk_sizes), workers + 1).astype(int)
+                row_offsets = np.concatenate(([0], np.cumsum(chunk_sizes)))
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_resample_worker,
+                    initargs=(returns,)
+                ) as executor:
+                    futures = {
+                        executor.submit(
+                            _run_resample_task,
+                            chunk_sizes[lo:hi],
+                            seeds[lo:hi],
+                            block_size,
+                            config['periods_per_year']
+                        ): row_offsets[lo]
+                        for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo
+                    }
+                    for future in as_completed(futures):
+                        metrics = future.result()
+                        start = futures[future]
+                        samples[start:start + len(metrics)] = metrics
+
+            samples_df = pd.DataFrame(samples, columns=['total_return', 'sharpe', 'max_drawdown'])
+            summary = samples_df.describe(percentiles=[p / 100 for p in SUMMARY_PERCENTILES]).T
+            summary['prob_loss'] = [
+                float((samples[:, 0] < 0).mean()),
+                float((samples[:, 1] < 0).mean()),
+                float('nan')
+            ]
+
+            logger.info(f"몬테카를로 평가 완료: {n_resamples}회 리샘플")
+            return {
+                'summary': summary,
+                'samples': samples_df,
+                'original': original,
+                'chunk_size': chunk_size,
+                'peak_rss_mb': _peak_rss_mb()
+            }
+
+        except Exception as e:
+            logger.error(f"몬테카를로 평가 실패: {e}")
+            raise
@@ -0,0 +1,365 @@
+"""
+Execution History Service
+셀 실행 기록 및 성능 지표(실행 시간, CPU, 메모리, 출력 크기, 대기 시간) 저장/집계 서비스
+"""
+
+import os
+import uuid
+import queue
+import atexit
+import sqlite3
+import hashlib
+import threading
+import contextlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS execution_history (
+    id INTEGER PRIMARY KEY,
+    execution_id TEXT NOT NULL UNIQUE,
+    session_id TEXT,
+    cell_id TEXT,
+    code TEXT,
+    code_hash TEXT,
+    execution_count INTEGER,
+    execution_time REAL,
+    exec_time REAL,
+    cpu_time REAL,
+    peak_rss INTEGER,
+    output_bytes INTEGER,
+    queue_wait REAL,
+    status TEXT,
+    created_at TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_execution_history_session ON execution_history (session_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_execution_history_created ON execution_history (created_at);
+CREATE INDEX IF NOT EXISTS idx_execution_history_code ON execution_history (code_hash);
+
+CREATE TABLE IF NOT EXISTS execution_functions (
+    execution_id TEXT NOT NULL,
+    function TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    wall_time REAL NOT NULL,
+    created_at TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_execution_functions_execution ON execution_functions (execution_id);
+"""
+
+# 집계 대상 지표 (execution_time: 서버 기준 전체 시간, exec_time: 셀 코드 실행 시간)
+METRICS = ['execution_time', 'exec_time', 'cpu_time', 'peak_rss', 'output_bytes', 'queue_wait']
+
+# 저장하는 코드 최대 길이 (핫 셀 식별용 미리보기)
+MAX_CODE_LENGTH = 2000
+
+def percentiles(values: List[float], points=(50, 95)) -> Dict[str, Optional[float]]:
+    """p50/p95 등 백분위수 (값이 없으면 None)"""
+    values = [v for v in values if v is not None]
+    if not values:
+        return {f"p{p}": None for p in points}
+    result = np.percentile(np.asarray(values, dtype=float), points)
+    return {f"p{p}": round(float(v), 6) for p, v in zip(points, result)}
+
+class ExecutionHistory:
+    """
+    셀 실행 기록 저장소
+
+    record()는 큐에 넣기만 하고 반환하며, 백그라운드 스레드가 batch_size개 또는
+    flush_interval초마다 한 트랜잭션으로 묶어 기록합니다 (요청 처리 경로에서 디스크 I/O 없음).
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = 'logs/execution_history.sqlite3',
+        batch_size: int = 100,
+        flush_interval: float = 1.0
+    ):
+        """
+        Args:
+            db_path: SQLite DB 경로
+            batch_size: 한 번에 기록할 최대 실행 수
+            flush_interval: 기록 주기(초)
+        """
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: queue.Queue = queue.Queue()
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._counts_lock = threading.Lock()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+        atexit.register(self.flush)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def next_execution_count(self, session_id: Optional[str]) -> int:
+        """
+        세션별 실행 번호
+
+        프로세스에서 세션을 처음 보면 DB에 기록된 마지막 번호에서 이어서 셉니다 (서버 재시작 후 1부터 다시 세지 않음).
+        여러 워커가 같은 세션을 동시에 처리하면 번호가 겹칠 수 있으므로 클라이언트가 번호를 보내면 그 값을 우선합니다.
+        """
+        key = session_id or ''
+        with self._counts_lock:
+            if key not in self._counts:
+                self._counts[key] = self._last_execution_count(session_id)
+            self._counts[key] += 1
+            return self._counts[key]
+
+    def _last_execution_count(self, session_id: Optional[str]) -> int:
+        """DB에 기록된 세션의 최대 실행 번호 (없으면 0)"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT MAX(execution_count) FROM execution_history WHERE session_id IS ?', (session_id,)
+                ).fetchone()
+            return int(row[0] or 0)
+        except sqlite3.Error as e:
+            logger.warning(f"실행 번호 조회 실패: {e}")
+            return 0
+
+    # 기록
+
+    def record(
+        self,
+        session_id: Optional[str],
+        cell_id: Optional[str],
+        code: str,
+        status: str,
+        execution_count: Optional[int] = None,
+        execution_time: Optional[float] = None,
+        exec_time: Optional[float] = None,
+        cpu_time: Optional[float] = None,
+        peak_rss: Optional[int] = None,
+        output_bytes: Optional[int] = None,
+        queue_wait: Optional[float] = None,
+        functions: Optional[Dict[str, Dict[str, float]]] = None
+    ) -> str:
+        """
+        실행 기록을 쓰기 큐에 추가
+
+        Args:
+            session_id: 브라우저 세션 ID
+            cell_id: 셀 ID
+            code: 실행한 코드
+            status: 'success' 또는 'error'
+            execution_count: 세션 내 실행 번호
+            execution_time: 요청 처리 기준 전체 실행 시간(초, 프로세스 시작 포함)
+            exec_time: 셀 코드 실행 시간(초)
+            cpu_time: CPU 시간(초, 자식 프로세스 포함)
+            peak_rss: 최대 메모리 사용량(bytes)
+            output_bytes: 표준 출력/에러 크기(bytes)
+            queue_wait: 실행 슬롯 대기 시간(초)
+            functions: 사용자 함수별 {'calls', 'wall_time'}
+
+        Returns:
+            실행 ID
+        """
+        execution_id = uuid.uuid4().hex
+        created_at = datetime.now().isoformat(sep=' ')
+        self._queue.put((
+            (
+                execution_id, session_id, cell_id, code[:MAX_CODE_LENGTH],
+                hashlib.sha1(code.encode('utf-8')).hexdigest(), execution_count,
+                execution_time, exec_time, cpu_time, peak_rss, output_bytes, queue_wait,
+                status, created_at
+            ),
+            [
+                (execution_id, name, int(stats.get('calls', 0)), float(stats.get('wall_time', 0.0)), created_at)
+                for name, stats in (functions or {}).items()
+            ]
+        ))
+        self._ensure_writer()
+        return execution_id
+
+    def _ensure_writer(self):
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name='execution-history-writer', daemon=True)
+                self._writer.start()
+
+    def _drain(self, block: bool) -> list:
+        items = []
+        try:
+            items.append(self._queue.get(timeout=self.flush_interval) if block else self._queue.get_nowait())
+            while len(items) < self.batch_size:
+                items.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return items
+
+    def _write(self, items: list):
+        if not items:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                'INSERT INTO execution_history (execution_id, session_id, cell_id, code, code_hash, execution_count, '
+                'execution_time, exec_time, cpu_time, peak_rss, output_bytes, queue_wait, status, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [row for row, _ in items]
+            )
+            conn.executemany(
+                'INSERT INTO execution_functions (execution_id, function, calls, wall_time, created_at) VALUES (?, ?, ?, ?, ?)',
+                [f for _, functions in items for f in functions]
+            )
+
+    def _write_loop(self):
+        while True:
+            items = self._drain(block=True)
+            try:
+                self._write(items)
+            except Exception as e:
+                logger.error(f"실행 기록 저장 실패 ({len(items)}건): {e}")
+
+    def pending(self) -> int:
+        """저장 대기 중인 기록 수"""
+        return self._queue.qsize()
+
+    def flush(self):
+        """대기 중인 기록을 즉시 저장 (종료 시, 조회 직전)"""
+        while True:
+            items = self._drain(block=False)
+            if not items:
+                return
+            self._write(items)
+
+    # 조회
+
+    def _where(self, session_id: Optional[str], since: Optional[str], prefix: str = '') -> tuple:
+        conditions, params = [], []
+        if session_id:
+            conditions.append(f'{prefix}session_id = ?')
+            params.append(session_id)
+        if since:
+            conditions.append(f'{prefix}created_at >= ?')
+            params.append(since)
+        return (f"WHERE {' AND '.join(conditions)}" if conditions else ''), params
+
+    def history(self, session_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """최근 실행 기록 (최신 순)"""
+        self.flush()
+        where, params = self._where(session_id, None)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM execution_history {where} ORDER BY id DESC LIMIT ?",
+                params + [int(limit)]
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def stats(
+        self,
+        group: str = 'session',
+        session_id: Optional[str] = None,
+        since: Optional[str] = None,
+        hours: Optional[float] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        그룹별 실행 지표 p50/p95
+
+        Args:
+            group: 'session' (세션별), 'function' (사용자 함수별), 'cell' (같은 코드별)
+            session_id: 특정 세션만
+            since: 이 시각 이후 기록만 ('YYYY-MM-DD HH:MM:SS')
+            hours: 최근 N시간 기록만 (since 대신)
+            limit: 최대 그룹 수 (p95 실행 시간이 큰 순)
+
+        Returns:
+            그룹별 count와 지표별 {p50, p95} 딕셔너리 리스트
+        """
+        if group not in ('session', 'function', 'cell'):
+            raise ValueError(f"지원하지 않는 그룹: {group}")
+        if hours is not None and not since:
+            since = (datetime.now() - timedelta(hours=hours)).isoformat(sep=' ')
+
+        self.flush()
+        with self._connect() as conn:
+            if group == 'function':
+                where, params = self._where(session_id, since, 'h.')
+                rows = conn.execute(
+                    'SELECT f.function, f.calls, f.wall_time FROM execution_functions f '
+                    f'JOIN execution_history h ON h.execution_id = f.execution_id {where}',
+                    params
+                ).fetchall()
+
+                grouped = defaultdict(lambda: {'calls': 0, 'wall_time': [], 'per_call': []})
+                for name, calls, wall_time in rows:
+                    entry = grouped[name]
+                    entry['calls'] += calls
+                    entry['wall_time'].append(wall_time)
+                    entry['per_call'].append(wall_time / calls if calls else None)
+
+                result = [
+                    {
+                        'function': name,
+                        'executions': len(entry['wall_time']),
+                        'calls': entry['calls'],
+                        'wall_time': percentiles(entry['wall_time']),
+                        'per_call': percentiles(entry['per_call'])
+                    }
+                    for name, entry in grouped.items()
+                ]
+                result.sort(key=lambda r: r['wall_time']['p95'] or 0, reverse=True)
+                return result[:limit]
+
+            where, params = self._where(session_id, since)
+            key = 'session_id' if group == 'session' else 'code_hash'
+            rows = conn.execute(
+                f"SELECT {key} AS key, code, status, {', '.join(METRICS)} FROM execution_history {where}",
+                params
+            ).fetchall()
+
+        grouped = defaultdict(list)
+        for row in rows:
+            grouped[row['key']].append(row)
+
+        result = []
+        for key, items in grouped.items():
+            entry = {
+                group if group == 'session' else 'code_hash': key,
+                'count': len(items),
+                'errors': sum(1 for r in items if r['status'] != 'success')
+            }
+            if group == 'cell':
+                entry['code'] = items[-1]['code'][:200]
+            for metric in METRICS:
+                entry[metric] = percentiles([r[metric] for r in items])
+            result.append(entry)
+
+        result.sort(key=lambda r: r['execution_time']['p95'] or 0, reverse=True)
+        return result[:limit]
+
+_history: Optional[ExecutionHistory] = None
+_history_lock = threading.Lock()
+
+def get_execution_history() -> ExecutionHistory:
+    """프로세스 공용 실행 기록 인스턴스"""
+    global _history
+    if _history is None:
+        with _history_lock:
+            if _history is None:
+                _history = ExecutionHistory(os.getenv('EXECUTION_HISTORY_DB', 'logs/execution_history.sqlite3'))
+    return _history
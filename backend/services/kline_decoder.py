@@ -0,0 +1,167 @@
+"""
+Kline Decoder
+바이낸스 klines 응답 바이트 → 필요한 필드만 float64/int64 numpy 컬럼으로 디코딩
+
+응답은 [[1499040000000,"0.01634790",...],...] 형태의 고정 12필드 배열입니다. API 한 페이지
+(최대 1000행) 크기는 orjson(없으면 json)으로 파싱해 필요한 필드만 numpy 배열에 채우고, 큰 본문
+(파일로 받은 응답 등)은 대괄호/따옴표만 걷어내 CSV로 바꾼 뒤 pandas C 파서로 요청한 컬럼만 바로
+숫자형으로 읽습니다 (행마다 파이썬 리스트/문자열 객체를 만들지 않음). 여러 페이지는 KlineBuffer의
+미리 할당한 배열에 이어 씁니다.
+"""
+
+import io
+import re
+import json
+from typing import Dict, Iterable, Optional, Tuple, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # 선택 의존성
+    orjson = None
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# 필드 → (응답 배열 위치, dtype)
+KLINE_FIELDS = {
+    'timestamp': (0, np.int64),
+    'open': (1, np.float64),
+    'high': (2, np.float64),
+    'low': (3, np.float64),
+    'close': (4, np.float64),
+    'volume': (5, np.float64),
+    'close_time': (6, np.int64),
+    'quote_asset_volume': (7, np.float64),
+    'number_of_trades': (8, np.int64),
+    'taker_buy_base_asset_volume': (9, np.float64),
+    'taker_buy_quote_asset_volume': (10, np.float64)
+}
+
+OHLCV_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# extra_fields=True일 때 추가하는 필드
+EXTRA_FIELDS = ('quote_asset_volume', 'number_of_trades', 'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume')
+
+# 이 크기(약 1만 행) 이상이면 CSV 경로가 빠름 (그 아래는 read_csv 호출 비용이 더 큼)
+CSV_MIN_BYTES = 1_500_000
+
+_ROW_SEPARATOR = re.compile(rb'\]\s*,\s*\[')
+
+def resolve_fields(extra_fields: Union[bool, Iterable[str], None] = False) -> Tuple[str, ...]:
+    """OHLCV + 추가 필드 목록 (True면 EXTRA_FIELDS 전체)"""
+    if not extra_fields:
+        extra = ()
+    elif extra_fields is True:
+        extra = EXTRA_FIELDS
+    else:
+        extra = tuple(extra_fields)
+        unknown = [f for f in extra if f not in KLINE_FIELDS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 kline 필드: {unknown} (사용 가능: {', '.join(KLINE_FIELDS)})")
+    return OHLCV_FIELDS + tuple(f for f in extra if f not in OHLCV_FIELDS and f != 'timestamp')
+
+def _decode_csv(body: bytes, fields: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+    text = body.strip()
+    if not (text.startswith(b'[') and text.endswith(b']')):
+        raise ValueError('kline 배열 응답이 아닙니다')
+    text = text[1:-1].strip()
+    if not text:
+        return {f: np.empty(0, dtype=KLINE_FIELDS[f][1]) for f in fields}
+    if not (text.startswith(b'[') and text.endswith(b']')):
+        raise ValueError('kline 배열 응답이 아닙니다')
+
+    text = text[1:-1]
+    # 공백 없는 응답(바이낸스 기본)은 정규식 없이 치환
+    text = text.replace(b'],[', b'\n') if b' ' not in text else _ROW_SEPARATOR.sub(b'\n', text)
+    text = text.translate(None, b'"')
+
+    positions = {KLINE_FIELDS[f][0]: f for f in fields}
+    frame = pd.read_csv(
+        io.BytesIO(text),
+        header=None,
+        usecols=sorted(positions),
+        dtype={p: KLINE_FIELDS[f][1] for p, f in positions.items()},
+        engine='c'
+    )
+    return {f: frame[p].to_numpy() for p, f in positions.items()}
+
+def _decode_json(body: bytes, fields: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+    rows = _loads(body)
+    if not isinstance(rows, list):
+        raise ValueError(f"kline 배열 응답이 아닙니다: {str(rows)[:200]}")
+    columns = {}
+    for field in fields:
+        position, dtype = KLINE_FIELDS[field]
+        column = np.empty(len(rows), dtype=dtype)
+        column[:] = [row[position] for row in rows]
+        columns[field] = column
+    return columns
+
+def decode_klines(body: Union[bytes, str], extra_fields: Union[bool, Iterable[str], None] = False) -> Dict[str, np.ndarray]:
+    """
+    klines 응답 본문 → {필드: numpy 배열} (timestamp 포함)
+
+    Args:
+        body: 응답 바이트 (response.content)
+        extra_fields: True면 거래대금/체결 수/테이커 거래량도 디코딩, 필드명 목록으로 지정 가능
+    """
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    fields = ('timestamp',) + resolve_fields(extra_fields)
+    if len(body) < CSV_MIN_BYTES:
+        return _decode_json(body, fields)
+    try:
+        return _decode_csv(body, fields)
+    except (ValueError, pd.errors.ParserError) as e:
+        logger.debug(f"kline 고속 디코딩 실패, JSON 파서 사용: {e}")
+        return _decode_json(body, fields)
+
+class KlineBuffer:
+    """
+    여러 페이지 kline 응답을 미리 할당한 numpy 컬럼에 이어 쓰는 버퍼
+
+    예상 행 수(기간 / 봉 간격)로 한 번 할당하고, 넘치면 두 배로 늘립니다.
+    """
+
+    def __init__(self, capacity: int = 1000, extra_fields: Union[bool, Iterable[str], None] = False):
+        self.fields = ('timestamp',) + resolve_fields(extra_fields)
+        self.extra_fields = extra_fields
+        self.rows = 0
+        self.columns = {f: np.empty(max(capacity, 1), dtype=KLINE_FIELDS[f][1]) for f in self.fields}
+
+    def _reserve(self, rows: int):
+        capacity = len(self.columns['timestamp'])
+        if self.rows + rows <= capacity:
+            return
+        capacity = max(capacity * 2, self.rows + rows)
+        for field, column in self.columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.rows] = column[:self.rows]
+            self.columns[field] = grown
+
+    def extend(self, body: Union[bytes, str]) -> int:
+        """응답 한 페이지를 디코딩해 이어 쓰기 (추가된 행 수 반환)"""
+        page = decode_klines(body, self.extra_fields)
+        count = len(page['timestamp'])
+        self._reserve(count)
+        for field, values in page.items():
+            self.columns[field][self.rows:self.rows + count] = values
+        self.rows += count
+        return count
+
+    def last_timestamp(self) -> Optional[int]:
+        return int(self.columns['timestamp'][self.rows - 1]) if self.rows else None
+
+    def to_frame(self) -> pd.DataFrame:
+        """timestamp 인덱스 DataFrame (컬럼은 버퍼 배열의 뷰, 남는 용량이 크면 행 수에 맞게 줄인 뒤)"""
+        if len(self.columns['timestamp']) - self.rows > self.rows // 4:
+            # 예상 행 수보다 훨씬 적게 받으면(상장 전 구간 등) 뷰가 큰 버퍼 전체를 붙잡지 않도록 복사
+            self.columns = {f: column[:self.rows].copy() for f, column in self.columns.items()}
+        index = pd.DatetimeIndex(pd.to_datetime(self.columns['timestamp'][:self.rows], unit='ms'), name='timestamp')
+        data = {f: self.columns[f][:self.rows] for f in self.fields if f != 'timestamp'}
+        return pd.DataFrame(data, index=index, copy=False)
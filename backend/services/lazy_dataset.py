@@ -0,0 +1,399 @@
+"""
+Lazy Dataset
+메모리보다 큰 로컬 데이터를 청크 단위로 처리하는 지연 실행 데이터셋
+
+scan_local_data()가 돌려주는 LazyDataset에 필터, 컬럼 선택, 봉 간격 변환, 기술 지표를
+이어 붙이면 실행 계획만 쌓이고, collect()/last()/head() 등을 호출할 때 파일을 청크 단위로
+읽으며 계획을 적용합니다. 메모리에는 청크 하나와 단계별 이월분(롤링 윈도우 겹침, 미완성 봉)만
+올라가고 최종 결과만 DataFrame으로 만들어집니다.
+
+    scan = LazyDataset(paths).indicator('rsi').resample('1h').between('2024-01-01')
+    latest = scan.last(1)
+
+- 롤링 지표(SMA, 볼린저, 스토캐스틱, Williams %R)는 앞 청크의 마지막 window-1행을 겹쳐 계산합니다.
+  pandas 롤링 합/표준편차는 구간 전체를 누적 계산하므로 시작 위치가 다르면 부동소수점 차이가
+  남습니다 (2M행 1분봉에서 볼린저 표준편차 기준 최대 상대 오차 약 1e-7, benchmarks/lazy_scan.py는
+  1e-6 이내를 일치로 판정).
+- EWM 계열(EMA, MACD, RSI, ATR)은 잘려 나가는 가중치 합이 EWM_TOLERANCE(1e-12) 이하가 되는
+  만큼 겹쳐 계산합니다 (잘림 오차는 위 누적 오차보다 작음).
+- 봉 간격 변환은 청크 끝의 미완성 봉에 해당하는 원본 행을 다음 청크로 넘깁니다.
+- 단계는 추가한 순서대로 적용됩니다. between()을 지표 앞에 두면 시작 이전 행은 지표 계산에도
+  쓰이지 않으므로, 워밍업이 필요하면 지표 뒤에 두세요.
+"""
+
+import re
+import copy
+import math
+import inspect
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, Union, Callable
+import logging
+
+import pandas as pd
+
+from .storage_formats import iter_frame
+from .resampling import resample_ohlcv
+from .technical_indicators import TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
+SCAN_CHUNK_ROWS = 500_000
+
+# EWM 지표를 청크로 나눌 때 버리는 과거 가중치의 허용 비율
+EWM_TOLERANCE = 1e-12
+
+# 바이낸스 원본 파일명 (심볼_간격_...) → 같은 심볼/간격 파일은 하나의 시계열로 이어서 처리
+_SERIES_PATTERN = re.compile(r'^(?P<symbol>[A-Z0-9]+)_(?P<interval>\d+[smhdwM])_')
+
+def _ewm_lookback(alpha: float) -> int:
+    """가중치 (1-alpha)^k가 EWM_TOLERANCE 아래로 내려가는 k"""
+    if alpha >= 1:
+        return 0
+    return int(math.ceil(math.log(EWM_TOLERANCE) / math.log(1 - alpha)))
+
+# 이름 → (TechnicalIndicators 메서드, 가격 인자, 필요한 이전 행 수)
+INDICATORS = {
+    'sma': ('calculate_sma', ('data',), lambda p: p['period'] - 1),
+    'ema': ('calculate_ema', ('data',), lambda p: _ewm_lookback(2 / (p['period'] + 1))),
+    'macd': ('calculate_macd', ('data',), lambda p: (
+        _ewm_lookback(2 / (max(p['fast_period'], p['slow_period']) + 1)) + _ewm_lookback(2 / (p['signal_period'] + 1))
+    )),
+    'rsi': ('calculate_rsi', ('data',), lambda p: 1 + _ewm_lookback(1 / p['period'])),
+    'bollinger': ('calculate_bollinger_bands', ('data',), lambda p: p['period'] - 1),
+    'stochastic': ('calculate_stochastic', ('high', 'low', 'close'), lambda p: p['k_period'] + p['d_period'] - 2),
+    'atr': ('calculate_atr', ('high', 'low', 'close'), lambda p: 1 + _ewm_lookback(1 / p['period'])),
+    'williams_r': ('calculate_williams_r', ('high', 'low', 'close'), lambda p: p['period'] - 1)
+}
+
+_INDICATOR_ALIASES = {'bollinger_bands': 'bollinger', 'bb': 'bollinger', 'stoch': 'stochastic', 'williams': 'williams_r'}
+
+def _concat(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    frames = [f for f in frames if f is not None and len(f)]
+    if not frames:
+        return pd.DataFrame()
+    return frames[0] if len(frames) == 1 else pd.concat(frames)
+
+# 실행 단계 (시계열마다 deepcopy한 새 인스턴스로 실행)
+
+class _Step:
+    """process()는 청크를 받아 확정된 결과만 반환, flush()는 마지막 청크 뒤 남은 결과 반환"""
+
+    stateful = False
+
+    def process(self, frame: pd.DataFrame) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def flush(self) -> Optional[pd.DataFrame]:
+        return None
+
+class _Between(_Step):
+    def __init__(self, start, end):
+        self.start = pd.Timestamp(start) if start is not None else None
+        self.end = pd.Timestamp(end) if end is not None else None
+
+    def _bound(self, bound: pd.Timestamp, index: pd.DatetimeIndex) -> pd.Timestamp:
+        # 시간대가 있는 인덱스(tz 봉 변환 결과)와 비교할 수 있도록 맞춤
+        if index.tz is not None and bound.tz is None:
+            return bound.tz_localize(index.tz)
+        return bound
+
+    def past_end(self, frame: pd.DataFrame) -> bool:
+        """정렬된 원본 청크가 이미 종료 시각을 넘었는지 (이후 청크는 읽지 않음)"""
+        return self.end is not None and len(frame) > 0 and frame.index[0] > self._bound(self.end, frame.index)
+
+    def process(self, frame: pd.DataFrame) -> pd.DataFrame:
+        if self.start is not None:
+            frame = frame[frame.index >= self._bound(self.start, frame.index)]
+        if self.end is not None:
+            frame = frame[frame.index <= self._bound(self.end, frame.index)]
+        return frame
+
+    def __repr__(self):
+        return f"between({self.start}, {self.end})"
+
+class _Where(_Step):
+    def __init__(self, condition: Union[str, Callable[[pd.DataFrame], Any]]):
+        self.condition = condition
+
+    def process(self, frame: pd.DataFrame) -> pd.DataFrame:
+        if isinstance(self.condition, str):
+            return frame.query(self.condition)
+        return frame[self.condition(frame)]
+
+    def __repr__(self):
+        return f"where({self.condition if isinstance(self.condition, str) else getattr(self.condition, '__name__', 'func')})"
+
+class _Select(_Step):
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+
+    def process(self, frame: pd.DataFrame) -> pd.DataFrame:
+        return frame[self.columns]
+
+    def __repr__(self):
+        return f"select({', '.join(self.columns)})"
+
+class _Resample(_Step):
+    """청크 끝의 미완성 봉에 해당하는 원본 행은 다음 청크 앞에 붙여 다시 집계"""
+
+    stateful = True
+
+    def __init__(self, interval: str, tz: Optional[str]):
+        self.interval = interval
+        self.tz = tz
+        self.pending = None
+
+    def process(self, frame: pd.DataFrame) -> pd.DataFrame:
+        frame = _concat([self.pending, frame])
+        if frame.empty:
+            return frame
+        buckets = resample_ohlcv(frame, self.interval, tz=self.tz)
+        index = pd.DatetimeIndex(frame.index)
+        if self.tz:
+            index = (index.tz_localize('UTC') if index.tz is None else index).tz_convert(self.tz)
+        self.pending = frame.iloc[index.searchsorted(buckets.index[-1]):]
+        return buckets.iloc[:-1]
+
+    def flush(self) -> Optional[pd.DataFrame]:
+        if self.pending is None or self.pending.empty:
+            return None
+        pending, self.pending = self.pending, None
+        return resample_ohlcv(pending, self.interval, tz=self.tz)
+
+    def __repr__(self):
+        return f"resample({self.interval}{', ' + self.tz if self.tz else ''})"
+
+class _Indicator(_Step):
+    """앞 청크의 마지막 lookback행을 겹쳐 계산하고 겹친 부분의 결과는 버림"""
+
+    stateful = True
+
+    def __init__(self, name: str, inputs: Dict[str, str], params: Dict[str, Any], lookback: int, output: str):
+        self.name = name
+        self.method = getattr(TechnicalIndicators, INDICATORS[name][0])
+        self.inputs = inputs
+        self.params = params
+        self.lookback = lookback
+        self.output = output
+        self.tail = None
+
+    def process(self, frame: pd.DataFrame) -> pd.DataFrame:
+        if frame.empty:
+            return frame
+        overlap = 0 if self.tail is None else len(self.tail)
+        columns = _concat([self.tail, frame[list(set(self.inputs.values()))]])
+        result = self.method(**{arg: columns[col] for arg, col in self.inputs.items()}, **self.params)
+        self.tail = columns.iloc[max(0, len(columns) - self.lookback):] if self.lookback else None
+
+        result = result.iloc[overlap:]
+        if isinstance(result, pd.Series):
+            return frame.assign(**{self.output: result.to_numpy()})
+        return frame.assign(**{
+            (self.output if column == self.output else f"{self.output}_{column}"): result[column].to_numpy()
+            for column in result.columns
+        })
+
+    def __repr__(self):
+        params = ', '.join(f"{k}={v}" for k, v in self.params.items())
+        return f"indicator({self.name}{', ' + params if params else ''} → {self.output}, 겹침 {self.lookback}행)"
+
+def _series_key(path: Path) -> tuple:
+    match = _SERIES_PATTERN.match(path.name)
+    if match:
+        return (str(path.parent), match['symbol'], match['interval']), match['symbol']
+    return (str(path.parent), path.stem), path.stem
+
+class LazyDataset:
+    """
+    로컬 파일(들)에 대한 지연 실행 데이터셋
+
+    각 메서드는 단계를 추가한 새 LazyDataset을 반환하며 파일은 실행 메서드
+    (iter_chunks, collect, last, head, count)를 호출할 때만 읽습니다.
+    같은 심볼/간격의 여러 파일(월별 아카이브 등)은 이름순으로 이어 하나의 시계열로 처리하고
+    (앞 파일과 겹치는 시각은 제외), 시계열이 여러 개면 결과에 symbol 컬럼을 붙입니다.
+    """
+
+    def __init__(
+        self,
+        paths: List[Union[str, Path]],
+        columns: Optional[List[str]] = None,
+        chunk_rows: int = SCAN_CHUNK_ROWS,
+        steps: tuple = ()
+    ):
+        """
+        Args:
+            paths: 파일 경로 목록
+            columns: 파일에서 읽을 컬럼 (인덱스 제외, 생략 시 전체)
+            chunk_rows: 한 번에 읽을 행 수
+        """
+        if chunk_rows <= 0:
+            raise ValueError(f"chunk_rows는 0보다 커야 합니다: {chunk_rows}")
+        self.paths = [Path(p) for p in paths]
+        self.columns = list(columns) if columns is not None else None
+        self.chunk_rows = chunk_rows
+        self._steps = tuple(steps)
+
+    def _with(self, step: _Step) -> 'LazyDataset':
+        return LazyDataset(self.paths, self.columns, self.chunk_rows, self._steps + (step,))
+
+    # 계획 단계
+
+    def between(self, start=None, end=None) -> 'LazyDataset':
+        """시각 범위 필터 (start 이상, end 이하)"""
+        return self._with(_Between(start, end))
+
+    def where(self, condition: Union[str, Callable[[pd.DataFrame], Any]]) -> 'LazyDataset':
+        """행 필터 (DataFrame.query 문자열 또는 청크 → 불리언 마스크 함수)"""
+        return self._with(_Where(condition))
+
+    def select(self, *columns: str) -> 'LazyDataset':
+        """컬럼 선택 (파일에서 읽을 컬럼 자체를 줄이려면 scan_local_data(columns=...) 사용)"""
+        return self._with(_Select(columns))
+
+    def resample(self, interval: str, tz: Optional[str] = None) -> 'LazyDataset':
+        """상위 봉 간격으로 변환 (resample_ohlcv와 같은 집계)"""
+        return self._with(_Resample(interval, tz))
+
+    def indicator(self, name: str, column: str = 'close', output: Optional[str] = None, **params) -> 'LazyDataset':
+        """
+        TechnicalIndicators 지표 컬럼 추가
+
+        Args:
+            name: 'sma', 'ema', 'macd', 'rsi', 'bollinger', 'stochastic', 'atr', 'williams_r'
+            column: 가격 컬럼 (단일 입력 지표, 고가/저가/종가 지표는 high/low/close 사용)
+            output: 결과 컬럼명 (생략 시 'rsi_14'처럼 이름_기간, 여러 컬럼 결과는 접두어)
+            **params: 지표 인자 (period, fast_period 등)
+        """
+        key = name.lower()
+        key = key[len('calculate_'):] if key.startswith('calculate_') else key
+        key = _INDICATOR_ALIASES.get(key, key)
+        if key not in INDICATORS:
+            raise ValueError(f"지원하지 않는 지표: {name} (사용 가능: {', '.join(INDICATORS)})")
+
+        method_name, price_args, lookback = INDICATORS[key]
+        signature = inspect.signature(getattr(TechnicalIndicators, method_name))
+        try:
+            bound = signature.bind_partial(**params)
+        except TypeError as e:
+            raise ValueError(f"{key} 지표 인자 오류: {e}")
+        values = {
+            p.name: bound.arguments.get(p.name, p.default)
+            for p in signature.parameters.values() if p.name not in price_args
+        }
+        missing = [k for k, v in values.items() if v is inspect.Parameter.empty]
+        if missing:
+            raise ValueError(f"{key} 지표에 필요한 인자: {', '.join(missing)}")
+
+        inputs = {'data': column} if price_args == ('data',) else {arg: arg for arg in price_args}
+        if output is None:
+            output = f"{key}_{values['period']}" if 'period' in values else key
+        return self._with(_Indicator(key, inputs, values, lookback(values), output))
+
+    # 실행
+
+    def _groups(self) -> Dict[tuple, Dict[str, Any]]:
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for path in sorted(self.paths, key=lambda p: (p.parent.as_posix(), p.name)):
+            key, label = _series_key(path)
+            groups.setdefault(key, {'label': label, 'paths': []})['paths'].append(path)
+        return groups
+
+    def _stop_bound(self) -> Optional[_Between]:
+        # 봉 변환 전의 시각 필터만 원본 시각 기준 (봉 변환 뒤에는 봉 시작 시각 기준)
+        for step in self._steps:
+            if isinstance(step, _Resample):
+                return None
+            if isinstance(step, _Between) and step.end is not None:
+                return step
+        return None
+
+    def _run_series(self, paths: List[Path], stats: Dict[str, int]) -> Iterator[pd.DataFrame]:
+        steps = copy.deepcopy(self._steps)
+        stop = self._stop_bound()
+
+        def apply(frame: pd.DataFrame, start: int) -> pd.DataFrame:
+            for step in steps[start:]:
+                if frame.empty and not step.stateful:
+                    break
+                frame = step.process(frame)
+            return frame
+
+        last = None
+        for path in paths:
+            for chunk in iter_frame(path, columns=self.columns, chunk_rows=self.chunk_rows):
+                stats['rows_read'] += len(chunk)
+                if last is not None:
+                    # 앞 파일과 겹치는 구간(재수집, 스트림 저장분)은 제외
+                    chunk = chunk[chunk.index > last]
+                if chunk.empty:
+                    continue
+                if stop is not None and stop.past_end(chunk):
+                    break
+                last = chunk.index[-1]
+                out = apply(chunk, 0)
+                if len(out):
+                    yield out
+            else:
+                continue
+            break
+
+        # 상태가 있는 단계의 남은 결과를 이후 단계에 흘려 보냄
+        for i, step in enumerate(steps):
+            remaining = step.flush()
+            if remaining is not None and len(remaining):
+                out = apply(remaining, i + 1)
+                if len(out):
+                    yield out
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """계획을 적용한 결과를 청크 단위로 반환 (시계열 순서대로)"""
+        groups = self._groups()
+        stats = {'rows_read': 0}
+        for group in groups.values():
+            for out in self._run_series(group['paths'], stats):
+                if len(groups) > 1 and 'symbol' not in out.columns:
+                    out = out.assign(symbol=group['label'])
+                yield out
+        logger.info(f"스캔 완료: 파일 {len(self.paths)}개, 원본 {stats['rows_read']:,}행")
+
+    def collect(self) -> pd.DataFrame:
+        """전체 결과 DataFrame (봉 변환/필터로 줄어든 결과를 모을 때 사용)"""
+        return _concat(list(self.iter_chunks()))
+
+    def last(self, n: int = 1) -> pd.DataFrame:
+        """시계열별 마지막 n행 (최신 지표 값 스캔)"""
+        groups = self._groups()
+        stats = {'rows_read': 0}
+        frames = []
+        for group in groups.values():
+            tail = None
+            for out in self._run_series(group['paths'], stats):
+                tail = _concat([tail, out]).iloc[-n:]
+            if tail is not None and len(tail):
+                frames.append(tail.assign(symbol=group['label']) if len(groups) > 1 and 'symbol' not in tail.columns else tail)
+        logger.info(f"스캔 완료: 파일 {len(self.paths)}개, 원본 {stats['rows_read']:,}행")
+        return _concat(frames)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """처음 n행 (n행을 채우면 더 읽지 않음)"""
+        frames, rows = [], 0
+        for out in self.iter_chunks():
+            frames.append(out.iloc[:n - rows])
+            rows += len(frames[-1])
+            if rows >= n:
+                break
+        return _concat(frames)
+
+    def count(self) -> int:
+        """결과 행 수"""
+        return sum(len(out) for out in self.iter_chunks())
+
+    def explain(self) -> str:
+        """실행 계획 문자열"""
+        lines = [f"scan({len(self.paths)}개 파일, 시계열 {len(self._groups())}개, "
+                 f"컬럼 {self.columns or '전체'}, 청크 {self.chunk_rows:,}행)"]
+        lines += [f"  → {step!r}" for step in self._steps]
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return f"<LazyDataset\n{self.explain()}>"
@@ -0,0 +1,340 @@
+"""
+Market Stream Service
+바이낸스 WebSocket 실시간 시세(kline/trade) 수집 서비스
+"""
+
+import os
+import json
+import time
+import threading
+import pandas as pd
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Tuple
+import logging
+
+from .candle_ring import CandleRing, CANDLE_COLUMNS
+from .data_catalog import get_catalog
+
+logger = logging.getLogger(__name__)
+
+# 바이낸스 공개 스트림 주소 (로컬 재생 서버 사용 시 BINANCE_STREAM_URL=ws://localhost:9999)
+DEFAULT_STREAM_URL = 'wss://stream.binance.com:9443'
+
+class MarketStreamService:
+    """실시간 시세 스트림 수집 서비스"""
+
+    def __init__(
+        self,
+        stream_url: Optional[str] = None,
+        buffer_size: int = 1000,
+        save_closed: bool = True,
+        on_update: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Args:
+            stream_url: WebSocket 서버 주소 (기본값: BINANCE_STREAM_URL 또는 바이낸스)
+            buffer_size: (심볼, 간격)별 메모리에 유지할 최근 캔들 수
+            save_closed: 마감된 캔들을 로컬 저장소(raw_data/binance)에 추가 저장할지 여부
+            on_update: 캔들/체결 갱신 시 호출할 콜백 (예: 차트 세션 델타 전송)
+        """
+        self.stream_url = (stream_url or os.getenv('BINANCE_STREAM_URL', DEFAULT_STREAM_URL)).rstrip('/')
+        self.buffer_size = buffer_size
+        self.save_closed = save_closed
+        self.on_update = on_update
+        self.store_path = Path('local_data/raw_data/binance')
+
+        self._subscriptions = set()
+        self._buffers: Dict[Tuple[str, str], CandleRing] = {}
+        self._current: Dict[Tuple[str, str], tuple] = {}
+        self._trades: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+        self._ws = None
+        self._thread = None
+        self._running = False
+        self._connected = False
+        self._request_id = 0
+        self._message_count = 0
+
+    # 구독 관리
+
+    @staticmethod
+    def kline_stream(symbol: str, interval: str) -> str:
+        """kline 스트림 이름 (예: btcusdt@kline_1m)"""
+        return f"{symbol.lower()}@kline_{interval}"
+
+    @staticmethod
+    def trade_stream(symbol: str) -> str:
+        """trade 스트림 이름 (예: btcusdt@trade)"""
+        return f"{symbol.lower()}@trade"
+
+    def subscribe(self, symbol: str, interval: str = '1m', trades: bool = False) -> List[str]:
+        """심볼/간격 kline 스트림 구독 (trades=True면 체결 스트림도 구독)"""
+        streams = [self.kline_stream(symbol, interval)]
+        if trades:
+            streams.append(self.trade_stream(symbol))
+
+        with self._lock:
+            new_streams = [s for s in streams if s not in self._subscriptions]
+            self._subscriptions.update(new_streams)
+            self._buffers.setdefault((symbol.upper(), interval), CandleRing(self.buffer_size))
+
+        if new_streams and self._connected:
+            self._send_request('SUBSCRIBE', new_streams)
+        logger.info(f"스트림 구독: {', '.join(streams)}")
+        return streams
+
+    def unsubscribe(self, symbol: str, interval: str = '1m', trades: bool = False) -> List[str]:
+        """스트림 구독 해제 (메모리 버퍼는 유지)"""
+        streams = [self.kline_stream(symbol, interval)]
+        if trades:
+            streams.append(self.trade_stream(symbol))
+
+        with self._lock:
+            removed = [s for s in streams if s in self._subscriptions]
+            self._subscriptions.difference_update(removed)
+
+        if removed and self._connected:
+            self._send_request('UNSUBSCRIBE', removed)
+        logger.info(f"스트림 구독 해제: {', '.join(streams)}")
+        return removed
+
+    # 연결 관리
+
+    def start(self):
+        """백그라운드 스레드에서 스트림 수신 시작 (연결이 끊기면 자동 재연결)"""
+        if self._running:
+            return
+        try:
+            import websocket  # noqa: F401  (websocket-client)
+        except ImportError:
+            raise ImportError("websocket-client 패키지가 필요합니다: pip install websocket-client")
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='market-stream', daemon=True)
+        self._thread.start()
+        logger.info(f"시세 스트림 시작: {self.stream_url}")
+
+    def stop(self):
+        """스트림 수신 중지"""
+        self._running = False
+        if self._ws is not None:
+            self._ws.close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+        logger.info("시세 스트림 중지")
+
+    def _run(self):
+        import websocket
+
+        backoff = 1
+        while self._running:
+            self._ws = websocket.WebSocketApp(
+                f"{self.stream_url}/stream",
+                on_open=self._on_open,
+                on_message=lambda ws, message: self.handle_message(message),
+                on_error=lambda ws, error: logger.error(f"시세 스트림 오류: {error}"),
+                on_close=self._on_close
+            )
+            self._ws.run_forever(ping_interval=60, ping_timeout=10)
+
+            if self._running:
+                logger.warning(f"시세 스트림 연결 끊김, {backoff}초 후 재연결")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+            else:
+                break
+
+    def _on_open(self, ws):
+        self._connected = True
+        with self._lock:
+            streams = sorted(self._subscriptions)
+        if streams:
+            self._send_request('SUBSCRIBE', streams)
+        logger.info(f"시세 스트림 연결됨 ({len(streams)}개 스트림)")
+
+    def _on_close(self, ws, status_code=None, message=None):
+        self._connected = False
+
+    def _send_request(self, method: str, streams: List[str]):
+        self._request_id += 1
+        try:
+            self._ws.send(json.dumps({'method': method, 'params': streams, 'id': self._request_id}))
+        except Exception as e:
+            logger.error(f"스트림 요청 전송 실패 ({method}): {e}")
+
+    # 메시지 처리
+
+    def handle_message(self, message: str):
+        """스트림 메시지 처리 (combined stream {"stream", "data"} 또는 단일 이벤트)"""
+        try:
+            payload = json.loads(message)
+            event = payload.get('data', payload)
+            event_type = event.get('e')
+
+            if event_type == 'kline':
+                self._handle_kline(event['k'])
+            elif event_type == 'trade':
+                self._handle_trade(event)
+            else:
+                return  # 구독 응답 등
+
+            self._message_count += 1
+
+        except Exception as e:
+            logger.error(f"스트림 메시지 처리 실패: {e}")
+
+    def _handle_kline(self, kline: Dict[str, Any]):
+        symbol = kline['s'].upper()
+        interval = kline['i']
+        key = (symbol, interval)
+        candle = (
+            int(kline['t']),
+            float(kline['o']),
+            float(kline['h']),
+            float(kline['l']),
+            float(kline['c']),
+            float(kline['v'])
+        )
+        closed = bool(kline['x'])
+
+        with self._lock:
+            if closed:
+                self._buffers.setdefault(key, CandleRing(self.buffer_size)).append(*candle)
+                self._current.pop(key, None)
+            else:
+                self._current[key] = candle
+
+        if closed and self.save_closed:
+            self._store_candle(symbol, interval, candle)
+
+        self._notify({
+            'type': 'kline',
+            'title': f"{symbol} {interval}",
+            'symbol': symbol,
+            'interval': interval,
+            'closed': closed,
+            'candle': self._candle_to_dict(candle)
+        })
+
+    def _handle_trade(self, trade: Dict[str, Any]):
+        symbol = trade['s'].upper()
+        record = (int(trade['T']), float(trade['p']), float(trade['q']), bool(trade['m']))
+
+        with self._lock:
+            self._trades.setdefault(symbol, deque(maxlen=self.buffer_size)).append(record)
+
+        self._notify({
+            'type': 'trade',
+            'title': f"{symbol} trades",
+            'symbol': symbol,
+            'trade': {
+                'timestamp': datetime.utcfromtimestamp(record[0] / 1000).isoformat(),
+                'price': record[1],
+                'quantity': record[2],
+                'is_buyer_maker': record[3]
+            }
+        })
+
+    def _notify(self, payload: Dict[str, Any]):
+        if self.on_update is None:
+            return
+        try:
+            self.on_update(payload)
+        except Exception as e:
+            logger.error(f"스트림 갱신 전송 실패: {e}")
+
+    @staticmethod
+    def _candle_to_dict(candle: tuple) -> Dict[str, Any]:
+        timestamp = datetime.utcfromtimestamp(candle[0] / 1000).isoformat()
+        return {'timestamp': timestamp, **dict(zip(CANDLE_COLUMNS, candle[1:]))}
+
+    def _store_candle(self, symbol: str, interval: str, candle: tuple):
+        """마감된 캔들을 로컬 CSV에 한 행씩 추가 (load_local_data로 바로 로드 가능)"""
+        try:
+            file_path = self.store_path / f"{symbol}_{interval}_stream.csv"
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not file_path.exists()
+
+            timestamp = datetime.utcfromtimestamp(candle[0] / 1000).strftime('%Y-%m-%d %H:%M:%S')
+            with open(file_path, 'a', encoding='utf-8') as f:
+                if is_new:
+                    f.write('timestamp,' + ','.join(CANDLE_COLUMNS) + ',symbol,interval\n')
+                f.write(f"{timestamp},{','.join(repr(v) for v in candle[1:])},{symbol},{interval}\n")
+
+            get_catalog(self.store_path.parent.parent).record(file_path, start=timestamp, end=timestamp, append=True)
+
+        except Exception as e:
+            logger.error(f"스트림 캔들 저장 실패: {e}")
+
+    # 조회
+
+    def get_candles(
+        self,
+        symbol: str,
+        interval: str = '1m',
+        limit: Optional[int] = None,
+        include_current: bool = False
+    ) -> pd.DataFrame:
+        """
+        메모리 버퍼의 최근 캔들을 OHLCV DataFrame으로 반환
+
+        Args:
+            symbol: 거래 쌍
+            interval: 봉 간격
+            limit: 최근 N개만 반환
+            include_current: 아직 마감되지 않은 현재 캔들 포함 여부
+
+        Returns:
+            get_ohlcv_dataframe과 같은 형식의 DataFrame
+        """
+        key = (symbol.upper(), interval)
+        with self._lock:
+            ring = self._buffers.get(key)
+            if ring is None:
+                ring = CandleRing(1)
+            current = self._current.get(key) if include_current else None
+            if current is not None and limit:
+                limit -= 1
+            # 수신 스레드가 계속 기록하므로 잠금 안에서 복사본으로 꺼냄
+            df = ring.to_dataframe(copy=True, last=limit)
+
+        if current is not None:
+            df.loc[pd.Timestamp(current[0], unit='ms')] = current[1:]
+
+        df['symbol'] = symbol.upper()
+        df['interval'] = interval
+        return df
+
+    def get_trades(self, symbol: str, limit: Optional[int] = None) -> pd.DataFrame:
+        """메모리 버퍼의 최근 체결 내역 반환"""
+        with self._lock:
+            trades = list(self._trades.get(symbol.upper(), ()))
+
+        if limit:
+            trades = trades[-limit:]
+
+        df = pd.DataFrame(trades, columns=['timestamp', 'price', 'quantity', 'is_buyer_maker'])
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        return df.set_index('timestamp')
+
+    def status(self) -> Dict[str, Any]:
+        """스트림 상태 정보"""
+        with self._lock:
+            buffers = {
+                f"{symbol}_{interval}": len(buffer)
+                for (symbol, interval), buffer in self._buffers.items()
+            }
+            subscriptions = sorted(self._subscriptions)
+
+        return {
+            'running': self._running,
+            'connected': self._connected,
+            'stream_url': self.stream_url,
+            'subscriptions': subscriptions,
+            'buffers': buffers,
+            'messages': self._message_count
+        }
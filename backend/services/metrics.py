@@ -0,0 +1,413 @@
+"""
+Metrics Service
+Prometheus 텍스트 형식(/metrics) 지표 레지스트리 (외부 의존성 없음)
+
+핫 패스(바이낸스 요청, 셀 실행, 차트 전송)의 증가 연산은 락을 잡지 않습니다.
+카운터/히스토그램 값은 스레드별 샤드에 나눠 저장하고 각 샤드는 그 스레드만 수정하므로,
+GIL 아래에서 경쟁 없이 더할 수 있고 스크레이프 시점에 샤드를 합산합니다.
+저장소 합계처럼 비싼 값은 스크레이프 때 콜백으로 계산합니다 (카탈로그 합계, 파일 시스템 순회 없음).
+
+셀은 별도 프로세스에서 실행되므로 셀 안에서 쌓인 지표는 실행 지표 마커(export)로
+서버에 전달되어 합쳐집니다 (merge).
+"""
+
+import math
+import time
+import bisect
+import threading
+from typing import Optional, Dict, Any, Callable, List, Tuple, Iterable
+import logging
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 초 단위 지연 시간 버킷 (바이낸스 요청, 셀 실행)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 바이트 크기 버킷 (차트/DataFrame 페이로드)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+class _CounterValue:
+    """스레드별 샤드에 나눠 더하는 카운터 값"""
+
+    __slots__ = ('_shards',)
+
+    def __init__(self):
+        self._shards: Dict[int, float] = {}
+
+    def inc(self, amount: float = 1.0):
+        # 키는 현재 스레드 전용이므로 읽고-더하고-쓰는 사이에 다른 스레드가 끼어들 수 없음
+        ident = threading.get_ident()
+        shards = self._shards
+        shards[ident] = shards.get(ident, 0.0) + amount
+
+    def get(self) -> float:
+        return sum(list(self._shards.values()))
+
+class _GaugeValue:
+    """현재 값 (set은 단일 대입, inc/dec는 드물게 호출되므로 락 사용)"""
+
+    __slots__ = ('_value', '_lock')
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def get(self) -> float:
+        return self._value
+
+class _HistogramValue:
+    """버킷 카운트/합계/개수를 스레드별 샤드에 기록하는 히스토그램 값"""
+
+    __slots__ = ('_bounds', '_shards')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        self._shards: Dict[int, List[float]] = {}
+
+    def observe(self, value: float):
+        ident = threading.get_ident()
+        shard = self._shards.get(ident)
+        if shard is None:
+            # [버킷별 개수 (+Inf 포함)..., 합계, 개수]
+            shard = self._shards[ident] = [0] * (len(self._bounds) + 1) + [0.0, 0]
+        shard[bisect.bisect_left(self._bounds, value)] += 1
+        shard[-2] += value
+        shard[-1] += 1
+
+    def time(self) -> '_Timer':
+        """with 블록 실행 시간을 기록하는 컨텍스트 매니저"""
+        return _Timer(self)
+
+    def snapshot(self) -> List[float]:
+        total = [0] * (len(self._bounds) + 1) + [0.0, 0]
+        for shard in list(self._shards.values()):
+            for i, v in enumerate(shard):
+                total[i] += v
+        return total
+
+    def add(self, values: List[float]):
+        """다른 프로세스에서 집계한 [버킷..., 합계, 개수]를 더함"""
+        ident = threading.get_ident()
+        shard = self._shards.get(ident)
+        if shard is None:
+            shard = self._shards[ident] = [0] * (len(self._bounds) + 1) + [0.0, 0]
+        for i, v in enumerate(values[:len(shard)]):
+            shard[i] += v
+
+class _Timer:
+    __slots__ = ('_histogram', '_started')
+
+    def __init__(self, histogram: _HistogramValue):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._started)
+        return False
+
+class Metric:
+    """
+    레이블별 값을 가진 지표 패밀리
+
+    labels(...)로 레이블 조합별 값을 얻습니다. 조합 생성만 락을 잡고, 이후 조회는 딕셔너리 읽기뿐입니다.
+    레이블이 없는 지표는 inc/set/observe를 바로 호출할 수 있습니다.
+    """
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def _new_value(self):
+        raise NotImplementedError
+
+    def labels(self, *values, **kwargs):
+        """레이블 값 조합의 지표 값 (위치 또는 키워드 인자)"""
+        if kwargs:
+            values = tuple(kwargs[n] for n in self.labelnames)
+        value = self._values.get(values)
+        if value is None:
+            values = tuple(str(v) for v in values)
+            value = self._values.get(values)
+        if value is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} 레이블 개수 불일치: {self.labelnames}")
+            with self._lock:
+                value = self._values.get(values)
+                if value is None:
+                    value = self._values[values] = self._new_value()
+        return value
+
+    def items(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        return list(self._values.items())
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        for labelvalues, value in sorted(self.items()):
+            lines.extend(self._render_value(labelvalues, value))
+        return lines
+
+    def _render_value(self, labelvalues, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value.get())}"]
+
+class Counter(Metric):
+    """누적 카운터"""
+
+    kind = 'counter'
+
+    def _new_value(self):
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+class Gauge(Metric):
+    """현재 값 게이지"""
+
+    kind = 'gauge'
+
+    def _new_value(self):
+        return _GaugeValue()
+
+    def set(self, value: float):
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default.dec(amount)
+
+class Histogram(Metric):
+    """누적 버킷 히스토그램 (_bucket, _sum, _count)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_value(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self) -> _Timer:
+        return self._default.time()
+
+    def _render_value(self, labelvalues, value) -> List[str]:
+        snapshot = value.snapshot()
+        lines, cumulative = [], 0
+        for bound, count in zip(self.buckets + (math.inf,), snapshot):
+            cumulative += count
+            labels = _format_labels(self.labelnames, labelvalues, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+        labels = _format_labels(self.labelnames, labelvalues)
+        lines.append(f"{self.name}_sum{labels} {_format_value(snapshot[-2])}")
+        lines.append(f"{self.name}_count{labels} {_format_value(snapshot[-1])}")
+        return lines
+
+class CallbackGauge(Metric):
+    """스크레이프 때 콜백으로 계산하는 게이지 (콜백은 값 또는 {레이블 값 튜플: 값} 반환)"""
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), callback: Optional[Callable[[], Any]] = None):
+        self.callback = callback
+        super().__init__(name, documentation, labelnames)
+
+    def _new_value(self):
+        return None
+
+    def items(self):
+        if self.callback is None:
+            return []
+        try:
+            result = self.callback()
+        except Exception as e:
+            logger.warning(f"지표 콜백 실패 ({self.name}): {e}")
+            return []
+        if not isinstance(result, dict):
+            return [((), result)] if result is not None else []
+        return [(tuple(str(v) for v in (k if isinstance(k, tuple) else (k,))), v) for k, v in result.items()]
+
+    def _render_value(self, labelvalues, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(float(value))}"]
+
+class MetricsRegistry:
+    """지표 패밀리 모음 (이름 순서대로 렌더링)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 지표: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback_gauge(self, name: str, documentation: str, labelnames: Iterable[str] = (), callback: Optional[Callable[[], Any]] = None) -> CallbackGauge:
+        return self.register(CallbackGauge(name, documentation, labelnames, callback))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 0.0.4"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def export(self) -> Dict[str, List[list]]:
+        """
+        값이 있는 카운터/히스토그램/게이지를 JSON 직렬화 가능한 형태로 반환 (셀 프로세스 → 서버)
+
+        Returns:
+            {지표명: [[레이블 값 리스트, 값 또는 히스토그램 스냅샷], ...]}
+        """
+        exported = {}
+        for metric in list(self._metrics.values()):
+            entries = []
+            for labelvalues, value in metric.items():
+                if isinstance(value, _HistogramValue):
+                    snapshot = value.snapshot()
+                    if snapshot[-1]:
+                        entries.append([list(labelvalues), snapshot])
+                elif isinstance(value, _CounterValue) and value.get():
+                    entries.append([list(labelvalues), value.get()])
+                elif isinstance(value, _GaugeValue) and value.get():
+                    entries.append([list(labelvalues), value.get()])
+            if entries:
+                exported[metric.name] = entries
+        return exported
+
+    def merge(self, exported: Optional[Dict[str, List[list]]]):
+        """export() 결과를 합침 (카운터/히스토그램은 더하고 게이지는 덮어씀, 모르는 지표는 무시)"""
+        for name, entries in (exported or {}).items():
+            metric = self._metrics.get(name)
+            if metric is None or isinstance(metric, CallbackGauge):
+                continue
+            for labelvalues, value in entries:
+                try:
+                    target = metric.labels(*labelvalues)
+                except ValueError:
+                    continue
+                if isinstance(target, _HistogramValue):
+                    target.add(value)
+                elif isinstance(target, _CounterValue):
+                    target.inc(float(value))
+                elif isinstance(target, _GaugeValue):
+                    target.set(float(value))
+
+registry = MetricsRegistry()
+
+# 바이낸스 REST API
+BINANCE_REQUESTS = registry.counter(
+    'juppelin_binance_requests_total', 'Binance REST requests by endpoint and HTTP status', ('endpoint', 'status'))
+BINANCE_LATENCY = registry.histogram(
+    'juppelin_binance_request_seconds', 'Binance REST request latency in seconds', ('endpoint',))
+BINANCE_WEIGHT = registry.gauge(
+    'juppelin_binance_used_weight', 'Last X-MBX-USED-WEIGHT-1M header value reported by Binance')
+
+# 셀 실행
+EXECUTIONS = registry.counter(
+    'juppelin_executions_total', 'Cell executions by status', ('status',))
+EXECUTION_LATENCY = registry.histogram(
+    'juppelin_execution_seconds', 'Cell execution latency in seconds (process start to exit)')
+EXECUTION_QUEUE_WAIT = registry.histogram(
+    'juppelin_execution_queue_wait_seconds', 'Time spent waiting for an execution slot in seconds')
+EXECUTION_SLOTS = registry.gauge(
+    'juppelin_execution_slots', 'Maximum number of concurrent cell processes')
+EXECUTIONS_IN_PROGRESS = registry.gauge(
+    'juppelin_executions_in_progress', 'Cell processes currently running')
+EXECUTIONS_WAITING = registry.gauge(
+    'juppelin_executions_waiting', 'Execution requests waiting for a slot (queue depth)')
+
+# 캐시 (rollup: 저장된 롤업 재사용, local_ohlcv: API 대신 로컬 데이터 사용)
+CACHE_REQUESTS = registry.counter(
+    'juppelin_cache_requests_total', 'Cache lookups by cache and result (hit or miss)', ('cache', 'result'))
+
+# 전송량
+BYTES_SERVED = registry.counter(
+    'juppelin_bytes_served_total', 'Serialized bytes sent to clients by payload kind', ('kind',))
+PAYLOAD_SIZE = registry.histogram(
+    'juppelin_payload_bytes', 'Serialized payload size in bytes by kind', ('kind',), SIZE_BUCKETS)
+
+# 스크레이프 때 계산 (저장소는 카탈로그 합계, 파일 시스템 순회 없음)
+def _storage_usage() -> Dict[str, Any]:
+    from .data_catalog import get_catalog
+    return get_catalog('local_data').storage_usage()['directories']
+
+def _history_pending() -> int:
+    from .execution_history import get_execution_history
+    return get_execution_history().pending()
+
+STORAGE_BYTES = registry.callback_gauge(
+    'juppelin_storage_bytes', 'Bytes stored under local_data by top-level directory', ('directory',),
+    lambda: {d: v['bytes'] for d, v in _storage_usage().items()})
+STORAGE_FILES = registry.callback_gauge(
+    'juppelin_storage_files', 'Files stored under local_data by top-level directory', ('directory',),
+    lambda: {d: v['files'] for d, v in _storage_usage().items()})
+EXECUTION_HISTORY_PENDING = registry.callback_gauge(
+    'juppelin_execution_history_pending', 'Execution records queued for the history writer', (), _history_pending)
+
+def cache_result(cache: str, hit: bool):
+    """캐시 조회 결과 기록"""
+    CACHE_REQUESTS.labels(cache, 'hit' if hit else 'miss').inc()
+
+def record_payload(kind: str, size: int):
+    """클라이언트로 보낸 직렬화 페이로드 크기 기록"""
+    BYTES_SERVED.labels(kind).inc(size)
+    PAYLOAD_SIZE.labels(kind).observe(size)
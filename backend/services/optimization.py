@@ -0,0 +1,262 @@
+"""
+Parameter Optimization Service
+프로세스 풀 기반 백테스트 파라미터 그리드 최적화 서비스
+"""
+
+import os
+import itertools
+import contextlib
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Iterator, Optional, Callable, Union
+import logging
+
+from .backtest import BacktestEngine
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스 전역 상태 (initializer에서 공유 메모리에 연결, 작업마다 재사용)
+_worker_shm = None
+_worker_index_shm = None
+_worker_data = None
+_worker_config = None
+
+def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """파라미터 그리드를 조합 목록으로 전개 ({'a': [1, 2], 'b': [3]} → [{'a': 1, 'b': 3}, ...])"""
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+@contextlib.contextmanager
+def shared_frame(data: pd.DataFrame):
+    """
+    DataFrame을 워커에 한 번만 전달 (작업마다 피클링하지 않음)
+
+    숫자형 컬럼과 시각 인덱스(int64)는 공유 메모리 블록으로 복사하고,
+    그 외 인덱스와 숫자가 아닌 컬럼(symbol 등)은 initargs로 워커당 한 번 피클링합니다.
+
+    Yields:
+        (공유 메모리 이름, 블록 shape, 컬럼 리스트, 인덱스/기타 컬럼 정보) - _init_worker의 initargs로 사용
+    """
+    numeric = data.select_dtypes(include=[np.number])
+    columns = list(numeric.columns)
+    shape = (len(columns), len(numeric))
+    others = [column for column in data.columns if column not in numeric.columns]
+    extras = {
+        'columns': list(data.columns),
+        'others': data[others].reset_index(drop=True) if others else None
+    }
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+    index_shm = None
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        for i, column in enumerate(columns):
+            block[i] = numeric[column].to_numpy(dtype=np.float64)
+        del block  # 공유 메모리 해제 전에 버퍼 참조 제거
+
+        index = data.index
+        if isinstance(index, pd.DatetimeIndex):
+            index_shm = shared_memory.SharedMemory(create=True, size=max(1, len(index) * 8))
+            np.ndarray(len(index), dtype=np.int64, buffer=index_shm.buf)[:] = index.asi8
+            extras['index'] = {
+                'shm': index_shm.name, 'length': len(index), 'unit': index.unit,
+                'tz': str(index.tz) if index.tz is not None else None, 'name': index.name
+            }
+        else:
+            extras['index'] = index
+
+        yield shm.name, shape, columns, extras
+    finally:
+        for block_shm in (shm, index_shm):
+            if block_shm is not None:
+                block_shm.close()
+                block_shm.unlink()
+
+def _init_worker(shm_name: str, shape: tuple, columns: List[str], extras: Dict[str, Any], config: Dict[str, Any]):
+    """워커 초기화: 공유 메모리의 가격 배열/시각 인덱스를 복사 없이 DataFrame으로 연결"""
+    global _worker_shm, _worker_index_shm, _worker_data, _worker_config
+
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    block = np.ndarray(shape, dtype=np.float64, buffer=_worker_shm.buf)
+
+    index = extras['index']
+    if isinstance(index, dict):
+        _worker_index_shm = shared_memory.SharedMemory(name=index['shm'])
+        values = np.ndarray(index['length'], dtype=np.int64, buffer=_worker_index_shm.buf)
+        # asi8은 UTC 기준 값이므로 시간대가 있으면 UTC로 해석 후 변환
+        index_values = pd.DatetimeIndex(values.view(f"datetime64[{index['unit']}]"), name=index['name'])
+        if index['tz'] is not None:
+            index_values = index_values.tz_localize('UTC').tz_convert(index['tz'])
+        index = index_values
+
+    # (컬럼 수, 행 수) 블록의 전치 → pandas 내부 블록 레이아웃과 같아 복사 없음
+    _worker_data = pd.DataFrame(block.T, columns=columns, index=index, copy=False)
+
+    # 숫자가 아닌 컬럼은 원래 위치에 새 블록으로 추가 (숫자 블록은 그대로 공유)
+    others = extras['others']
+    if others is not None:
+        for position, column in enumerate(extras['columns']):
+            if column in others.columns:
+                _worker_data.insert(position, column, others[column].to_numpy())
+    _worker_config = config
+
+def _worker_engine(config: Dict[str, Any]) -> BacktestEngine:
+    """워커 설정으로 백테스트 엔진 생성"""
+    return BacktestEngine(
+        fee_rate=config['fee_rate'],
+        slippage=config['slippage'],
+        initial_capital=config['initial_capital']
+    )
+
+def _build_positions(engine: BacktestEngine, data: pd.DataFrame, config: Dict[str, Any], params: Dict[str, Any]) -> np.ndarray:
+    """내장 전략명 또는 사용자 함수로 목표 포지션 생성"""
+    strategy = config['strategy']
+    if callable(strategy):
+        return strategy(data, **params)
+    return engine.build_positions(data, strategy, config['allow_short'], config['price_column'], **params)
+
+def _run_batch(param_batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """워커에서 파라미터 묶음 백테스트 실행 후 성과 지표 반환"""
+    config = _worker_config
+    engine = _worker_engine(config)
+    close = _worker_data[config['price_column']].to_numpy()
+
+    rows = []
+    for params in param_batch:
+        try:
+            positions = _build_positions(engine, _worker_data, config, params)
+            result = engine.run(close, positions)
+            stats = engine.compute_stats(result, config['periods_per_year'])
+            rows.append({**params, **stats})
+        except Exception as e:
+            rows.append({**params, 'error': str(e)})
+    return rows
+
+class GridOptimizer:
+    """백테스트 파라미터 그리드 최적화 (ProcessPoolExecutor + 공유 메모리)"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        fee_rate: float = 0.001,
+        slippage: float = 0.0005,
+        initial_capital: float = 10000.0,
+        allow_short: bool = False,
+        price_column: str = 'close'
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.fee_rate = fee_rate
+        self.slippage = slippage
+        self.initial_capital = initial_capital
+        self.allow_short = allow_short
+        self.price_column = price_column
+
+    def iter_results(
+        self,
+        strategy: Union[str, Callable],
+        data: pd.DataFrame,
+        grid: Union[Dict[str, List[Any]], List[Dict[str, Any]]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        그리드 백테스트 결과를 완료되는 순서대로 스트리밍
+
+        Args:
+            strategy: 내장 전략명 ('macd', 'rsi', 'sma_cross') 또는
+                      (data, **params) → 포지션 배열을 반환하는 모듈 수준 함수 (피클 가능해야 함)
+            data: OHLCV 데이터 (숫자형 컬럼과 시각 인덱스가 공유 메모리로 워커에 전달됨)
+            grid: 파라미터 그리드 딕셔너리 또는 파라미터 조합 리스트
+
+        Yields:
+            파라미터와 성과 지표(sharpe, max_drawdown, turnover 등)가 합쳐진 딕셔너리
+        """
+        param_list = expand_grid(grid) if isinstance(grid, dict) else list(grid)
+        if not param_list:
+            return
+
+        if self.price_column not in data.columns:
+            raise ValueError(f"가격 컬럼이 없습니다: {self.price_column}")
+
+        config = self.build_config(strategy, data)
+
+        # 작업 전달 비용을 줄이도록 워커당 여러 묶음으로 분할 (부하 분산 유지)
+        workers = min(self.max_workers, len(param_list))
+        batch_size = max(1, len(param_list) // (workers * 4))
+        batches = [param_list[i:i + batch_size] for i in range(0, len(param_list), batch_size)]
+
+        with shared_frame(data) as (shm_name, shape, columns, extras):
+            logger.info(f"그리드 최적화 시작: {len(param_list)}개 조합, 워커 {workers}개, 묶음 {len(batches)}개")
+
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(shm_name, shape, columns, extras, config)
+            )
+            try:
+                futures = [executor.submit(_run_batch, batch) for batch in batches]
+                for future in as_completed(futures):
+                    for row in future.result():
+                        yield row
+            finally:
+                # 중간에 순회를 멈춘 경우 남은 작업 취소
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def build_config(self, strategy: Union[str, Callable], data: pd.DataFrame) -> Dict[str, Any]:
+        """워커 프로세스에 전달할 백테스트 설정"""
+        return {
+            'strategy': strategy,
+            'fee_rate': self.fee_rate,
+            'slippage': self.slippage,
+            'initial_capital': self.initial_capital,
+            'allow_short': self.allow_short,
+            'price_column': self.price_column,
+            'periods_per_year': BacktestEngine.infer_periods_per_year(data.index)
+        }
+
+    def optimize(
+        self,
+        strategy: Union[str, Callable],
+        data: pd.DataFrame,
+        grid: Union[Dict[str, List[Any]], List[Dict[str, Any]]],
+        rank_by: str = 'sharpe',
+        ascending: bool = False,
+        callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None
+    ) -> pd.DataFrame:
+        """
+        그리드 최적화 실행 후 순위가 매겨진 결과 DataFrame 반환
+
+        Args:
+            strategy: 내장 전략명 또는 포지션 생성 함수
+            data: OHLCV 데이터
+            grid: 파라미터 그리드
+            rank_by: 정렬 기준 지표 (기본값: 'sharpe')
+            ascending: 오름차순 정렬 여부 (max_drawdown 등은 False가 좋은 순)
+            callback: 결과 도착 시 호출 (완료 수, 전체 수, 결과 행)
+
+        Returns:
+            rank 컬럼이 추가된 결과 DataFrame
+        """
+        try:
+            total = len(expand_grid(grid)) if isinstance(grid, dict) else len(grid)
+            rows = []
+            for row in self.iter_results(strategy, data, grid):
+                rows.append(row)
+                if callback:
+                    callback(len(rows), total, row)
+
+            results = pd.DataFrame(rows)
+            if results.empty:
+                return results
+
+            if rank_by in results.columns:
+                results = results.sort_values(rank_by, ascending=ascending, na_position='last')
+            results = results.reset_index(drop=True)
+            results.insert(0, 'rank', np.arange(1, len(results) + 1))
+
+            logger.info(f"그리드 최적화 완료: {len(results)}개 결과")
+            return results
+
+        except Exception as e:
+            logger.error(f"그리드 최적화 실패: {e}")
+            raise
@@ -0,0 +1,385 @@
+"""
+Resampling Service
+OHLCV 상위 봉 간격 변환 및 로컬 롤업(증분 갱신) 서비스
+"""
+
+import io
+import re
+import json
+import hashlib
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Any, Union
+import logging
+
+from .metrics import cache_result
+
+logger = logging.getLogger(__name__)
+
+# 봉 간격 → 밀리초 (바이낸스 klines 간격, 월봉은 길이가 일정하지 않아 제외)
+INTERVAL_MS = {
+    '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000, '6h': 21_600_000,
+    '8h': 28_800_000, '12h': 43_200_000, '1d': 86_400_000, '3d': 259_200_000, '1w': 604_800_000
+}
+
+# 컬럼별 집계 방법 (그 외 숫자형 컬럼은 합계, 문자열 컬럼은 첫 값)
+OHLCV_AGGREGATION = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+
+_INTERVAL_PATTERN = re.compile(r'^(\d+)([smhdwM])$')
+_RAW_FILE_PATTERN = re.compile(r'^(?P<symbol>[A-Z0-9]+)_(?P<interval>\d+[smhdwM])_(?P<start>\d{4}-\d{2}-\d{2})_to_(?P<end>\d{4}-\d{2}-\d{2})\.csv$')
+
+def interval_to_rule(interval: str):
+    """
+    바이낸스 봉 간격 → pandas resample 규칙
+
+    분/시간 봉은 하루를 나누어 떨어지므로 자정 기준으로, 주봉은 월요일 00:00,
+    월봉은 매월 1일에 맞춤 (바이낸스 캔들 경계와 동일). 일봉은 24시간이 아닌 달력 일 규칙이라
+    서머타임 전환일에도 현지 자정에서 시작함 (그날 봉은 23/25시간)
+    """
+    match = _INTERVAL_PATTERN.match(interval)
+    if not match:
+        raise ValueError(f"지원하지 않는 봉 간격: {interval}")
+
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == 's':
+        return pd.Timedelta(seconds=count)
+    if unit == 'm':
+        return f"{count}min"
+    if unit == 'h':
+        return f"{count}h"
+    if unit == 'd':
+        return f"{count}D"
+    if unit == 'w':
+        return f"{count}W-MON"
+    return f"{count}MS"
+
+def interval_ms(interval: str) -> Optional[int]:
+    """봉 간격 길이(ms), 월봉처럼 길이가 일정하지 않으면 None"""
+    return INTERVAL_MS.get(interval)
+
+def resample_ohlcv(
+    data: pd.DataFrame,
+    interval: str,
+    tz: Optional[str] = None,
+    base_interval: Optional[str] = None,
+    drop_incomplete: bool = False
+) -> pd.DataFrame:
+    """
+    OHLCV 데이터를 상위 봉 간격으로 변환 (open=first, high=max, low=min, close=last, volume=sum)
+
+    Args:
+        data: timestamp 인덱스의 OHLCV DataFrame (시간대 없는 인덱스는 UTC로 간주)
+        interval: 목표 봉 간격 ('15m', '1h', '4h', '1d', '1w', '1M' 등)
+        tz: 봉 경계를 맞출 시간대 (예: 'Asia/Seoul' → 한국 시간 자정 기준 일봉, 결과 인덱스도 해당 시간대)
+        base_interval: 원본 봉 간격 (마지막 봉 완성 여부 판단용, 생략 시 interval 컬럼 또는 인덱스 간격으로 추정)
+        drop_incomplete: 원본 데이터가 끝까지 채우지 못한 마지막 봉 제외
+
+    Returns:
+        상위 봉 OHLCV DataFrame (빈 구간 제외, interval 컬럼은 목표 간격으로 변경)
+    """
+    if data.empty:
+        return data.copy()
+
+    index = pd.DatetimeIndex(data.index)
+    if tz:
+        index = (index.tz_localize('UTC') if index.tz is None else index).tz_convert(tz)
+    frame = data.set_axis(index, axis=0)
+
+    aggregation = {}
+    for column in frame.columns:
+        if column in OHLCV_AGGREGATION:
+            aggregation[column] = OHLCV_AGGREGATION[column]
+        elif pd.api.types.is_numeric_dtype(frame[column]):
+            aggregation[column] = 'sum'
+        else:
+            aggregation[column] = 'first'
+
+    count, unit = int(_INTERVAL_PATTERN.match(interval).group(1)), interval[-1]
+    if unit == 'd' and count > 1:
+        # 달력 일 규칙은 origin을 무시하므로, 데이터 시작일과 무관하게 같은 경계가 나오도록 직접 묶음
+        result = frame.groupby(_epoch_day_buckets(frame.index, count)).agg(aggregation)
+    elif unit in 'smh' and index.tz is not None:
+        # 고정 길이 규칙은 서머타임 전환 뒤 경계가 한 시간 밀리므로 현지 시각(벽시계) 기준으로 내림
+        result = frame.groupby(_local_floor(frame.index, interval_to_rule(interval))).agg(aggregation)
+    else:
+        result = frame.resample(interval_to_rule(interval), closed='left', label='left', origin='start_day').agg(aggregation)
+    if 'open' in result.columns:
+        result = result[result['open'].notna()]
+    if 'interval' in result.columns:
+        result['interval'] = interval
+    result.index.name = data.index.name or 'timestamp'
+
+    if drop_incomplete and len(result) and not is_last_complete(frame.index, result.index[-1], interval, base_interval or _infer_base_interval(data)):
+        result = result.iloc[:-1]
+
+    return result
+
+def _epoch_day_buckets(index: pd.DatetimeIndex, count: int) -> pd.DatetimeIndex:
+    """현지 날짜 기준 1970-01-01부터 count일씩 묶은 봉 시작 시각 (시간대 인덱스면 현지 자정)"""
+    epoch = pd.Timestamp('1970-01-01')
+    local = index.tz_localize(None) if index.tz is not None else index
+    days = (local.normalize() - epoch).days
+    starts = pd.DatetimeIndex(epoch + pd.to_timedelta(days - days % count, unit='D'))
+    if index.tz is not None:
+        # 자정이 없거나 두 번인 시간대(드묾)는 전환 이후/첫 번째 자정으로
+        starts = starts.tz_localize(index.tz, ambiguous=np.ones(len(starts), dtype=bool), nonexistent='shift_forward')
+    return starts
+
+def _local_floor(index: pd.DatetimeIndex, rule) -> pd.DatetimeIndex:
+    """현지 벽시계 기준으로 내린 봉 시작 시각 (시간대 인덱스)"""
+    floored = index.tz_localize(None).floor(rule)
+    labels = floored.tz_localize(index.tz, ambiguous='NaT', nonexistent='shift_forward')
+    ambiguous = np.asarray(labels.isna())
+    if ambiguous.any():
+        # 서머타임 종료로 두 번 나오는 시각(한 시간 분량)은 원래 시각이 서머타임인지로 구분
+        dst = np.array([bool(t.dst()) for t in index[ambiguous]])
+        labels = pd.Series(labels)
+        labels[ambiguous] = floored[ambiguous].tz_localize(index.tz, ambiguous=dst)
+        labels = pd.DatetimeIndex(labels)
+    return labels
+
+def _infer_base_interval(data: pd.DataFrame) -> Optional[str]:
+    if 'interval' in data.columns and len(data):
+        return str(data['interval'].iloc[0])
+    if len(data) > 1:
+        step = (data.index[1:] - data.index[:-1]).min()
+        for name, ms in INTERVAL_MS.items():
+            if pd.Timedelta(milliseconds=ms) == step:
+                return name
+    return None
+
+def is_last_complete(base_index: pd.DatetimeIndex, bucket_start: pd.Timestamp, interval: str, base_interval: Optional[str]) -> bool:
+    """마지막 상위 봉이 원본 봉으로 끝까지 채워졌는지 (원본 마지막 봉의 끝 ≥ 상위 봉의 끝)"""
+    base_ms = interval_ms(base_interval) if base_interval else None
+    if base_ms is None:
+        return False
+
+    last_end = base_index[-1] + pd.Timedelta(milliseconds=base_ms)
+    if interval[-1] in 'smh' and bucket_start.tz is not None:
+        # 현지 시각 기준 봉은 전환일에 길이가 달라지므로 원본 끝이 다음 봉에 들어갔는지로 판단
+        return _local_floor(pd.DatetimeIndex([last_end]), interval_to_rule(interval))[0] > bucket_start
+    bucket_end = bucket_start + pd.tseries.frequencies.to_offset(interval_to_rule(interval))
+    return last_end >= bucket_end
+
+class ResamplingService:
+    """
+    로컬 OHLCV 파일의 상위 봉 롤업 관리
+
+    롤업은 processed_data/rollups에 완성된 봉만 CSV로 저장하고, 원본 CSV에서 아직 처리하지
+    않은 바이트 위치(마지막 미완성 봉의 첫 행)를 메타데이터로 기록합니다. 원본 파일에 행이
+    추가되면(스트림 저장, 재수집) 그 위치부터만 읽어 롤업을 이어 붙입니다.
+    """
+
+    def __init__(self, data_service=None):
+        self._data_service = data_service
+        self.rollup_path = Path('local_data/processed_data/rollups')
+
+    @property
+    def data_service(self):
+        if self._data_service is None:
+            from .data_collection import DataCollectionService
+            self._data_service = DataCollectionService()
+        return self._data_service
+
+    def _rollup_files(self, source: Path, interval: str, tz: Optional[str]):
+        suffix = f"__{tz.replace('/', '-')}" if tz else ''
+        # 파일 시스템이 대소문자를 구분하지 않아도 1m(분)과 1M(월)이 겹치지 않도록
+        interval_key = interval.replace('M', 'mo')
+        stem = f"{source.stem}__{interval_key}{suffix}"
+        return self.rollup_path / f"{stem}.csv", self.rollup_path / f"{stem}.json"
+
+    @staticmethod
+    def _fingerprint(path: Path, end: int, length: int = 4096) -> str:
+        """파일의 [end-length, end) 구간 해시 (이미 처리한 부분이 그대로인지 확인용)"""
+        with open(path, 'rb') as f:
+            f.seek(max(0, end - length))
+            return hashlib.sha1(f.read(end - max(0, end - length))).hexdigest()
+
+    @staticmethod
+    def _read_rows(path: Path, offset: int, columns: Optional[list]):
+        """
+        원본 CSV의 offset 위치부터 완성된 줄만 읽기
+
+        Returns:
+            (DataFrame 또는 None, 컬럼 리스트, 각 행의 시작 offset 배열, 마지막 완성 줄 다음 offset)
+        """
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            raw = f.read()
+
+        if offset == 0:
+            header_end = raw.index(b'\n') + 1
+            columns = raw[:header_end].decode('utf-8').strip().split(',')
+            raw = raw[header_end:]
+            offset = header_end
+
+        # 쓰는 중인 마지막 줄은 제외
+        raw = raw[:raw.rfind(b'\n') + 1]
+        end_offset = offset + len(raw)
+        if not raw:
+            return None, columns, np.array([], dtype=np.int64), end_offset
+
+        newlines = np.flatnonzero(np.frombuffer(raw, dtype=np.uint8) == ord('\n'))
+        row_offsets = offset + np.concatenate(([0], newlines[:-1] + 1))
+
+        df = pd.read_csv(io.BytesIO(raw), header=None, names=columns, index_col=0)
+        df.index = pd.DatetimeIndex(pd.to_datetime(df.index), name=columns[0])
+        return df, columns, row_offsets, end_offset
+
+    def _load_rollup(self, data_path: Path, tz: Optional[str]) -> Optional[pd.DataFrame]:
+        if not data_path.exists():
+            return None
+        df = pd.read_csv(data_path, index_col=0)
+        self.data_service.catalog.touch(data_path)
+        index = pd.to_datetime(df.index, utc=True)
+        df.index = pd.DatetimeIndex(index.tz_convert(tz) if tz else index.tz_localize(None), name=df.index.name)
+        return df
+
+    def rollup(self, filename: str, interval: str, tz: Optional[str] = None, drop_incomplete: bool = False) -> pd.DataFrame:
+        """
+        로컬 OHLCV 파일의 상위 봉 롤업 반환 (저장된 롤업이 있으면 새로 추가된 행만 처리)
+
+        Args:
+            filename: 원본 파일명 또는 경로 (load_local_data와 같은 방식으로 찾음)
+            interval: 목표 봉 간격
+            tz: 봉 경계 시간대
+            drop_incomplete: 마지막 미완성 봉 제외
+
+        Returns:
+            상위 봉 DataFrame (저장은 완성된 봉만)
+        """
+        try:
+            source = self.data_service.find_local_file(filename)
+            data_path, meta_path = self._rollup_files(source, interval, tz)
+            stat = source.stat()
+
+            meta = None
+            if meta_path.exists() and data_path.exists():
+                meta = json.loads(meta_path.read_text(encoding='utf-8'))
+
+            if source.suffix.lower() != '.csv':
+                # CSV가 아니면 증분 읽기 없이 변경 시에만 전체 재계산
+                return self._rollup_whole(source, interval, tz, data_path, meta_path, meta, stat, drop_incomplete)
+
+            # 이미 처리한 부분이 그대로이고 뒤에만 행이 추가됐으면 이어서 처리
+            appended = (
+                meta is not None
+                and stat.st_size >= meta['offset']
+                and self._fingerprint(source, meta['offset']) == meta['fingerprint']
+            )
+            cache_result('rollup', appended)
+            if appended:
+                offset, columns, base_interval = meta['offset'], meta['columns'], meta['base_interval']
+            else:
+                if meta is not None:
+                    logger.info(f"원본 파일이 변경되어 롤업 재생성: {source.name} → {interval}")
+                data_path.unlink(missing_ok=True)
+                offset, columns, base_interval = 0, None, None
+
+            # offset 이후 = 지난번 미완성 봉의 원본 행 + 새로 추가된 행
+            new_rows, columns, row_offsets, end_offset = self._read_rows(source, offset, columns)
+            stored = self._load_rollup(data_path, tz)
+            if new_rows is None:
+                return stored if stored is not None else pd.DataFrame()
+
+            base_interval = base_interval or _infer_base_interval(new_rows)
+            buckets = resample_ohlcv(new_rows, interval, tz=tz, base_interval=base_interval)
+            local_index = new_rows.index.tz_localize('UTC').tz_convert(tz) if tz else new_rows.index
+
+            partial = buckets.iloc[:0]
+            next_offset = end_offset
+            if len(buckets) and not is_last_complete(local_index, buckets.index[-1], interval, base_interval):
+                partial = buckets.iloc[-1:]
+                buckets = buckets.iloc[:-1]
+                # 다음에는 미완성 봉의 첫 원본 행부터 다시 읽음
+                next_offset = int(row_offsets[np.searchsorted(local_index, partial.index[0])])
+
+            self.rollup_path.mkdir(parents=True, exist_ok=True)
+            if len(buckets) or not data_path.exists():
+                buckets.to_csv(data_path, mode='a', header=not data_path.exists(), encoding='utf-8')
+                self.data_service.catalog.record(data_path, append=offset > 0)
+
+            meta_path.write_text(json.dumps({
+                'source': str(source),
+                'interval': interval,
+                'base_interval': base_interval,
+                'tz': tz,
+                'columns': columns,
+                'offset': next_offset,
+                'fingerprint': self._fingerprint(source, next_offset),
+                'updated': datetime.now().isoformat()
+            }, ensure_ascii=False), encoding='utf-8')
+
+            logger.info(f"롤업 갱신: {source.name} → {interval} (완성 봉 {len(buckets)}개 추가, 원본 {len(new_rows)}행 처리)")
+            frames = [df for df in (stored, buckets, None if drop_incomplete else partial) if df is not None and len(df)]
+            return pd.concat(frames) if frames else buckets
+
+        except Exception as e:
+            logger.error(f"롤업 생성 실패: {e}")
+            raise
+
+    def _rollup_whole(self, source: Path, interval: str, tz: Optional[str], data_path: Path, meta_path: Path, meta, stat, drop_incomplete: bool) -> pd.DataFrame:
+        unchanged = meta is not None and meta.get('source_size') == stat.st_size and meta.get('source_mtime') == stat.st_mtime
+        cache_result('rollup', unchanged)
+        if unchanged:
+            result = self._load_rollup(data_path, tz)
+            return result.iloc[:-1] if drop_incomplete and not meta['last_complete'] else result
+
+        data = self.data_service.load_local_data(str(source))
+        result = resample_ohlcv(data, interval, tz=tz)
+        last_complete = bool(len(result)) and is_last_complete(
+            data.index.tz_localize('UTC').tz_convert(tz) if tz and data.index.tz is None else data.index,
+            result.index[-1], interval, _infer_base_interval(data)
+        )
+        self.rollup_path.mkdir(parents=True, exist_ok=True)
+        result.to_csv(data_path, encoding='utf-8')
+        self.data_service.catalog.record(data_path)
+        meta_path.write_text(json.dumps({
+            'source': str(source),
+            'source_size': stat.st_size,
+            'source_mtime': stat.st_mtime,
+            'last_complete': last_complete,
+            'interval': interval,
+            'tz': tz,
+            'updated': datetime.now().isoformat()
+        }, ensure_ascii=False), encoding='utf-8')
+        return result.iloc[:-1] if drop_incomplete and not last_complete else result
+
+    def find_base_file(self, symbol: str, interval: str, start_date: str, days: int) -> Optional[Path]:
+        """
+        요청 구간을 포함하고 목표 간격으로 롤업 가능한 더 작은 간격의 로컬 원본 파일 찾기
+
+        Returns:
+            가장 큰(행 수가 적은) 원본 간격의 파일 경로, 없으면 None
+        """
+        target_ms = interval_ms(interval)
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = start + timedelta(days=days)
+
+        candidates = []
+        catalog = self.data_service.catalog
+        for row in catalog.find_series(symbol, directory=self.data_service.raw_data_path / 'binance'):
+            match = _RAW_FILE_PATTERN.match(row['filename'])
+            if not match or match['interval'] == interval:
+                continue
+
+            base_ms = interval_ms(match['interval'])
+            if base_ms is None:
+                continue
+            # 주/월봉은 일봉 이하 원본이면 경계가 맞음
+            divisible = target_ms % base_ms == 0 if target_ms else base_ms <= INTERVAL_MS['1d']
+            if not divisible or (target_ms and base_ms >= target_ms):
+                continue
+
+            file_start = datetime.strptime(match['start'], '%Y-%m-%d')
+            file_end = datetime.strptime(match['end'], '%Y-%m-%d')
+            # 파일명의 종료일은 마지막 봉의 날짜 (그날 끝까지 포함)
+            if file_start <= start and file_end + timedelta(days=1) >= end:
+                candidates.append((base_ms, catalog.root / row['file_path']))
+
+        if not candidates:
+            return None
+        return max(candidates, key=lambda item: item[0])[1]
@@ -0,0 +1,449 @@
+"""
+Market Screener
+전체 TRADING 심볼을 지표 조건식으로 거르고 순위를 매기는 스크리너
+
+    screener.scan("rsi14 < 30 and close > sma200 and quote_volume > 1e7", interval='1h', rank_by='rsi14', ascending=True)
+
+- 심볼별 최근 bars개 봉은 local_data/.screener/<interval> 스냅샷 파일 하나에 모아 두고, 실행할 때마다
+  마지막 마감 봉 이후만 스레드 풀로 이어 받습니다 (처음 보는 심볼은 로컬 원본 파일 끝부분으로 시작).
+- 지표는 심볼을 컬럼으로 한 패널(봉 × 심볼)에서 한 번에 계산하고 마지막 봉 값만 사용합니다.
+- 24시간 통계(거래대금, 등락률)는 전체 심볼을 한 번에 받아 TICKER_TTL초 동안 재사용합니다.
+- 심볼을 24시간 거래대금 순으로 batch_size개씩 처리하고, 묶음마다 지금까지의 순위를 콜백으로 넘깁니다.
+
+조건식은 pandas eval 문법(and/or/not, 비교, 산술)이며 사용할 수 있는 이름은 describe_fields() 참고.
+"""
+
+import re
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .resampling import INTERVAL_MS
+from .storage_formats import DEFAULT_EXTENSIONS, choose_format, read_frame, write_frame
+
+logger = logging.getLogger(__name__)
+
+SCREENER_DIR = '.screener'
+
+# 심볼별로 보관하는 최근 봉 수 (klines 한 페이지)
+DEFAULT_BARS = 500
+
+# 24시간 통계 / 거래 가능 심볼 목록 재사용 시간 (초)
+TICKER_TTL = 60
+SYMBOLS_TTL = 3600
+
+# 증분 수집 동시 요청 수 (klines 가중치 2 → 심볼 400개에 약 800)
+REFRESH_WORKERS = 8
+
+# 한 번에 갱신/평가하고 중간 순위를 알리는 심볼 수
+DEFAULT_BATCH_SIZE = 100
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# 조건식 이름 → 24시간 통계 필드
+TICKER_FIELDS = {
+    'last_price': 'lastPrice',
+    'price_change_pct': 'priceChangePercent',
+    'volume_24h': 'volume',
+    'quote_volume': 'quoteVolume',
+    'trades_24h': 'count',
+    'high_24h': 'highPrice',
+    'low_24h': 'lowPrice'
+}
+
+# 조건식 이름 패턴 (예: rsi14, sma200, vol_sma20, highest55)
+INDICATOR_PATTERN = re.compile(r'^(sma|ema|rsi|atr|roc|vol_sma|highest|lowest)(\d+)$')
+
+_NAME_PATTERN = re.compile(r'(?<![\w.])[A-Za-z_][A-Za-z0-9_]*')
+_KEYWORDS = {'and', 'or', 'not', 'True', 'False', 'abs'}
+
+def describe_fields() -> Dict[str, str]:
+    """조건식/순위 기준에 쓸 수 있는 이름"""
+    return {
+        **{c: f"마지막 마감 봉 {c}" for c in OHLCV_COLUMNS},
+        **{name: f"24시간 {field}" for name, field in TICKER_FIELDS.items()},
+        'sma<n>': '종가 단순 이동평균', 'ema<n>': '종가 지수 이동평균', 'rsi<n>': 'RSI (Wilder)',
+        'atr<n>': 'ATR (Wilder)', 'roc<n>': 'n봉 변화율 (%)', 'vol_sma<n>': '거래량 단순 이동평균',
+        'highest<n>': 'n봉 최고가', 'lowest<n>': 'n봉 최저가'
+    }
+
+def parse_fields(*expressions: Optional[str]) -> List[str]:
+    """식에 쓰인 필드 이름 (알 수 없는 이름이면 ValueError)"""
+    names = []
+    for expression in expressions:
+        for name in _NAME_PATTERN.findall(expression or ''):
+            if name in _KEYWORDS or name in names:
+                continue
+            if name not in OHLCV_COLUMNS and name not in TICKER_FIELDS and not INDICATOR_PATTERN.match(name):
+                raise ValueError(f"알 수 없는 필드: {name} (사용 가능: {', '.join(describe_fields())})")
+            names.append(name)
+    return names
+
+def lookback_of(fields: Sequence[str]) -> int:
+    """필드 계산에 필요한 최소 봉 수"""
+    periods = [int(m.group(2)) + 1 for m in map(INDICATOR_PATTERN.match, fields) if m]
+    return max(periods, default=1)
+
+def _wilder(panel: pd.DataFrame, period: int) -> pd.DataFrame:
+    return panel.ewm(alpha=1 / period).mean()
+
+def panel_features(panels: Dict[str, pd.DataFrame], fields: Sequence[str]) -> pd.DataFrame:
+    """
+    (봉 × 심볼) 패널에서 필드별 마지막 봉 값 계산 (심볼 인덱스 DataFrame)
+
+    TechnicalIndicators와 같은 정의이며, 롤링 지표는 마지막 n봉만, EWM 지표는 패널 전체를 한 번에
+    계산합니다. 마지막 봉이 없는(갱신이 안 된) 심볼은 NaN입니다.
+    """
+    close = panels['close']
+    features = {}
+    for name in fields:
+        if name in OHLCV_COLUMNS:
+            features[name] = panels[name].iloc[-1]
+            continue
+        match = INDICATOR_PATTERN.match(name)
+        if not match:
+            continue
+        kind, period = match.group(1), int(match.group(2))
+        if kind == 'sma':
+            features[name] = close.iloc[-period:].mean(skipna=False) if len(close) >= period else np.nan
+        elif kind == 'vol_sma':
+            volume = panels['volume']
+            features[name] = volume.iloc[-period:].mean(skipna=False) if len(volume) >= period else np.nan
+        elif kind == 'highest':
+            features[name] = panels['high'].iloc[-period:].max(skipna=False) if len(close) >= period else np.nan
+        elif kind == 'lowest':
+            features[name] = panels['low'].iloc[-period:].min(skipna=False) if len(close) >= period else np.nan
+        elif kind == 'roc':
+            features[name] = (close.iloc[-1] / close.iloc[-period - 1] - 1) * 100 if len(close) > period else np.nan
+        elif kind == 'ema':
+            features[name] = close.ewm(span=period).mean().iloc[-1]
+        elif kind == 'rsi':
+            delta = close.diff()
+            # 상장 전(값 없는) 행은 관측치에서 제외해 심볼별 계산과 같게 함
+            gain = delta.where(delta > 0, 0).where(close.notna())
+            loss = (-delta).where(delta < 0, 0).where(close.notna())
+            rs = _wilder(gain, period).iloc[-1] / _wilder(loss, period).iloc[-1]
+            features[name] = 100 - 100 / (1 + rs)
+        elif kind == 'atr':
+            high, low, prev_close = panels['high'], panels['low'], close.shift(1)
+            true_range = np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
+            features[name] = _wilder(true_range, period).iloc[-1]
+    result = pd.DataFrame(features, index=close.columns)
+    # 마지막 봉이 없는 심볼은 지표도 계산하지 않음 (ewm은 직전 값을 이어 씀)
+    result.loc[close.iloc[-1].isna()] = np.nan
+    return result
+
+class _TimedCache:
+    """메모리 + 파일 JSON 캐시 (셀 프로세스가 매번 새로 떠도 TTL 동안 재사용)"""
+
+    def __init__(self, path: Path, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self.value = None
+        self.fetched = 0.0
+        self.lock = threading.Lock()
+
+    def get(self, fetch: Callable[[], Any]):
+        with self.lock:
+            now = time.time()
+            if self.value is not None and now - self.fetched < self.ttl:
+                return self.value
+            try:
+                cached = json.loads(self.path.read_text(encoding='utf-8'))
+                if now - cached['fetched'] < self.ttl:
+                    self.value, self.fetched = cached['value'], cached['fetched']
+                    return self.value
+            except (OSError, ValueError, KeyError):
+                pass
+            self.value, self.fetched = fetch(), now
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix('.tmp')
+            tmp.write_text(json.dumps({'fetched': now, 'value': self.value}), encoding='utf-8')
+            tmp.replace(self.path)
+            return self.value
+
+class MarketScreener:
+    """전체 심볼 스크리너 (스냅샷 파일 + 증분 갱신 + 패널 지표)"""
+
+    def __init__(self, data_service=None, client_factory: Optional[Callable[[], Any]] = None,
+                 workers: int = REFRESH_WORKERS):
+        self._data_service = data_service
+        self._client_factory = client_factory
+        self._local = threading.local()
+        self.workers = workers
+        # interval → (스냅샷 파일 mtime, DataFrame)
+        self._snapshots: Dict[str, tuple] = {}
+        self._tickers = _TimedCache(self.store_path / 'ticker_24hr.json', TICKER_TTL)
+        self._symbols = _TimedCache(self.store_path / 'exchange_symbols.json', SYMBOLS_TTL)
+
+    @property
+    def data_service(self):
+        if self._data_service is None:
+            from .data_collection import DataCollectionService
+            self._data_service = DataCollectionService()
+        return self._data_service
+
+    @property
+    def store_path(self) -> Path:
+        return self.data_service.raw_data_path.parent / SCREENER_DIR
+
+    @property
+    def client(self):
+        """스레드별 바이낸스 클라이언트 (requests 세션을 스레드 간에 공유하지 않음)"""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            if self._client_factory is not None:
+                client = self._client_factory()
+            else:
+                from .binance_client import BinanceClient
+                client = BinanceClient()
+            self._local.client = client
+        return client
+
+    # 심볼 / 24시간 통계
+
+    def trading_symbols(self, quote: Optional[str] = None) -> List[str]:
+        """거래 가능(TRADING) 심볼 목록 (quote: 'USDT' 등 견적 자산으로 필터)"""
+        symbols = self._symbols.get(lambda: [
+            [s['symbol'], s.get('quoteAsset', '')]
+            for s in self.client.get_exchange_info()['symbols'] if s['status'] == 'TRADING'
+        ])
+        return sorted(symbol for symbol, asset in symbols if not quote or asset == quote.upper())
+
+    def tickers(self) -> pd.DataFrame:
+        """전체 심볼 24시간 통계 (심볼 인덱스, TICKER_FIELDS 컬럼, TTL 동안 캐시)"""
+        rows = self._tickers.get(lambda: [
+            {'symbol': t['symbol'], **{name: t.get(field) for name, field in TICKER_FIELDS.items()}}
+            for t in self.client.get_24hr_tickers()
+        ])
+        frame = pd.DataFrame(rows, columns=['symbol', *TICKER_FIELDS]).set_index('symbol')
+        return frame.apply(pd.to_numeric, errors='coerce')
+
+    # 스냅샷
+
+    def _snapshot_paths(self, interval: str) -> List[Path]:
+        return [self.store_path / f"{interval}.{ext}" for ext in ('feather', 'csv')]
+
+    def load_snapshot(self, interval: str) -> pd.DataFrame:
+        """symbol, timestamp, OHLCV 컬럼의 최근 봉 스냅샷 (없으면 빈 DataFrame)"""
+        existing = [p for p in self._snapshot_paths(interval) if p.exists()]
+        path = max(existing, key=lambda p: p.stat().st_mtime) if existing else None
+        mtime = path.stat().st_mtime if path else None
+        # 다른 프로세스(셀/서버)가 파일을 갱신했을 때만 다시 읽음
+        cached = self._snapshots.get(interval)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if path:
+            snapshot = read_frame(path)
+            snapshot = snapshot.reset_index(drop=True) if 'symbol' in snapshot.columns else snapshot.reset_index()
+            snapshot['timestamp'] = pd.to_datetime(snapshot['timestamp'])
+        else:
+            snapshot = pd.DataFrame(columns=['symbol', 'timestamp', *OHLCV_COLUMNS])
+        self._snapshots[interval] = (mtime, snapshot)
+        return snapshot
+
+    def _save_snapshot(self, interval: str, snapshot: pd.DataFrame):
+        file_format = choose_format(snapshot, 'reload')
+        path = self.store_path / f"{interval}.{DEFAULT_EXTENSIONS[file_format]}"
+        write_frame(snapshot.reset_index(drop=True), path, file_format)
+        for stale in self._snapshot_paths(interval):
+            if stale != path and stale.exists():
+                stale.unlink()
+        self._snapshots[interval] = (path.stat().st_mtime, snapshot)
+
+    def _local_tail(self, symbol: str, interval: str, bars: int) -> Optional[pd.DataFrame]:
+        """로컬 원본 파일(가장 최근 것)의 마지막 bars개 봉"""
+        try:
+            rows = self.data_service.catalog.find_series(symbol, interval)
+        except Exception:
+            return None
+        for row in sorted(rows, key=lambda r: r['end_date'] or '', reverse=True):
+            path = self.data_service.catalog.root / row['file_path']
+            try:
+                frame = read_frame(path)
+            except Exception:
+                continue
+            if not set(OHLCV_COLUMNS) <= set(frame.columns):
+                continue
+            frame.index = pd.to_datetime(frame.index)
+            return frame[list(OHLCV_COLUMNS)].iloc[-bars:]
+        return None
+
+    def _refresh_symbol(self, symbol: str, interval: str, last: Optional[pd.Timestamp], target_ms: int, bars: int):
+        """마지막 봉 이후 ~ target_ms(마지막 마감 봉 시작)까지 받아 새 행 반환"""
+        step = INTERVAL_MS[interval]
+        seed = None
+        if last is None:
+            seed = self._local_tail(symbol, interval, bars)
+            if seed is not None and not seed.empty:
+                last = seed.index[-1]
+
+        oldest = target_ms - (bars - 1) * step
+        start_ms = oldest if last is None else max(int(last.value // 1_000_000) + step, oldest)
+        frames = [seed] if seed is not None and not seed.empty else []
+        if start_ms <= target_ms:
+            fetched = self.client.get_ohlcv_range(symbol, interval, start_ms, target_ms)
+            frames.append(fetched[list(OHLCV_COLUMNS)])
+        if not frames:
+            return None
+        new = pd.concat(frames)
+        new = new[~new.index.duplicated(keep='last')].iloc[-bars:]
+        return new.rename_axis('timestamp').reset_index().assign(symbol=symbol)
+
+    def refresh(self, symbols: Sequence[str], interval: str, bars: int = DEFAULT_BARS,
+                now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        스냅샷을 마지막 마감 봉까지 증분 갱신
+
+        Returns:
+            updated(갱신한 심볼 수), failed(실패 심볼 목록), target(마지막 마감 봉 시각)
+        """
+        step = INTERVAL_MS.get(interval)
+        if step is None:
+            raise ValueError(f"지원하지 않는 봉 간격: {interval} (사용 가능: {', '.join(INTERVAL_MS)})")
+        now_ms = int((now if now is not None else time.time()) * 1000)
+        target_ms = now_ms // step * step - step
+        target = pd.Timestamp(target_ms, unit='ms')
+
+        snapshot = self.load_snapshot(interval)
+        last_seen = snapshot.groupby('symbol')['timestamp'].max() if not snapshot.empty else pd.Series(dtype='datetime64[ns]')
+        stale = [s for s in symbols if s not in last_seen.index or last_seen[s] < target]
+
+        new_rows, failed = [], []
+        if stale:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(stale)))) as pool:
+                futures = {
+                    symbol: pool.submit(self._refresh_symbol, symbol, interval, last_seen.get(symbol), target_ms, bars)
+                    for symbol in stale
+                }
+                for symbol, future in futures.items():
+                    try:
+                        rows = future.result()
+                        if rows is not None and not rows.empty:
+                            new_rows.append(rows)
+                    except Exception as e:
+                        logger.warning(f"스크리너 갱신 실패 {symbol}: {e}")
+                        failed.append(symbol)
+
+        if new_rows:
+            snapshot = pd.concat([snapshot, *new_rows] if not snapshot.empty else new_rows, ignore_index=True)
+            snapshot = snapshot.astype({'symbol': str, **{c: np.float64 for c in OHLCV_COLUMNS}})
+            snapshot = snapshot.drop_duplicates(['symbol', 'timestamp'], keep='last')
+            snapshot = snapshot.sort_values(['symbol', 'timestamp']).groupby('symbol').tail(bars)
+            self._save_snapshot(interval, snapshot)
+
+        logger.info(f"스크리너 갱신: {interval} {len(new_rows)}/{len(symbols)}개 심볼 (실패 {len(failed)})")
+        return {'updated': len(new_rows), 'failed': failed, 'target': target}
+
+    def panels(self, symbols: Sequence[str], interval: str) -> Dict[str, pd.DataFrame]:
+        """스냅샷 → OHLCV 필드별 (봉 × 심볼) 패널"""
+        snapshot = self.load_snapshot(interval)
+        subset = snapshot[snapshot['symbol'].isin(symbols)]
+        wide = subset.pivot(index='timestamp', columns='symbol', values=list(OHLCV_COLUMNS)).sort_index()
+        return {column: wide[column].astype(np.float64) for column in OHLCV_COLUMNS}
+
+    # 스캔
+
+    def scan(
+        self,
+        expression: Optional[str] = None,
+        interval: str = '1h',
+        rank_by: Optional[str] = None,
+        ascending: bool = False,
+        limit: Optional[int] = 50,
+        quote: Optional[str] = None,
+        symbols: Optional[Sequence[str]] = None,
+        bars: int = DEFAULT_BARS,
+        refresh: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_batch: Optional[Callable[[pd.DataFrame, int, int], None]] = None
+    ) -> pd.DataFrame:
+        """
+        조건식을 만족하는 심볼을 순위대로 반환
+
+        Args:
+            expression: 조건식 (예: "rsi14 < 30 and close > sma200 and quote_volume > 1e7", 생략 시 전체)
+            interval: 봉 간격
+            rank_by: 순위 기준 식 (생략 시 24시간 거래대금)
+            ascending: 오름차순 순위 여부
+            limit: 반환할 최대 심볼 수 (None이면 전체)
+            quote: 견적 자산 필터 (예: 'USDT')
+            symbols: 대상 심볼 직접 지정 (생략 시 TRADING 전체)
+            bars: 심볼별 보관/계산 봉 수
+            refresh: 마지막 마감 봉까지 증분 갱신할지 (False면 스냅샷만 사용)
+            batch_size: 갱신/평가 묶음 크기
+            on_batch: 묶음마다 호출 (지금까지의 순위 DataFrame, 처리한 심볼 수, 전체 심볼 수)
+
+        Returns:
+            symbol 인덱스, score(rank_by 값), 식에 쓰인 필드, bar_time(마지막 봉) 컬럼의 DataFrame (순위순)
+        """
+        rank_by = rank_by or 'quote_volume'
+        fields = parse_fields(expression, rank_by)
+        required = lookback_of(fields)
+        if required > bars:
+            raise ValueError(f"{required}봉이 필요한 지표가 있습니다 (bars={bars})")
+        if interval not in INTERVAL_MS:
+            raise ValueError(f"지원하지 않는 봉 간격: {interval} (사용 가능: {', '.join(INTERVAL_MS)})")
+
+        tickers = self.tickers()
+        universe = [s.upper() for s in symbols] if symbols else self.trading_symbols(quote)
+        # 거래대금이 큰 심볼부터 처리해 중간 결과도 의미 있게
+        volume = tickers['quote_volume'].reindex(universe).fillna(0)
+        universe = list(volume.sort_values(ascending=False, kind='stable').index)
+
+        started = time.perf_counter()
+        ranked = pd.DataFrame()
+        for start in range(0, len(universe), max(1, batch_size)):
+            batch = universe[start:start + batch_size]
+            if refresh:
+                self.refresh(batch, interval, bars)
+            matched = self._evaluate(batch, interval, fields, expression, rank_by, tickers)
+            ranked = pd.concat([ranked, matched]) if not ranked.empty else matched
+            ranked = ranked.sort_values('score', ascending=ascending, kind='stable')
+            if limit:
+                ranked = ranked.iloc[:limit]
+            if on_batch is not None:
+                on_batch(ranked, min(start + batch_size, len(universe)), len(universe))
+
+        logger.info(f"스크리너 완료: {len(universe)}개 심볼 중 {len(ranked)}개 ({time.perf_counter() - started:.2f}초)")
+        return ranked
+
+    def _evaluate(self, batch, interval, fields, expression, rank_by, tickers) -> pd.DataFrame:
+        snapshot = self.load_snapshot(interval)
+        stored = set(snapshot['symbol'].unique())
+        available = [s for s in batch if s in stored]
+        if not available:
+            return pd.DataFrame(columns=['score', *fields])
+
+        panels = self.panels(available, interval)
+        features = panel_features(panels, fields)
+        valid = panels['close'].notna().to_numpy()
+        last_row = len(valid) - 1 - valid[::-1].argmax(axis=0)
+        bar_time = pd.Series(panels['close'].index[last_row], index=panels['close'].columns)
+        ticker_fields = [f for f in fields if f in TICKER_FIELDS]
+        if ticker_fields:
+            features = features.join(tickers[ticker_fields], how='left')
+        features = features[fields]
+
+        mask = features.eval(expression).fillna(False).astype(bool) if expression else pd.Series(True, index=features.index)
+        result = features[mask].copy()
+        result.insert(0, 'score', result.eval(rank_by) if len(result) else pd.Series(dtype=float))
+        result['bar_time'] = bar_time.reindex(result.index)
+        result.index.name = 'symbol'
+        return result.dropna(subset=['score'])
+
+_screener = None
+
+def get_screener() -> MarketScreener:
+    """프로세스 공용 스크리너 (스냅샷/캐시를 메모리에 유지)"""
+    global _screener
+    if _screener is None:
+        _screener = MarketScreener()
+    return _screener
@@ -0,0 +1,339 @@
+"""
+Storage Formats
+분석 결과 저장 형식 (CSV, Excel, Parquet, Feather, HDF5) 청크 단위 쓰기와 형식 자동 선택
+
+모든 쓰기는 같은 폴더의 임시 파일에 청크(chunk_rows행) 단위로 쓴 뒤 이름을 바꿔 교체하므로,
+쓰는 도중 실패하거나 다른 프로세스가 읽어도 반쯤 쓰인 파일이 보이지 않습니다.
+append=True면 기존 내용을 임시 파일로 옮겨 담은 뒤(Parquet/Feather는 row group/배치 단위 스트리밍)
+새 행을 이어 씁니다.
+
+    parquet  zstd 압축, row group 단위 (보관, 용량 우선)
+    feather  Arrow IPC 파일, lz4 압축 (다시 읽기 속도 우선, 메모리 매핑)
+    hdf5     PyTables 테이블 형식 (선택, tables 패키지 필요)
+    csv      사람이 읽거나 다른 도구와 교환
+    xlsx     스프레드시트 (1,048,575행 제한, 가장 느림)
+"""
+
+import os
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Union
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 확장자 → 형식
+FORMAT_EXTENSIONS = {
+    'csv': 'csv',
+    'xlsx': 'xlsx',
+    'xls': 'xlsx',
+    'parquet': 'parquet',
+    'feather': 'feather',
+    'arrow': 'feather',
+    'h5': 'hdf5',
+    'hdf5': 'hdf5'
+}
+
+# 형식 → 저장 확장자
+DEFAULT_EXTENSIONS = {'csv': 'csv', 'xlsx': 'xlsx', 'parquet': 'parquet', 'feather': 'feather', 'hdf5': 'h5'}
+
+# 형식 자동 선택 용도
+PURPOSES = ('auto', 'reload', 'archive', 'exchange', 'spreadsheet')
+
+EXCEL_MAX_ROWS = 1_048_575
+DEFAULT_CHUNK_ROWS = 100_000
+
+# 이보다 작은 결과는 사람이 바로 열어볼 수 있는 CSV로 저장 (메모리 기준 bytes)
+SMALL_FRAME_BYTES = 1024 * 1024
+
+HDF_KEY = 'data'
+
+def _has_module(name: str) -> bool:
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+def normalize_format(file_format: str) -> str:
+    """형식명/확장자 → 내부 형식명"""
+    key = file_format.lower().lstrip('.')
+    if key not in FORMAT_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 파일 형식: {file_format} (사용 가능: {', '.join(DEFAULT_EXTENSIONS)}, auto)")
+    return FORMAT_EXTENSIONS[key]
+
+def format_of(path: Union[str, Path]) -> str:
+    """파일 확장자로 형식 판별"""
+    return normalize_format(Path(path).suffix or '.')
+
+def choose_format(data: pd.DataFrame, purpose: str = 'auto') -> str:
+    """
+    데이터 크기와 용도로 저장 형식 선택
+
+    Args:
+        data: 저장할 데이터
+        purpose: 'reload' (다시 읽기 속도), 'archive' (용량), 'exchange' (다른 도구와 교환),
+                 'spreadsheet' (엑셀로 열기), 'auto' (작으면 CSV, 크면 Parquet)
+
+    Returns:
+        형식명 (pyarrow가 없으면 Parquet/Feather 대신 CSV)
+    """
+    if purpose not in PURPOSES:
+        raise ValueError(f"지원하지 않는 용도: {purpose} (사용 가능: {', '.join(PURPOSES)})")
+    arrow = _has_module('pyarrow')
+
+    if purpose == 'spreadsheet':
+        if len(data) <= EXCEL_MAX_ROWS and _available(_WRITERS['xlsx'][1]):
+            return 'xlsx'
+        return 'csv'
+    if purpose == 'exchange':
+        return 'csv'
+    if purpose == 'reload':
+        return 'feather' if arrow else 'csv'
+    if purpose == 'archive':
+        return 'parquet' if arrow else 'csv'
+
+    if data.memory_usage(index=True, deep=False).sum() < SMALL_FRAME_BYTES or not arrow:
+        return 'csv'
+    return 'parquet'
+
+def _chunks(data: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(data), chunk_rows):
+        yield data.iloc[start:start + chunk_rows]
+
+@contextlib.contextmanager
+def atomic_path(path: Path, copy_existing: bool = False) -> Iterator[Path]:
+    """
+    같은 폴더 임시 파일 경로를 넘겨주고, 블록이 정상 종료되면 대상 파일을 교체
+
+    Args:
+        path: 최종 파일 경로
+        copy_existing: 기존 파일을 임시 파일로 먼저 복사 (제자리 추가 방식 형식의 append)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # '.'으로 시작하는 이름은 카탈로그 목록에서 숨김
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        if copy_existing and path.exists():
+            shutil.copyfile(path, tmp)
+        else:
+            tmp.unlink()
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+# 형식별 쓰기 (tmp에 기존 내용 + 새 데이터)
+
+def _write_csv(data: pd.DataFrame, path: Path, tmp: Path, append: bool, chunk_rows: int):
+    header = not (append and path.exists() and path.stat().st_size > 0)
+    if not header:
+        existing = pd.read_csv(path, index_col=0, nrows=0).columns
+        if list(existing) != [str(c) for c in data.columns]:
+            raise ValueError(f"기존 파일과 컬럼이 다릅니다: {list(existing)} != {list(data.columns)}")
+    data.to_csv(tmp, mode='a' if not header else 'w', header=header, encoding='utf-8', chunksize=chunk_rows)
+
+def _write_xlsx(data: pd.DataFrame, path: Path, tmp: Path, append: bool, chunk_rows: int):
+    if append and path.exists():
+        data = pd.concat([pd.read_excel(path, index_col=0), data])
+    if len(data) > EXCEL_MAX_ROWS:
+        raise ValueError(f"Excel 시트 최대 행 수({EXCEL_MAX_ROWS:,})를 넘습니다: {len(data):,}행 (parquet/feather 사용)")
+    # xlsxwriter가 있으면 상수 메모리 모드 (openpyxl보다 빠름)
+    if _has_module('xlsxwriter'):
+        with pd.ExcelWriter(tmp, engine='xlsxwriter', engine_kwargs={'options': {'constant_memory': True}}) as writer:
+            data.to_excel(writer)
+    else:
+        data.to_excel(tmp)
+
+def _arrow_table(chunk: pd.DataFrame, schema=None):
+    import pyarrow as pa
+    return pa.Table.from_pandas(chunk, schema=schema, preserve_index=True)
+
+def _write_parquet(data: pd.DataFrame, path: Path, tmp: Path, append: bool, chunk_rows: int, compression: str = 'zstd'):
+    import pyarrow.parquet as pq
+
+    with contextlib.ExitStack() as stack:
+        existing = stack.enter_context(pq.ParquetFile(path)) if append and path.exists() else None
+        schema = existing.schema_arrow if existing is not None else _arrow_table(data.iloc[:0]).schema
+        writer = stack.enter_context(pq.ParquetWriter(tmp, schema, compression=compression))
+        if existing is not None:
+            # 기존 row group을 하나씩 옮겨 담음 (전체를 메모리에 올리지 않음)
+            for i in range(existing.num_row_groups):
+                writer.write_table(existing.read_row_group(i))
+        for chunk in _chunks(data, chunk_rows):
+            writer.write_table(_arrow_table(chunk, schema))
+
+def _write_feather(data: pd.DataFrame, path: Path, tmp: Path, append: bool, chunk_rows: int, compression: str = 'lz4'):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    options = ipc.IpcWriteOptions(compression=compression)
+    with contextlib.ExitStack() as stack:
+        existing = None
+        if append and path.exists():
+            existing = ipc.open_file(stack.enter_context(pa.memory_map(str(path))))
+        schema = existing.schema if existing is not None else _arrow_table(data.iloc[:0]).schema
+        sink = stack.enter_context(pa.OSFile(str(tmp), 'wb'))
+        writer = stack.enter_context(ipc.new_file(sink, schema, options=options))
+        if existing is not None:
+            for i in range(existing.num_record_batches):
+                writer.write_batch(existing.get_batch(i))
+        for chunk in _chunks(data, chunk_rows):
+            writer.write_table(_arrow_table(chunk, schema), max_chunksize=chunk_rows)
+
+def _write_hdf5(data: pd.DataFrame, path: Path, tmp: Path, append: bool, chunk_rows: int):
+    # tmp에는 atomic_path가 기존 파일을 복사해 둠 (HDF5 테이블은 제자리 추가)
+    with pd.HDFStore(tmp, mode='a', complevel=5, complib='blosc:zstd') as store:
+        if not append and HDF_KEY in store:
+            store.remove(HDF_KEY)
+        for chunk in _chunks(data, chunk_rows):
+            store.append(HDF_KEY, chunk, format='table', index=False)
+
+# 형식 → (쓰기 함수, 필요한 패키지 중 하나)
+_WRITERS = {
+    'csv': (_write_csv, ()),
+    'xlsx': (_write_xlsx, ('xlsxwriter', 'openpyxl')),
+    'parquet': (_write_parquet, ('pyarrow',)),
+    'feather': (_write_feather, ('pyarrow',)),
+    'hdf5': (_write_hdf5, ('tables',))
+}
+
+def _available(modules) -> bool:
+    return not modules or any(_has_module(m) for m in modules)
+
+def write_frame(
+    data: pd.DataFrame,
+    path: Union[str, Path],
+    file_format: Optional[str] = None,
+    append: bool = False,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Path:
+    """
+    DataFrame을 청크 단위로 임시 파일에 쓰고 원자적으로 교체
+
+    Args:
+        data: 저장할 데이터
+        path: 최종 파일 경로
+        file_format: 형식 (생략 시 확장자로 판별)
+        append: 기존 파일 뒤에 행 추가 (컬럼 구성이 같아야 함)
+        chunk_rows: 청크(Parquet row group, Feather 배치) 행 수
+
+    Returns:
+        저장된 파일 경로
+    """
+    path = Path(path)
+    file_format = normalize_format(file_format) if file_format else format_of(path)
+    writer, modules = _WRITERS[file_format]
+    if not _available(modules):
+        raise ImportError(f"{file_format} 형식 저장에는 {' 또는 '.join(modules)} 패키지가 필요합니다 (pip install {modules[-1]})")
+
+    copy_existing = append and file_format in ('csv', 'hdf5')
+    with atomic_path(path, copy_existing=copy_existing) as tmp:
+        writer(data, path, tmp, append, chunk_rows)
+    return path
+
+def read_frame(path: Union[str, Path], file_format: Optional[str] = None) -> pd.DataFrame:
+    """write_frame으로 저장한 파일 읽기 (CSV/Excel은 첫 컬럼을 날짜 인덱스로)"""
+    path = Path(path)
+    file_format = normalize_format(file_format) if file_format else format_of(path)
+    if file_format == 'csv':
+        return pd.read_csv(path, index_col=0, parse_dates=True)
+    if file_format == 'xlsx':
+        return pd.read_excel(path, index_col=0, parse_dates=True)
+    if file_format == 'parquet':
+        return pd.read_parquet(path)
+    if file_format == 'feather':
+        return pd.read_feather(path)
+    if file_format == 'hdf5':
+        return pd.read_hdf(path, HDF_KEY)
+    raise ValueError(f"지원하지 않는 파일 형식: {file_format}")
+
+def _arrow_to_pandas(batch, metadata):
+    import pyarrow as pa
+    # 배치에는 pandas 메타데이터가 없을 수 있어 파일 스키마의 메타데이터로 인덱스 복원
+    return pa.Table.from_batches([batch]).replace_schema_metadata(metadata).to_pandas()
+
+def _projection(names, columns, index_columns):
+    if columns is None:
+        return None
+    missing = [c for c in columns if c not in names]
+    if missing:
+        raise ValueError(f"파일에 없는 컬럼: {missing}")
+    return [n for n in names if n in columns or n in index_columns]
+
+def _arrow_index_columns(schema) -> list:
+    import json
+    meta = (schema.metadata or {}).get(b'pandas')
+    if not meta:
+        return []
+    return [c for c in json.loads(meta).get('index_columns', []) if isinstance(c, str)]
+
+def iter_frame(
+    path: Union[str, Path],
+    file_format: Optional[str] = None,
+    columns: Optional[list] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[pd.DataFrame]:
+    """
+    파일을 chunk_rows행 이하의 DataFrame으로 나누어 읽기 (read_frame과 같은 인덱스)
+
+    Args:
+        path: 파일 경로
+        file_format: 형식 (생략 시 확장자로 판별)
+        columns: 읽을 컬럼 (인덱스 제외, 생략 시 전체). CSV/Parquet/Feather/HDF5는 읽을 때 제외
+        chunk_rows: 청크 행 수
+
+    Excel은 나누어 읽을 수 없어 전체를 읽은 뒤 잘라서 반환합니다.
+    """
+    path = Path(path)
+    file_format = normalize_format(file_format) if file_format else format_of(path)
+
+    if file_format == 'csv':
+        header = list(pd.read_csv(path, nrows=0).columns)
+        usecols = _projection(header[1:], columns, ())
+        if usecols is not None:
+            usecols = [header[0]] + usecols
+        yield from pd.read_csv(path, index_col=0, parse_dates=True, usecols=usecols, chunksize=chunk_rows)
+
+    elif file_format == 'parquet':
+        import pyarrow.parquet as pq
+        with pq.ParquetFile(path) as parquet:
+            schema = parquet.schema_arrow
+            selected = _projection(schema.names, columns, _arrow_index_columns(schema))
+            for batch in parquet.iter_batches(batch_size=chunk_rows, columns=selected):
+                yield _arrow_to_pandas(batch, schema.metadata)
+
+    elif file_format == 'feather':
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        with pa.memory_map(str(path)) as source:
+            reader = ipc.open_file(source)
+            schema = reader.schema
+            selected = _projection(schema.names, columns, _arrow_index_columns(schema))
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                if selected is not None:
+                    batch = batch.select(selected)
+                for start in range(0, batch.num_rows, chunk_rows):
+                    yield _arrow_to_pandas(batch.slice(start, chunk_rows), schema.metadata)
+
+    elif file_format == 'hdf5':
+        with pd.HDFStore(path, mode='r') as store:
+            yield from store.select(HDF_KEY, columns=columns, chunksize=chunk_rows)
+
+    else:
+        data = read_frame(path, file_format)
+        if columns is not None:
+            data = data[columns]
+        yield from _chunks(data, chunk_rows)
+
+def describe_formats() -> Dict[str, Any]:
+    """형식별 사용 가능 여부 (필요 패키지 설치 여부)"""
+    return {name: _available(modules) for name, (_, modules) in _WRITERS.items()}
@@ -0,0 +1,197 @@
+"""
+Storage Quota Service
+local_data 용량 제한 및 파생 데이터(롤업, 지표 캐시) LRU 정리
+
+원본 데이터(raw_data)와 분석 결과는 지우지 않고, 다시 만들 수 있는 파생 데이터만
+마지막으로 읽은 시각이 오래된 순서로 삭제합니다. 용량은 카탈로그 합계 테이블에서 읽으므로
+확인 비용은 디렉토리 수에 비례합니다 (파일 시스템 순회 없음).
+
+    STORAGE_QUOTA=20GB            # local_data 전체
+    DERIVED_STORAGE_QUOTA=5GB     # 파생 데이터 디렉토리 합계
+"""
+
+import os
+import re
+import time
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+import logging
+
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# 다시 계산할 수 있는 데이터 (local_data 기준 상대 경로)
+DERIVED_DIRECTORIES = (
+    'processed_data/rollups',
+    'processed_data/technical_indicators',
+    'cache'
+)
+
+STORAGE_EVICTIONS = registry.counter(
+    'juppelin_storage_evictions_total', 'Derived data files removed by quota enforcement')
+STORAGE_EVICTED_BYTES = registry.counter(
+    'juppelin_storage_evicted_bytes_total', 'Bytes of derived data removed by quota enforcement')
+
+_SIZE_UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+
+def parse_size(value: Optional[str]) -> Optional[int]:
+    """'500MB', '20GB', '1048576' 같은 크기 문자열 → bytes (빈 값이면 None)"""
+    if value is None or not str(value).strip():
+        return None
+    match = re.fullmatch(r'\s*([\d.]+)\s*([KMGT]?B?)\s*', str(value).upper())
+    if not match:
+        raise ValueError(f"용량 형식을 해석할 수 없습니다: {value} (예: 500MB, 20GB)")
+    number, unit = match.groups()
+    if unit and not unit.endswith('B'):
+        unit += 'B'
+    return int(float(number) * _SIZE_UNITS[unit])
+
+class StorageQuota:
+    """
+    카탈로그 용량 합계 기준 용량 제한
+
+    제한을 넘으면 파생 데이터를 LRU 순으로 지워 제한의 low_watermark 비율까지 낮춥니다.
+    같은 디렉토리에서 확장자만 다른 파일(롤업 CSV와 메타 JSON 등)은 함께 지웁니다.
+    """
+
+    def __init__(
+        self,
+        catalog,
+        total: Optional[int] = None,
+        derived: Optional[int] = None,
+        derived_directories: Tuple[str, ...] = DERIVED_DIRECTORIES,
+        low_watermark: float = 0.9,
+        check_interval: float = 1.0
+    ):
+        """
+        Args:
+            catalog: DataCatalog 인스턴스
+            total: local_data 전체 용량 제한(bytes)
+            derived: 파생 데이터 디렉토리 합계 제한(bytes)
+            derived_directories: 정리 대상 디렉토리 (local_data 기준)
+            low_watermark: 정리 후 목표 사용률
+            check_interval: 쓰기 후 자동 확인 최소 간격(초)
+        """
+        self.catalog = catalog
+        self.total = total
+        self.derived = derived
+        self.derived_directories = tuple(derived_directories)
+        self.low_watermark = low_watermark
+        self.check_interval = check_interval
+
+        self._last_check = float('-inf')
+        self._lock = threading.Lock()
+        self.evicted_files = 0
+        self.evicted_bytes = 0
+
+    @classmethod
+    def from_env(cls, catalog) -> Optional['StorageQuota']:
+        """STORAGE_QUOTA / DERIVED_STORAGE_QUOTA 환경 변수로 생성 (둘 다 없으면 None)"""
+        try:
+            total = parse_size(os.getenv('STORAGE_QUOTA'))
+            derived = parse_size(os.getenv('DERIVED_STORAGE_QUOTA'))
+        except ValueError as e:
+            logger.error(f"용량 제한 설정 무시: {e}")
+            return None
+        if total is None and derived is None:
+            return None
+        return cls(catalog, total=total, derived=derived)
+
+    def _is_derived(self, directory: str) -> bool:
+        return any(directory == d or directory.startswith(f"{d}/") for d in self.derived_directories)
+
+    def usage(self, reconcile: bool = True) -> Dict[str, int]:
+        """전체/파생 데이터 사용량(bytes)"""
+        directories = self.catalog.usage_totals(reconcile=reconcile)['directory']
+        total = sum(entry['bytes'] for entry in directories.values())
+        derived = sum(entry['bytes'] for directory, entry in directories.items() if self._is_derived(directory))
+        return {'total': total, 'derived': derived}
+
+    def _excess(self, usage: Dict[str, int]) -> int:
+        """제한을 넘었으면 목표 사용률까지 지워야 할 bytes"""
+        excess = 0
+        for key, limit in (('total', self.total), ('derived', self.derived)):
+            if limit is not None and usage[key] > limit:
+                excess = max(excess, usage[key] - int(limit * self.low_watermark))
+        return excess
+
+    def maybe_enforce(self):
+        """쓰기 직후 호출 (check_interval 안에 다시 호출되거나 정리 중이면 건너뜀)"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+        try:
+            self.enforce(reconcile=False)
+        except Exception as e:
+            logger.warning(f"용량 제한 확인 실패: {e}")
+
+    def enforce(self, reconcile: bool = True) -> Dict[str, Any]:
+        """
+        제한을 넘었으면 파생 데이터를 LRU 순으로 삭제
+
+        Returns:
+            evicted_files, evicted_bytes, usage(정리 후), over_quota(파생 데이터를 모두 지워도 초과) 딕셔너리
+        """
+        if not self._lock.acquire(blocking=False):
+            return {'evicted_files': 0, 'evicted_bytes': 0, 'usage': None, 'over_quota': False}
+        try:
+            usage = self.usage(reconcile=reconcile)
+            excess = self._excess(usage)
+            files, freed = 0, 0
+            if excess > 0:
+                files, freed = self._evict(excess)
+                usage = {'total': usage['total'] - freed, 'derived': usage['derived'] - freed}
+            over = self._excess(usage) > 0
+            if over:
+                logger.warning(
+                    f"파생 데이터를 정리해도 용량 제한 초과: 전체 {usage['total']:,} bytes, 파생 {usage['derived']:,} bytes "
+                    f"(제한 {self.total}, {self.derived})"
+                )
+            return {'evicted_files': files, 'evicted_bytes': freed, 'usage': usage, 'over_quota': over}
+        finally:
+            self._lock.release()
+
+    def _evict(self, excess: int) -> Tuple[int, int]:
+        # 같은 디렉토리/같은 이름(확장자 제외) 파일을 한 묶음으로, 묶음 중 가장 최근 사용 시각 기준
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for row in self.catalog.least_recently_used(list(self.derived_directories)):
+            groups.setdefault((row['directory'], Path(row['filename']).stem), []).append(row)
+        ordered = sorted(groups.values(), key=lambda rows: max(r['last_used'] for r in rows))
+
+        files, freed = 0, 0
+        for rows in ordered:
+            if freed >= excess:
+                break
+            for row in rows:
+                path = self.catalog.root / row['file_path']
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"파생 데이터 삭제 실패: {path} ({e})")
+                    continue
+                self.catalog.forget(path)
+                files += 1
+                freed += row['file_size']
+
+        if files:
+            STORAGE_EVICTIONS.inc(files)
+            STORAGE_EVICTED_BYTES.inc(freed)
+            self.evicted_files += files
+            self.evicted_bytes += freed
+            logger.info(f"용량 제한 정리: 파생 데이터 {files}개 삭제 ({freed:,} bytes)")
+        return files, freed
+
+    def status(self) -> Dict[str, Any]:
+        """제한, 현재 사용량, 누적 정리량"""
+        return {
+            'limits': {'total': self.total, 'derived': self.derived},
+            'usage': self.usage(),
+            'derived_directories': list(self.derived_directories),
+            'evicted_files': self.evicted_files,
+            'evicted_bytes': self.evicted_bytes
+        }
@@ -0,0 +1,366 @@
+"""
+Stream Replay Server
+저장된 OHLCV/체결 데이터를 바이낸스 WebSocket 스트림 형식으로 재생하는 로컬 서버 (네트워크 없이 테스트용)
+
+사용 예시:
+    python -m services.stream_replay local_data/raw_data/binance/BTCUSDT_1m_2025-01-01_to_2025-01-02.csv \\
+        --symbol BTCUSDT --interval 1m --port 9999 --delay 0.1
+
+    이후 BINANCE_STREAM_URL=ws://localhost:9999 로 서버를 실행하면 MarketStreamService가 재생 데이터를 수신
+"""
+
+import sys
+import json
+import time
+import base64
+import hashlib
+import struct
+import argparse
+import threading
+import socketserver
+import pandas as pd
+from urllib.parse import urlparse, parse_qs
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+import logging
+
+from .resampling import INTERVAL_MS
+
+logger = logging.getLogger(__name__)
+
+_WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+_OPCODE_TEXT = 0x1
+_OPCODE_CLOSE = 0x8
+_OPCODE_PING = 0x9
+_OPCODE_PONG = 0xA
+
+def kline_events(data: pd.DataFrame, symbol: str, interval: str, updates: int = 1) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    OHLCV DataFrame을 kline 이벤트로 변환
+
+    Args:
+        data: timestamp 인덱스와 open/high/low/close/volume 컬럼을 가진 DataFrame
+        symbol: 거래 쌍
+        interval: 봉 간격
+        updates: 캔들 하나당 마감 전 진행 중(x=false) 이벤트 수
+
+    Yields:
+        (스트림 이름, 이벤트) 튜플
+    """
+    stream = f"{symbol.lower()}@kline_{interval}"
+    step = INTERVAL_MS.get(interval, 60_000)
+    index_ms = pd.DatetimeIndex(data.index).as_unit('ms').asi8
+
+    columns = [data[c].to_numpy(dtype=float) for c in ('open', 'high', 'low', 'close', 'volume')]
+    for start, o, h, l, c, v in zip(index_ms, *columns):
+        start = int(start)
+        for i in range(updates + 1):
+            closed = i == updates
+            # 진행 중 캔들은 시가에서 종가로 이동하며 고가/저가/거래량이 누적되는 것처럼 표현
+            fraction = (i + 1) / (updates + 1)
+            close = c if closed else o + (c - o) * fraction
+            yield stream, {
+                'e': 'kline',
+                'E': start + (step - 1 if closed else int(step * fraction)),
+                's': symbol.upper(),
+                'k': {
+                    't': start,
+                    'T': start + step - 1,
+                    's': symbol.upper(),
+                    'i': interval,
+                    'o': str(o),
+                    'h': str(h if closed else max(o, close)),
+                    'l': str(l if closed else min(o, close)),
+                    'c': str(close),
+                    'v': str(v if closed else v * fraction),
+                    'x': closed
+                }
+            }
+
+def trade_events(trades: pd.DataFrame, symbol: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """체결 DataFrame(timestamp 인덱스, price/quantity[/is_buyer_maker] 컬럼)을 trade 이벤트로 변환"""
+    stream = f"{symbol.lower()}@trade"
+    index_ms = pd.DatetimeIndex(trades.index).as_unit('ms').asi8
+    maker = trades['is_buyer_maker'] if 'is_buyer_maker' in trades.columns else [False] * len(trades)
+
+    for trade_id, (ts, price, quantity, is_maker) in enumerate(
+        zip(index_ms, trades['price'], trades['quantity'], maker)
+    ):
+        yield stream, {
+            'e': 'trade',
+            'E': int(ts),
+            's': symbol.upper(),
+            't': trade_id,
+            'p': str(price),
+            'q': str(quantity),
+            'T': int(ts),
+            'm': bool(is_maker)
+        }
+
+def _merge_events(sources: List[Iterator[Tuple[str, Dict[str, Any]]]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """여러 스트림 이벤트를 이벤트 시간(E) 순으로 병합"""
+    events = [event for source in sources for event in source]
+    events.sort(key=lambda item: item[1]['E'])
+    return events
+
+class _ReplayHandler(socketserver.BaseRequestHandler):
+    """WebSocket 연결 하나를 처리 (RFC 6455 최소 구현: 텍스트/close/ping 프레임)"""
+
+    def setup(self):
+        self.subscriptions = set()
+        self.subscribed = threading.Event()
+        self.lock = threading.Lock()
+        self.closed = threading.Event()
+
+    def handle(self):
+        path = self._handshake()
+        if path is None:
+            return
+
+        # /stream?streams=a/b 형식의 초기 구독
+        query = parse_qs(urlparse(path).query)
+        for streams in query.get('streams', []):
+            self.subscriptions.update(s for s in streams.split('/') if s)
+        if self.subscriptions:
+            self.subscribed.set()
+
+        feeder = threading.Thread(target=self._feed, daemon=True)
+        feeder.start()
+
+        try:
+            while not self.closed.is_set():
+                frame = self._recv_frame()
+                if frame is None:
+                    break
+                opcode, payload = frame
+
+                if opcode == _OPCODE_CLOSE:
+                    self._send_frame(_OPCODE_CLOSE, payload[:2])
+                    break
+                if opcode == _OPCODE_PING:
+                    self._send_frame(_OPCODE_PONG, payload)
+                elif opcode == _OPCODE_TEXT:
+                    self._handle_request(payload.decode('utf-8'))
+        except OSError:
+            pass
+        finally:
+            self.closed.set()
+            feeder.join(timeout=1)
+
+    def _handshake(self) -> Optional[str]:
+        raw = b''
+        while b'\r\n\r\n' not in raw:
+            chunk = self.request.recv(4096)
+            if not chunk:
+                return None
+            raw += chunk
+
+        lines = raw.split(b'\r\n\r\n', 1)[0].decode('latin-1').split('\r\n')
+        path = lines[0].split(' ')[1] if len(lines[0].split(' ')) > 1 else '/'
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        key = headers.get('sec-websocket-key')
+        if not key:
+            self.request.sendall(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n')
+            return None
+
+        accept = base64.b64encode(hashlib.sha1((key + _WEBSOCKET_GUID).encode()).digest()).decode()
+        self.request.sendall((
+            'HTTP/1.1 101 Switching Protocols\r\n'
+            'Upgrade: websocket\r\n'
+            'Connection: Upgrade\r\n'
+            f'Sec-WebSocket-Accept: {accept}\r\n\r\n'
+        ).encode())
+        return path
+
+    def _recv_exact(self, size: int) -> Optional[bytes]:
+        data = b''
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _recv_frame(self) -> Optional[Tuple[int, bytes]]:
+        header = self._recv_exact(2)
+        if header is None:
+            return None
+
+        opcode = header[0] & 0x0F
+        masked = header[1] & 0x80
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack('!H', self._recv_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack('!Q', self._recv_exact(8))[0]
+
+        mask = self._recv_exact(4) if masked else None
+        payload = self._recv_exact(length) if length else b''
+        if payload is None:
+            return None
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return opcode, payload
+
+    def _send_frame(self, opcode: int, payload: bytes):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+
+        with self.lock:
+            self.request.sendall(header + payload)
+
+    def _send_json(self, payload: Dict[str, Any]):
+        self._send_frame(_OPCODE_TEXT, json.dumps(payload).encode('utf-8'))
+
+    def _handle_request(self, message: str):
+        """바이낸스 SUBSCRIBE/UNSUBSCRIBE/LIST_SUBSCRIPTIONS 요청 처리"""
+        try:
+            request = json.loads(message)
+        except ValueError:
+            return
+
+        method = request.get('method')
+        params = request.get('params', [])
+        if method == 'SUBSCRIBE':
+            self.subscriptions.update(params)
+            self.subscribed.set()
+            result = None
+        elif method == 'UNSUBSCRIBE':
+            self.subscriptions.difference_update(params)
+            result = None
+        elif method == 'LIST_SUBSCRIPTIONS':
+            result = sorted(self.subscriptions)
+        else:
+            return
+        self._send_json({'result': result, 'id': request.get('id')})
+
+    def _feed(self):
+        """구독 중인 스트림의 이벤트만 순서대로 전송 (첫 구독 요청 이후 재생 시작)"""
+        server = self.server
+        while not self.subscribed.wait(0.1):
+            if self.closed.is_set():
+                return
+        try:
+            while not self.closed.is_set():
+                for stream, event in server.events:
+                    if self.closed.is_set():
+                        return
+                    if stream not in self.subscriptions:
+                        continue
+                    self._send_json({'stream': stream, 'data': event})
+                    if server.delay:
+                        time.sleep(server.delay)
+                if not server.loop:
+                    return
+        except OSError:
+            self.closed.set()
+
+class ReplayServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """저장된 시세 데이터를 바이낸스 combined stream 형식으로 재생하는 WebSocket 서버"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        events: List[Tuple[str, Dict[str, Any]]],
+        host: str = 'localhost',
+        port: int = 9999,
+        delay: float = 0.05,
+        loop: bool = False
+    ):
+        """
+        Args:
+            events: (스트림 이름, 이벤트) 리스트 (kline_events/trade_events 결과)
+            host: 바인딩 주소
+            port: 포트 (0이면 임의 포트)
+            delay: 메시지 간 지연 시간(초)
+            loop: 데이터 끝에 도달하면 처음부터 반복
+        """
+        self.events = events
+        self.delay = delay
+        self.loop = loop
+        super().__init__((host, port), _ReplayHandler)
+
+    @property
+    def url(self) -> str:
+        """MarketStreamService에 넘길 스트림 주소"""
+        host, port = self.server_address[:2]
+        return f"ws://{host}:{port}"
+
+    @classmethod
+    def from_frames(
+        cls,
+        klines: Optional[Dict[Tuple[str, str], pd.DataFrame]] = None,
+        trades: Optional[Dict[str, pd.DataFrame]] = None,
+        updates: int = 1,
+        **kwargs
+    ) -> 'ReplayServer':
+        """
+        DataFrame으로 재생 서버 생성
+
+        Args:
+            klines: {(심볼, 간격): OHLCV DataFrame}
+            trades: {심볼: 체결 DataFrame}
+            updates: 캔들당 진행 중 이벤트 수
+            **kwargs: ReplayServer 생성자 인자
+        """
+        sources = [kline_events(df, symbol, interval, updates) for (symbol, interval), df in (klines or {}).items()]
+        sources += [trade_events(df, symbol) for symbol, df in (trades or {}).items()]
+        return cls(_merge_events(sources), **kwargs)
+
+    def start(self) -> threading.Thread:
+        """백그라운드 스레드에서 서버 실행"""
+        thread = threading.Thread(target=self.serve_forever, name='stream-replay', daemon=True)
+        thread.start()
+        logger.info(f"스트림 재생 서버 시작: {self.url} ({len(self.events)}개 이벤트)")
+        return thread
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='저장된 OHLCV CSV를 바이낸스 WebSocket 스트림으로 재생')
+    parser.add_argument('files', nargs='+', help='OHLCV CSV 파일 (collect_binance_data 저장 형식)')
+    parser.add_argument('--symbol', help='심볼 (생략 시 CSV의 symbol 컬럼 또는 파일명 앞부분)')
+    parser.add_argument('--interval', help='봉 간격 (생략 시 CSV의 interval 컬럼 또는 파일명)')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=9999)
+    parser.add_argument('--delay', type=float, default=0.05, help='메시지 간 지연 시간(초)')
+    parser.add_argument('--updates', type=int, default=1, help='캔들당 진행 중 이벤트 수')
+    parser.add_argument('--loop', action='store_true', help='데이터 끝에서 처음부터 반복')
+    args = parser.parse_args(argv)
+
+    klines = {}
+    for file_path in args.files:
+        df = pd.read_csv(file_path, index_col=0, parse_dates=True)
+        name_parts = file_path.replace('\\', '/').rsplit('/', 1)[-1].split('_')
+        symbol = args.symbol or (df['symbol'].iloc[0] if 'symbol' in df.columns else name_parts[0])
+        interval = args.interval or (df['interval'].iloc[0] if 'interval' in df.columns else name_parts[1])
+        klines[(symbol.upper(), interval)] = df
+
+    server = ReplayServer.from_frames(
+        klines, updates=args.updates, host=args.host, port=args.port, delay=args.delay, loop=args.loop
+    )
+    print(f"🔁 스트림 재생 서버: {server.url}")
+    for symbol, interval in klines:
+        print(f"   - {symbol.lower()}@kline_{interval} ({len(klines[(symbol, interval)])}개 캔들)")
+    print(f"   BINANCE_STREAM_URL={server.url} 로 Juppelin 서버를 실행하세요.")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
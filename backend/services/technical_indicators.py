@@ -8,20 +8,22 @@ import numpy as np
 from typing import Dict, Tuple, Optional
 import logging
 
+from .compute_backend import get_backend
+
 logger = logging.getLogger(__name__)
 
 class TechnicalIndicators:
-    """기술 지표 계산 클래스"""
+    """기술 지표 계산 클래스 (롤링/EWM 윈도우는 세션의 연산 백엔드에서 실행)"""
     
     @staticmethod
     def calculate_sma(data: pd.Series, period: int) -> pd.Series:
         """단순 이동평균선 (Simple Moving Average)"""
-        return data.rolling(window=period).mean()
+        return get_backend().rolling(data, period, 'mean')
     
     @staticmethod
     def calculate_ema(data: pd.Series, period: int) -> pd.Series:
         """지수 이동평균선 (Exponential Moving Average)"""
-        return data.ewm(span=period).mean()
+        return get_backend().ewm_mean(data, span=period)
     
     @staticmethod
     def calculate_macd(
@@ -91,8 +93,9 @@ class TechnicalIndicators:
             loss = -delta.where(delta < 0, 0)
             
             # 평균 상승분과 하락분 계산 (Wilder's smoothing)
-            avg_gain = gain.ewm(alpha=1/period).mean()
-            avg_loss = loss.ewm(alpha=1/period).mean()
+            backend = get_backend()
+            avg_gain = backend.ewm_mean(gain, alpha=1/period)
+            avg_loss = backend.ewm_mean(loss, alpha=1/period)
             
             # RS (Relative Strength) 계산
             rs = avg_gain / avg_loss
@@ -125,11 +128,8 @@ class TechnicalIndicators:
             상단밴드, 중간밴드(SMA), 하단밴드가 포함된 DataFrame
         """
         try:
-            # 중간밴드 (SMA) 계산
-            middle_band = TechnicalIndicators.calculate_sma(data, period)
-            
-            # 표준편차 계산
-            std = data.rolling(window=period).std()
+            # 중간밴드 (SMA)와 표준편차 계산
+            middle_band, std = get_backend().rolling_many([(data, period, 'mean'), (data, period, 'std')])
             
             # 상단밴드와 하단밴드 계산
             upper_band = middle_band + (std * std_dev)
@@ -173,14 +173,14 @@ class TechnicalIndicators:
         """
         try:
             # 최고가와 최저가의 롤링 계산
-            highest_high = high.rolling(window=k_period).max()
-            lowest_low = low.rolling(window=k_period).min()
+            backend = get_backend()
+            highest_high, lowest_low = backend.rolling_many([(high, k_period, 'max'), (low, k_period, 'min')])
             
             # %K 계산
             k_percent = ((close - lowest_low) / (highest_high - lowest_low)) * 100
             
             # %D 계산 (%K의 SMA)
-            d_percent = k_percent.rolling(window=d_period).mean()
+            d_percent = backend.rolling(k_percent, d_period, 'mean')
             
             # 결과 DataFrame 생성
             result = pd.DataFrame({
@@ -226,7 +226,7 @@ class TechnicalIndicators:
             true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
             
             # ATR 계산 (Wilder's smoothing)
-            atr = true_range.ewm(alpha=1/period).mean()
+            atr = get_backend().ewm_mean(true_range, alpha=1/period)
             
             logger.info(f"ATR 계산 완료: {len(atr)}개 데이터")
             return atr
@@ -256,8 +256,7 @@ class TechnicalIndicators:
         """
         try:
             # 최고가와 최저가의 롤링 계산
-            highest_high = high.rolling(window=period).max()
-            lowest_low = low.rolling(window=period).min()
+            highest_high, lowest_low = get_backend().rolling_many([(high, period, 'max'), (low, period, 'min')])
             
             # Williams %R 계산
             williams_r = ((highest_high - close) / (highest_high - lowest_low)) * -100
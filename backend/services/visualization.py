@@ -12,12 +12,61 @@ import json
 from typing import Dict, Any, List, Optional
 import logging
 
+from . import correlation
+from .chart_session import to_plotly_values
+from .compute_backend import get_backend
+
 logger = logging.getLogger(__name__)
 
+# 히트맵 셀에 숫자를 표시하는 최대 컬럼 수
+MAX_ANNOTATED_HEATMAP = 30
+
+# 트레이스 점 수가 이보다 많으면 SVG(Scatter/Bar) 대신 WebGL(Scattergl)로 그림
+WEBGL_THRESHOLD = 10_000
+
+# 캔들 표현 전환 기준 (캔들 수): 이하 candlestick, 이하 WebGL 사각형(몸통/꼬리 선분), 초과 종가 선
+# WebGL 선분(x, x, None 반복)은 같은 캔들 수에서 JSON이 candlestick의 약 1.7배라 자동 선택에서는
+# 쓰지 않음 (두 기준이 같음). candle_mode='webgl' 또는 webgl_candle_max_points를 키워 사용
+CANDLESTICK_MAX_POINTS = 200_000
+WEBGL_CANDLE_MAX_POINTS = 200_000
+
+CANDLE_MODES = ('auto', 'candlestick', 'ohlc', 'webgl', 'line')
+
+# 거래량 막대 색상 (하락 0 → red, 상승 1 → green)
+VOLUME_COLORSCALE = [[0, 'red'], [1, 'green']]
+
+def _x_milliseconds(index: pd.Index) -> np.ndarray:
+    """x 값을 float 배열로 (시각은 epoch ms, date 축이 그대로 해석하고 NaN으로 선분을 끊을 수 있음)"""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.as_unit('ms').asi8.astype(np.float64)
+    return np.asarray(index, dtype=np.float64)
+
+def _segments(x: np.ndarray, start: np.ndarray, end: np.ndarray):
+    """점마다 (x, start) → (x, end) 선분을 NaN으로 구분한 하나의 배열로"""
+    xs = np.empty(len(x) * 3)
+    ys = np.empty(len(x) * 3)
+    xs[0::3], xs[1::3], xs[2::3] = x, x, np.nan
+    ys[0::3], ys[1::3], ys[2::3] = start, end, np.nan
+    return xs, ys
+
 class VisualizationService:
     """시각화 서비스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        webgl_threshold: int = WEBGL_THRESHOLD,
+        candlestick_max_points: int = CANDLESTICK_MAX_POINTS,
+        webgl_candle_max_points: int = WEBGL_CANDLE_MAX_POINTS
+    ):
+        """
+        Args:
+            webgl_threshold: 이 점 수를 넘는 선/거래량 트레이스는 Scattergl 사용
+            candlestick_max_points: 이 캔들 수까지 Candlestick 트레이스 사용
+            webgl_candle_max_points: 이 캔들 수까지 WebGL 사각형, 넘으면 종가 선
+        """
+        self.webgl_threshold = webgl_threshold
+        self.candlestick_max_points = candlestick_max_points
+        self.webgl_candle_max_points = webgl_candle_max_points
         # 다크 테마 설정
         self.theme = 'plotly_dark'
         self.color_palette = {
@@ -29,12 +78,91 @@ class VisualizationService:
             'text': '#A9B7C6'
         }
     
+    # 대용량 시계열 트레이스 선택
+    
+    def candle_mode(self, points: int, mode: str = 'auto') -> str:
+        """캔들 수에 맞는 캔들 표현 ('candlestick', 'ohlc', 'webgl', 'line')"""
+        if mode not in CANDLE_MODES:
+            raise ValueError(f"지원하지 않는 캔들 표현: {mode} (사용 가능: {', '.join(CANDLE_MODES)})")
+        if mode != 'auto':
+            return mode
+        if points <= self.candlestick_max_points:
+            return 'candlestick'
+        return 'webgl' if points <= self.webgl_candle_max_points else 'line'
+    
+    def _line_trace(self, x, y: pd.Series, name: str, color: str, width: float = 2, **kwargs):
+        """선 트레이스 (점 수가 webgl_threshold를 넘으면 Scattergl, 점별 hover 텍스트 없음)"""
+        if len(y) > self.webgl_threshold:
+            # 대용량은 시각을 ISO 문자열 대신 epoch ms 숫자 배열로 (전송 크기/직렬화 시간 감소)
+            trace_type, x = go.Scattergl, _x_milliseconds(pd.Index(x))
+        else:
+            trace_type = go.Scatter
+        return trace_type(
+            x=x, y=y.to_numpy() if isinstance(y, pd.Series) else y,
+            mode='lines', name=name, line=dict(color=color, width=width), **kwargs
+        )
+    
+    def _candle_traces(self, data: pd.DataFrame, mode: str = 'auto') -> list:
+        """가격 트레이스 목록 (mode는 candle_mode 참고)"""
+        mode = self.candle_mode(len(data), mode)
+        up_color, down_color = self.color_palette['primary'], self.color_palette['secondary']
+        
+        if mode in ('candlestick', 'ohlc'):
+            trace_type = go.Candlestick if mode == 'candlestick' else go.Ohlc
+            return [trace_type(
+                x=data.index, open=data['open'], high=data['high'], low=data['low'], close=data['close'],
+                name='가격', increasing_line_color=up_color, decreasing_line_color=down_color
+            )]
+        
+        if mode == 'line':
+            return [self._line_trace(data.index, data['close'], '가격 (종가)', up_color, width=1)]
+        
+        # WebGL 사각형: 꼬리는 가는 선분, 몸통은 굵은 선분 (상승/하락 각각 하나의 Scattergl)
+        x = _x_milliseconds(data.index)
+        open_, high, low, close = (data[c].to_numpy(dtype=np.float64) for c in ('open', 'high', 'low', 'close'))
+        rising = close >= open_
+        traces = []
+        for label, mask, color in (('상승', rising, up_color), ('하락', ~rising, down_color)):
+            wick_x, wick_y = _segments(x[mask], low[mask], high[mask])
+            body_x, body_y = _segments(x[mask], open_[mask], close[mask])
+            traces.append(go.Scattergl(
+                x=wick_x, y=wick_y, mode='lines', name=f'가격 {label} 꼬리', legendgroup='가격',
+                line=dict(color=color, width=1), hoverinfo='skip', showlegend=False
+            ))
+            traces.append(go.Scattergl(
+                x=body_x, y=body_y, mode='lines', name=f'가격 {label}', legendgroup='가격',
+                line=dict(color=color, width=3), hoverinfo='x+y', showlegend=label == '상승'
+            ))
+        return traces
+    
+    def _volume_trace(self, data: pd.DataFrame):
+        """거래량 트레이스 (대용량이면 점별 색상 배열 없이 WebGL 영역 선)"""
+        if len(data) > self.webgl_threshold:
+            return go.Scattergl(
+                x=_x_milliseconds(data.index), y=data['volume'].to_numpy(), mode='lines', name='거래량',
+                fill='tozeroy', line=dict(color=self.color_palette['tertiary'], width=1), showlegend=False
+            )
+        # 점별 색상은 문자열 대신 0/1 값 + 2색 컬러스케일 (검증/전송 비용 감소)
+        return go.Bar(
+            x=data.index,
+            y=data['volume'],
+            name='거래량',
+            marker=dict(color=self._rising(data), colorscale=VOLUME_COLORSCALE, cmin=0, cmax=1),
+            showlegend=False
+        )
+    
+    @staticmethod
+    def _rising(data: pd.DataFrame) -> np.ndarray:
+        """거래량 색상 값 (상승/보합 1, 하락 0)"""
+        return (data['close'].to_numpy() >= data['open'].to_numpy()).astype(np.int8)
+    
     def create_candlestick_chart(
         self,
         data: pd.DataFrame,
         title: str = "캔들스틱 차트",
         height: int = 600,
-        show_volume: bool = True
+        show_volume: bool = True,
+        candle_mode: str = 'auto'
     ) -> Dict[str, Any]:
         """
         캔들스틱 차트 생성
@@ -44,6 +172,7 @@ class VisualizationService:
             title: 차트 제목
             height: 차트 높이
             show_volume: 거래량 표시 여부
+            candle_mode: 캔들 표현 ('auto'면 캔들 수에 따라 candlestick → line, 'webgl'은 직접 지정)
         
         Returns:
             Plotly 차트 JSON 데이터
@@ -61,35 +190,19 @@ class VisualizationService:
             else:
                 fig = go.Figure()
             
-            # 캔들스틱 차트 추가
-            candlestick = go.Candlestick(
-                x=data.index,
-                open=data['open'],
-                high=data['high'],
-                low=data['low'],
-                close=data['close'],
-                name='가격',
-                increasing_line_color=self.color_palette['primary'],
-                decreasing_line_color=self.color_palette['secondary']
-            )
+            # 가격 트레이스 추가 (캔들 수에 따라 candlestick / WebGL 사각형 / 종가 선)
+            candle_mode = self.candle_mode(len(data), candle_mode)
+            price_traces = self._candle_traces(data, candle_mode)
             
             if show_volume:
-                fig.add_trace(candlestick, row=1, col=1)
-                
-                # 거래량 바 차트 추가
-                colors = ['red' if close < open else 'green' 
-                         for close, open in zip(data['close'], data['open'])]
+                for trace in price_traces:
+                    fig.add_trace(trace, row=1, col=1)
                 
-                volume_bar = go.Bar(
-                    x=data.index,
-                    y=data['volume'],
-                    name='거래량',
-                    marker_color=colors,
-                    showlegend=False
-                )
-                fig.add_trace(volume_bar, row=2, col=1)
+                # 거래량 추가
+                fig.add_trace(self._volume_trace(data), row=2, col=1)
             else:
-                fig.add_trace(candlestick)
+                for trace in price_traces:
+                    fig.add_trace(trace)
                 fig.update_layout(title=title)
             
             # 레이아웃 설정
@@ -99,7 +212,13 @@ class VisualizationService:
                 showlegend=True,
                 xaxis_rangeslider_visible=False,
                 paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)'
+                plot_bgcolor='rgba(0,0,0,0)',
+                # 차트 세션이 새 캔들을 같은 트레이스 구성으로 바꿀 때 쓰는 candle_points 인자
+                meta={'candles': {
+                    'candle_mode': candle_mode,
+                    'show_volume': show_volume,
+                    'volume_webgl': show_volume and len(data) > self.webgl_threshold
+                }}
             )
             
             # x축 설정
@@ -115,13 +234,89 @@ class VisualizationService:
                 gridcolor=self.color_palette['grid']
             )
             
-            logger.info(f"캔들스틱 차트 생성 완료: {len(data)}개 캔들")
+            logger.info(f"캔들스틱 차트 생성 완료: {len(data)}개 캔들 ({candle_mode})")
             return json.loads(fig.to_json())
             
         except Exception as e:
             logger.error(f"캔들스틱 차트 생성 실패: {e}")
             raise
     
+    def candle_points(
+        self,
+        data: pd.DataFrame,
+        show_volume: bool = True,
+        candle_mode: str = 'candlestick',
+        volume_webgl: bool = False
+    ) -> Dict[str, Dict[str, list]]:
+        """
+        create_candlestick_chart 트레이스에 이어 붙일 점 (ChartSession.merge 입력)
+        
+        인자는 차트를 만들 때 정해진 표현과 같아야 하며, 피겨 layout.meta['candles']에 그대로 들어 있습니다.
+        
+        Args:
+            data: 새(또는 갱신된) OHLCV 행
+            show_volume: 거래량 트레이스 포함 여부
+            candle_mode: 차트의 캔들 표현 ('candlestick', 'ohlc', 'webgl', 'line')
+            volume_webgl: 거래량이 WebGL 영역 선인지 (점별 색상 없음)
+        
+        Returns:
+            {트레이스 이름: {속성: 값 리스트}} (webgl 표현은 방향별 선분 {x, start, end},
+            다른 방향 캔들의 start/end는 None)
+        """
+        if candle_mode in ('candlestick', 'ohlc'):
+            points = {'가격': {
+                'x': to_plotly_values(data.index),
+                **{c: to_plotly_values(data[c]) for c in ('open', 'high', 'low', 'close')}
+            }}
+        elif candle_mode == 'line':
+            points = {'가격 (종가)': {'x': _x_milliseconds(data.index).tolist(), 'y': to_plotly_values(data['close'])}}
+        elif candle_mode == 'webgl':
+            x = _x_milliseconds(data.index).tolist()
+            rising = self._rising(data).astype(bool)
+            points = {}
+            for label, mask in (('상승', rising), ('하락', ~rising)):
+                for name, low, high in ((f'가격 {label} 꼬리', 'low', 'high'), (f'가격 {label}', 'open', 'close')):
+                    points[name] = {
+                        'x': x,
+                        'start': to_plotly_values(data[low].where(mask)),
+                        'end': to_plotly_values(data[high].where(mask))
+                    }
+        else:
+            raise ValueError(f"지원하지 않는 캔들 표현: {candle_mode}")
+        
+        if show_volume and volume_webgl:
+            points['거래량'] = {'x': _x_milliseconds(data.index).tolist(), 'y': to_plotly_values(data['volume'])}
+        elif show_volume:
+            points['거래량'] = {
+                'x': to_plotly_values(data.index),
+                'y': to_plotly_values(data['volume']),
+                'marker.color': self._rising(data).tolist()
+            }
+        return points
+    
+    def overlay_trace(self, series: pd.Series, name: str, color: Optional[str] = None) -> Dict[str, Any]:
+        """
+        가격 패널(첫 번째 축)에 겹쳐 그릴 선 트레이스 (ChartSession.add_traces 입력)
+        
+        Args:
+            series: 지표 값 (시각 인덱스)
+            name: 트레이스 이름 (이후 merge 대상)
+            color: 선 색상
+        
+        Returns:
+            Plotly 트레이스 dict
+        """
+        return {
+            'type': 'scattergl' if len(series) > self.webgl_threshold else 'scatter',
+            'mode': 'lines',
+            'name': name,
+            'x': to_plotly_values(series.index),
+            'y': to_plotly_values(series),
+            'line': {'color': color or self.color_palette['tertiary'], 'width': 1.5},
+            'xaxis': 'x',
+            'yaxis': 'y'
+        }
+    
     def create_line_chart(
         self,
         data: pd.DataFrame,
@@ -149,13 +344,7 @@ class VisualizationService:
             
             for i, column in enumerate(columns):
                 if column in data.columns:
-                    fig.add_trace(go.Scatter(
-                        x=data.index,
-                        y=data[column],
-                        mode='lines',
-                        name=column,
-                        line=dict(color=colors[i % len(colors)], width=2)
-                    ))
+                    fig.add_trace(self._line_trace(data.index, data[column], column, colors[i % len(colors)]))
             
             # 레이아웃 설정
             fig.update_layout(
@@ -167,8 +356,9 @@ class VisualizationService:
                 plot_bgcolor='rgba(0,0,0,0)'
             )
             
-            # 축 설정
+            # 축 설정 (Scattergl의 epoch ms x도 시각으로 표시)
             fig.update_xaxes(
+                type='date' if isinstance(data.index, pd.DatetimeIndex) else None,
                 showgrid=True,
                 gridcolor=self.color_palette['grid']
             )
@@ -189,7 +379,8 @@ class VisualizationService:
         data: pd.DataFrame,
         indicators: Dict[str, pd.DataFrame],
         title: str = "기술적 분석",
-        height: int = 800
+        height: int = 800,
+        candle_mode: str = 'auto'
     ) -> Dict[str, Any]:
         """
         기술적 분석 복합 차트 생성
@@ -199,6 +390,7 @@ class VisualizationService:
             indicators: 기술 지표 데이터 딕셔너리
             title: 차트 제목
             height: 차트 높이
+            candle_mode: 캔들 표현 ('auto'면 캔들 수에 따라 candlestick → line, 'webgl'은 직접 지정)
         
         Returns:
             Plotly 차트 JSON 데이터
@@ -215,20 +407,9 @@ class VisualizationService:
                 row_heights=[0.5] + [0.5/(num_subplots-1)]*(num_subplots-1) if num_subplots > 1 else [1.0]
             )
             
-            # 1. 캔들스틱 차트
-            fig.add_trace(
-                go.Candlestick(
-                    x=data.index,
-                    open=data['open'],
-                    high=data['high'], 
-                    low=data['low'],
-                    close=data['close'],
-                    name='가격',
-                    increasing_line_color=self.color_palette['primary'],
-                    decreasing_line_color=self.color_palette['secondary']
-                ),
-                row=1, col=1
-            )
+            # 1. 가격 (캔들 수에 따라 candlestick / WebGL 사각형 / 종가 선)
+            for trace in self._candle_traces(data, candle_mode):
+                fig.add_trace(trace, row=1, col=1)
             
             # 2. 기술 지표들
             colors = [self.color_palette['primary'], self.color_palette['secondary'], 
@@ -240,13 +421,9 @@ class VisualizationService:
                 # 각 지표의 컬럼들을 개별 라인으로 추가
                 for j, column in enumerate(indicator_data.columns):
                     fig.add_trace(
-                        go.Scatter(
-                            x=indicator_data.index,
-                            y=indicator_data[column],
-                            mode='lines',
-                            name=f"{indicator_name}_{column}",
-                            line=dict(color=colors[j % len(colors)], width=2),
-                            showlegend=True
+                        self._line_trace(
+                            indicator_data.index, indicator_data[column], f"{indicator_name}_{column}",
+                            colors[j % len(colors)], showlegend=True
                         ),
                         row=row_num, col=1
                     )
@@ -294,25 +471,43 @@ class VisualizationService:
         self,
         data: pd.DataFrame,
         title: str = "상관관계 히트맵",
-        height: int = 500
+        height: int = 500,
+        method: str = 'pearson',
+        cluster: bool = False,
+        is_matrix: bool = False
     ) -> Dict[str, Any]:
         """
         상관관계 히트맵 생성
         
         Args:
-            data: 데이터
+            data: 데이터 (is_matrix=True면 이미 계산한 상관계수 행렬)
             title: 차트 제목
             height: 차트 높이
+            method: 'pearson' 또는 'spearman'
+            cluster: 비슷한 컬럼끼리 모이도록 행/열 재배열
+            is_matrix: data가 상관계수 행렬인지 (correlation 서비스 결과 등)
         
         Returns:
             Plotly 차트 JSON 데이터
         """
         try:
-            # 숫자형 컬럼만 선택
-            numeric_data = data.select_dtypes(include=[np.number])
+            if is_matrix:
+                corr_matrix = data
+            else:
+                # 숫자형 컬럼만 선택
+                numeric_data = data.select_dtypes(include=[np.number])
+                
+                # 상관관계 계산 (피어슨은 세션의 연산 백엔드)
+                if method == 'pearson':
+                    corr_matrix = get_backend().corr(numeric_data)
+                else:
+                    corr_matrix = correlation.correlation_matrix(numeric_data, method)
+            
+            if cluster:
+                corr_matrix = correlation.reorder(corr_matrix)
             
-            # 상관관계 계산
-            corr_matrix = numeric_data.corr()
+            # 셀 숫자 표시는 읽을 수 있는 크기까지만 (수백 개 심볼은 색만)
+            annotate = corr_matrix.shape[0] <= MAX_ANNOTATED_HEATMAP
             
             # 히트맵 생성
             fig = go.Figure(data=go.Heatmap(
@@ -321,8 +516,8 @@ class VisualizationService:
                 y=corr_matrix.columns,
                 colorscale='RdBu',
                 zmid=0,
-                text=np.round(corr_matrix.values, 2),
-                texttemplate="%{text}",
+                text=np.round(corr_matrix.values, 2) if annotate else None,
+                texttemplate="%{text}" if annotate else None,
                 textfont={"size": 10},
                 hoverongaps=False
             ))
@@ -7,6 +7,17 @@ class JuppelinApp {
     this.cellCounter = 1;
     this.editors = new Map();
     this.executionCount = 0;
+    // 서버 차트 세션별 요소와 마지막으로 적용한 버전 (chart_id → {element, version})
+    this.charts = new Map();
+    // 셀이 바꾼 세션 설정 (성능 모드, 연산 백엔드). 서버 응답을 받아 다음 실행에 다시 보냄 (멀티 워커에서도 유지)
+    this.sessionSettings = {};
+    // 요소가 없는 차트에 델타가 와서 전체 피겨를 요청한 chart_id (중복 요청 방지)
+    this.pendingCharts = new Set();
+    // 실행 기록을 세션 단위로 묶기 위한 ID (페이지를 새로 열면 새 세션)
+    this.sessionId =
+      window.crypto && crypto.randomUUID
+        ? crypto.randomUUID()
+        : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
 
     this.init();
   }
@@ -22,11 +33,20 @@ class JuppelinApp {
   }
 
   setupSocketConnection() {
-    this.socket = io();
+    // 웹소켓 우선 연결 (멀티 워커 프로덕션 서버는 폴링을 허용하지 않으므로 서버가 알려준 전송 방식만 사용)
+    const serverTransports = (window.JUPPELIN_CONFIG || {}).socketTransports || ["polling", "websocket"];
+    const transports = serverTransports.includes("polling") ? ["websocket", "polling"] : ["websocket"];
+    this.socket = io({ transports });
 
     this.socket.on("connect", () => {
       console.log("Connected to server");
       this.updateConnectionStatus("connected", "서버 연결됨");
+      // 연결이 끊긴 동안 놓친 버전이 있을 수 있으므로 열려 있는 차트는 전체 피겨를 다시 받음
+      this.pendingCharts.clear();
+      this.charts.forEach((chart, chartId) => {
+        chart.resyncing = true;
+        this.socket.emit("chart_resync", { chart_id: chartId });
+      });
     });
 
     this.socket.on("disconnect", () => {
@@ -43,9 +63,17 @@ class JuppelinApp {
       this.displayExecutionResult(data.cell_id, data);
     });
 
-    // 차트 데이터 수신
-    this.socket.on("chart_update", (data) => {
-      this.displayChart(data);
+    // 차트 세션: 전체 피겨는 처음/재동기화 때만, 이후에는 바뀐 부분만 수신
+    this.socket.on("chart_figure", (data) => {
+      this.renderChartFigure(data);
+    });
+
+    this.socket.on("chart_delta", (data) => {
+      this.applyChartDelta(data);
+    });
+
+    this.socket.on("chart_closed", (data) => {
+      this.removeChart(data.chart_id);
     });
   }
 
@@ -177,12 +205,18 @@ print("Hello from new cell!")
         },
         body: JSON.stringify({
           cell_id: cellId,
+          session_id: this.sessionId,
+          execution_count: this.executionCount,
+          settings: this.sessionSettings,
           code: code,
           cell_type: "code",
         }),
       });
 
       const result = await response.json();
+      if (result.settings) {
+        this.sessionSettings = result.settings;
+      }
       this.displayExecutionResult(cellId, result);
     } catch (error) {
       console.error("Execution error:", error);
@@ -201,6 +235,7 @@ print("Hello from new cell!")
       let dataFrameCount = 0;
       let lastDataFrame = null;
       let hasChart = false;
+      const flameGraphs = [];
       
       if (result.outputs && result.outputs.length > 0) {
         result.outputs.forEach((output) => {
@@ -221,12 +256,19 @@ print("Hello from new cell!")
             if (output.data && output.data["text/plain"]) {
               outputHTML += `<pre>${this.escapeHtml(output.data["text/plain"])}</pre>`;
             }
+          } else if (output.output_type === "profile") {
+            const flameId = `flame-${cellId}-${flameGraphs.length}`;
+            outputHTML += this.renderProfile(output.data, flameId);
+            if (output.data.mode === "flame") {
+              flameGraphs.push({ id: flameId, data: output.data });
+            }
           }
         });
       }
       outputElement.innerHTML =
         outputHTML || "<pre>실행 완료 (출력 없음)</pre>";
       outputElement.className = "cell-output has-content";
+      flameGraphs.forEach(({ id, data }) => this.renderFlameGraph(id, data));
       
       // DataFrame이 있으면 마지막 것만 한 번만 처리
       if (lastDataFrame) {
@@ -246,6 +288,63 @@ print("Hello from new cell!")
     this.updateLastUpdate();
   }
 
+  renderProfile(profile, flameId) {
+    // %%prun: 상위 함수 표, %%timeit: 요약, %%flame: 플레임 그래프 영역
+    if (profile.mode === "prun") {
+      const rows = profile.functions
+        .map(
+          (f) => `<tr>
+            <td>${this.escapeHtml(String(f.ncalls))}</td>
+            <td>${f.tottime.toFixed(4)}</td>
+            <td>${f.cumtime.toFixed(4)}</td>
+            <td>${this.escapeHtml(f.function)}</td>
+          </tr>`,
+        )
+        .join("");
+      return `<pre>${profile.total_calls.toLocaleString()} function calls in ${profile.total_time.toFixed(3)} s (sort: ${this.escapeHtml(profile.sort)})</pre>
+        <table class="dataframe-table profile-table">
+          <thead><tr><th>ncalls</th><th>tottime</th><th>cumtime</th><th>function</th></tr></thead>
+          <tbody>${rows}</tbody>
+        </table>`;
+    }
+    if (profile.mode === "timeit") {
+      return `<pre>${this.escapeHtml(profile.summary)}</pre>`;
+    }
+    if (profile.mode === "flame") {
+      return `<pre>${profile.samples.toLocaleString()} samples (${profile.interval_ms} ms 간격, ${profile.elapsed.toFixed(3)} s)</pre>
+        <div id="${flameId}" class="profile-flame"></div>`;
+    }
+    return "";
+  }
+
+  renderFlameGraph(elementId, profile) {
+    const element = document.getElementById(elementId);
+    if (!element || typeof Plotly === "undefined" || profile.samples === 0) {
+      return;
+    }
+    // 루트가 위, 호출된 함수가 아래로 내려가는 icicle 차트
+    Plotly.newPlot(
+      element,
+      [
+        {
+          type: "icicle",
+          ids: profile.ids,
+          labels: profile.labels,
+          parents: profile.parents,
+          values: profile.values,
+          branchvalues: "total",
+          tiling: { orientation: "v" },
+          hovertemplate: "%{label}<br>%{value} samples (%{percentRoot:.1%})<extra></extra>",
+        },
+      ],
+      {
+        margin: { t: 10, l: 0, r: 0, b: 0 },
+        paper_bgcolor: "rgba(0,0,0,0)",
+      },
+      { displayModeBar: false, responsive: true },
+    );
+  }
+
   addInteractiveDataFrameTab(dfData) {
     const chartsContainer = document.getElementById("charts-container");
     
@@ -612,28 +711,118 @@ print("Hello from new cell!")
     }
   }
 
-  displayChart(chartData) {
-    const chartsContainer = document.getElementById("charts-container");
+  renderChartFigure(message) {
+    if (typeof Plotly === "undefined") return;
 
-    // Welcome message 제거
-    const welcomeMessage = chartsContainer.querySelector(".welcome-message");
-    if (welcomeMessage) {
-      welcomeMessage.remove();
-    }
+    let chart = this.charts.get(message.chart_id);
+    if (!chart) {
+      const chartsContainer = document.getElementById("charts-container");
+      const welcomeMessage = chartsContainer.querySelector(".welcome-message");
+      if (welcomeMessage) {
+        welcomeMessage.remove();
+      }
 
-    // 새 차트 컨테이너 생성
-    const chartContainer = document.createElement("div");
-    chartContainer.className = "chart-container";
-    chartContainer.innerHTML = `
-            <div class="chart-title">${chartData.title || "차트"}</div>
-            <div class="chart-plot" id="chart-${Date.now()}"></div>
+      const chartContainer = document.createElement("div");
+      chartContainer.className = "chart-container";
+      chartContainer.dataset.chartId = message.chart_id;
+      chartContainer.innerHTML = `
+            <div class="chart-title"></div>
+            <div class="chart-plot"></div>
         `;
+      chartContainer.querySelector(".chart-title").textContent = message.chart_id;
+      chartsContainer.appendChild(chartContainer);
 
-    chartsContainer.appendChild(chartContainer);
+      chart = { container: chartContainer, element: chartContainer.querySelector(".chart-plot") };
+      this.charts.set(message.chart_id, chart);
+    }
 
-    // Plotly 차트 렌더링 (실제 구현은 나중에)
-    const plotElement = chartContainer.querySelector(".chart-plot");
-    plotElement.innerHTML = "<p>차트가 여기에 표시됩니다.</p>";
+    this.pendingCharts.delete(message.chart_id);
+    chart.version = message.version;
+    chart.resyncing = false;
+    Plotly.react(chart.element, message.figure.data, message.figure.layout, { responsive: true });
+  }
+
+  applyChartDelta(delta) {
+    if (typeof Plotly === "undefined") return;
+    const chart = this.charts.get(delta.chart_id);
+    // 처음 보는 차트(페이지를 연 뒤 열린 차트를 놓친 경우)는 전체 피겨부터 요청
+    if (!chart) {
+      if (!this.pendingCharts.has(delta.chart_id)) {
+        this.pendingCharts.add(delta.chart_id);
+        this.socket.emit("chart_resync", { chart_id: delta.chart_id });
+      }
+      return;
+    }
+    if (delta.version <= chart.version) return; // 재동기화 피겨에 이미 포함
+
+    // 버전이 빠졌으면 전체 피겨를 다시 받을 때까지 델타 무시
+    if (delta.version !== chart.version + 1) {
+      if (!chart.resyncing) {
+        chart.resyncing = true;
+        this.socket.emit("chart_resync", { chart_id: delta.chart_id });
+      }
+      return;
+    }
+
+    const element = chart.element;
+    switch (delta.op) {
+      case "extend":
+        Plotly.extendTraces(element, delta.update, delta.traces, delta.max_points || undefined);
+        break;
+      case "replace_last":
+        // 마지막 점만 바꾸는 Plotly API가 없어 배열을 직접 고친 뒤 다시 그림
+        delta.traces.forEach((traceIndex, position) => {
+          const trace = element.data[traceIndex];
+          Object.entries(delta.update).forEach(([path, values]) => {
+            const keys = path.split(".");
+            const array = keys.reduce((node, key) => (node ? node[key] : undefined), trace);
+            if (Array.isArray(array) && array.length > 0) {
+              array[array.length - 1] = values[position];
+            }
+          });
+        });
+        Plotly.redraw(element);
+        break;
+      case "truncate":
+        // 선분 트레이스의 마지막 선분(마감 전 캔들) 제거, 뒤따르는 extend가 새 값으로 다시 추가
+        delta.traces.forEach((traceIndex) => {
+          const trace = element.data[traceIndex];
+          ["x", "y"].forEach((key) => {
+            if (trace[key] && trace[key].length) {
+              trace[key] = Array.from(trace[key]).slice(0, -delta.count);
+            }
+          });
+        });
+        Plotly.redraw(element);
+        break;
+      case "restyle":
+        Plotly.restyle(element, delta.update, delta.traces);
+        break;
+      case "relayout":
+        Plotly.relayout(element, delta.update);
+        break;
+      case "add_traces":
+        Plotly.addTraces(element, delta.traces);
+        break;
+      case "delete_traces":
+        Plotly.deleteTraces(element, delta.traces);
+        break;
+      default:
+        console.warn("Unknown chart delta:", delta.op);
+        return;
+    }
+    chart.version = delta.version;
+  }
+
+  removeChart(chartId) {
+    this.pendingCharts.delete(chartId);
+    const chart = this.charts.get(chartId);
+    if (!chart) return;
+    if (typeof Plotly !== "undefined") {
+      Plotly.purge(chart.element);
+    }
+    chart.container.remove();
+    this.charts.delete(chartId);
   }
 
   addVisualizationTab(outputs, fullText) {
@@ -861,6 +1050,13 @@ print("Hello from new cell!")
   }
 
   clearCharts() {
+    // 서버 세션도 닫아야 이후 델타/재연결 때 다시 나타나지 않음 (스트림 차트는 다음 갱신 때 새로 열림)
+    this.charts.forEach((_, chartId) => {
+      fetch(`/api/charts/${encodeURIComponent(chartId)}`, { method: "DELETE" }).catch((error) =>
+        console.warn("Chart close failed:", chartId, error)
+      );
+      this.removeChart(chartId);
+    });
     const chartsContainer = document.getElementById("charts-container");
     chartsContainer.innerHTML = `
             <div class="welcome-message">
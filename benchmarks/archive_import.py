@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+바이낸스 kline 아카이브 임포트 벤치마크 및 검증
+- data.binance.vision과 같은 형식(헤더 없는 12컬럼 CSV를 담은 zip)의 일별 아카이브를 로컬에서 생성
+- 누락 구간, 겹치는 봉, 헤더 있는 파일, 체크섬 불일치 파일을 섞어 임포트 결과 확인
+- 프로세스 풀 디코딩 시간 측정
+
+사용 예시:
+    python benchmarks/archive_import.py --days 60 --workers 4
+"""
+
+import os
+import sys
+import time
+import json
+import hashlib
+import zipfile
+import argparse
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.archive_import import ArchiveImporter, KLINE_COLUMNS
+
+MINUTE_MS = 60_000
+
+def make_day(day: pd.Timestamp, seed: int) -> pd.DataFrame:
+    """하루치 1분봉 kline 행 (아카이브 CSV 컬럼 순서)"""
+    rng = np.random.default_rng(seed)
+    open_time = int(day.value // 1_000_000) + np.arange(1440, dtype=np.int64) * MINUTE_MS
+    close = 40000 + np.cumsum(rng.normal(0, 5, 1440))
+    return pd.DataFrame({
+        'open_time': open_time,
+        'open': close.round(2),
+        'high': (close + 3).round(2),
+        'low': (close - 3).round(2),
+        'close': close.round(2),
+        'volume': rng.uniform(1, 50, 1440).round(5),
+        'close_time': open_time + MINUTE_MS - 1,
+        'quote_asset_volume': 0.0,
+        'number_of_trades': rng.integers(10, 500, 1440),
+        'taker_buy_base_asset_volume': 0.0,
+        'taker_buy_quote_asset_volume': 0.0,
+        'ignore': 0
+    }, columns=KLINE_COLUMNS)
+
+def write_archive(directory: str, symbol: str, day: pd.Timestamp, rows: pd.DataFrame, header: bool = False) -> str:
+    name = f"{symbol}-1m-{day:%Y-%m-%d}"
+    path = os.path.join(directory, f"{name}.zip")
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(f"{name}.csv", rows.to_csv(index=False, header=header))
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    with open(f"{path}.CHECKSUM", 'w') as f:
+        f.write(f"{digest}  {name}.zip\n")
+    return path
+
+def build_fixture(directory: str, days: int) -> dict:
+    """누락/중복/헤더/체크섬 케이스가 섞인 일별 아카이브 생성, 기대값 반환"""
+    start = pd.Timestamp('2024-01-01')
+    expected = {'rows': 0, 'missing_rows': 0, 'gaps': 0, 'duplicates': 0}
+    for i in range(days):
+        day = start + pd.Timedelta(days=i)
+        rows = make_day(day, seed=i)
+        if i == 3:
+            rows = rows.drop(index=range(100, 130))  # 30분 누락
+            expected['missing_rows'] += 30
+            expected['gaps'] += 1
+        if i == 5:
+            # 전날 마지막 10분이 다시 들어있는 파일 (겹침)
+            previous = make_day(day - pd.Timedelta(days=1), seed=i - 1).iloc[-10:]
+            rows = pd.concat([previous, rows])
+            expected['duplicates'] += len(previous)
+        expected['rows'] += 1440 - (30 if i == 3 else 0)
+        write_archive(directory, 'BTCUSDT', day, rows, header=(i % 7 == 6))
+
+    # 내용이 손상된 아카이브 (체크섬 불일치 → 제외)
+    broken_day = start + pd.Timedelta(days=days)
+    path = write_archive(directory, 'BTCUSDT', broken_day, make_day(broken_day, seed=999))
+    with open(f"{path}.CHECKSUM", 'w') as f:
+        f.write('0' * 64 + '\n')
+
+    expected['broken'] = os.path.basename(path)
+    return expected
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='kline 아카이브 임포트 벤치마크')
+    parser.add_argument('--days', type=int, default=30, help='생성할 일별 아카이브 수')
+    parser.add_argument('--workers', type=int, default=None, help='디코딩 프로세스 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archives = os.path.join(tmp, 'archives')
+        os.makedirs(archives)
+        expected = build_fixture(archives, args.days)
+
+        # 저장 경로(local_data/...)가 임시 디렉토리 아래에 생기도록 이동
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            started = time.perf_counter()
+            ArchiveImporter(max_workers=args.workers).import_archives(archives, save_file=False)
+            elapsed = time.perf_counter() - started
+
+            serial_started = time.perf_counter()
+            ArchiveImporter(max_workers=1).import_archives(archives, save_file=False)
+            serial_elapsed = time.perf_counter() - serial_started
+
+            result = ArchiveImporter(max_workers=args.workers).import_archives(archives)['BTCUSDT_1m']
+
+            stored = pd.read_csv(result['file_path'], index_col=0, parse_dates=True)
+        finally:
+            os.chdir(cwd)
+
+    continuity = result['continuity']
+    checks = {
+        'rows': continuity['rows'] == expected['rows'],
+        'missing_rows': continuity['missing_rows'] == expected['missing_rows'] and len(continuity['gaps']) == expected['gaps'],
+        'duplicates': result['duplicates'] == expected['duplicates'],
+        'checksum': result['checksum_failures'] == [expected['broken']],
+        'stored': len(stored) == expected['rows'] and list(stored.columns[:5]) == ['open', 'high', 'low', 'close', 'volume']
+    }
+    report = {
+        'archives': args.days,
+        'rows': continuity['rows'],
+        'seconds': round(elapsed, 3),
+        'serial_seconds': round(serial_elapsed, 3),
+        'rows_per_second': int(continuity['rows'] / elapsed) if elapsed > 0 else 0,
+        'checks': checks
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"📦 아카이브 {args.days}개 → {continuity['rows']:,}행: 병렬 {elapsed:.2f}s / 단일 프로세스 {serial_elapsed:.2f}s")
+        for name, ok in checks.items():
+            print(f"   {'✅' if ok else '❌'} {name}")
+
+    return 0 if all(checks.values()) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+연산 백엔드 동등성 검사 + 벤치마크
+- 같은 입력(결측 포함)으로 pandas와 다른 백엔드의 TechnicalIndicators, 상관계수 결과가
+  같은지 확인
+- 백엔드별 실행 시간 비교
+
+사용 예시:
+    python benchmarks/backend_parity.py --rows 1000000
+    python benchmarks/backend_parity.py --backend polars --json
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services import compute_backend
+from services.technical_indicators import TechnicalIndicators
+
+# 컬럼 크기 대비 허용 오차 (pandas rolling std는 구간 전체를 누적 갱신해 1e-8 수준의 부동소수점 차이가 남)
+TOLERANCE = 1e-6
+
+def make_ohlcv(rows: int, seed: int = 3, missing: float = 0.001) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2021-01-01', periods=rows, freq='min', name='timestamp')
+    close = 30000 + np.cumsum(rng.normal(0, 5, rows))
+    spread = rng.random(rows) * 10
+    data = pd.DataFrame({
+        'open': close + rng.normal(0, 1, rows),
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': rng.random(rows) * 100
+    }, index=index)
+    # 결측 처리(롤링 min_periods, EWM 결측 위치)도 같은지 확인
+    holes = rng.random(rows) < missing
+    data.loc[holes, ['high', 'low', 'close']] = np.nan
+    return data
+
+def cases(data: pd.DataFrame):
+    ti = TechnicalIndicators
+    close, high, low = data['close'], data['high'], data['low']
+    returns = data[['open', 'high', 'low', 'close', 'volume']].pct_change().iloc[1:].fillna(0)
+    return {
+        'sma': lambda: ti.calculate_sma(close, 20),
+        'ema': lambda: ti.calculate_ema(close, 20),
+        'macd': lambda: ti.calculate_macd(close),
+        'rsi': lambda: ti.calculate_rsi(close),
+        'bollinger_bands': lambda: ti.calculate_bollinger_bands(close),
+        'stochastic': lambda: ti.calculate_stochastic(high, low, close),
+        'atr': lambda: ti.calculate_atr(high, low, close),
+        'williams_r': lambda: ti.calculate_williams_r(high, low, close),
+        'corr': lambda: compute_backend.get_backend().corr(returns),
+        'corr_missing': lambda: compute_backend.get_backend().corr(data.pct_change())
+    }
+
+def compare(expected, actual) -> dict:
+    expected = expected.to_frame() if isinstance(expected, pd.Series) else expected
+    actual = actual.to_frame() if isinstance(actual, pd.Series) else actual
+    if expected.shape != actual.shape or not expected.index.equals(actual.index) or list(expected.columns) != list(actual.columns):
+        return {'match': False, 'reason': f"shape/index/columns 불일치 {expected.shape} vs {actual.shape}"}
+
+    left, right = expected.to_numpy(dtype=float), actual.to_numpy(dtype=float)
+    if not (np.isnan(left) == np.isnan(right)).all():
+        return {'match': False, 'reason': '결측 위치 불일치'}
+    scale = np.nanmax(np.abs(left), axis=0) if np.isfinite(left).any() else 1
+    error = float(np.nanmax(np.abs(left - right) / np.where(scale > 0, scale, 1), initial=0))
+    return {'match': error <= TOLERANCE, 'error': error}
+
+def timed(func, repeat: int):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='연산 백엔드 동등성 검사')
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--backend', default=None, help='비교할 백엔드 (생략 시 설치된 전체)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('services').setLevel(logging.WARNING)
+    available = compute_backend.available_backends()
+    targets = [args.backend] if args.backend else [name for name, ok in available.items() if ok and name != 'pandas']
+
+    data = make_ohlcv(args.rows)
+
+    compute_backend.set_backend('pandas')
+    baseline = {name: timed(func, args.repeat) for name, func in cases(data).items()}
+
+    report = {'rows': args.rows, 'available': available, 'results': {}}
+    for backend in targets:
+        if not available.get(backend):
+            report['results'][backend] = {'skipped': f'{backend} 패키지 없음'}
+            continue
+        compute_backend.set_backend(backend)
+        results = {}
+        for name, func in cases(data).items():
+            actual, seconds = timed(func, args.repeat)
+            expected, base_seconds = baseline[name]
+            results[name] = {
+                **compare(expected, actual),
+                'pandas_ms': round(base_seconds * 1000, 2),
+                'backend_ms': round(seconds * 1000, 2)
+            }
+        report['results'][backend] = results
+    compute_backend.set_backend('pandas')
+
+    ok = all(
+        r.get('match', True) for results in report['results'].values() if 'skipped' not in results
+        for r in results.values()
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"🧮 연산 백엔드 비교 ({args.rows:,}행, 최소 {args.repeat}회)")
+        for backend, results in report['results'].items():
+            if 'skipped' in results:
+                print(f"   ⏭️  {backend}: {results['skipped']}")
+                continue
+            print(f"   {'case':>16} {'pandas ms':>10} {backend + ' ms':>10}  오차")
+            for name, r in results.items():
+                mark = '✅' if r['match'] else '❌'
+                detail = f"{r['error']:.1e}" if 'error' in r else r['reason']
+                print(f"   {name:>16} {r['pandas_ms']:>10.2f} {r['backend_ms']:>10.2f}  {mark} {detail}")
+        if not targets:
+            print("   ⏭️  pandas 외에 설치된 백엔드가 없습니다 (pip install polars)")
+
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+백테스트 엔진 벤치마크 및 교차 검증
+- 벡터화 엔진을 대용량(기본 10M 바) 합성 데이터로 실행해 처리 시간 측정
+- 작은 구간에서 바 단위 이벤트 루프 참조 구현과 결과가 일치하는지 확인
+- 종가 중간/앞쪽 NaN이 있어도 직전 종가로 채운 결과와 같은지(자본 곡선이 NaN으로 번지지 않는지) 확인
+
+사용 예시:
+    python benchmarks/backtest.py --bars 10000000 --check-bars 200000
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.backtest import BacktestEngine
+
+def make_inputs(bars: int, seed: int = 7):
+    """합성 종가와 진입/청산 시그널 생성"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, bars)))
+    entries = rng.random(bars) < 0.01
+    exits = rng.random(bars) < 0.01
+    return close, entries, exits
+
+def reference_backtest(close, entries, exits, fee_rate, slippage, initial_capital, allow_short=False):
+    """바 단위 이벤트 루프 참조 구현 (엔진과 같은 체결 모델)"""
+    n = len(close)
+    equity = np.empty(n)
+    positions = np.empty(n)
+    fees = np.empty(n)
+
+    capital = initial_capital
+    position = 0.0
+    for t in range(n):
+        # 직전 바 포지션으로 이번 바 수익 반영
+        if t > 0:
+            capital *= 1.0 + position * (close[t] / close[t - 1] - 1.0)
+
+        target = position
+        if entries[t] and not exits[t]:
+            target = 1.0
+        elif exits[t] and not entries[t]:
+            target = -1.0 if allow_short else 0.0
+
+        change = abs(target - position)
+        fees[t] = capital * change * fee_rate
+        capital -= capital * change * (fee_rate + slippage)
+        position = target
+
+        positions[t] = position
+        equity[t] = capital
+
+    return {'equity': equity, 'position': positions, 'fees': fees}
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='백테스트 엔진 벤치마크')
+    parser.add_argument('--bars', type=int, default=10_000_000)
+    parser.add_argument('--check-bars', type=int, default=200_000, help='참조 구현 교차 검증 바 수')
+    parser.add_argument('--fee-rate', type=float, default=0.001)
+    parser.add_argument('--slippage', type=float, default=0.0005)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    engine = BacktestEngine(fee_rate=args.fee_rate, slippage=args.slippage)
+
+    # 1. 교차 검증 (롱 전용 / 숏 허용)
+    close, entries, exits = make_inputs(args.check_bars)
+    mismatches = []
+    for allow_short in (False, True):
+        positions = engine.signals_to_positions(entries, exits, allow_short)
+        vectorised = engine.run(close, positions)
+        reference = reference_backtest(
+            close, entries, exits, args.fee_rate, args.slippage, engine.initial_capital, allow_short
+        )
+        for key in ('equity', 'position', 'fees'):
+            if not np.allclose(vectorised[key], reference[key], rtol=1e-9, atol=1e-9):
+                mismatches.append(f"{key} (allow_short={allow_short})")
+
+    # 2. 결측 종가 (앞쪽 NaN + 중간 NaN, 참조 구현에는 직전 종가로 채운 값을 전달)
+    gappy = close.copy()
+    gappy[:3] = np.nan
+    gappy[len(gappy) // 4::len(gappy) // 10] = np.nan
+    filled = BacktestEngine.forward_fill(gappy, fill_value=np.nan)
+    filled[:3] = filled[3]
+    positions = engine.signals_to_positions(entries, exits)
+    vectorised = engine.run(gappy, positions)
+    reference = reference_backtest(
+        filled, entries, exits, args.fee_rate, args.slippage, engine.initial_capital
+    )
+    stats = engine.compute_stats(vectorised)
+    if not np.allclose(vectorised['equity'], reference['equity'], rtol=1e-9, atol=1e-9):
+        mismatches.append('equity (NaN close)')
+    if not all(np.isfinite(stats[key]) for key in ('total_return', 'max_drawdown', 'final_equity', 'total_fees')):
+        mismatches.append('stats (NaN close)')
+
+    # 3. 대용량 처리 시간
+    close, entries, exits = make_inputs(args.bars)
+    started = time.perf_counter()
+    positions = engine.signals_to_positions(entries, exits)
+    result = engine.run(close, positions)
+    stats = engine.compute_stats(result, periods_per_year=365 * 24 * 60)
+    elapsed = time.perf_counter() - started
+
+    report = {
+        'bars': args.bars,
+        'seconds': round(elapsed, 3),
+        'bars_per_second': int(args.bars / elapsed) if elapsed > 0 else 0,
+        'num_trades': stats['num_trades'],
+        'check_bars': args.check_bars,
+        'reference_match': not mismatches,
+        'mismatches': mismatches
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"📊 벡터화 백테스트: {args.bars:,}개 바 {elapsed:.3f}s "
+              f"({report['bars_per_second']:,} bars/s, {stats['num_trades']:,}회 체결)")
+        if mismatches:
+            print(f"❌ 참조 구현과 불일치: {', '.join(mismatches)}")
+        else:
+            print(f"✅ 참조 이벤트 루프와 일치 ({args.check_bars:,}개 바)")
+
+    return 1 if mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+체결 → 사용자 정의 바 집계 벤치마크
+- 바이낸스 aggTrades 아카이브 형식(zip CSV)의 합성 파일을 만들어 청크 단위로 집계
+- 청크 크기와 관계없이 결과가 같은지 확인 (청크 경계 상태 이월 검증)
+- 처리 속도와 청크 처리 중 파이썬 메모리 최대 사용량 측정
+
+사용 예시:
+    python benchmarks/bar_aggregation.py --trades 5000000 --chunksize 500000
+"""
+
+import os
+import sys
+import time
+import json
+import zipfile
+import argparse
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.bar_aggregation import build_bars, AGG_TRADE_COLUMNS
+
+def write_agg_trades_zip(path: str, trades: int, seed: int = 3):
+    """합성 aggTrades 아카이브 생성 (헤더 없는 CSV 1개를 담은 zip)"""
+    rng = np.random.default_rng(seed)
+    price = 30000 + np.cumsum(rng.normal(0, 2.0, trades))
+    frame = pd.DataFrame({
+        'agg_trade_id': np.arange(trades),
+        'price': price.round(2),
+        'quantity': rng.exponential(0.05, trades).round(5),
+        'first_trade_id': np.arange(trades),
+        'last_trade_id': np.arange(trades),
+        'transact_time': 1_704_067_200_000 + np.cumsum(rng.integers(0, 20, trades)),
+        'is_buyer_maker': rng.random(trades) < 0.5,
+        'is_best_match': True
+    }, columns=AGG_TRADE_COLUMNS)
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(os.path.basename(path).replace('.zip', '.csv'), frame.to_csv(index=False, header=False))
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='체결 바 집계 벤치마크')
+    parser.add_argument('--trades', type=int, default=2_000_000)
+    parser.add_argument('--chunksize', type=int, default=250_000)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    thresholds = {'tick': 1000, 'volume': 50.0, 'dollar': 1_500_000.0, 'renko': 25.0}
+    report = {'trades': args.trades, 'chunksize': args.chunksize, 'bars': {}}
+    mismatches = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'BTCUSDT-aggTrades-2024-01.zip')
+        write_agg_trades_zip(path, args.trades)
+        report['file_mb'] = round(os.path.getsize(path) / 1024 ** 2, 1)
+
+        for bar_type, threshold in thresholds.items():
+            tracemalloc.start()
+            started = time.perf_counter()
+            bars = build_bars(path, bar_type, threshold, chunksize=args.chunksize)
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            # 청크 크기를 바꿔도 같은 바가 나와야 함
+            other = build_bars(path, bar_type, threshold, chunksize=args.chunksize // 3 + 1)
+            if not (bars.index.equals(other.index) and np.allclose(bars.to_numpy(dtype=float), other.to_numpy(dtype=float))):
+                mismatches.append(bar_type)
+
+            report['bars'][bar_type] = {
+                'bars': len(bars),
+                'seconds': round(elapsed, 3),
+                'trades_per_second': int(args.trades / elapsed) if elapsed > 0 else 0,
+                'peak_mb': round(peak / 1024 ** 2, 1)
+            }
+
+    report['chunk_invariant'] = not mismatches
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"🧱 aggTrades {args.trades:,}건 ({report['file_mb']}MB zip), 청크 {args.chunksize:,}건")
+        for bar_type, row in report['bars'].items():
+            print(f"   {bar_type:>6}: {row['bars']:>8,}개 바  {row['seconds']:.2f}s  "
+                  f"({row['trades_per_second']:,} trades/s, 최대 {row['peak_mb']}MB)")
+        if mismatches:
+            print(f"❌ 청크 크기에 따라 결과가 다름: {', '.join(mismatches)}")
+        else:
+            print("✅ 청크 크기와 무관하게 같은 바 생성")
+
+    return 1 if mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+CandleRing 메모리/추가 속도 벤치마크
+- 심볼 수 × 캔들 수 규모에서 CandleRing과 심볼별 DataFrame(get_ohlcv_dataframe 형식)의 메모리 비교
+- 캔들 1개 추가 시간 비교 (CandleRing.append vs DataFrame 행 추가)
+- 순환 후에도 시간순 뷰가 마지막 capacity개 캔들과 일치하는지 확인
+
+사용 예시:
+    python benchmarks/candle_ring.py --symbols 500 --candles 10000
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.candle_ring import CandleRing, CANDLE_COLUMNS
+
+def make_ohlcv(rows: int, symbol: str = 'BTCUSDT', interval: str = '1m', seed: int = 42) -> pd.DataFrame:
+    """get_ohlcv_dataframe과 같은 형식의 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    index = pd.date_range('2025-01-01', periods=rows, freq='1min', name='timestamp')
+    df = pd.DataFrame({
+        'open': close,
+        'high': close * 1.001,
+        'low': close * 0.999,
+        'close': close,
+        'volume': rng.uniform(1, 100, rows)
+    }, index=index)
+    df['symbol'] = symbol
+    df['interval'] = interval
+    return df
+
+def time_appends(appends: int, capacity: int, rows: pd.DataFrame) -> dict:
+    """캔들 1개씩 추가하는 시간 (마이크로초/회)"""
+    values = rows[CANDLE_COLUMNS].to_numpy()
+    stamps = rows.index.as_unit('ms').asi8
+
+    ring = CandleRing(capacity)
+    started = time.perf_counter()
+    for i in range(appends):
+        ring.append(int(stamps[i]), *values[i])
+    ring_us = (time.perf_counter() - started) / appends * 1e6
+
+    # DataFrame 방식: 행 추가 후 최근 capacity개 유지 (매번 전체 복사)
+    frame = rows.iloc[:0]
+    frame_appends = min(appends, 2000)
+    started = time.perf_counter()
+    for i in range(frame_appends):
+        frame = pd.concat([frame, rows.iloc[i:i + 1]]).iloc[-capacity:]
+    frame_us = (time.perf_counter() - started) / frame_appends * 1e6
+
+    return {'ring_append_us': round(ring_us, 2), 'dataframe_append_us': round(frame_us, 2)}
+
+def check_views(capacity: int, rows: pd.DataFrame) -> bool:
+    """여러 번 순환한 뒤 뷰가 원본의 마지막 capacity개와 일치하는지 확인"""
+    ring = CandleRing(capacity)
+    values = rows[CANDLE_COLUMNS].to_numpy()
+    stamps = rows.index.as_unit('ms').asi8
+    half = len(rows) // 2
+
+    for i in range(half):
+        ring.append(int(stamps[i]), *values[i])
+    ring.extend(rows.iloc[half:])
+
+    expected = rows[CANDLE_COLUMNS].iloc[-capacity:]
+    view = ring.to_dataframe()
+    return (
+        np.shares_memory(view.to_numpy(), ring._values)
+        and view.index.equals(expected.index)
+        and np.array_equal(view.to_numpy(), expected.to_numpy())
+    )
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='CandleRing 벤치마크')
+    parser.add_argument('--symbols', type=int, default=500)
+    parser.add_argument('--candles', type=int, default=10_000, help='심볼당 보관 캔들 수')
+    parser.add_argument('--appends', type=int, default=50_000)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    sample = make_ohlcv(args.candles)
+    frame_bytes = int(sample.memory_usage(deep=True).sum())
+    ring = CandleRing.from_dataframe(sample, args.candles)
+
+    report = {
+        'symbols': args.symbols,
+        'candles': args.candles,
+        'ring_mb': round(CandleRing.estimate_nbytes(args.candles, args.symbols) / 1024 ** 2, 1),
+        'ring_mb_measured_per_symbol': round(ring.nbytes / 1024 ** 2, 3),
+        'dataframe_mb': round(frame_bytes * args.symbols / 1024 ** 2, 1),
+        **time_appends(args.appends, args.candles, make_ohlcv(args.appends)),
+        'views_match': check_views(1000, make_ohlcv(7_777))
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"📦 메모리 ({args.symbols}개 심볼 × {args.candles:,}개 캔들)")
+        print(f"   CandleRing: {report['ring_mb']}MB (심볼당 {report['ring_mb_measured_per_symbol']}MB)")
+        print(f"   DataFrame:  {report['dataframe_mb']}MB")
+        print(f"⏱️ 캔들 1개 추가: CandleRing {report['ring_append_us']}µs / "
+              f"DataFrame {report['dataframe_append_us']}µs")
+        print(f"{'✅' if report['views_match'] else '❌'} 순환 후 시간순 뷰 일치 (복사 없음)")
+
+    return 0 if report['views_match'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+차트 델타 전송량 벤치마크
+- 실시간 캔들 차트에서 틱마다 피겨 전체를 다시 보내는 방식과 ChartSessionManager 델타 방식의
+  전송 바이트/직렬화 시간 비교 (마감 전 캔들 갱신 + 마감 후 새 캔들 + 지표 오버레이)
+- 피겨와 델타는 VisualizationService로 만들며, 캔들 수별로 실행
+  (--candlestick-max-points를 넘으면 WebGL 캔들 표현, 작게 주면 적은 캔들로 WebGL 경로 검증)
+- 모든 델타를 적용한 서버 상태가 마지막 데이터로 새로 만든 피겨와 같은지 확인
+
+사용 예시:
+    python benchmarks/chart_delta.py --history 2000,6000 --ticks 200 --candlestick-max-points 5000
+    python benchmarks/chart_delta.py --history 1000 --ticks 500 --ticks-per-candle 5 --json
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.chart_session import ChartSession, ChartSessionManager, to_plotly_values, _x_key
+from services.visualization import CANDLESTICK_MAX_POINTS, VisualizationService
+
+def make_ticks(history: int, ticks: int, ticks_per_candle: int, seed: int = 9):
+    """과거 캔들 + 틱별 (진행 중 캔들 시각, 현재가) 목록"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2024-01-01', periods=history, freq='min', name='timestamp')
+    close = 30000 + np.cumsum(rng.normal(0, 5, history))
+    data = pd.DataFrame({
+        'open': close + rng.normal(0, 2, history), 'high': close + 5, 'low': close - 5,
+        'close': close, 'volume': rng.random(history) * 10
+    }, index=index)
+    prices = close[-1] + np.cumsum(rng.normal(0, 1, ticks))
+    times = index[-1] + pd.to_timedelta(np.arange(ticks) // ticks_per_candle + 1, unit='min')
+    return data, list(zip(times, prices))
+
+def candle_figure(viz: VisualizationService, data: pd.DataFrame) -> dict:
+    """가격 + 거래량 + SMA 오버레이 피겨 (open_chart + update_chart(overlays=...)와 같은 구성)"""
+    figure = viz.create_candlestick_chart(data)
+    sma = data['close'].rolling(20).mean()
+    figure['data'].append(viz.overlay_trace(sma, 'sma20'))
+    return figure
+
+def candle_rows(data: pd.DataFrame) -> dict:
+    """update_chart가 보내는 candles 연산 인자"""
+    return {'x': to_plotly_values(data.index), **{c: to_plotly_values(data[c]) for c in data.columns}}
+
+def apply_tick(data: pd.DataFrame, timestamp, price: float) -> pd.DataFrame:
+    """틱을 진행 중 캔들에 반영 (새 시각이면 캔들 추가)"""
+    if timestamp in data.index:
+        row = data.loc[timestamp]
+        data.loc[timestamp, ['high', 'low', 'close', 'volume']] = [
+            max(row['high'], price), min(row['low'], price), price, row['volume'] + 0.1
+        ]
+    else:
+        data.loc[timestamp] = [data['close'].iloc[-1], price, price, price, 0.1]
+    return data
+
+def same_trace(expected: dict, actual: dict) -> bool:
+    """트레이스 배열 값 비교 (x는 시각 형식 무관, 값은 부동소수점 오차 허용)"""
+    if expected.get('name') != actual.get('name'):
+        return False
+    for key in ('x', 'open', 'high', 'low', 'close', 'y'):
+        if key not in expected:
+            continue
+        left, right = expected[key], actual.get(key) or []
+        if key == 'x':
+            left, right = [_x_key(v) for v in left], [_x_key(v) for v in right]
+        left = np.array([np.nan if v is None else v for v in left], dtype=float)
+        right = np.array([np.nan if v is None else v for v in right], dtype=float)
+        if left.shape != right.shape or not np.allclose(left, right, equal_nan=True):
+            return False
+    return (expected.get('marker') or {}).get('color') == (actual.get('marker') or {}).get('color')
+
+def run_case(viz: VisualizationService, history: int, ticks: int, ticks_per_candle: int) -> dict:
+    data, updates = make_ticks(history, ticks, ticks_per_candle)
+
+    sent = {'full': 0, 'delta': 0}
+    messages = {'full': 0, 'delta': 0}
+    seconds = {'full': 0.0, 'delta': 0.0}
+
+    def emit(event, message):
+        sent['delta'] += len(json.dumps(message))
+        messages['delta'] += 1
+
+    sessions = ChartSessionManager(emit=emit, candle_points=viz.candle_points)
+    sessions.open('live', candle_figure(viz, data))
+    mode = sessions.get('live').candle_options['candle_mode']
+    sent['delta'] = messages['delta'] = 0  # 처음 피겨는 두 방식 모두 같음
+
+    for timestamp, price in updates:
+        data = apply_tick(data, timestamp, price)
+        sma = data['close'].iloc[-20:].rolling(20).mean()
+
+        # 기존 방식: 피겨 전체를 다시 만들어 전송
+        started = time.perf_counter()
+        sent['full'] += len(json.dumps(candle_figure(viz, data)))
+        messages['full'] += 1
+        seconds['full'] += time.perf_counter() - started
+
+        # 델타 방식: 마지막 캔들(차트 표현에 맞춰 서버가 변환)과 지표 마지막 값만 병합
+        started = time.perf_counter()
+        sessions.apply('live', 'candles', candles=candle_rows(data.iloc[-1:]))
+        sessions.apply('live', 'overlay', trace={'name': 'sma20', 'x': to_plotly_values(sma.index[-1:]),
+                                                 'y': to_plotly_values(sma.iloc[-1:])})
+        seconds['delta'] += time.perf_counter() - started
+
+    expected = ChartSession('expected', candle_figure(viz, data)).figure
+    actual = sessions.snapshot('live')['figure']
+    match = len(expected['data']) == len(actual['data']) and all(
+        same_trace(e, a) for e, a in zip(expected['data'], actual['data'])
+    )
+
+    return {
+        'history': history,
+        'ticks': ticks,
+        'candle_mode': mode,
+        'full_bytes': sent['full'],
+        'delta_bytes': sent['delta'],
+        'ratio': round(sent['full'] / max(sent['delta'], 1), 1),
+        'full_ms': round(seconds['full'] * 1000, 1),
+        'delta_ms': round(seconds['delta'] * 1000, 1),
+        'delta_messages': messages['delta'],
+        'version': sessions.get('live').version,
+        'match': bool(match)
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='차트 델타 전송량 벤치마크')
+    parser.add_argument('--history', default='2000,6000', help='처음 표시할 캔들 수 목록 (쉼표 구분)')
+    parser.add_argument('--ticks', type=int, default=200, help='갱신 횟수')
+    parser.add_argument('--ticks-per-candle', type=int, default=10, help='캔들 하나가 마감될 때까지 갱신 수')
+    parser.add_argument('--candlestick-max-points', type=int, default=CANDLESTICK_MAX_POINTS,
+                        help='이 캔들 수를 넘으면 WebGL 캔들 표현')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('services').setLevel(logging.WARNING)
+    viz = VisualizationService(candlestick_max_points=args.candlestick_max_points)
+    report = {'results': [
+        run_case(viz, int(history), args.ticks, args.ticks_per_candle) for history in args.history.split(',')
+    ]}
+    ok = all(r['match'] for r in report['results'])
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"📡 차트 델타 ({args.ticks:,}회 갱신, 캔들당 {args.ticks_per_candle}회)")
+        print(f"   {'캔들':>7} {'표현':>12} {'전체 bytes':>13} {'델타 bytes':>11} {'배':>7} "
+              f"{'전체 ms':>9} {'델타 ms':>9}  일치")
+        for r in report['results']:
+            print(f"   {r['history']:>7,} {r['candle_mode']:>12} {r['full_bytes']:>13,} {r['delta_bytes']:>11,} "
+                  f"{r['ratio']:>7} {r['full_ms']:>9.1f} {r['delta_ms']:>9.1f}  {'✅' if r['match'] else '❌'}")
+
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
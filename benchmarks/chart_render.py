@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+대용량 차트 렌더링 벤치마크
+- 점 수별(10k ~ 1M)로 VisualizationService 피겨 생성 시간과 전송 크기(JSON bytes) 기록
+- 기존 방식(항상 SVG Scatter/Candlestick/Bar, 점별 거래량 색상)과 자동 선택
+  (Scattergl, 대용량 캔들은 종가 선, 점별 색상 제거) 비교
+- 선택된 트레이스 종류도 함께 출력
+
+사용 예시:
+    python benchmarks/chart_render.py
+    python benchmarks/chart_render.py --points 10k,100k,1m --json
+    python benchmarks/chart_render.py --points 1m --skip-baseline
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.visualization import VisualizationService
+
+def parse_rows(value: str) -> int:
+    value = value.strip().lower()
+    for suffix, factor in (('k', 1_000), ('m', 1_000_000)):
+        if value.endswith(suffix):
+            return int(float(value[:-1]) * factor)
+    return int(value)
+
+def make_ohlcv(rows: int, seed: int = 17) -> pd.DataFrame:
+    """1분봉 OHLCV"""
+    rng = np.random.default_rng(seed)
+    close = 30000 + np.cumsum(rng.normal(0, 5, rows))
+    open_ = close + rng.normal(0, 3, rows)
+    spread = rng.random(rows) * 10
+    index = pd.date_range('2020-01-01', periods=rows, freq='min', name='timestamp')
+    return pd.DataFrame({
+        'open': open_, 'high': np.maximum(open_, close) + spread, 'low': np.minimum(open_, close) - spread,
+        'close': close, 'volume': rng.random(rows) * 100
+    }, index=index)
+
+def measure(func, repeat: int) -> tuple:
+    best, figure = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        figure = func()
+        best = min(best, time.perf_counter() - started)
+    return figure, best
+
+def trace_types(figure: dict) -> str:
+    names = []
+    for trace in figure['data']:
+        if trace.get('type') not in names:
+            names.append(trace.get('type'))
+    return '+'.join(names)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='대용량 차트 렌더링 벤치마크')
+    parser.add_argument('--points', default='10k,100k,1m', help='점 수 목록 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--skip-baseline', action='store_true', help='기존(SVG) 방식 측정 생략 (1M은 수십 초 이상)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('services').setLevel(logging.WARNING)
+    never = sys.maxsize
+    services = {
+        'auto': VisualizationService(),
+        # 기존 동작: 점 수와 관계없이 SVG 트레이스, 점별 거래량 색상
+        'svg': VisualizationService(webgl_threshold=never, candlestick_max_points=never, webgl_candle_max_points=never)
+    }
+    if args.skip_baseline:
+        services.pop('svg')
+
+    # plotly 검증기/템플릿 로딩을 측정에서 제외
+    warmup = make_ohlcv(100)
+    for viz in services.values():
+        viz.create_candlestick_chart(warmup)
+        viz.create_line_chart(warmup, ['close'])
+
+    report = {'results': []}
+    for rows in (parse_rows(p) for p in args.points.split(',')):
+        data = make_ohlcv(rows)
+        indicators = {'SMA': data[['close']].rolling(20).mean().rename(columns={'close': 'sma20'})}
+        charts = {
+            'candlestick': lambda viz: viz.create_candlestick_chart(data),
+            'line': lambda viz: viz.create_line_chart(data, ['close', 'open']),
+            'technical': lambda viz: viz.create_technical_analysis_chart(data, indicators)
+        }
+        for chart, build in charts.items():
+            for name, viz in services.items():
+                figure, seconds = measure(lambda: build(viz), args.repeat)
+                report['results'].append({
+                    'points': rows,
+                    'chart': chart,
+                    'mode': name,
+                    'traces': trace_types(figure),
+                    'build_ms': round(seconds * 1000, 1),
+                    'payload_mb': round(len(json.dumps(figure)) / 1e6, 2)
+                })
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print("🖼️  대용량 차트 렌더링 (피겨 생성 + JSON 크기)")
+        print(f"   {'points':>9} {'chart':>12} {'mode':>5} {'build ms':>10} {'MB':>8}  traces")
+        for r in report['results']:
+            print(f"   {r['points']:>9,} {r['chart']:>12} {r['mode']:>5} {r['build_ms']:>10.1f} "
+                  f"{r['payload_mb']:>8.2f}  {r['traces']}")
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+상관계수 서비스 동등성 검사 + 벤치마크
+- 심볼 유니버스(공통 요인 + 결측)의 로그 수익률로 correlation 서비스와 pandas 결과 비교
+  (전체 Pearson/Spearman 행렬, 쌍별 롤링 Pearson, 타일 단위 top_pairs)
+- 방식별 실행 시간 비교
+
+사용 예시:
+    python benchmarks/correlation.py --symbols 300 --rows 20000
+    python benchmarks/correlation.py --symbols 50 --rows 5000 --window 240 --json
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services import correlation
+
+TOLERANCE = 1e-9
+
+def make_prices(symbols: int, rows: int, missing: float = 0.002, seed: int = 5) -> pd.DataFrame:
+    """시장 요인 + 섹터 요인으로 상관 구조가 있는 종가 패널 (상장 전 구간 결측 포함)"""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.004, rows)
+    sectors = rng.normal(0, 0.003, (rows, 8))
+    sector_of = rng.integers(0, 8, symbols)
+    returns = (
+        market[:, None] * rng.uniform(0.5, 1.5, symbols)
+        + sectors[:, sector_of]
+        + rng.normal(0, 0.006, (rows, symbols))
+    )
+    prices = 100 * np.exp(np.cumsum(returns, axis=0))
+    prices[rng.random((rows, symbols)) < missing] = np.nan
+    late = rng.random(symbols) < 0.1
+    prices[: rows // 4, late] = np.nan
+    index = pd.date_range('2022-01-01', periods=rows, freq='h', name='timestamp')
+    return pd.DataFrame(prices, index=index, columns=[f"SYM{i:03d}USDT" for i in range(symbols)])
+
+def max_error(expected: pd.DataFrame, actual: pd.DataFrame) -> dict:
+    left, right = expected.to_numpy(dtype=float), actual.to_numpy(dtype=float)
+    if left.shape != right.shape:
+        return {'match': False, 'reason': f"shape 불일치 {left.shape} vs {right.shape}"}
+    if not (np.isnan(left) == np.isnan(right)).all():
+        return {'match': False, 'reason': '결측 위치 불일치'}
+    error = float(np.nanmax(np.abs(left - right), initial=0))
+    return {'match': error <= TOLERANCE, 'error': error}
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='상관계수 서비스 동등성 검사')
+    parser.add_argument('--symbols', type=int, default=100)
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--window', type=int, default=168, help='롤링 윈도우 (행 수)')
+    parser.add_argument('--rolling-symbols', type=int, default=20, help='롤링 비교에 쓸 심볼 수 (모든 쌍)')
+    parser.add_argument('--block-size', type=int, default=correlation.DEFAULT_BLOCK_SIZE)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('services').setLevel(logging.WARNING)
+    returns = correlation.log_returns(make_prices(args.symbols, args.rows))
+    complete = returns.dropna()
+    subset = returns.iloc[:, :args.rolling_symbols]
+
+    cases = {
+        'pearson': (
+            lambda: returns.corr(),
+            lambda: correlation.correlation_matrix(returns, block_size=args.block_size)
+        ),
+        # pandas는 결측이 있으면 쌍마다 다시 순위를 매기므로 결측 없는 행으로 비교
+        'spearman': (
+            lambda: complete.corr('spearman'),
+            lambda: correlation.correlation_matrix(complete, 'spearman', block_size=args.block_size)
+        ),
+        'rolling_pearson': (
+            lambda: subset.rolling(args.window).corr().unstack().T,
+            lambda: correlation.rolling_correlation(subset, args.window, block_size=args.block_size)
+        )
+    }
+
+    report = {'symbols': args.symbols, 'rows': len(returns), 'window': args.window, 'results': {}}
+    for name, (baseline, candidate) in cases.items():
+        expected, base_seconds = timed(baseline)
+        actual, seconds = timed(candidate)
+        if name == 'rolling_pearson':
+            # pandas 결과(심볼×심볼 MultiIndex)에서 같은 쌍만 골라 비교
+            expected = pd.DataFrame(
+                {pair: expected.loc[pair] for pair in actual.columns}, index=actual.index
+            )
+        report['results'][name] = {
+            **max_error(expected, actual),
+            'pandas_ms': round(base_seconds * 1000, 1),
+            'service_ms': round(seconds * 1000, 1)
+        }
+
+    matrix = correlation.correlation_matrix(returns)
+    expected_top = correlation.top_pairs(matrix, 20, is_matrix=True)
+    actual_top, seconds = timed(lambda: correlation.top_pairs(returns, 20, block_size=args.block_size))
+    report['results']['top_pairs'] = {
+        'match': expected_top[['symbol_a', 'symbol_b']].equals(actual_top[['symbol_a', 'symbol_b']]),
+        'service_ms': round(seconds * 1000, 1)
+    }
+    _, seconds = timed(lambda: correlation.cluster_order(matrix))
+    report['results']['cluster_order'] = {'service_ms': round(seconds * 1000, 1)}
+
+    ok = all(r.get('match', True) for r in report['results'].values())
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"🔗 상관계수 ({args.symbols}개 심볼, {len(returns):,}행, window={args.window})")
+        print(f"   {'case':>16} {'pandas ms':>10} {'service ms':>10}  오차")
+        for name, r in report['results'].items():
+            mark = '' if 'match' not in r else ('✅' if r['match'] else '❌')
+            detail = f"{r['error']:.1e}" if 'error' in r else r.get('reason', '')
+            pandas_ms = f"{r['pandas_ms']:>10.1f}" if 'pandas_ms' in r else f"{'-':>10}"
+            print(f"   {name:>16} {pandas_ms} {r['service_ms']:>10.1f}  {mark} {detail}")
+
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
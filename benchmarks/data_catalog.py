@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+데이터 카탈로그 조회 벤치마크
+- 심볼/간격별 파일 수만 개를 만든 local_data에서 rglob/os.walk 순회와 카탈로그 조회 비교
+- 외부에서 파일을 추가/삭제한 뒤 reconcile이 바뀐 디렉토리만 다시 읽는지 확인
+
+사용 예시:
+    python benchmarks/data_catalog.py --files 20000
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.data_catalog import DataCatalog
+
+def build_tree(root: Path, files: int) -> int:
+    """raw_data/binance/{심볼}/ 아래 일별 파일 생성, 생성한 파일 수 반환"""
+    symbols = [f"SYM{i:03d}USDT" for i in range(max(1, files // 365))]
+    created = 0
+    for symbol in symbols:
+        directory = root / 'raw_data' / 'binance' / symbol
+        directory.mkdir(parents=True, exist_ok=True)
+        for day in range(365):
+            if created >= files:
+                return created
+            start = date(2024, 1, 1) + timedelta(days=day)
+            (directory / f"{symbol}_1m_{start}_to_{start}.csv").write_bytes(b'timestamp,open\n')
+            created += 1
+    return created
+
+def timed(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='데이터 카탈로그 벤치마크')
+    parser.add_argument('--files', type=int, default=20000)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'local_data'
+        created = build_tree(root, args.files)
+        symbol = 'SYM000USDT'
+
+        def walk_list():
+            return [(p, p.stat().st_size, p.stat().st_mtime) for p in (root / 'raw_data').rglob('*') if p.is_file()]
+
+        def walk_usage():
+            return sum(os.path.getsize(os.path.join(d, f)) for d, _, names in os.walk(root) for f in names)
+
+        catalog = DataCatalog(root)
+        started = time.perf_counter()
+        catalog.reconcile(force=True)
+        initial = time.perf_counter() - started
+
+        results = {
+            'rglob_list': timed(walk_list),
+            'catalog_list': timed(lambda: catalog.list_files(root / 'raw_data')),
+            'catalog_list_recent': timed(lambda: (catalog.count_files(root / 'raw_data'), catalog.list_files(root / 'raw_data', limit=10))),
+            'walk_usage': timed(walk_usage),
+            'catalog_usage': timed(catalog.storage_usage),
+            'catalog_coverage': timed(lambda: catalog.coverage(symbol)),
+            'catalog_find': timed(lambda: catalog.find(f"{symbol}_1m_2024-03-01_to_2024-03-01.csv")),
+            'reconcile_unchanged': timed(lambda: catalog.reconcile(force=True))
+        }
+
+        # 외부 변경: 한 폴더에 파일 추가, 다른 폴더에서 삭제
+        extra = root / 'raw_data' / 'binance' / symbol / f"{symbol}_1h_2025-01-01_to_2025-01-31.csv"
+        extra.write_bytes(b'x' * 1000)
+        removed = next((root / 'raw_data' / 'binance').glob('SYM001USDT/*.csv'), None)
+        if removed:
+            removed.unlink()
+        rescanned = catalog.reconcile(force=True)
+
+        usage = catalog.storage_usage()
+        checks = {
+            'files': usage['files'] == created + 1 - (1 if removed else 0),
+            'rescanned_changed_only': rescanned == (2 if removed else 1),
+            'coverage': any(s['interval'] == '1h' for s in catalog.coverage(symbol)),
+            'listing': len(catalog.list_files(root / 'raw_data')) == len(walk_list())
+        }
+
+    report = {'files': created, 'initial_index_seconds': round(initial, 3),
+              'seconds': {k: round(v, 5) for k, v in results.items()}, 'checks': checks}
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"🗂️ 파일 {created:,}개 (최초 인덱싱 {initial:.2f}s)")
+        for name, seconds in results.items():
+            print(f"   {name:>20}: {seconds * 1000:9.2f}ms")
+        for name, ok in checks.items():
+            print(f"   {'✅' if ok else '❌'} {name}")
+
+    return 0 if all(checks.values()) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+커널 시작 임포트 시간 점검 스크립트
+`python -X importtime`으로 셀 실행 환경(user_functions) 임포트 비용을 측정하고,
+예산을 초과하거나 지연 로드 대상 모듈이 시작 시점에 임포트되면 실패 코드로 종료합니다.
+
+사용 예시:
+    python benchmarks/import_time.py --budget-ms 1500
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 셀 시작 시점에 임포트되면 안 되는 무거운 모듈 (첫 사용 시 지연 로드 대상)
+LAZY_MODULES = ['plotly', 'requests', 'services.visualization', 'services.binance_client']
+
+def measure_import_time(module: str = 'user_functions') -> dict:
+    """-X importtime 출력을 파싱해 모듈별 누적 임포트 시간(us) 반환"""
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join([
+        os.path.join(PROJECT_ROOT, 'shared'),
+        os.path.join(PROJECT_ROOT, 'backend'),
+        PROJECT_ROOT
+    ])
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} 임포트 실패:\n{result.stderr}")
+
+    modules = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        # 형식: "import time:      self [us] |  cumulative | imported package"
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        cumulative = int(cumulative_us.strip())
+        # 들여쓰기 없는 최상위 임포트만 합산 (하위 임포트는 누적값에 포함됨)
+        if not name[1:].startswith(' '):
+            total_us += cumulative
+        modules[name.strip()] = cumulative
+
+    return {'total_us': total_us, 'modules': modules}
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='user_functions 임포트 시간 예산 점검')
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.getenv('JUPPELIN_IMPORT_BUDGET_MS', 1500)),
+                        help='허용 임포트 시간(ms)')
+    parser.add_argument('--module', default='user_functions')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (최소값 사용)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 상위 모듈 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    runs = [measure_import_time(args.module) for _ in range(max(1, args.repeat))]
+    best = min(runs, key=lambda run: run['total_us'])
+    total_ms = best['total_us'] / 1000
+
+    eager = [
+        name for name in best['modules']
+        if any(name == lazy or name.startswith(lazy + '.') for lazy in LAZY_MODULES)
+    ]
+    top = sorted(best['modules'].items(), key=lambda item: item[1], reverse=True)[:args.top]
+    passed = total_ms <= args.budget_ms and not eager
+
+    if args.json:
+        print(json.dumps({
+            'module': args.module,
+            'total_ms': round(total_ms, 2),
+            'budget_ms': args.budget_ms,
+            'eager_lazy_modules': eager,
+            'top_modules_ms': {name: round(us / 1000, 2) for name, us in top},
+            'passed': passed
+        }, indent=2))
+    else:
+        print(f"📊 {args.module} 임포트 시간: {total_ms:.1f}ms (예산 {args.budget_ms:.0f}ms)")
+        for name, us in top:
+            print(f"   {name:<40} {us / 1000:>8.1f}ms")
+        if eager:
+            print(f"❌ 시작 시점에 임포트된 지연 로드 대상: {', '.join(eager)}")
+        if total_ms > args.budget_ms:
+            print(f"❌ 임포트 시간 예산 초과: {total_ms:.1f}ms > {args.budget_ms:.0f}ms")
+        if passed:
+            print("✅ 임포트 시간 예산 통과")
+
+    return 0 if passed else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+바이낸스 klines 응답 디코딩 벤치마크
+- 기존 방식(json 파싱 → 12컬럼 DataFrame → 컬럼별 astype)과 kline_decoder의
+  자동 선택(KlineBuffer.extend), CSV 변환 경로, orjson/json 경로를 같은 응답 바이트로 비교
+- --page-rows로 본문 크기를 바꿔 CSV_MIN_BYTES 경계 확인
+- 각 방식의 결과(OHLCV, 추가 필드)가 기존 방식과 같은지 확인
+
+사용 예시:
+    python benchmarks/kline_decode.py --rows 1m
+    python benchmarks/kline_decode.py --rows 100k --extra --json
+    python benchmarks/kline_decode.py --rows 1m --page-rows 100k
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.kline_decoder import (
+    KLINE_FIELDS, KlineBuffer, _decode_csv, _decode_json, orjson, resolve_fields
+)
+
+COLUMNS = [
+    'timestamp', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_asset_volume',
+    'number_of_trades', 'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
+]
+
+def parse_rows(value: str) -> int:
+    value = value.strip().lower()
+    for suffix, factor in (('k', 1_000), ('m', 1_000_000)):
+        if value.endswith(suffix):
+            return int(float(value[:-1]) * factor)
+    return int(value)
+
+def make_pages(rows: int, page_rows: int = 1000, seed: int = 11) -> list:
+    """1분봉 klines 응답 본문 목록 (바이낸스와 같은 문자열 숫자, page_rows행 단위)"""
+    rng = np.random.default_rng(seed)
+    open_time = 1_600_000_000_000 + np.arange(rows, dtype=np.int64) * 60_000
+    close = 30000 + np.cumsum(rng.normal(0, 5, rows))
+    spread = rng.random(rows) * 10
+    volume = rng.random(rows) * 100
+    trades = rng.integers(1, 5000, rows)
+    taker = volume * rng.random(rows)
+
+    pages = []
+    for start in range(0, rows, page_rows):
+        page = [
+            [
+                int(open_time[i]), f"{close[i] + 1:.8f}", f"{close[i] + spread[i]:.8f}",
+                f"{close[i] - spread[i]:.8f}", f"{close[i]:.8f}", f"{volume[i]:.8f}",
+                int(open_time[i] + 59_999), f"{volume[i] * close[i]:.8f}", int(trades[i]),
+                f"{taker[i]:.8f}", f"{taker[i] * close[i]:.8f}", "0"
+            ]
+            for i in range(start, min(start + page_rows, rows))
+        ]
+        pages.append(json.dumps(page, separators=(',', ':')).encode())
+    return pages
+
+def baseline(pages: list, fields: tuple) -> pd.DataFrame:
+    """기존 get_klines + get_ohlcv_dataframe 방식"""
+    klines = []
+    for body in pages:
+        klines.extend(json.loads(body))
+    df = pd.DataFrame(klines, columns=COLUMNS)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    for field in fields:
+        df[field] = df[field].astype(KLINE_FIELDS[field][1])
+    return df.set_index('timestamp')[list(fields)]
+
+def buffered(pages: list, rows: int, extra, decoder=None) -> pd.DataFrame:
+    """KlineBuffer에 페이지를 이어 쓰는 방식 (decoder를 주면 그 경로로 고정)"""
+    buffer = KlineBuffer(rows, extra_fields=extra)
+    if decoder is None:
+        for body in pages:
+            buffer.extend(body)
+        return buffer.to_frame()
+    fields = buffer.fields
+    for body in pages:
+        page = decoder(body, fields)
+        count = len(page['timestamp'])
+        for field, values in page.items():
+            buffer.columns[field][buffer.rows:buffer.rows + count] = values
+        buffer.rows += count
+    return buffer.to_frame()
+
+def timed(func, repeat: int):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='klines 디코딩 벤치마크')
+    parser.add_argument('--rows', default='1m', help='총 행 수 (예: 100k, 1m)')
+    parser.add_argument('--page-rows', default='1000', help='응답 본문 하나의 행 수 (API 한 페이지는 1000)')
+    parser.add_argument('--extra', action='store_true', help='추가 필드(거래대금, 체결 수, 테이커 거래량) 포함')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    rows = parse_rows(args.rows)
+    pages = make_pages(rows, parse_rows(args.page_rows))
+    fields = resolve_fields(args.extra)
+
+    expected, base_seconds = timed(lambda: baseline(pages, fields), args.repeat)
+    cases = {
+        'auto': lambda: buffered(pages, rows, args.extra),
+        'csv': lambda: buffered(pages, rows, args.extra, _decode_csv),
+        'orjson' if orjson is not None else 'json': lambda: buffered(pages, rows, args.extra, _decode_json)
+    }
+
+    report = {'rows': rows, 'fields': list(fields), 'baseline_ms': round(base_seconds * 1000, 1), 'results': {}}
+    for name, func in cases.items():
+        actual, seconds = timed(func, args.repeat)
+        match = expected.index.equals(actual.index) and expected.equals(actual)
+        report['results'][name] = {
+            'ms': round(seconds * 1000, 1),
+            'speedup': round(base_seconds / seconds, 2),
+            'match': bool(match)
+        }
+
+    ok = all(r['match'] for r in report['results'].values())
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"📦 klines 디코딩 ({rows:,}행, {len(pages)}페이지, 필드 {len(fields)}개, 최소 {args.repeat}회)")
+        print(f"   {'방식':>10} {'ms':>10} {'배속':>6}  결과")
+        print(f"   {'baseline':>10} {report['baseline_ms']:>10.1f} {1:>6.2f}")
+        for name, r in report['results'].items():
+            mark = '✅' if r['match'] else '❌ 불일치'
+            print(f"   {name:>10} {r['ms']:>10.1f} {r['speedup']:>6.2f}  {mark}")
+
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
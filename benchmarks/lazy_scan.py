@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+지연 실행 데이터셋(scan_local_data) 벤치마크
+- 여러 파일로 나뉜 1분봉 데이터에 지표 + 봉 변환 계획을 청크 단위로 실행한 결과가
+  전체를 메모리에 올려 계산한 결과와 같은지 확인
+- 두 방식의 실행 시간과 최대 메모리(tracemalloc) 비교
+
+사용 예시:
+    python benchmarks/lazy_scan.py --rows 2000000 --files 4 --chunk-rows 200000
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import logging
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.lazy_dataset import LazyDataset
+from services.resampling import resample_ohlcv
+from services.storage_formats import DEFAULT_EXTENSIONS, describe_formats, read_frame, write_frame
+from services.technical_indicators import TechnicalIndicators
+
+def make_ohlcv(rows: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2020-01-01', periods=rows, freq='min', name='timestamp')
+    close = 30000 + np.cumsum(rng.normal(0, 5, rows))
+    spread = rng.random(rows) * 10
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 1, rows),
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': rng.random(rows) * 100
+    }, index=index)
+
+def plan(dataset: LazyDataset) -> LazyDataset:
+    return (dataset
+            .indicator('rsi', period=14)
+            .indicator('macd')
+            .indicator('bollinger', period=20)
+            .indicator('atr', period=14)
+            .resample('1h')
+            .indicator('sma', period=24))
+
+def eager(paths) -> pd.DataFrame:
+    """비교용: 전체 로드 후 같은 계산"""
+    data = pd.concat([read_frame(p) for p in paths])
+    data = data[~data.index.duplicated(keep='first')]
+    ti = TechnicalIndicators
+    data['rsi_14'] = ti.calculate_rsi(data['close'], 14)
+    macd = ti.calculate_macd(data['close'])
+    data['macd'], data['macd_signal'], data['macd_histogram'] = macd['macd'], macd['signal'], macd['histogram']
+    bands = ti.calculate_bollinger_bands(data['close'], 20)
+    for column in bands.columns:
+        data[f'bollinger_20_{column}'] = bands[column]
+    data['atr_14'] = ti.calculate_atr(data['high'], data['low'], data['close'], 14)
+    hourly = resample_ohlcv(data, '1h')
+    hourly['sma_24'] = ti.calculate_sma(hourly['close'], 24)
+    return hourly
+
+def measure(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='지연 실행 데이터셋 벤치마크')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='전체 1분봉 행 수')
+    parser.add_argument('--files', type=int, default=4, help='나눌 파일 수')
+    parser.add_argument('--chunk-rows', type=int, default=100_000)
+    parser.add_argument('--format', default='parquet' if describe_formats()['parquet'] else 'csv', help='파일 형식')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('services').setLevel(logging.WARNING)
+    data = make_ohlcv(args.rows)
+
+    with tempfile.TemporaryDirectory(prefix='juppelin_scan_') as tmp:
+        paths = []
+        bounds = np.linspace(0, len(data), args.files + 1).astype(int)
+        for i, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+            # 파일 경계마다 10행씩 겹치게 저장 (재수집 파일 상황)
+            part = data.iloc[max(0, start - 10):end]
+            path = Path(tmp) / f"BTCUSDT_1m_part{i:03d}.{DEFAULT_EXTENSIONS[args.format]}"
+            write_frame(part, path, args.format)
+            paths.append(path)
+        del data
+
+        lazy, lazy_seconds, lazy_peak = measure(lambda: plan(LazyDataset(paths, chunk_rows=args.chunk_rows)).collect())
+        full, full_seconds, full_peak = measure(lambda: eager(paths))
+
+    columns = list(full.columns)
+    same_shape = lazy.shape == full.shape and list(lazy.columns) == columns
+    # 컬럼 크기 대비 오차 (pandas rolling std는 전체 구간을 누적 계산해 1e-8 수준의 부동소수점 차이가 남)
+    max_error = None
+    if same_shape:
+        diff = np.abs(lazy[columns].to_numpy() - full.to_numpy())
+        scale = np.nanmax(np.abs(full.to_numpy()), axis=0)
+        max_error = float(np.nanmax(diff / np.where(scale > 0, scale, 1)))
+    checks = {
+        'same_shape': same_shape,
+        'same_index': same_shape and lazy.index.equals(full.index),
+        'values_match': max_error is not None and max_error < 1e-6,
+        'nan_positions_match': same_shape and bool((lazy[columns].isna().to_numpy() == full.isna().to_numpy()).all())
+    }
+
+    report = {
+        'rows': args.rows,
+        'files': args.files,
+        'chunk_rows': args.chunk_rows,
+        'format': args.format,
+        'result_rows': len(lazy),
+        'lazy': {'seconds': round(lazy_seconds, 3), 'peak_mb': round(lazy_peak / 1024 ** 2, 1)},
+        'eager': {'seconds': round(full_seconds, 3), 'peak_mb': round(full_peak / 1024 ** 2, 1)},
+        'max_relative_error': max_error,
+        'checks': checks
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"🔎 {args.rows:,}행 → {args.files}개 {args.format} 파일, 청크 {args.chunk_rows:,}행, 결과 {len(lazy):,}행")
+        print(f"   {'lazy':>6}: {report['lazy']['seconds']:8.3f} s, 최대 {report['lazy']['peak_mb']:8.1f} MB")
+        print(f"   {'eager':>6}: {report['eager']['seconds']:8.3f} s, 최대 {report['eager']['peak_mb']:8.1f} MB")
+        print(f"   최대 상대 오차: {max_error}")
+        for name, ok in checks.items():
+            print(f"   {'✅' if ok else '❌'} {name}")
+
+    return 0 if all(checks.values()) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
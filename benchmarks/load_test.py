@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Juppelin 부하 테스트 스크립트
+N개의 동시 클라이언트로 API 엔드포인트를 호출하고 지연 시간 분포(p50/p99)를 보고합니다.
+
+사용 예시:
+    python benchmarks/load_test.py --url http://localhost:8888 --clients 32 --requests 20
+"""
+
+import sys
+import math
+import time
+import json
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# 엔드포인트별 요청 정의 (method, path, body)
+ENDPOINTS = {
+    'health': ('GET', '/api/health', None),
+    'execute': ('POST', '/api/execute', {
+        'cell_id': 'load-test',
+        'code': 'x = sum(range(1000))\nprint(x)',
+        'cell_type': 'code'
+    })
+}
+
+def percentile(values, pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산 (최근접 순위 방식)"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+def run_client(base_url: str, endpoint: str, num_requests: int, timeout: float) -> dict:
+    """단일 클라이언트: 세션 하나로 요청을 순차 실행하며 지연 시간 기록 (지연 시간은 성공한 요청만)"""
+    method, path, body = ENDPOINTS[endpoint]
+    session = requests.Session()
+    latencies = []
+    errors = 0
+
+    for _ in range(num_requests):
+        started = time.perf_counter()
+        try:
+            response = session.request(method, base_url + path, json=body, timeout=timeout)
+        except requests.exceptions.RequestException:
+            errors += 1
+            continue
+        if response.status_code != 200:
+            errors += 1
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    return {'latencies': latencies, 'errors': errors}
+
+def run_load_test(base_url: str, endpoint: str, clients: int, num_requests: int, timeout: float) -> dict:
+    """동시 클라이언트로 엔드포인트 부하 테스트 실행"""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        futures = [
+            executor.submit(run_client, base_url, endpoint, num_requests, timeout)
+            for _ in range(clients)
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+
+    latencies = [value for result in results for value in result['latencies']]
+    errors = sum(result['errors'] for result in results)
+
+    return {
+        'endpoint': ENDPOINTS[endpoint][1],
+        'clients': clients,
+        'requests': len(latencies) + errors,
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'mean_ms': round(statistics.mean(latencies), 2) if latencies else float('nan')
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Juppelin API 부하 테스트')
+    parser.add_argument('--url', default='http://localhost:8888', help='서버 주소')
+    parser.add_argument('--clients', type=int, default=16, help='동시 클라이언트 수')
+    parser.add_argument('--requests', type=int, default=20, help='클라이언트당 요청 수')
+    parser.add_argument('--endpoints', nargs='+', choices=sorted(ENDPOINTS),
+                        default=['health', 'execute'])
+    parser.add_argument('--timeout', type=float, default=60.0, help='요청 타임아웃(초)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    reports = []
+    for endpoint in args.endpoints:
+        if not args.json:
+            print(f"📊 {ENDPOINTS[endpoint][1]} 부하 테스트 중... "
+                  f"(clients={args.clients}, requests={args.requests})")
+        reports.append(run_load_test(
+            args.url.rstrip('/'), endpoint, args.clients, args.requests, args.timeout
+        ))
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+        return 0
+
+    print()
+    print(f"{'endpoint':<16}{'clients':>8}{'requests':>10}{'errors':>8}"
+          f"{'rps':>10}{'p50(ms)':>10}{'p99(ms)':>10}")
+    for report in reports:
+        print(f"{report['endpoint']:<16}{report['clients']:>8}{report['requests']:>10}"
+              f"{report['errors']:>8}{report['throughput_rps']:>10}"
+              f"{report['p50_ms']:>10}{report['p99_ms']:>10}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+지표 레지스트리 핫 패스 벤치마크
+- 스레드별 샤드 카운터/히스토그램과 락 기반 카운터의 증가 비용 비교
+- 여러 스레드가 동시에 증가시킨 뒤 합계가 정확한지, 렌더링 시간이 얼마인지 확인
+
+사용 예시:
+    python benchmarks/metrics.py --threads 8 --ops 200000
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import threading
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.metrics import MetricsRegistry
+
+class LockedCounter:
+    """비교용: 증가마다 락을 잡는 카운터"""
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self.lock:
+            self.value += amount
+
+def run_threads(func, threads: int, ops: int) -> float:
+    workers = [threading.Thread(target=func, args=(ops,)) for _ in range(threads)]
+    started = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - started
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='지표 레지스트리 벤치마크')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--ops', type=int, default=200000, help='스레드당 증가 횟수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    registry = MetricsRegistry()
+    counter = registry.counter('bench_requests_total', 'bench', ('endpoint', 'status'))
+    histogram = registry.histogram('bench_request_seconds', 'bench', ('endpoint',))
+    locked = LockedCounter()
+
+    def sharded(ops):
+        value = counter.labels('klines', '200')
+        for _ in range(ops):
+            value.inc()
+
+    def sharded_labels(ops):
+        for _ in range(ops):
+            counter.labels('klines', '200').inc()
+
+    def observed(ops):
+        value = histogram.labels('klines')
+        for i in range(ops):
+            value.observe((i % 100) / 1000)
+
+    def locking(ops):
+        for _ in range(ops):
+            locked.inc()
+
+    total_ops = args.threads * args.ops
+    results = {
+        'sharded_counter': run_threads(sharded, args.threads, args.ops),
+        'sharded_counter_labels': run_threads(sharded_labels, args.threads, args.ops),
+        'sharded_histogram': run_threads(observed, args.threads, args.ops),
+        'locked_counter': run_threads(locking, args.threads, args.ops)
+    }
+
+    started = time.perf_counter()
+    text = registry.render()
+    render_seconds = time.perf_counter() - started
+
+    checks = {
+        'counter_total': counter.labels('klines', '200').get() == 2 * total_ops,
+        'histogram_count': f'bench_request_seconds_count{{endpoint="klines"}} {total_ops}' in text,
+        'locked_total': locked.value == total_ops
+    }
+
+    report = {
+        'threads': args.threads,
+        'ops': total_ops,
+        'ns_per_op': {k: round(v / total_ops * 1e9, 1) for k, v in results.items()},
+        'render_ms': round(render_seconds * 1000, 3),
+        'checks': checks
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"📈 스레드 {args.threads}개 × {args.ops:,}회")
+        for name, ns in report['ns_per_op'].items():
+            print(f"   {name:>24}: {ns:8.1f} ns/op")
+        print(f"   {'render':>24}: {report['render_ms']:8.3f} ms")
+        for name, ok in checks.items():
+            print(f"   {'✅' if ok else '❌'} {name}")
+
+    return 0 if all(checks.values()) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+성능 모드 오버헤드 벤치마크
+user_functions.calculate_* 를 1,000회 반복 호출하면서 일반 모드(진행 출력 + INFO 로그)와
+성능 모드의 실행 시간을 비교합니다.
+
+사용 예시:
+    python benchmarks/performance_mode.py --calls 1000 --rows 500
+"""
+
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+import tempfile
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'shared'))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+import user_functions
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """합성 OHLCV 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    index = pd.date_range('2025-01-01', periods=rows, freq='1min', name='timestamp')
+    return pd.DataFrame({
+        'open': close * (1 + rng.normal(0, 0.001, rows)),
+        'high': close * 1.002,
+        'low': close * 0.998,
+        'close': close,
+        'volume': rng.uniform(1, 100, rows)
+    }, index=index)
+
+def configure_logging(log_dir: str, stream):
+    """서버와 같은 형식의 파일 + 스트림 로깅 설정"""
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(os.path.join(log_dir, 'bench.log'), encoding='utf-8'),
+        logging.StreamHandler(stream)
+    ]
+    root_logger = logging.getLogger()
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root_logger.addHandler(handler)
+    root_logger.setLevel(logging.INFO)
+    return handlers
+
+def run_loop(data: pd.DataFrame, calls: int) -> float:
+    """calculate_rsi / calculate_sma 를 번갈아 호출하는 루프 실행 시간(초)"""
+    started = time.perf_counter()
+    for i in range(calls):
+        if i % 2:
+            user_functions.calculate_rsi(data, period=14)
+        else:
+            user_functions.calculate_sma(data, 20)
+    return time.perf_counter() - started
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='성능 모드 오버헤드 벤치마크')
+    parser.add_argument('--calls', type=int, default=1000)
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    data = make_ohlcv(args.rows)
+
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            open(os.path.join(tmp_dir, 'stdout.txt'), 'w', encoding='utf-8') as sink:
+        handlers = configure_logging(tmp_dir, sink)
+        try:
+            # 워밍업 (서비스 지연 로드)
+            with contextlib.redirect_stdout(sink):
+                run_loop(data, 10)
+
+            with contextlib.redirect_stdout(sink):
+                normal = run_loop(data, args.calls)
+
+            with user_functions.performance_mode(), contextlib.redirect_stdout(sink):
+                fast = run_loop(data, args.calls)
+        finally:
+            for handler in handlers:
+                logging.getLogger().removeHandler(handler)
+                handler.close()
+
+    result = {
+        'calls': args.calls,
+        'rows': args.rows,
+        'normal_s': round(normal, 4),
+        'performance_mode_s': round(fast, 4),
+        'overhead_removed_s': round(normal - fast, 4),
+        'per_call_overhead_us': round((normal - fast) / args.calls * 1e6, 1)
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"📊 {args.calls}회 호출 (rows={args.rows})")
+        print(f"   일반 모드:   {normal:.4f}s")
+        print(f"   성능 모드:   {fast:.4f}s")
+        print(f"   제거된 오버헤드: {normal - fast:.4f}s ({result['per_call_overhead_us']}us/호출)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+OHLCV 봉 간격 변환(resample_ohlcv) 벤치마크 및 경계 검증
+- 1분봉을 상위 봉으로 변환하는 처리 시간 측정
+- 서머타임 시간대(기본 America/New_York)에서 일봉/시간봉이 현지 자정 기준으로 나뉘는지,
+  전환일 일봉이 23/25시간 분량인지 확인
+- 여러 날 봉(3d)이 데이터 시작일과 무관하게 같은 경계를 갖는지 확인
+
+사용 예시:
+    python benchmarks/resampling.py --rows 2000000 --tz America/New_York
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.resampling import resample_ohlcv
+
+def make_minutes(start: str, rows: int, seed: int = 5) -> pd.DataFrame:
+    """UTC 시각(시간대 없는 인덱스)의 합성 1분봉 (volume=1이라 봉 volume 합계가 분 수)"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=rows, freq='min', name='timestamp')
+    close = 30000 + np.cumsum(rng.normal(0, 5, rows))
+    return pd.DataFrame({
+        'open': close,
+        'high': close + 1,
+        'low': close - 1,
+        'close': close,
+        'volume': np.ones(rows)
+    }, index=index)
+
+def check_dst(tz: str) -> list:
+    """서머타임 전환이 있는 구간에서 경계 검증, 실패 항목 목록 반환"""
+    failures = []
+    # 3월/11월 전환을 모두 포함 (2024-03-10, 2024-11-03, 미국 기준)
+    for start in ('2024-03-05', '2024-10-29'):
+        data = make_minutes(start, 10 * 24 * 60)
+        local = data.index.tz_localize('UTC').tz_convert(tz)
+
+        daily = resample_ohlcv(data, '1d', tz=tz)
+        if not (daily.index == daily.index.normalize()).all():
+            failures.append(f"{start} 1d: 현지 자정이 아닌 봉 시작")
+        expected = pd.Series(1.0, index=local).groupby(local.normalize()).sum()
+        if not np.array_equal(daily['volume'].to_numpy(), expected.to_numpy()):
+            failures.append(f"{start} 1d: 봉별 분 수가 현지 날짜와 다름")
+
+        hourly = resample_ohlcv(data, '4h', tz=tz)
+        if (hourly.index.hour % 4 != 0).any() or (hourly.index.minute != 0).any():
+            failures.append(f"{start} 4h: 정시가 아닌 봉 시작")
+
+        # 시작일을 하루 미뤄도 (첫 봉 이후) 3일봉 경계는 같아야 함
+        whole = resample_ohlcv(data, '3d', tz=tz)
+        shifted = resample_ohlcv(data.iloc[24 * 60:], '3d', tz=tz)
+        if (not whole.index[whole.index >= shifted.index[1]].equals(shifted.index[1:])
+                or not (whole.index == whole.index.normalize()).all()):
+            failures.append(f"{start} 3d: 데이터 시작일에 따라 경계가 달라짐")
+    return failures
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='OHLCV 봉 간격 변환 벤치마크')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='1분봉 행 수')
+    parser.add_argument('--tz', default='America/New_York', help='서머타임 검증 시간대')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    data = make_minutes('2024-01-01', args.rows)
+    report = {'rows': args.rows, 'tz': args.tz, 'intervals': {}}
+    for interval in ('15m', '1h', '4h', '1d', '3d', '1w'):
+        for tz in (None, args.tz):
+            started = time.perf_counter()
+            bars = resample_ohlcv(data, interval, tz=tz)
+            elapsed = time.perf_counter() - started
+            report['intervals'][f"{interval}{'@' + tz if tz else ''}"] = {
+                'bars': len(bars),
+                'seconds': round(elapsed, 3),
+                'rows_per_second': int(args.rows / elapsed) if elapsed > 0 else 0
+            }
+
+    failures = check_dst(args.tz)
+    report['dst_failures'] = failures
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"🕯️ 1분봉 {args.rows:,}행 → 상위 봉")
+        for name, row in report['intervals'].items():
+            print(f"   {name:>22}: {row['bars']:>8,}개 봉  {row['seconds']:.3f}s  ({row['rows_per_second']:,} rows/s)")
+        if failures:
+            for failure in failures:
+                print(f"❌ {args.tz} {failure}")
+        else:
+            print(f"✅ {args.tz} 서머타임 전환일에도 현지 자정/정시 기준 경계, 3일봉 경계는 시작일과 무관")
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+시장 스크리너 벤치마크 + 지표 동등성 검사
+- 합성 심볼 유니버스를 돌려주는 메모리 클라이언트로 MarketScreener 실행 (네트워크 없음)
+- 콜드 스캔(스냅샷 없음, 전 심볼 수집) / 웜 스캔(갱신 없음) / 다음 봉 증분 갱신 스캔 시간 비교
+- panel_features 값이 심볼별 TechnicalIndicators 결과와 같은지 확인
+
+사용 예시:
+    python benchmarks/screener.py --symbols 400
+    python benchmarks/screener.py --symbols 1500 --bars 300 --json
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import logging
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.screener import MarketScreener, panel_features
+from services.resampling import INTERVAL_MS
+from services.technical_indicators import TechnicalIndicators
+
+TOLERANCE = 1e-9
+EXPRESSION = 'rsi14 > 50 and close > sma50 and quote_volume > 1e6'
+
+class SyntheticMarket:
+    """봉 번호의 결정적 함수로 만든 봉을 돌려주는 메모리 클라이언트 (BinanceClient와 같은 메서드)"""
+
+    def __init__(self, symbols: int, seed: int = 3):
+        rng = np.random.default_rng(seed)
+        self.symbols = [f"SYM{i:04d}USDT" for i in range(symbols)]
+        self.volumes = dict(zip(self.symbols, rng.lognormal(15, 2, symbols)))
+        # 일부 심볼은 최근 상장 (봉 수가 적음)
+        self.listed = {s: (rng.integers(50, 400) if rng.random() < 0.05 else 0) for s in self.symbols}
+        self.seed = seed
+        self.requests = 0
+
+    def get_exchange_info(self):
+        return {'symbols': [{'symbol': s, 'status': 'TRADING', 'quoteAsset': 'USDT'} for s in self.symbols]}
+
+    def get_24hr_tickers(self):
+        return [
+            {'symbol': s, 'lastPrice': '1', 'priceChangePercent': '0', 'volume': str(v),
+             'quoteVolume': str(v), 'count': 1000, 'highPrice': '1', 'lowPrice': '1'}
+            for s, v in self.volumes.items()
+        ]
+
+    def get_ohlcv_range(self, symbol, interval, start_ms, end_ms, extra_fields=False):
+        self.requests += 1
+        step = INTERVAL_MS[interval]
+        opens = np.arange(start_ms // step, end_ms // step + 1, dtype=np.int64)
+        listed_from = end_ms // step - self.listed[symbol] if self.listed[symbol] else 0
+        opens = opens[opens >= listed_from]
+        # 같은 봉은 어느 요청에서 받아도 같은 값
+        rng = np.random.default_rng([self.seed, int(symbol[3:7])])
+        base = 10 + int(symbol[3:7]) % 90
+        noise = np.sin(opens * 0.37 + int(symbol[3:7])) * 0.02 + np.cos(opens * 0.011) * 0.05
+        close = base * (1 + noise)
+        spread = close * (0.002 + 0.001 * rng.random())
+        index = pd.DatetimeIndex(pd.to_datetime(opens * step, unit='ms'), name='timestamp')
+        return pd.DataFrame({
+            'open': close - spread / 3, 'high': close + spread, 'low': close - spread,
+            'close': close, 'volume': np.abs(noise) * 1000 + 1
+        }, index=index)
+
+def parity(screener: MarketScreener, symbols: list, interval: str) -> dict:
+    """panel_features vs 심볼별 TechnicalIndicators (최대 절대 오차)"""
+    fields = ['sma50', 'ema20', 'rsi14', 'atr14', 'roc10', 'highest20', 'lowest20']
+    panels = screener.panels(symbols, interval)
+    actual = panel_features(panels, fields)
+    errors = {}
+    for symbol in symbols:
+        df = pd.DataFrame({c: panels[c][symbol] for c in panels}).dropna()
+        expected = {
+            'sma50': TechnicalIndicators.calculate_sma(df['close'], 50).iloc[-1],
+            'ema20': TechnicalIndicators.calculate_ema(df['close'], 20).iloc[-1],
+            'rsi14': TechnicalIndicators.calculate_rsi(df['close'], 14).iloc[-1],
+            'atr14': TechnicalIndicators.calculate_atr(df['high'], df['low'], df['close'], 14).iloc[-1],
+            'roc10': (df['close'].iloc[-1] / df['close'].iloc[-11] - 1) * 100,
+            'highest20': df['high'].iloc[-20:].max(),
+            'lowest20': df['low'].iloc[-20:].min()
+        }
+        for field, value in expected.items():
+            error = abs(float(actual.at[symbol, field]) - float(value))
+            errors[field] = max(errors.get(field, 0.0), error)
+    return {'match': all(e <= TOLERANCE for e in errors.values()), 'max_error': max(errors.values())}
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='시장 스크리너 벤치마크')
+    parser.add_argument('--symbols', type=int, default=400)
+    parser.add_argument('--bars', type=int, default=300)
+    parser.add_argument('--interval', default='1h')
+    parser.add_argument('--expression', default=EXPRESSION)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('services').setLevel(logging.WARNING)
+    market = SyntheticMarket(args.symbols)
+    step = INTERVAL_MS[args.interval]
+    now = time.time()
+    report = {'symbols': args.symbols, 'bars': args.bars, 'expression': args.expression, 'results': {}}
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # DataCollectionService 경로(local_data/...)가 작업 디렉토리 기준이라 임시 디렉토리에서 실행
+        os.chdir(workdir)
+        try:
+            from services.data_collection import DataCollectionService
+            screener = MarketScreener(DataCollectionService(), client_factory=lambda: market)
+
+            def run(name, refresh, at):
+                requests = market.requests
+                started = time.perf_counter()
+                if refresh:
+                    screener.refresh(market.symbols, args.interval, args.bars, now=at)
+                ranked = screener.scan(args.expression, args.interval, bars=args.bars, refresh=False, limit=None)
+                report['results'][name] = {
+                    'ms': round((time.perf_counter() - started) * 1000, 1),
+                    'requests': market.requests - requests,
+                    'matched': len(ranked)
+                }
+                return ranked
+
+            cold = run('cold', True, now)
+            warm = run('warm', False, now)
+            run('next_bar', True, now + step / 1000)
+            # 새 인스턴스(새 셀 프로세스와 같음)는 스냅샷 파일에서 다시 읽음
+            screener = MarketScreener(DataCollectionService(), client_factory=lambda: market)
+            run('reload', False, now + step / 1000)
+
+            report['results']['warm']['same_as_cold'] = bool(cold.equals(warm))
+            report['parity'] = parity(screener, market.symbols[:50], args.interval)
+        finally:
+            os.chdir(cwd)
+
+    ok = report['parity']['match'] and report['results']['warm']['same_as_cold']
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False, default=str))
+    else:
+        print(f"🔎 스크리너 ({args.symbols}개 심볼, {args.bars}봉, {args.interval})")
+        print(f"   조건식: {args.expression}")
+        print(f"   {'case':>10} {'ms':>10} {'요청':>6} {'결과':>6}")
+        for name, r in report['results'].items():
+            print(f"   {name:>10} {r['ms']:>10.1f} {r['requests']:>6} {r['matched']:>6}")
+        mark = '✅' if report['parity']['match'] else '❌'
+        print(f"   지표 동등성 (TechnicalIndicators): {mark} 최대 오차 {report['parity']['max_error']:.1e}")
+        if not report['results']['warm']['same_as_cold']:
+            print("   ❌ 웜 스캔 결과가 콜드 스캔과 다릅니다")
+
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+분석 결과 저장 형식 벤치마크
+- 지표 패널(날짜 인덱스 + 실수 컬럼)을 형식별로 쓰고 다시 읽는 시간과 파일 크기 비교
+- append 쓰기 후 행 수와 내용이 원본과 같은지 확인
+
+사용 예시:
+    python benchmarks/storage_formats.py --rows 10k,100k,1m
+    python benchmarks/storage_formats.py --formats parquet,feather --rows 1m --columns 40
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+from services.storage_formats import (
+    DEFAULT_EXTENSIONS, EXCEL_MAX_ROWS, describe_formats, read_frame, write_frame
+)
+
+# Excel은 10만 행에서도 수십 초라 그 이상은 건너뜀
+XLSX_MAX_ROWS = 100_000
+
+def parse_rows(value: str) -> int:
+    value = value.strip().lower()
+    for suffix, factor in (('k', 1_000), ('m', 1_000_000)):
+        if value.endswith(suffix):
+            return int(float(value[:-1]) * factor)
+    return int(value)
+
+def make_panel(rows: int, columns: int, seed: int = 7) -> pd.DataFrame:
+    """1분봉 지표 패널 (close + 지표 컬럼)"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2020-01-01', periods=rows, freq='min', name='timestamp')
+    close = 30000 + np.cumsum(rng.normal(0, 10, rows))
+    data = {'close': close}
+    for i in range(columns - 1):
+        data[f'ind_{i}'] = close * (1 + rng.normal(0, 0.01, rows))
+    return pd.DataFrame(data, index=index)
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+def bench_format(file_format: str, data: pd.DataFrame, directory: Path) -> dict:
+    path = directory / f"panel_{len(data)}.{DEFAULT_EXTENSIONS[file_format]}"
+    _, write_seconds = timed(lambda: write_frame(data, path, file_format))
+    size = path.stat().st_size
+    loaded, read_seconds = timed(lambda: read_frame(path, file_format))
+
+    # 절반을 쓰고 나머지를 append
+    half = len(data) // 2
+    append_path = directory / f"append_{len(data)}.{DEFAULT_EXTENSIONS[file_format]}"
+    write_frame(data.iloc[:half], append_path, file_format)
+    _, append_seconds = timed(lambda: write_frame(data.iloc[half:], append_path, file_format, append=True))
+    appended = read_frame(append_path, file_format)
+
+    def same(frame: pd.DataFrame) -> bool:
+        return len(frame) == len(data) and np.allclose(frame['close'].to_numpy(), data['close'].to_numpy())
+
+    leftovers = [p.name for p in directory.iterdir() if p.name.startswith('.')]
+    return {
+        'format': file_format,
+        'rows': len(data),
+        'write_seconds': round(write_seconds, 4),
+        'read_seconds': round(read_seconds, 4),
+        'append_seconds': round(append_seconds, 4),
+        'size_bytes': size,
+        'checks': {
+            'roundtrip': same(loaded),
+            'append': same(appended),
+            'no_temp_files': not leftovers
+        }
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='저장 형식 쓰기/읽기 벤치마크')
+    parser.add_argument('--rows', default='10k,100k,1m', help='행 수 목록 (예: 10k,100k,1m)')
+    parser.add_argument('--columns', type=int, default=20, help='컬럼 수 (close 포함)')
+    parser.add_argument('--formats', default=','.join(DEFAULT_EXTENSIONS), help='비교할 형식')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    available = describe_formats()
+    formats = [f.strip() for f in args.formats.split(',') if f.strip()]
+    results, skipped = [], []
+
+    with tempfile.TemporaryDirectory(prefix='juppelin_formats_') as tmp:
+        directory = Path(tmp)
+        for rows in (parse_rows(r) for r in args.rows.split(',')):
+            data = make_panel(rows, args.columns)
+            for file_format in formats:
+                if not available.get(file_format):
+                    skipped.append({'format': file_format, 'rows': rows, 'reason': '패키지 없음'})
+                    continue
+                if file_format == 'xlsx' and rows > min(XLSX_MAX_ROWS, EXCEL_MAX_ROWS):
+                    skipped.append({'format': file_format, 'rows': rows, 'reason': f'{XLSX_MAX_ROWS:,}행 초과'})
+                    continue
+                results.append(bench_format(file_format, data, directory))
+
+    ok = all(all(r['checks'].values()) for r in results)
+
+    if args.json:
+        print(json.dumps({'columns': args.columns, 'results': results, 'skipped': skipped}, indent=2))
+    else:
+        print(f"💾 저장 형식 비교 (컬럼 {args.columns}개)")
+        print(f"   {'format':>8} {'rows':>10} {'write s':>9} {'read s':>9} {'append s':>9} {'size MB':>9}")
+        for r in results:
+            mark = '✅' if all(r['checks'].values()) else '❌'
+            print(
+                f"   {r['format']:>8} {r['rows']:>10,} {r['write_seconds']:>9.3f} {r['read_seconds']:>9.3f} "
+                f"{r['append_seconds']:>9.3f} {r['size_bytes'] / 1024 ** 2:>9.2f} {mark}"
+            )
+        for s in skipped:
+            print(f"   ⏭️  {s['format']} {s['rows']:,}행: {s['reason']}")
+
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
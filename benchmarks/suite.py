@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Juppelin 벤치마크 모음
+합성 OHLCV(10k/1M/10M행)로 기술 지표, 로컬 데이터 저장/로드, 차트 생성/직렬화,
+DataFrame 출력 직렬화, /api/execute 왕복 시간을 측정하고 결과를 JSON으로 저장합니다.
+
+케이스마다 준비(setup)는 측정에서 빼고 반환된 함수만 반복 측정합니다 (asv 방식).
+필요한 선택 패키지(pyarrow, openpyxl, plotly, flask)가 없으면 해당 케이스는 skipped로 기록됩니다.
+결과 파일은 benchmarks/results/ 아래 '<날짜>_<커밋>.json'으로 저장되어 커밋 간 비교에 씁니다.
+
+사용 예시:
+    python benchmarks/suite.py                            # 10k, 1M행
+    python benchmarks/suite.py --sizes 10k,1m,10m --filter indicators,io
+    python benchmarks/suite.py --compare benchmarks/results/before.json
+    python benchmarks/suite.py --compare before.json --against after.json   # 실행 없이 두 결과 비교
+"""
+
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+import platform
+import tempfile
+import importlib
+import statistics
+import subprocess
+import contextlib
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'shared'))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'backend'))
+
+RESULTS_DIR = os.path.join(PROJECT_ROOT, 'benchmarks', 'results')
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """합성 1분봉 OHLCV 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    open_ = close * (1 + rng.normal(0, 0.0005, rows))
+    spread = np.abs(rng.normal(0, 0.001, rows))
+    index = pd.date_range('2020-01-01', periods=rows, freq='1min', name='timestamp')
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + spread),
+        'low': np.minimum(open_, close) * (1 - spread),
+        'close': close,
+        'volume': rng.uniform(1, 100, rows)
+    }, index=index)
+
+class Context:
+    """케이스 준비에 쓰는 데이터와 작업 디렉토리 (작업 디렉토리가 local_data의 기준)"""
+
+    def __init__(self, data: Optional[pd.DataFrame], workdir: Path):
+        self.data = data
+        self.rows = len(data) if data is not None else 0
+        self.workdir = workdir
+
+class Case:
+    def __init__(self, group: str, name: str, setup: Callable, requires=(), max_rows: Optional[int] = None, sized: bool = True):
+        self.group = group
+        self.name = name
+        self.setup = setup
+        self.requires = requires
+        self.max_rows = max_rows
+        self.sized = sized
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.group}.{self.name}"
+
+CASES: List[Case] = []
+
+def case(group: str, name: str, requires=(), max_rows: Optional[int] = None, sized: bool = True):
+    """
+    벤치마크 케이스 등록 데코레이터
+
+    Args:
+        group: 그룹명 (indicators, io, viz, serialize, execute)
+        name: 케이스명
+        requires: 필요한 모듈 (튜플 항목은 그중 하나만 있으면 됨)
+        max_rows: 이보다 큰 데이터에서는 건너뜀
+        sized: False면 데이터 크기와 무관한 케이스 (한 번만 실행)
+    """
+    def decorator(setup):
+        CASES.append(Case(group, name, setup, requires, max_rows, sized))
+        return setup
+    return decorator
+
+def missing_requirement(requires) -> Optional[str]:
+    for requirement in requires:
+        alternatives = requirement if isinstance(requirement, tuple) else (requirement,)
+        for module in alternatives:
+            try:
+                importlib.import_module(module)
+                break
+            except ImportError:
+                continue
+        else:
+            return ' 또는 '.join(alternatives)
+    return None
+
+# 기술 지표: TechnicalIndicators.calculate_* 전부 (인자 이름으로 OHLCV 컬럼 연결)
+
+def _register_indicators():
+    import inspect
+    from services.technical_indicators import TechnicalIndicators
+
+    for attr in sorted(dir(TechnicalIndicators)):
+        if not attr.startswith('calculate_'):
+            continue
+        method = getattr(TechnicalIndicators, attr)
+        params = inspect.signature(method).parameters
+
+        def setup(ctx, method=method, params=params):
+            columns = {'data': 'close', 'high': 'high', 'low': 'low', 'close': 'close', 'volume': 'volume'}
+            args = {p: ctx.data[columns[p]] for p in params if p in columns}
+            # 기본값이 없는 기간 인자 (sma, ema)
+            if 'period' in params and params['period'].default is inspect.Parameter.empty:
+                args['period'] = 20
+            return lambda: method(**args)
+
+        case('indicators', attr[len('calculate_'):])(setup)
+
+_register_indicators()
+
+# 로컬 데이터 저장/로드 (DataCollectionService, 작업 디렉토리 기준 local_data)
+
+def _io_cases(file_format: str, requires=(), max_rows: Optional[int] = None):
+    def save_setup(ctx):
+        from services.data_collection import DataCollectionService
+        service = DataCollectionService()
+        return lambda: service.save_analysis_result(ctx.data, f"bench_{ctx.rows}", file_format)
+
+    def load_setup(ctx):
+        from services.data_collection import DataCollectionService
+        service = DataCollectionService()
+        path = service.save_analysis_result(ctx.data, f"bench_{ctx.rows}", file_format)
+        # processed_data 아래 하위 경로로 조회 (load_local_data('analysis_results/...')와 같은 경로)
+        return lambda: service.load_local_data(f"analysis_results/{Path(path).name}")
+
+    case('io', f'save_{file_format}', requires, max_rows)(save_setup)
+    case('io', f'load_{file_format}', requires, max_rows)(load_setup)
+
+_io_cases('csv')
+_io_cases('parquet', requires=('pyarrow',))
+_io_cases('feather', requires=('pyarrow',))
+_io_cases('hdf5', requires=('tables',))
+# Excel은 시트당 1,048,576행 제한, 그 전에 한 번 쓰는 데 수 분이 걸려 10만 행까지만
+_io_cases('xlsx', requires=('openpyxl',), max_rows=100_000)
+
+# 차트 생성 + Plotly JSON 직렬화 (VisualizationService는 fig.to_json() 결과를 반환)
+
+VIZ_MAX_ROWS = 1_000_000
+
+@case('viz', 'candlestick', requires=('plotly',), max_rows=VIZ_MAX_ROWS)
+def _viz_candlestick(ctx):
+    from services.visualization import VisualizationService
+    viz = VisualizationService()
+    return lambda: viz.create_candlestick_chart(ctx.data)
+
+@case('viz', 'line', requires=('plotly',), max_rows=VIZ_MAX_ROWS)
+def _viz_line(ctx):
+    from services.visualization import VisualizationService
+    viz = VisualizationService()
+    return lambda: viz.create_line_chart(ctx.data, ['close'])
+
+@case('viz', 'technical_analysis', requires=('plotly',), max_rows=VIZ_MAX_ROWS)
+def _viz_technical(ctx):
+    from services.visualization import VisualizationService
+    from services.technical_indicators import TechnicalIndicators
+    viz = VisualizationService()
+    indicators = {
+        'RSI': TechnicalIndicators.calculate_rsi(ctx.data['close']).to_frame('rsi'),
+        'MACD': TechnicalIndicators.calculate_macd(ctx.data['close'])
+    }
+    return lambda: viz.create_technical_analysis_chart(ctx.data, indicators)
+
+@case('viz', 'correlation_heatmap', requires=('plotly',))
+def _viz_heatmap(ctx):
+    from services.visualization import VisualizationService
+    viz = VisualizationService()
+    return lambda: viz.create_correlation_heatmap(ctx.data)
+
+@case('serialize', 'chart_json', requires=('plotly',), max_rows=VIZ_MAX_ROWS)
+def _serialize_chart(ctx):
+    from services.visualization import VisualizationService
+    chart = VisualizationService().create_candlestick_chart(ctx.data)
+    return lambda: json.dumps(chart)
+
+# 셀 결과 DataFrame/Series 출력 직렬화 (execute_with_result.py와 같은 함수)
+
+@case('serialize', 'dataframe_output')
+def _serialize_dataframe(ctx):
+    from execute_with_result import dataframe_payload
+    return lambda: json.dumps(dataframe_payload(ctx.data))
+
+@case('serialize', 'series_output')
+def _serialize_series(ctx):
+    from execute_with_result import series_payload
+    return lambda: json.dumps(series_payload(ctx.data['close']))
+
+# /api/execute 왕복 (Flask 테스트 클라이언트, 셀 프로세스 실행 포함)
+
+EXECUTE_CELLS = {
+    'print': 'x = sum(range(1000))\nprint(x)',
+    'dataframe': "df = pd.DataFrame(np.random.rand(1000, 5), columns=list('abcde'))\ndf",
+    'indicator': "data = pd.DataFrame({'close': np.random.rand(10000).cumsum()})\ncalculate_rsi(data).tail()"
+}
+
+def _execute_setup(code: str):
+    def setup(ctx):
+        venv = Path(PROJECT_ROOT) / 'venv'
+        if not venv.exists():
+            raise SkipCase('venv 없음 (api.get_venv_python이 venv의 Python으로 셀을 실행)')
+        if not (ctx.workdir / 'venv').exists():
+            (ctx.workdir / 'venv').symlink_to(venv, target_is_directory=True)
+
+        from app import create_app
+        client = create_app().test_client()
+        body = {'cell_id': 'bench', 'session_id': 'bench', 'code': code, 'cell_type': 'code'}
+
+        def run():
+            response = client.post('/api/execute', json=body)
+            result = response.get_json()
+            if response.status_code != 200 or result.get('status') != 'success':
+                raise RuntimeError(result.get('error_message') or response.status_code)
+        return run
+    return setup
+
+for _name, _code in EXECUTE_CELLS.items():
+    case('execute', _name, requires=('flask', 'flask_cors', 'flask_socketio'), sized=False)(_execute_setup(_code))
+
+class SkipCase(Exception):
+    """케이스 준비 중 실행할 수 없는 환경을 발견"""
+
+def measure(func: Callable, repeat: int, budget: float) -> Dict[str, Any]:
+    """
+    반복 측정 (최소 1회, repeat회 또는 누적 budget초까지)
+
+    Returns:
+        min, median, mean, stdev, runs(회차별 초)
+    """
+    runs = []
+    started = time.perf_counter()
+    while len(runs) < repeat:
+        run_started = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - run_started)
+        if time.perf_counter() - started >= budget:
+            break
+    return {
+        'min': min(runs),
+        'median': statistics.median(runs),
+        'mean': statistics.fmean(runs),
+        'stdev': statistics.stdev(runs) if len(runs) > 1 else 0.0,
+        'runs': runs
+    }
+
+@contextlib.contextmanager
+def working_directory(path: Path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+def run_case(item: Case, ctx: Context, size: str, repeat: int, budget: float) -> Dict[str, Any]:
+    result = {'name': item.full_name, 'size': size if item.sized else None, 'rows': ctx.rows if item.sized else None}
+
+    missing = missing_requirement(item.requires)
+    if missing:
+        return {**result, 'status': 'skipped', 'reason': f"{missing} 미설치"}
+    if item.max_rows is not None and ctx.rows > item.max_rows:
+        return {**result, 'status': 'skipped', 'reason': f"{item.max_rows:,}행 초과"}
+
+    try:
+        func = item.setup(ctx)
+        # 첫 호출(임포트, 캐시 준비)은 측정에서 제외
+        func()
+        return {**result, 'status': 'ok', **measure(func, repeat, budget)}
+    except SkipCase as e:
+        return {**result, 'status': 'skipped', 'reason': str(e)}
+    except Exception as e:
+        return {**result, 'status': 'error', 'reason': f"{type(e).__name__}: {e}"}
+
+def git_revision() -> Dict[str, Any]:
+    def git(*args):
+        try:
+            return subprocess.run(['git', *args], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=10).stdout.strip()
+        except Exception:
+            return ''
+    return {
+        'commit': git('rev-parse', '--short', 'HEAD') or 'unknown',
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no'))
+    }
+
+def environment() -> Dict[str, Any]:
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        **git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__
+    }
+
+def select_cases(patterns: Optional[str]) -> List[Case]:
+    if not patterns:
+        return list(CASES)
+    wanted = [p.strip() for p in patterns.split(',') if p.strip()]
+    return [c for c in CASES if any(p in c.full_name for p in wanted)]
+
+def run_suite(cases: List[Case], sizes: List[str], repeat: int, budget: float, quiet: bool = False) -> List[Dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, working_directory(Path(tmp)):
+        sized = [c for c in cases if c.sized]
+        for size in sizes:
+            if not sized:
+                break
+            if not quiet:
+                print(f"📊 {size} ({SIZES[size]:,}행) 데이터 생성 중...")
+            ctx = Context(make_ohlcv(SIZES[size]), Path(tmp))
+            for item in sized:
+                result = run_case(item, ctx, size, repeat, budget)
+                results.append(result)
+                if not quiet:
+                    print_result(result)
+            del ctx
+
+        unsized = [c for c in cases if not c.sized]
+        if unsized and not quiet:
+            print("📊 크기 무관 케이스")
+        for item in unsized:
+            result = run_case(item, Context(None, Path(tmp)), '', repeat, budget)
+            results.append(result)
+            if not quiet:
+                print_result(result)
+    return results
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+def print_result(result: Dict[str, Any]):
+    label = f"{result['name']}" + (f" [{result['size']}]" if result['size'] else '')
+    if result['status'] == 'ok':
+        print(f"   {label:<40} {format_seconds(result['min']):>12} (median {format_seconds(result['median'])}, {len(result['runs'])}회)")
+    else:
+        icon = '⏭️' if result['status'] == 'skipped' else '❌'
+        print(f"   {icon} {label:<38} {result['status']}: {result['reason']}")
+
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float) -> int:
+    """
+    두 결과 파일의 케이스별 최소 시간 비교
+
+    Returns:
+        threshold 비율 이상 느려진 케이스 수
+    """
+    key = lambda r: (r['name'], r['size'])
+    base_results = {key(r): r for r in base['results'] if r['status'] == 'ok'}
+    regressions = 0
+
+    print(f"\n🔍 {base['environment']['commit']} → {head['environment']['commit']}"
+          f"{' (수정됨)' if head['environment'].get('dirty') else ''}")
+    print(f"{'case':<42}{'before':>12}{'after':>12}{'ratio':>9}")
+    for result in head['results']:
+        before = base_results.get(key(result))
+        if result['status'] != 'ok' or before is None:
+            continue
+        ratio = result['min'] / before['min'] if before['min'] else float('inf')
+        mark = ''
+        if ratio >= 1 + threshold:
+            mark = ' ⚠️'
+            regressions += 1
+        elif ratio <= 1 / (1 + threshold):
+            mark = ' 🚀'
+        label = result['name'] + (f" [{result['size']}]" if result['size'] else '')
+        print(f"{label:<42}{format_seconds(before['min']):>12}{format_seconds(result['min']):>12}{ratio:>8.2f}x{mark}")
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Juppelin 벤치마크 모음')
+    parser.add_argument('--sizes', default='10k,1m', help=f"데이터 크기 (쉼표 구분, 사용 가능: {', '.join(SIZES)})")
+    parser.add_argument('--filter', help='케이스 이름에 포함된 문자열 (쉼표 구분, 예: indicators,io.load)')
+    parser.add_argument('--repeat', type=int, default=5, help='케이스당 최대 반복 횟수')
+    parser.add_argument('--budget', type=float, default=10.0, help='케이스당 최대 측정 시간(초, 최소 1회는 실행)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/<날짜>_<커밋>.json)')
+    parser.add_argument('--compare', help='비교 기준 결과 JSON')
+    parser.add_argument('--against', help='--compare와 함께: 실행하지 않고 이 결과 JSON과 비교')
+    parser.add_argument('--threshold', type=float, default=0.1, help='회귀로 표시할 느려짐 비율 (기본 0.1 = 10%%)')
+    parser.add_argument('--list', action='store_true', help='케이스 목록만 출력')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    cases = select_cases(args.filter)
+    if args.list:
+        for item in cases:
+            notes = [f"requires {', '.join('/'.join(r) if isinstance(r, tuple) else r for r in item.requires)}"] if item.requires else []
+            if item.max_rows:
+                notes.append(f"max {item.max_rows:,} rows")
+            if not item.sized:
+                notes.append('size independent')
+            print(f"{item.full_name:<32} {'; '.join(notes)}")
+        return 0
+
+    if args.against:
+        if not args.compare:
+            parser.error('--against는 --compare와 함께 사용')
+        base = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        head = json.loads(Path(args.against).read_text(encoding='utf-8'))
+        return 1 if compare(base, head, args.threshold) else 0
+
+    sizes = [s.strip().lower() for s in args.sizes.split(',') if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"알 수 없는 크기: {', '.join(unknown)}")
+
+    # 서비스 INFO 로그가 측정에 섞이지 않도록
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    report = {
+        'environment': environment(),
+        'settings': {'sizes': sizes, 'repeat': args.repeat, 'budget': args.budget, 'filter': args.filter},
+        'results': run_suite(cases, sizes, args.repeat, args.budget, quiet=args.json)
+    }
+
+    output = Path(args.output) if args.output else Path(RESULTS_DIR) / (
+        f"{datetime.now():%Y%m%d-%H%M%S}_{report['environment']['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"\n💾 결과 저장: {output}")
+
+    errors = sum(1 for r in report['results'] if r['status'] == 'error')
+    regressions = 0
+    if args.compare:
+        regressions = compare(json.loads(Path(args.compare).read_text(encoding='utf-8')), report, args.threshold)
+    return 1 if errors or regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,7 @@ Juppelin 실행 스크립트
 
 import os
 import sys
+import argparse
 import subprocess
 import shutil
 from pathlib import Path
@@ -83,8 +84,19 @@ def check_directory_structure():
     for directory in required_dirs:
         Path(directory).mkdir(parents=True, exist_ok=True)
 
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Juppelin 실행 스크립트")
+    parser.add_argument("--production", action="store_true",
+                        help="개발 서버 대신 eventlet/gevent 워커 기반 프로덕션 서버로 실행")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="프로덕션 워커 프로세스 수 (기본값: JUPPELIN_WORKERS 또는 1)")
+    return parser.parse_args()
+
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+
     print("🚀 Juppelin 시작 중...")
     print("=" * 50)
     
@@ -113,15 +125,21 @@ def main():
     print("=" * 50)
     
     venv_python = get_venv_python()
-    app_path = Path("backend/app.py")
+    app_path = Path("backend/server.py") if args.production else Path("backend/app.py")
     
     if not app_path.exists():
-        print("❌ backend/app.py 파일을 찾을 수 없습니다.")
+        print(f"❌ {app_path} 파일을 찾을 수 없습니다.")
         return 1
     
+    command = [venv_python, str(app_path)]
+    if args.production:
+        print("🏭 프로덕션 모드로 실행합니다.")
+        if args.workers:
+            command += ["--workers", str(args.workers)]
+    
     try:
         # Flask 서버 실행
-        subprocess.run([venv_python, str(app_path)], check=True)
+        subprocess.run(command, check=True)
     except KeyboardInterrupt:
         print("\n👋 Juppelin 서버가 종료되었습니다.")
     except subprocess.CalledProcessError as e:
@@ -5,49 +5,201 @@ User Functions Library
 
 import sys
 import os
+import logging
+import time
+import contextlib
 import pandas as pd
 import numpy as np
-from typing import Optional, Union
+from typing import Optional, Union, Dict, Any, List
 
 # 백엔드 서비스 모듈 경로 추가
 backend_path = os.path.join(os.path.dirname(__file__), '..', 'backend')
-sys.path.append(backend_path)
+if backend_path not in sys.path:
+    sys.path.append(backend_path)
 
-# 서비스 모듈들을 안전하게 임포트
+# 서비스 인스턴스는 첫 사용 시 생성 (plotly/requests 등 무거운 임포트와
+# 디렉토리 생성을 지연시켜 차트를 쓰지 않는 셀의 시작 시간을 줄임)
 _data_service = None
 _tech_indicators = None
 _viz_service = None
-_services_loaded = False
+_resampling_service = None
 
-try:
-    # 백엔드 서비스 모듈 경로 추가
-    backend_path = os.path.join(os.path.dirname(__file__), '..', 'backend')
-    if backend_path not in sys.path:
-        sys.path.append(backend_path)
+def _get_data_service():
+    """데이터 수집 서비스 인스턴스 반환 (첫 호출 시 생성)"""
+    global _data_service
+    if _data_service is None:
+        try:
+            from services.data_collection import DataCollectionService
+            _data_service = DataCollectionService()
+        except Exception as e:
+            raise ImportError(f"데이터 수집 서비스를 사용할 수 없습니다: {str(e)}")
+    return _data_service
+
+def _get_tech_indicators():
+    """기술적 지표 서비스 인스턴스 반환 (첫 호출 시 생성)"""
+    global _tech_indicators
+    if _tech_indicators is None:
+        try:
+            from services.technical_indicators import TechnicalIndicators
+            _tech_indicators = TechnicalIndicators()
+        except Exception as e:
+            raise ImportError(f"기술적 지표 서비스를 사용할 수 없습니다: {str(e)}")
+    return _tech_indicators
+
+def _get_viz_service():
+    """시각화 서비스 인스턴스 반환 (첫 호출 시 생성)"""
+    global _viz_service
+    if _viz_service is None:
+        try:
+            from services.visualization import VisualizationService
+            _viz_service = VisualizationService()
+        except Exception as e:
+            raise ImportError(f"시각화 서비스를 사용할 수 없습니다: {str(e)}")
+    return _viz_service
+
+def _get_resampling_service():
+    """봉 간격 변환(롤업) 서비스 인스턴스 반환 (첫 호출 시 생성)"""
+    global _resampling_service
+    if _resampling_service is None:
+        try:
+            from services.resampling import ResamplingService
+            _resampling_service = ResamplingService(_get_data_service())
+        except Exception as e:
+            raise ImportError(f"봉 간격 변환 서비스를 사용할 수 없습니다: {str(e)}")
+    return _resampling_service
+
+# 성능 모드: 진행 상황 출력과 서비스 INFO 로그를 끔 (반복 호출 시 I/O 오버헤드 제거)
+_performance_mode = False
+# 성능 모드를 켜기 전 서비스 로거 레벨 (끌 때 복원)
+_services_log_level = logging.NOTSET
+
+def _progress(message: str):
+    """진행 상황 출력 (성능 모드에서는 생략)"""
+    if not _performance_mode:
+        print(message)
+
+def set_performance_mode(enabled: bool = True) -> bool:
+    """
+    성능 모드 설정 (세션 전체 적용, 다음 셀부터는 JUPPELIN_PERFORMANCE_MODE로 이어짐)
+    
+    사용 예시:
+        set_performance_mode(True)
+        for symbol_data in datasets:
+            rsi = calculate_rsi(symbol_data)
+    
+    Args:
+        enabled: 성능 모드 사용 여부 (기본값: True)
     
-    from services.data_collection import DataCollectionService
-    from services.technical_indicators import TechnicalIndicators
-    from services.visualization import VisualizationService
+    Returns:
+        이전 설정값
+    """
+    global _performance_mode, _services_log_level
+    previous = _performance_mode
+    _performance_mode = enabled
     
-    # 전역 서비스 인스턴스
-    _data_service = DataCollectionService()
-    _tech_indicators = TechnicalIndicators()
-    _viz_service = VisualizationService()
-    _services_loaded = True
+    # 서비스 로거의 INFO 레코드 생성 자체를 생략 (경고/오류는 유지), 끌 때는 켜기 전 레벨로 복원
+    services_logger = logging.getLogger('services')
+    if enabled and not previous:
+        _services_log_level = services_logger.level
+        services_logger.setLevel(logging.WARNING)
+    elif not enabled and previous:
+        services_logger.setLevel(_services_log_level)
+    return previous
+
+def _session_settings() -> Dict[str, Any]:
+    """다음 셀 실행에 이어 줄 설정 (execute_with_result가 실행 지표와 함께 전달)"""
+    return {'performance_mode': _performance_mode}
+
+# 셀마다 새 프로세스이므로 이전 셀에서 켠 성능 모드는 환경 변수로 복원
+if os.getenv('JUPPELIN_PERFORMANCE_MODE', '0').lower() in ('1', 'true', 'yes', 'on'):
+    set_performance_mode(True)
+
+@contextlib.contextmanager
+def performance_mode():
+    """
+    블록 안에서만 성능 모드 사용
     
-except ImportError as e:
-    pass  # 서비스 모듈 임포트 실패 시 무시
-except Exception as e:
-    pass  # 서비스 초기화 실패 시 무시
+    사용 예시:
+        with performance_mode():
+            results = {p: calculate_rsi(data, period=p) for p in range(5, 50)}
+    """
+    previous = set_performance_mode(True)
+    try:
+        yield
+    finally:
+        set_performance_mode(previous)
+
+def _compute_backend_module():
+    try:
+        from services import compute_backend
+    except Exception as e:
+        raise ImportError(f"연산 백엔드 서비스를 사용할 수 없습니다: {str(e)}")
+    return compute_backend
+
+def set_compute_backend(name: str = 'pandas') -> str:
+    """
+    연산 백엔드 설정 (세션 전체 적용, 다음 셀에도 유지)
+
+    지표 계산의 롤링/EWM 윈도우와 상관관계 계산을 선택한 백엔드로 실행합니다. 입력과 결과는 그대로 pandas DataFrame/Series입니다.
+
+    사용 예시:
+        set_compute_backend('polars')
+        rsi = calculate_rsi(data)   # polars로 계산한 pandas Series
+        set_compute_backend('pandas')
+
+    Args:
+        name: 'pandas' (기본값) 또는 'polars' (pip install polars 필요)
+
+    Returns:
+        이전 백엔드 이름
+    """
+    module = _compute_backend_module()
+    previous = module.get_backend().name
+    try:
+        module.set_backend(name)
+    except Exception as e:
+        print(f"❌ 연산 백엔드 변경 실패: {str(e)}")
+        raise
+    _progress(f"🧮 연산 백엔드: {previous} → {name.lower()}")
+    return previous
+
+@contextlib.contextmanager
+def compute_backend(name: str):
+    """
+    블록 안에서만 연산 백엔드 사용
+
+    사용 예시:
+        with compute_backend('polars'):
+            bb = calculate_bollinger_bands(data)
+    """
+    module = _compute_backend_module()
+    previous = module.get_backend().name
+    module.set_backend(name)
+    try:
+        yield
+    finally:
+        module.set_backend(previous)
 
 def test_services():
-    """서비스 로드 상태 테스트"""
+    """서비스 로드 상태 테스트 (지연 생성된 서비스를 모두 로드해 확인)"""
     try:
-        print(f"Services loaded: {_services_loaded}")
-        print(f"Data service: {_data_service is not None}")
-        print(f"Tech indicators: {_tech_indicators is not None}")
-        print(f"Viz service: {_viz_service is not None}")
-        return _services_loaded
+        status = {}
+        for name, getter in [
+            ('Data service', _get_data_service),
+            ('Tech indicators', _get_tech_indicators),
+            ('Viz service', _get_viz_service)
+        ]:
+            try:
+                getter()
+                status[name] = True
+            except ImportError:
+                status[name] = False
+        
+        services_loaded = all(status.values())
+        print(f"Services loaded: {services_loaded}")
+        for name, loaded in status.items():
+            print(f"{name}: {loaded}")
+        return services_loaded
     except Exception as e:
         print(f"테스트 함수 오류: {str(e)}")
         import traceback
@@ -97,15 +249,14 @@ def calculate_macd(
         MACD 데이터가 포함된 DataFrame
     """
     try:
-        print(f"📊 MACD 계산 중... (fast={fast_period}, slow={slow_period}, signal={signal_period})")
+        _progress(f"📊 MACD 계산 중... (fast={fast_period}, slow={slow_period}, signal={signal_period})")
         
-        if _tech_indicators is None:
-            raise ImportError("기술적 지표 서비스를 사용할 수 없습니다.")
+        tech_indicators = _get_tech_indicators()
         
         price_data = data[price_column]
-        macd_result = _tech_indicators.calculate_macd(price_data, fast_period, slow_period, signal_period)
+        macd_result = tech_indicators.calculate_macd(price_data, fast_period, slow_period, signal_period)
         
-        print(f"✅ MACD 계산 완료: {len(macd_result)}행")
+        _progress(f"✅ MACD 계산 완료: {len(macd_result)}행")
         return macd_result
         
     except Exception as e:
@@ -133,15 +284,14 @@ def calculate_rsi(
         RSI 값이 포함된 Series
     """
     try:
-        print(f"📊 RSI 계산 중... (period={period})")
+        _progress(f"📊 RSI 계산 중... (period={period})")
         
-        if _tech_indicators is None:
-            raise ImportError("기술적 지표 서비스를 사용할 수 없습니다.")
+        tech_indicators = _get_tech_indicators()
         
         price_data = data[price_column]
-        rsi_result = _tech_indicators.calculate_rsi(price_data, period)
+        rsi_result = tech_indicators.calculate_rsi(price_data, period)
         
-        print(f"✅ RSI 계산 완료: {len(rsi_result)}행")
+        _progress(f"✅ RSI 계산 완료: {len(rsi_result)}행")
         return rsi_result
         
     except Exception as e:
@@ -171,15 +321,14 @@ def calculate_bollinger_bands(
         볼린저 밴드 데이터가 포함된 DataFrame
     """
     try:
-        print(f"📊 볼린저 밴드 계산 중... (period={period}, std_dev={std_dev})")
+        _progress(f"📊 볼린저 밴드 계산 중... (period={period}, std_dev={std_dev})")
         
-        if _tech_indicators is None:
-            raise ImportError("기술적 지표 서비스를 사용할 수 없습니다.")
+        tech_indicators = _get_tech_indicators()
         
         price_data = data[price_column]
-        bb_result = _tech_indicators.calculate_bollinger_bands(price_data, period, std_dev)
+        bb_result = tech_indicators.calculate_bollinger_bands(price_data, period, std_dev)
         
-        print(f"✅ 볼린저 밴드 계산 완료: {len(bb_result)}행")
+        _progress(f"✅ 볼린저 밴드 계산 완료: {len(bb_result)}행")
         return bb_result
         
     except Exception as e:
@@ -207,21 +356,112 @@ def calculate_sma(
         SMA 값이 포함된 Series
     """
     try:
-        print(f"📊 SMA{period} 계산 중...")
+        _progress(f"📊 SMA{period} 계산 중...")
         
-        if _tech_indicators is None:
-            raise ImportError("기술적 지표 서비스를 사용할 수 없습니다.")
+        tech_indicators = _get_tech_indicators()
         
         price_data = data[price_column]
-        sma_result = _tech_indicators.calculate_sma(price_data, period)
+        sma_result = tech_indicators.calculate_sma(price_data, period)
         
-        print(f"✅ SMA{period} 계산 완료: {len(sma_result)}행")
+        _progress(f"✅ SMA{period} 계산 완료: {len(sma_result)}행")
         return sma_result
         
     except Exception as e:
         print(f"❌ SMA{period} 계산 실패: {str(e)}")
         raise
 
+def _correlation_module():
+    try:
+        from services import correlation
+    except Exception as e:
+        raise ImportError(f"상관관계 서비스를 사용할 수 없습니다: {str(e)}")
+    return correlation
+
+def calculate_correlation(
+    data: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+    method: str = 'pearson',
+    window: Optional[int] = None,
+    pairs: Optional[List[tuple]] = None,
+    returns: bool = True,
+    min_periods: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    심볼 간 상관계수 행렬 또는 롤링 상관계수 계산
+    
+    사용 예시:
+        prices = {s: load_local_data(f'{s}_1h.csv') for s in ['BTCUSDT', 'ETHUSDT', 'SOLUSDT']}
+        matrix = calculate_correlation(prices)                             # 로그 수익률 상관계수 행렬
+        rolling = calculate_correlation(prices, window=720, pairs=[('BTCUSDT', 'ETHUSDT')])
+        ranked = calculate_correlation(prices, method='spearman')
+    
+    Args:
+        data: {심볼: OHLCV DataFrame} (close 사용) 또는 심볼별 가격/수익률 컬럼 DataFrame
+        method: 'pearson' 또는 'spearman'
+        window: 롤링 윈도우 길이 (생략 시 전체 기간 행렬)
+        pairs: 롤링 상관계수를 계산할 (심볼a, 심볼b) 목록 (생략 시 모든 쌍)
+        returns: True면 가격에서 로그 수익률을 계산한 뒤 상관계수 계산 (이미 수익률이면 False)
+        min_periods: 최소 유효 행 수 (기본값: 행렬은 1, 롤링은 window)
+    
+    Returns:
+        상관계수 행렬 DataFrame 또는 (symbol_a, symbol_b) 컬럼의 롤링 상관계수 DataFrame
+    """
+    try:
+        correlation = _correlation_module()
+        panel = correlation.log_returns(data) if returns else correlation.price_panel(data)
+        
+        if window is None:
+            _progress(f"📊 상관계수 행렬 계산 중... ({panel.shape[1]}개 심볼, {method})")
+            result = correlation.correlation_matrix(panel, method, min_periods=min_periods or 1)
+            _progress(f"✅ 상관계수 행렬 계산 완료: {result.shape[0]}x{result.shape[1]}")
+        else:
+            _progress(f"📊 롤링 상관계수 계산 중... (window={window}, {method})")
+            result = correlation.rolling_correlation(panel, window, method, pairs=pairs, min_periods=min_periods)
+            _progress(f"✅ 롤링 상관계수 계산 완료: {result.shape[1]}쌍 x {len(result)}행")
+        return result
+        
+    except Exception as e:
+        print(f"❌ 상관계수 계산 실패: {str(e)}")
+        raise
+
+def top_correlations(
+    data: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+    k: int = 10,
+    method: str = 'pearson',
+    absolute: bool = True,
+    ascending: bool = False,
+    returns: bool = True
+) -> pd.DataFrame:
+    """
+    상관계수가 가장 높은(또는 낮은) 심볼 쌍 k개
+    
+    사용 예시:
+        top_correlations(prices, k=20)                               # 절댓값 기준 상위 20쌍
+        top_correlations(prices, k=10, absolute=False, ascending=True)  # 가장 음의 상관인 10쌍
+    
+    Args:
+        data: {심볼: OHLCV DataFrame} 또는 심볼별 가격/수익률 컬럼 DataFrame
+        k: 쌍 개수
+        method: 'pearson' 또는 'spearman'
+        absolute: 절댓값 기준 순위
+        ascending: True면 가장 낮은 쌍부터
+        returns: True면 가격에서 로그 수익률을 계산한 뒤 상관계수 계산
+    
+    Returns:
+        symbol_a, symbol_b, correlation 컬럼 DataFrame
+    """
+    try:
+        correlation = _correlation_module()
+        panel = correlation.log_returns(data) if returns else correlation.price_panel(data)
+        
+        _progress(f"📊 상관 쌍 순위 계산 중... ({panel.shape[1]}개 심볼, {method})")
+        result = correlation.top_pairs(panel, k, method, absolute=absolute, ascending=ascending)
+        _progress(f"✅ 상관 쌍 {len(result)}개")
+        return result
+        
+    except Exception as e:
+        print(f"❌ 상관 쌍 순위 계산 실패: {str(e)}")
+        raise
+
 # 시각화 함수들
 
 def plot_candlestick(
@@ -229,7 +469,8 @@ def plot_candlestick(
     symbol: str = None,
     start_candles: int = 0,
     num_candles: int = 100,
-    show_volume: bool = True
+    show_volume: bool = True,
+    candle_mode: str = 'auto'
 ) -> None:
     """
     캔들스틱 차트 표시
@@ -237,6 +478,7 @@ def plot_candlestick(
     사용 예시:
         plot_candlestick(data, symbol='BTCUSDT')
         plot_candlestick(data, num_candles=50, show_volume=False)
+        plot_candlestick(data, num_candles=500_000)              # 캔들 수에 따라 WebGL 표현으로 자동 전환
     
     Args:
         data: OHLCV 데이터
@@ -244,9 +486,10 @@ def plot_candlestick(
         start_candles: 시작 캔들 인덱스
         num_candles: 표시할 캔들 개수
         show_volume: 거래량 표시 여부
+        candle_mode: 캔들 표현 ('auto', 'candlestick', 'ohlc', 'webgl', 'line')
     """
     try:
-        print(f"📊 캔들스틱 차트 생성 중...")
+        _progress(f"📊 캔들스틱 차트 생성 중...")
         
         # 데이터 필터링
         if len(data) > num_candles:
@@ -255,30 +498,130 @@ def plot_candlestick(
         else:
             filtered_data = data
         
-        if _viz_service is None:
-            raise ImportError("시각화 서비스를 사용할 수 없습니다.")
+        viz_service = _get_viz_service()
         
         title = f"{symbol} 캔들스틱 차트" if symbol else "캔들스틱 차트"
         
-        chart_data = _viz_service.create_candlestick_chart(
+        chart_data = viz_service.create_candlestick_chart(
             filtered_data, 
             title=title,
-            show_volume=show_volume
+            show_volume=show_volume,
+            candle_mode=candle_mode
         )
         
         # 차트 표시 (현재는 JSON 출력, 나중에 실제 차트로 변경)
-        print(f"✅ 캔들스틱 차트 생성 완료")
-        print(f"📈 표시된 캔들 수: {len(filtered_data)}")
+        _progress(f"✅ 캔들스틱 차트 생성 완료")
+        _progress(f"📈 표시된 캔들 수: {len(filtered_data)}")
         
         # 간단한 통계 출력
-        print(f"📊 기간 통계:")
-        print(f"   최고가: ${filtered_data['high'].max():.2f}")
-        print(f"   최저가: ${filtered_data['low'].min():.2f}")
-        print(f"   평균 거래량: {filtered_data['volume'].mean():.0f}")
+        _progress(f"📊 기간 통계:")
+        _progress(f"   최고가: ${filtered_data['high'].max():.2f}")
+        _progress(f"   최저가: ${filtered_data['low'].min():.2f}")
+        _progress(f"   평균 거래량: {filtered_data['volume'].mean():.0f}")
         
     except Exception as e:
         print(f"❌ 캔들스틱 차트 생성 실패: {str(e)}")
 
+def open_chart(
+    data: pd.DataFrame,
+    chart_id: Optional[str] = None,
+    symbol: Optional[str] = None,
+    show_volume: bool = True,
+    max_points: Optional[int] = None,
+    candle_mode: str = 'auto'
+) -> str:
+    """
+    서버 차트 세션으로 캔들스틱 차트 열기 (이후 update_chart는 바뀐 부분만 전송)
+    
+    사용 예시:
+        chart = open_chart(data, symbol='BTCUSDT', max_points=2000)
+        update_chart(chart, data.tail(3), overlays={'sma20': calculate_sma(data, 20)})
+    
+    Args:
+        data: OHLCV 데이터
+        chart_id: 차트 ID (생략 시 심볼/시각으로 생성, 같은 ID면 피겨 교체)
+        symbol: 심볼명 (제목용)
+        show_volume: 거래량 표시 여부
+        max_points: 트레이스별 최대 점 수 (넘으면 앞쪽부터 버림)
+        candle_mode: 캔들 표현 ('auto', 'candlestick', 'ohlc', 'webgl', 'line', 이후 update_chart도 같은 표현)
+    
+    Returns:
+        차트 ID
+    """
+    try:
+        import requests
+        
+        chart_id = chart_id or f"{symbol or 'chart'}-{int(time.time() * 1000)}"
+        title = f"{symbol} 캔들스틱 차트" if symbol else "캔들스틱 차트"
+        figure = _get_viz_service().create_candlestick_chart(
+            data, title=title, show_volume=show_volume, candle_mode=candle_mode
+        )
+        
+        response = requests.post(
+            f"{_server_url()}/api/charts/{chart_id}",
+            json={'figure': figure, 'max_points': max_points},
+            timeout=30
+        )
+        result = response.json()
+        if result.get('status') != 'success':
+            raise RuntimeError(result.get('error_message', '차트 열기 실패'))
+        
+        _progress(f"📊 차트 열림: {chart_id} ({len(data)}개 캔들)")
+        return chart_id
+        
+    except Exception as e:
+        print(f"❌ 차트 열기 실패: {str(e)}")
+        raise
+
+def update_chart(
+    chart_id: str,
+    data: Optional[pd.DataFrame] = None,
+    overlays: Optional[Dict[str, pd.Series]] = None
+) -> int:
+    """
+    열린 차트에 새 캔들/지표 오버레이 반영 (서버가 마지막 점 이후만 델타로 전송)
+    
+    사용 예시:
+        update_chart(chart, latest)                                   # 새 캔들 추가, 진행 중 캔들 교체
+        update_chart(chart, overlays={'sma50': calculate_sma(data, 50)})  # 오버레이 추가/갱신
+    
+    Args:
+        chart_id: open_chart가 반환한 차트 ID
+        data: 새(또는 갱신된) OHLCV 행 (마지막 캔들 이전 행은 무시, 서버가 차트의 캔들 표현에 맞춰 변환)
+        overlays: {트레이스 이름: 지표 Series} (처음이면 추가, 이후에는 새 점만 병합)
+    
+    Returns:
+        적용 후 차트 버전
+    """
+    try:
+        import requests
+        
+        from services.chart_session import to_plotly_values
+        
+        viz_service = _get_viz_service()
+        bodies = []
+        if data is not None and not data.empty:
+            candles = {'x': to_plotly_values(data.index)}
+            candles.update({c: to_plotly_values(data[c]) for c in ('open', 'high', 'low', 'close', 'volume')})
+            bodies.append({'op': 'candles', 'candles': candles})
+        for name, series in (overlays or {}).items():
+            bodies.append({'op': 'overlay', 'trace': viz_service.overlay_trace(series, name)})
+        
+        version = None
+        for body in bodies:
+            response = requests.post(f"{_server_url()}/api/charts/{chart_id}/delta", json=body, timeout=30)
+            result = response.json()
+            if result.get('status') != 'success':
+                raise RuntimeError(result.get('error_message', '차트 갱신 실패'))
+            version = result['version'] or version
+        
+        _progress(f"✅ 차트 갱신: {chart_id} (버전 {version})")
+        return version
+        
+    except Exception as e:
+        print(f"❌ 차트 갱신 실패: {str(e)}")
+        raise
+
 def plot_line(
     data: pd.DataFrame,
     columns: list = None,
@@ -302,28 +645,27 @@ def plot_line(
             numeric_cols = data.select_dtypes(include=[np.number]).columns.tolist()
             columns = numeric_cols[:5]  # 최대 5개까지
         
-        print(f"📊 선 그래프 생성 중... (컬럼: {columns})")
+        _progress(f"📊 선 그래프 생성 중... (컬럼: {columns})")
         
-        if _viz_service is None:
-            raise ImportError("시각화 서비스를 사용할 수 없습니다.")
+        viz_service = _get_viz_service()
         
         chart_title = title or f"선 그래프 ({', '.join(columns)})"
         
-        chart_data = _viz_service.create_line_chart(
+        chart_data = viz_service.create_line_chart(
             data,
             columns=columns,
             title=chart_title
         )
         
-        print(f"✅ 선 그래프 생성 완료")
-        print(f"📈 표시된 라인: {len(columns)}개")
+        _progress(f"✅ 선 그래프 생성 완료")
+        _progress(f"📈 표시된 라인: {len(columns)}개")
         
         # 각 컬럼의 통계 출력
         for col in columns:
             if col in data.columns:
                 values = data[col].dropna()
                 if len(values) > 0:
-                    print(f"   {col}: 평균 {values.mean():.4f}, 최대 {values.max():.4f}, 최소 {values.min():.4f}")
+                    _progress(f"   {col}: 평균 {values.mean():.4f}, 최대 {values.max():.4f}, 최소 {values.min():.4f}")
         
     except Exception as e:
         print(f"❌ 선 그래프 생성 실패: {str(e)}")
@@ -331,7 +673,8 @@ def plot_line(
 def plot_technical_analysis(
     data: pd.DataFrame,
     indicators: list = ['macd', 'rsi'],
-    symbol: str = None
+    symbol: str = None,
+    candle_mode: str = 'auto'
 ) -> None:
     """
     기술적 분석 복합 차트 표시
@@ -344,9 +687,10 @@ def plot_technical_analysis(
         data: OHLCV 데이터
         indicators: 표시할 기술 지표 리스트
         symbol: 심볼명
+        candle_mode: 캔들 표현 ('auto', 'candlestick', 'ohlc', 'webgl', 'line')
     """
     try:
-        print(f"📊 기술적 분석 차트 생성 중... (지표: {indicators})")
+        _progress(f"📊 기술적 분석 차트 생성 중... (지표: {indicators})")
         
         # 지표별 계산
         indicator_data = {}
@@ -364,98 +708,615 @@ def plot_technical_analysis(
             print("❌ 유효한 지표가 없습니다.")
             return
         
-        if _viz_service is None:
-            raise ImportError("시각화 서비스를 사용할 수 없습니다.")
+        viz_service = _get_viz_service()
         
         title = f"{symbol} 기술적 분석" if symbol else "기술적 분석"
         
-        chart_data = _viz_service.create_technical_analysis_chart(
+        chart_data = viz_service.create_technical_analysis_chart(
             data,
             indicators=indicator_data,
-            title=title
+            title=title,
+            candle_mode=candle_mode
         )
         
-        print(f"✅ 기술적 분석 차트 생성 완료")
-        print(f"📈 포함된 지표: {len(indicator_data)}개")
+        _progress(f"✅ 기술적 분석 차트 생성 완료")
+        _progress(f"📈 포함된 지표: {len(indicator_data)}개")
         
     except Exception as e:
         print(f"❌ 기술적 분석 차트 생성 실패: {str(e)}")
 
 def plot_correlation_heatmap(
-    data: pd.DataFrame,
-    assets: list = None
+    data: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+    assets: list = None,
+    method: str = 'pearson',
+    returns: bool = False,
+    cluster: bool = False
 ) -> None:
     """
     상관관계 히트맵 표시
     
     사용 예시:
         plot_correlation_heatmap(combined_data)
+        plot_correlation_heatmap(prices, returns=True, cluster=True)   # 로그 수익률, 군집 순서
+        plot_correlation_heatmap(calculate_correlation(prices), cluster=True)  # 계산한 행렬
     
     Args:
-        data: 데이터
+        data: 데이터, {심볼: OHLCV DataFrame} 또는 calculate_correlation 결과 행렬
         assets: 자산 리스트 (컬럼 필터링용)
+        method: 'pearson' 또는 'spearman'
+        returns: True면 가격에서 로그 수익률을 계산한 뒤 상관계수 계산
+        cluster: 비슷한 자산끼리 모이도록 행/열 재배열
     """
     try:
-        print(f"📊 상관관계 히트맵 생성 중...")
+        _progress(f"📊 상관관계 히트맵 생성 중...")
+        
+        is_matrix = isinstance(data, pd.DataFrame) and _is_correlation_matrix(data)
+        if isinstance(data, dict) or returns:
+            correlation = _correlation_module()
+            data = correlation.log_returns(data) if returns else correlation.price_panel(data)
         
         # 자산별 필터링
         if assets:
             available_cols = [col for col in assets if col in data.columns]
-            filtered_data = data[available_cols]
+            filtered_data = data.loc[available_cols, available_cols] if is_matrix else data[available_cols]
         else:
             # 숫자형 컬럼만 선택
             filtered_data = data.select_dtypes(include=[np.number])
         
-        if _viz_service is None:
-            raise ImportError("시각화 서비스를 사용할 수 없습니다.")
+        viz_service = _get_viz_service()
         
-        chart_data = _viz_service.create_correlation_heatmap(
+        chart_data = viz_service.create_correlation_heatmap(
             filtered_data,
-            title="상관관계 히트맵"
+            title="상관관계 히트맵",
+            method=method,
+            cluster=cluster,
+            is_matrix=is_matrix
         )
         
-        print(f"✅ 상관관계 히트맵 생성 완료")
-        print(f"📈 분석된 컬럼: {len(filtered_data.columns)}개")
+        _progress(f"✅ 상관관계 히트맵 생성 완료")
+        _progress(f"📈 분석된 컬럼: {len(filtered_data.columns)}개")
         
     except Exception as e:
         print(f"❌ 상관관계 히트맵 생성 실패: {str(e)}")
 
+def _is_correlation_matrix(data: pd.DataFrame) -> bool:
+    """행/열 라벨이 같고 대각선이 1인 정사각 행렬인지 (calculate_correlation 결과)"""
+    if data.shape[0] != data.shape[1] or data.shape[0] < 2 or not data.index.equals(data.columns):
+        return False
+    diagonal = np.diagonal(data.to_numpy(dtype=float))
+    return bool(np.all(np.isnan(diagonal) | np.isclose(diagonal, 1.0)))
+
+# 백테스트 함수들
+
+def backtest(
+    data: pd.DataFrame,
+    strategy: str = 'macd',
+    signals: Optional[Union[pd.Series, np.ndarray]] = None,
+    fee_rate: float = 0.001,
+    slippage: float = 0.0005,
+    initial_capital: float = 10000.0,
+    allow_short: bool = False,
+    price_column: str = 'close',
+    **strategy_params
+) -> Dict[str, Any]:
+    """
+    시그널 기반 백테스트 실행
+    
+    사용 예시:
+        result = backtest(data, strategy='macd')
+        result = backtest(data, strategy='rsi', period=14, lower=25, upper=75)
+        result['equity']
+    
+    Args:
+        data: OHLCV 데이터
+        strategy: 내장 전략 ('macd', 'rsi', 'sma_cross')
+        signals: 직접 만든 목표 포지션 (1=롱, 0=현금, -1=숏, NaN=유지). 지정 시 strategy 무시
+        fee_rate: 거래 수수료율 (기본값: 0.001)
+        slippage: 슬리피지 비율 (기본값: 0.0005)
+        initial_capital: 초기 자본 (기본값: 10000)
+        allow_short: 숏 포지션 허용 여부
+        price_column: 가격 컬럼명 (기본값: 'close')
+        **strategy_params: 전략 파라미터 (예: fast_period, slow_period, period, lower, upper)
+    
+    Returns:
+        equity(바별 자본 곡선 DataFrame), trades(체결 내역), stats(성과 지표) 딕셔너리
+    """
+    try:
+        label = 'custom' if signals is not None else strategy
+        _progress(f"📊 백테스트 실행 중... (strategy={label}, fee={fee_rate}, slippage={slippage})")
+        
+        try:
+            from services.backtest import BacktestEngine
+        except Exception as e:
+            raise ImportError(f"백테스트 서비스를 사용할 수 없습니다: {str(e)}")
+        
+        engine = BacktestEngine(fee_rate=fee_rate, slippage=slippage, initial_capital=initial_capital)
+        result = engine.backtest(
+            data,
+            positions=signals,
+            strategy=strategy,
+            allow_short=allow_short,
+            price_column=price_column,
+            **strategy_params
+        )
+        
+        stats = result['stats']
+        _progress(f"✅ 백테스트 완료: {len(data)}개 바, {stats['num_trades']}회 체결")
+        _progress(f"   총 수익률: {stats['total_return'] * 100:.2f}%, 샤프: {stats['sharpe']:.2f}, "
+                  f"최대 낙폭: {stats['max_drawdown'] * 100:.2f}%")
+        return result
+        
+    except Exception as e:
+        print(f"❌ 백테스트 실패: {str(e)}")
+        raise
+
+def optimize(
+    strategy: str,
+    data: pd.DataFrame,
+    grid: dict,
+    rank_by: str = 'sharpe',
+    max_workers: Optional[int] = None,
+    fee_rate: float = 0.001,
+    slippage: float = 0.0005,
+    allow_short: bool = False,
+    price_column: str = 'close'
+) -> pd.DataFrame:
+    """
+    파라미터 그리드 최적화 (프로세스 풀 병렬 백테스트)
+    
+    사용 예시:
+        results = optimize('macd', data, {
+            'fast_period': [8, 12, 16],
+            'slow_period': [21, 26, 34],
+            'signal_period': [7, 9, 11]
+        })
+        results = optimize('rsi', data, {'period': [7, 14, 21], 'lower': [20, 25, 30], 'upper': [70, 75, 80]})
+    
+    Args:
+        strategy: 내장 전략 ('macd', 'rsi', 'sma_cross')
+        data: OHLCV 데이터
+        grid: 파라미터별 후보 값 딕셔너리
+        rank_by: 순위 기준 지표 (기본값: 'sharpe')
+        max_workers: 워커 프로세스 수 (기본값: CPU 코어 수)
+        fee_rate: 거래 수수료율
+        slippage: 슬리피지 비율
+        allow_short: 숏 포지션 허용 여부
+        price_column: 가격 컬럼명
+    
+    Returns:
+        파라미터와 성과 지표(sharpe, max_drawdown, turnover 등)가 순위별로 정렬된 DataFrame
+    """
+    try:
+        try:
+            from services.optimization import GridOptimizer, expand_grid
+        except Exception as e:
+            raise ImportError(f"최적화 서비스를 사용할 수 없습니다: {str(e)}")
+        
+        optimizer = GridOptimizer(
+            max_workers=max_workers,
+            fee_rate=fee_rate,
+            slippage=slippage,
+            allow_short=allow_short,
+            price_column=price_column
+        )
+        total = len(expand_grid(grid))
+        _progress(f"📊 그리드 최적화 실행 중... (strategy={strategy}, 조합 {total}개, 워커 {optimizer.max_workers}개)")
+        
+        # 결과가 도착하는 대로 10% 단위 진행 상황 출력
+        step = max(1, -(-total // 10))
+        def report(done, total, row):
+            if done % step == 0 or done == total:
+                _progress(f"   진행: {done}/{total}")
+        
+        results = optimizer.optimize(strategy, data, grid, rank_by=rank_by, callback=report)
+        
+        _progress(f"✅ 그리드 최적화 완료: {len(results)}개 결과")
+        if not results.empty and rank_by in results.columns:
+            best = results.loc[:0, list(grid) + [rank_by]].to_dict('records')[0]
+            best_score = best.pop(rank_by)
+            _progress(f"   최적 파라미터: {best} ({rank_by}={best_score:.4f})")
+        return results
+        
+    except Exception as e:
+        print(f"❌ 그리드 최적화 실패: {str(e)}")
+        raise
+
+def walk_forward(
+    strategy: str,
+    data: pd.DataFrame,
+    grid: dict,
+    train_size: int,
+    test_size: int,
+    step: Optional[int] = None,
+    anchored: bool = False,
+    rank_by: str = 'sharpe',
+    max_workers: Optional[int] = None,
+    fee_rate: float = 0.001,
+    slippage: float = 0.0005
+) -> pd.DataFrame:
+    """
+    워크포워드 평가 (학습 구간 최적화 → 다음 검증 구간 성과 측정 반복)
+    
+    사용 예시:
+        wf = walk_forward('rsi', data, {'period': [7, 14, 21], 'lower': [25, 30]},
+                          train_size=5000, test_size=1000)
+    
+    Args:
+        strategy: 내장 전략 ('macd', 'rsi', 'sma_cross')
+        data: OHLCV 데이터
+        grid: 파라미터별 후보 값 딕셔너리
+        train_size: 학습 구간 바 수
+        test_size: 검증 구간 바 수
+        step: 분할 이동 간격 (기본값: test_size)
+        anchored: 학습 구간 시작을 처음에 고정 (확장 윈도우)
+        rank_by: 학습 구간 최적화 기준 지표 (기본값: 'sharpe')
+        max_workers: 워커 프로세스 수 (기본값: CPU 코어 수)
+        fee_rate: 거래 수수료율
+        slippage: 슬리피지 비율
+    
+    Returns:
+        분할별 최적 파라미터와 학습/검증 성과 DataFrame
+    """
+    try:
+        try:
+            from services.evaluation import StrategyEvaluator
+        except Exception as e:
+            raise ImportError(f"평가 서비스를 사용할 수 없습니다: {str(e)}")
+        
+        _progress(f"📊 워크포워드 평가 중... (strategy={strategy}, train={train_size}, test={test_size})")
+        
+        evaluator = StrategyEvaluator(max_workers=max_workers, fee_rate=fee_rate, slippage=slippage)
+        results = evaluator.walk_forward(
+            strategy, data, grid, train_size, test_size,
+            step=step, anchored=anchored, rank_by=rank_by
+        )
+        
+        _progress(f"✅ 워크포워드 평가 완료: {len(results)}개 분할")
+        _progress(f"   검증 구간 평균 수익률: {results['test_total_return'].mean() * 100:.2f}%, "
+                  f"평균 샤프: {results['test_sharpe'].mean():.2f}")
+        return results
+        
+    except Exception as e:
+        print(f"❌ 워크포워드 평가 실패: {str(e)}")
+        raise
+
+def monte_carlo(
+    data: pd.DataFrame,
+    strategy: str = 'macd',
+    n_resamples: int = 1000,
+    block_size: int = 1,
+    memory_budget_mb: float = 256.0,
+    max_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    fee_rate: float = 0.001,
+    slippage: float = 0.0005,
+    **strategy_params
+) -> Dict[str, Any]:
+    """
+    몬테카를로 평가 (전략 수익률 부트스트랩 리샘플링으로 성과 분포 추정)
+    
+    사용 예시:
+        mc = monte_carlo(data, 'macd', n_resamples=10000, block_size=50, seed=42)
+        mc['summary']
+    
+    Args:
+        data: OHLCV 데이터
+        strategy: 내장 전략 ('macd', 'rsi', 'sma_cross')
+        n_resamples: 리샘플 수 (기본값: 1000)
+        block_size: 블록 부트스트랩 길이 (1이면 iid)
+        memory_budget_mb: 리샘플 작업 메모리 예산 (MB, 리샘플 수와 무관하게 유지)
+        max_workers: 워커 프로세스 수 (기본값: CPU 코어 수)
+        seed: 난수 시드
+        fee_rate: 거래 수수료율
+        slippage: 슬리피지 비율
+        **strategy_params: 전략 파라미터
+    
+    Returns:
+        summary(분포 통계), samples(리샘플별 지표), original(원래 성과) 등이 포함된 딕셔너리
+    """
+    try:
+        try:
+            from services.evaluation import StrategyEvaluator
+        except Exception as e:
+            raise ImportError(f"평가 서비스를 사용할 수 없습니다: {str(e)}")
+        
+        _progress(f"📊 몬테카를로 평가 중... (strategy={strategy}, 리샘플 {n_resamples}회, 블록 {block_size})")
+        
+        evaluator = StrategyEvaluator(
+            max_workers=max_workers,
+            memory_budget_mb=memory_budget_mb,
+            fee_rate=fee_rate,
+            slippage=slippage
+        )
+        result = evaluator.monte_carlo(
+            data, strategy, n_resamples=n_resamples, block_size=block_size, seed=seed, **strategy_params
+        )
+        
+        summary = result['summary']
+        _progress(f"✅ 몬테카를로 평가 완료 (청크 {result['chunk_size']}행)")
+        _progress(f"   수익률 중앙값: {summary.loc['total_return', '50%'] * 100:.2f}%, "
+                  f"5%: {summary.loc['total_return', '5%'] * 100:.2f}%, "
+                  f"손실 확률: {summary.loc['total_return', 'prob_loss'] * 100:.1f}%")
+        return result
+        
+    except Exception as e:
+        print(f"❌ 몬테카를로 평가 실패: {str(e)}")
+        raise
+
 def load_binance_data(
     symbol: str,
     start_date: str,
     days: int,
-    interval: str = '1d'
+    interval: str = '1d',
+    extra_fields: bool = False
 ) -> pd.DataFrame:
     """
     바이낸스에서 데이터 수집
     
     사용 예시:
         data = load_binance_data('BTCUSDT', '2025-01-01', 30)
+        flow = load_binance_data('BTCUSDT', '2025-01-01', 7, '1m', extra_fields=True)  # 테이커 거래량 포함
     
     Args:
         symbol: 거래 쌍 (예: 'BTCUSDT', 'ETHUSDT')
         start_date: 시작 날짜 ('YYYY-MM-DD' 형식)
         days: 수집할 일수
         interval: 봉 간격 ('1m', '5m', '15m', '30m', '1h', '4h', '1d' 등)
+        extra_fields: quote_asset_volume, number_of_trades, taker_buy_base_asset_volume,
+                      taker_buy_quote_asset_volume 컬럼도 포함 (로컬 롤업 대신 API에서 수집)
     
     Returns:
         OHLCV 데이터가 포함된 pandas DataFrame
     """
     try:
-        if _data_service is None:
-            raise ImportError("데이터 수집 서비스를 사용할 수 없습니다.")
-        df = _data_service.collect_binance_data(
+        # 요청 구간을 포함하는 더 작은 간격의 로컬 원본이 있으면 API 대신 로컬 롤업 사용
+        resampling = _get_resampling_service()
+        base_file = None if extra_fields else resampling.find_base_file(symbol, interval, start_date, days)
+        from services.metrics import cache_result
+        cache_result('local_ohlcv', base_file is not None)
+        if base_file is not None:
+            _progress(f"📦 로컬 데이터 롤업 사용: {base_file.name} → {interval}")
+            start = pd.Timestamp(start_date)
+            rollup = resampling.rollup(str(base_file), interval)
+            return rollup[(rollup.index >= start) & (rollup.index < start + pd.Timedelta(days=days))].copy()
+
+        df = _get_data_service().collect_binance_data(
             symbol=symbol,
             start_date=start_date,
             days=days,
             interval=interval,
-            save_file=True
+            save_file=True,
+            extra_fields=extra_fields
         )
         # DataFrame이 반환될 때는 출력하지 않음 (중복 탭 방지)
         return df
     except Exception as e:
         raise
 
+def _server_url() -> str:
+    """셀 실행 프로세스에서 접근할 Juppelin 서버 주소"""
+    host = os.getenv('FLASK_HOST', 'localhost')
+    if host == '0.0.0.0':
+        host = 'localhost'
+    return os.getenv('JUPPELIN_SERVER_URL', f"http://{host}:{os.getenv('FLASK_PORT', 8888)}")
+
+def subscribe_stream(symbol: str, interval: str = '1m', trades: bool = False) -> None:
+    """
+    실시간 시세 스트림 구독 (서버가 수신한 갱신은 차트 패널의 심볼별 차트에 이어서 표시)
+
+    사용 예시:
+        subscribe_stream('BTCUSDT', '1m')
+
+    Args:
+        symbol: 거래 쌍
+        interval: 봉 간격
+        trades: 체결 스트림도 구독할지 여부
+    """
+    try:
+        import requests
+
+        response = requests.post(
+            f"{_server_url()}/api/stream/subscribe",
+            json={'symbol': symbol, 'interval': interval, 'trades': trades},
+            timeout=10
+        )
+        result = response.json()
+        if result.get('status') != 'success':
+            raise RuntimeError(result.get('error_message', '스트림 구독 실패'))
+
+        _progress(f"📡 스트림 구독: {', '.join(result['streams'])}")
+
+    except Exception as e:
+        print(f"❌ 스트림 구독 실패: {str(e)}")
+        raise
+
+def load_stream_data(
+    symbol: str,
+    interval: str = '1m',
+    limit: Optional[int] = None,
+    include_current: bool = False
+) -> pd.DataFrame:
+    """
+    실시간 스트림 버퍼의 최근 캔들 로드 (REST 재요청 없이 서버 메모리에서 조회)
+
+    사용 예시:
+        subscribe_stream('BTCUSDT', '1m')
+        live = load_stream_data('BTCUSDT', '1m', limit=200)
+
+    Args:
+        symbol: 거래 쌍
+        interval: 봉 간격
+        limit: 최근 N개만 조회
+        include_current: 마감되지 않은 현재 캔들 포함 여부
+
+    Returns:
+        load_binance_data와 같은 형식의 OHLCV DataFrame
+    """
+    try:
+        import requests
+
+        params = {'symbol': symbol, 'interval': interval, 'include_current': str(include_current).lower()}
+        if limit:
+            params['limit'] = limit
+        response = requests.get(f"{_server_url()}/api/stream/candles", params=params, timeout=10)
+        result = response.json()
+        if 'candles' not in result:
+            raise RuntimeError(result.get('error_message', '스트림 데이터 조회 실패'))
+
+        df = pd.DataFrame(result['candles'])
+        if not df.empty:
+            df['timestamp'] = pd.to_datetime(df['timestamp']).dt.tz_localize(None)
+            df.set_index('timestamp', inplace=True)
+        return df
+
+    except Exception as e:
+        print(f"❌ 스트림 데이터 조회 실패: {str(e)}")
+        raise
+
+def build_bars(
+    trades: Union[pd.DataFrame, str],
+    bar_type: str = 'volume',
+    threshold: float = 100.0,
+    chunksize: int = 1_000_000,
+    include_partial: bool = False,
+    kind: str = 'aggTrades'
+) -> pd.DataFrame:
+    """
+    체결 데이터로 틱/거래량/거래대금/렌코 바 생성 (대용량 파일은 청크 단위로 일정한 메모리에서 처리)
+
+    사용 예시:
+        bars = build_bars('BTCUSDT-aggTrades-2024-01.zip', 'dollar', 1_000_000)
+        bars = build_bars(trades_df, 'renko', threshold=50)
+        plot_candlestick(bars)
+        calculate_rsi(bars)
+
+    Args:
+        trades: 체결 DataFrame(price, quantity, 시각) 또는 바이낸스 체결 아카이브 파일 경로
+                (파일이 없으면 local_data/raw_data 아래에서 찾음)
+        bar_type: 'tick', 'volume', 'dollar', 'renko'
+        threshold: 바 기준값 (체결 수, 거래량, 거래대금 또는 렌코 벽돌 크기)
+        chunksize: 청크당 체결 수
+        include_partial: 마지막 미완성 바 포함 여부
+        kind: 파일 입력 시 아카이브 종류 ('aggTrades' 또는 'trades')
+
+    Returns:
+        OHLCV + dollar_volume/trades/close_time 컬럼의 바 DataFrame
+    """
+    try:
+        try:
+            from services.bar_aggregation import build_bars as _build_bars
+        except Exception as e:
+            raise ImportError(f"바 집계 서비스를 사용할 수 없습니다: {str(e)}")
+
+        if isinstance(trades, str) and not os.path.exists(trades):
+            candidate = os.path.join('local_data', 'raw_data', trades)
+            if os.path.exists(candidate):
+                trades = candidate
+
+        _progress(f"🧱 {bar_type} 바 생성 중... (threshold={threshold:,})")
+        bars = _build_bars(trades, bar_type, threshold, chunksize, include_partial, kind)
+        _progress(f"✅ {len(bars):,}개 바 생성 완료")
+        return bars
+
+    except Exception as e:
+        print(f"❌ 바 생성 실패: {str(e)}")
+        raise
+
+def import_binance_archives(
+    source: str,
+    symbol: Optional[str] = None,
+    interval: Optional[str] = None,
+    max_workers: Optional[int] = None
+) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    바이낸스 공개 데이터 아카이브(kline zip CSV)를 로컬 저장소로 일괄 임포트
+
+    사용 예시:
+        data = import_binance_archives('downloads/klines', 'BTCUSDT', '1m')
+        all_series = import_binance_archives('downloads/klines')
+
+    Args:
+        source: 아카이브 디렉토리 또는 zip 파일 경로 (예: BTCUSDT-1m-2024-01.zip)
+        symbol: 특정 심볼만 임포트
+        interval: 특정 간격만 임포트
+        max_workers: 디코딩 프로세스 수 (기본값: CPU 코어 수)
+
+    Returns:
+        symbol과 interval을 모두 지정하면 해당 OHLCV DataFrame,
+        아니면 '{심볼}_{간격}' → DataFrame 딕셔너리
+    """
+    try:
+        try:
+            from services.archive_import import ArchiveImporter
+        except Exception as e:
+            raise ImportError(f"아카이브 임포트 서비스를 사용할 수 없습니다: {str(e)}")
+
+        _progress(f"📦 아카이브 임포트 중: {source}")
+        results = ArchiveImporter(max_workers, data_service=_get_data_service()).import_archives(
+            source, symbol=symbol, interval=interval
+        )
+
+        for name, result in results.items():
+            continuity = result['continuity']
+            _progress(f"✅ {name}: {continuity['rows']:,}행 (아카이브 {result['archives']}개) → {result['file_path']}")
+            if continuity['gaps']:
+                print(f"⚠️ {name}: 누락 구간 {len(continuity['gaps'])}개, {continuity['missing_rows']:,}개 봉 누락")
+                for gap in continuity['gaps'][:5]:
+                    print(f"   {gap['after']} ~ {gap['before']} ({gap['missing']}개)")
+            if result['checksum_failures']:
+                print(f"⚠️ {name}: 체크섬 불일치로 제외 - {', '.join(result['checksum_failures'])}")
+
+        frames = {name: result['data'] for name, result in results.items()}
+        if symbol and interval and len(frames) == 1:
+            return next(iter(frames.values()))
+        return frames
+
+    except Exception as e:
+        print(f"❌ 아카이브 임포트 실패: {str(e)}")
+        raise
+
+def resample_ohlcv(
+    data: Union[pd.DataFrame, str],
+    interval: str,
+    tz: Optional[str] = None,
+    drop_incomplete: bool = False
+) -> pd.DataFrame:
+    """
+    OHLCV 데이터를 상위 봉 간격으로 변환 (open=first, high=max, low=min, close=last, volume=sum)
+
+    사용 예시:
+        hourly = resample_ohlcv(minute_data, '1h')
+        daily_kst = resample_ohlcv(minute_data, '1d', tz='Asia/Seoul')
+        weekly = resample_ohlcv('BTCUSDT_1m_2024-01-01_to_2024-03-31.csv', '1w')
+
+    Args:
+        data: OHLCV DataFrame 또는 로컬 파일명
+              (파일명이면 local_data/processed_data/rollups에 롤업을 저장하고 다음부터 새로 추가된 행만 처리)
+        interval: 목표 봉 간격 ('15m', '1h', '4h', '1d', '1w', '1M' 등)
+        tz: 봉 경계 시간대 (기본값: UTC, 바이낸스 캔들과 동일)
+        drop_incomplete: 마지막 미완성 봉 제외
+
+    Returns:
+        상위 봉 OHLCV DataFrame
+    """
+    try:
+        if isinstance(data, str):
+            _progress(f"📦 롤업 생성 중: {data} → {interval}")
+            result = _get_resampling_service().rollup(data, interval, tz, drop_incomplete=drop_incomplete)
+        else:
+            try:
+                from services.resampling import resample_ohlcv as _resample_ohlcv
+            except Exception as e:
+                raise ImportError(f"봉 간격 변환 서비스를 사용할 수 없습니다: {str(e)}")
+            result = _resample_ohlcv(data, interval, tz=tz, drop_incomplete=drop_incomplete)
+
+        _progress(f"✅ {interval} 봉 {len(result):,}개 생성")
+        return result
+
+    except Exception as e:
+        print(f"❌ 봉 간격 변환 실패: {str(e)}")
+        raise
+
 def load_local_data(filename: str) -> pd.DataFrame:
     """
     로컬에 저장된 데이터 로드
@@ -470,13 +1331,13 @@ def load_local_data(filename: str) -> pd.DataFrame:
         로드된 pandas DataFrame
     """
     try:
-        print(f"📁 로컬 파일을 로드하는 중: {filename}")
+        _progress(f"📁 로컬 파일을 로드하는 중: {filename}")
         
-        df = _data_service.load_local_data(filename)
+        df = _get_data_service().load_local_data(filename)
         
-        print(f"✅ 파일 로드 완료: {len(df)}행")
+        _progress(f"✅ 파일 로드 완료: {len(df)}행")
         if hasattr(df.index, 'min') and hasattr(df.index, 'max'):
-            print(f"📅 기간: {df.index.min()} ~ {df.index.max()}")
+            _progress(f"📅 기간: {df.index.min()} ~ {df.index.max()}")
         
         return df
         
@@ -484,31 +1345,80 @@ def load_local_data(filename: str) -> pd.DataFrame:
         print(f"❌ 파일 로드 실패: {str(e)}")
         raise
 
+def scan_local_data(
+    source: Union[str, List[str]],
+    columns: Optional[List[str]] = None,
+    chunk_rows: Optional[int] = None
+):
+    """
+    메모리에 다 올릴 수 없는 로컬 데이터를 청크 단위로 처리하는 지연 실행 데이터셋 반환
+
+    필터/컬럼 선택/봉 간격 변환/지표를 이어 붙인 뒤 collect(), last(), head()를 호출할 때
+    파일을 나누어 읽으며 계산하고 최종 결과만 DataFrame으로 만듭니다.
+
+    사용 예시:
+        scan = scan_local_data('binance/*_1m_*.csv', columns=['open', 'high', 'low', 'close', 'volume'])
+        hourly = scan.resample('1h').indicator('rsi', period=14).between('2024-01-01').collect()
+        latest = scan.indicator('sma', period=200).indicator('atr').last(1)  # 심볼별 최신 값
+        print(scan.explain())
+
+    Args:
+        source: 파일명, glob 패턴 또는 파일명 목록 (같은 심볼/간격 파일은 이어서 하나의 시계열로 처리)
+        columns: 파일에서 읽을 컬럼 (인덱스 제외, 생략 시 전체)
+        chunk_rows: 한 번에 읽을 행 수 (기본값: 500,000)
+
+    Returns:
+        LazyDataset (between, where, select, resample, indicator로 계획 추가)
+    """
+    try:
+        try:
+            from services.lazy_dataset import LazyDataset, SCAN_CHUNK_ROWS
+        except Exception as e:
+            raise ImportError(f"지연 실행 데이터셋을 사용할 수 없습니다: {str(e)}")
+
+        service = _get_data_service()
+        patterns = [source] if isinstance(source, str) else list(source)
+        paths = [path for pattern in patterns for path in service.find_local_files(pattern)]
+
+        dataset = LazyDataset(paths, columns=columns, chunk_rows=chunk_rows or SCAN_CHUNK_ROWS)
+        _progress(f"🔎 스캔 준비: 파일 {len(paths)}개 ({sum(p.stat().st_size for p in paths) / 1024 ** 2:,.1f} MB)")
+        return dataset
+
+    except Exception as e:
+        print(f"❌ 스캔 준비 실패: {str(e)}")
+        raise
+
 def save_analysis_result(
     data: pd.DataFrame,
     filename: str,
-    format: str = 'csv'
+    format: str = 'csv',
+    purpose: str = 'auto',
+    append: bool = False
 ) -> str:
     """
     분석 결과 저장
     
     사용 예시:
         save_analysis_result(result_data, 'my_analysis', 'csv')
+        save_analysis_result(panel, 'indicator_panel', 'auto', purpose='reload')  # Feather (빠른 재로딩)
+        save_analysis_result(daily, 'signals', 'parquet', append=True)            # 기존 파일 뒤에 추가
     
     Args:
         data: 저장할 pandas DataFrame
         filename: 파일명 (확장자 제외)
-        format: 파일 형식 ('csv', 'xlsx', 'parquet')
+        format: 파일 형식 ('csv', 'xlsx', 'parquet', 'feather', 'hdf5', 'auto')
+        purpose: format='auto'일 때 용도 ('reload', 'archive', 'exchange', 'spreadsheet', 'auto'=작으면 CSV, 크면 Parquet)
+        append: 같은 이름의 파일이 있으면 뒤에 행 추가 (컬럼 구성이 같아야 함)
     
     Returns:
         저장된 파일 경로
     """
     try:
-        print(f"💾 분석 결과를 저장하는 중: {filename}.{format}")
+        _progress(f"💾 분석 결과를 저장하는 중: {filename} ({format}{', 추가' if append else ''})")
         
-        file_path = _data_service.save_analysis_result(data, filename, format)
+        file_path = _get_data_service().save_analysis_result(data, filename, format, purpose=purpose, append=append)
         
-        print(f"✅ 저장 완료: {file_path}")
+        _progress(f"✅ 저장 완료: {file_path}")
         return file_path
         
     except Exception as e:
@@ -529,7 +1439,7 @@ def list_files(directory: str = 'raw_data') -> None:
     try:
         print(f"📂 {directory} 폴더의 파일 목록:")
         
-        file_info = _data_service.list_local_files(directory)
+        file_info = _get_data_service().list_local_files(directory, limit=10)
         
         if file_info['total_files'] == 0:
             print("   📭 파일이 없습니다.")
@@ -569,11 +1479,7 @@ def get_file_info(filename: str) -> None:
     try:
         print(f"파일 정보: {filename}")
         
-        if _data_service is None:
-            print("데이터 서비스를 사용할 수 없습니다.")
-            return
-        
-        info = _data_service.get_file_info(filename)
+        info = _get_data_service().get_file_info(filename)
         
         print(f"   크기: {info['size_mb']}MB ({info['size']:,} bytes)")
         print(f"   생성일: {info['created'][:19]}")
@@ -590,6 +1496,107 @@ def get_file_info(filename: str) -> None:
         import traceback
         traceback.print_exc()
 
+def data_coverage(symbol: Optional[str] = None, interval: Optional[str] = None) -> pd.DataFrame:
+    """
+    로컬에 저장된 심볼/간격별 데이터 기간 조회 (파일 카탈로그 사용)
+
+    사용 예시:
+        data_coverage('BTCUSDT')
+        data_coverage(interval='1h')
+
+    Args:
+        symbol: 거래 쌍 (생략 시 전체)
+        interval: 봉 간격 (생략 시 전체)
+
+    Returns:
+        symbol, interval, start, end, files, bytes 컬럼의 DataFrame (끊긴 기간은 별도 행)
+    """
+    try:
+        coverage = _get_data_service().catalog.coverage(symbol, interval)
+
+        rows = []
+        for series in coverage:
+            for start, end in series['ranges']:
+                rows.append({
+                    'symbol': series['symbol'],
+                    'interval': series['interval'],
+                    'start': start,
+                    'end': end,
+                    'files': series['files'],
+                    'bytes': series['bytes']
+                })
+
+        if not rows:
+            _progress("📭 조건에 맞는 로컬 데이터가 없습니다.")
+        for series in coverage:
+            ranges = ', '.join(f"{start} ~ {end}" for start, end in series['ranges'])
+            _progress(f"📦 {series['symbol']} {series['interval']}: {ranges} (파일 {series['files']}개)")
+
+        return pd.DataFrame(rows, columns=['symbol', 'interval', 'start', 'end', 'files', 'bytes'])
+
+    except Exception as e:
+        print(f"❌ 데이터 기간 조회 실패: {str(e)}")
+        raise
+
+def screen_market(
+    expression: Optional[str] = None,
+    interval: str = '1h',
+    rank_by: Optional[str] = None,
+    ascending: bool = False,
+    limit: Optional[int] = 20,
+    quote: Optional[str] = None,
+    symbols: Optional[List[str]] = None,
+    bars: int = 500,
+    refresh: bool = True
+) -> pd.DataFrame:
+    """
+    전체 TRADING 심볼에서 조건식을 만족하는 심볼을 순위대로 조회
+    
+    사용 예시:
+        screen_market("rsi14 < 30 and close > sma200 and quote_volume > 1e7", quote='USDT')
+        screen_market("roc24 > 5", interval='1h', rank_by='roc24', limit=10)
+        screen_market(rank_by='rsi14', ascending=True, refresh=False)   # 저장된 스냅샷만 사용
+    
+    Args:
+        expression: 조건식 (OHLCV, sma/ema/rsi/atr/roc/vol_sma/highest/lowest<n>, 24시간 통계 이름 사용)
+        interval: 봉 간격
+        rank_by: 순위 기준 식 (생략 시 24시간 거래대금)
+        ascending: 오름차순 순위 여부
+        limit: 반환할 최대 심볼 수 (None이면 전체)
+        quote: 견적 자산 필터 (예: 'USDT')
+        symbols: 대상 심볼 직접 지정 (생략 시 TRADING 전체)
+        bars: 심볼별 보관/계산 봉 수
+        refresh: 마지막 마감 봉까지 증분 갱신할지
+    
+    Returns:
+        symbol 인덱스, score, 식에 쓰인 필드, bar_time 컬럼의 DataFrame (순위순)
+    """
+    try:
+        try:
+            from services.screener import MarketScreener
+        except Exception as e:
+            raise ImportError(f"스크리너 서비스를 사용할 수 없습니다: {str(e)}")
+        
+        screener = MarketScreener(_get_data_service())
+        
+        def report(ranked, done, total):
+            _progress(f"🔎 {done}/{total}개 심볼 처리, 조건 충족 {len(ranked)}개")
+        
+        _progress(f"🔎 스크리너 실행 중... ({interval}, {expression or '조건 없음'})")
+        result = screener.scan(
+            expression, interval, rank_by=rank_by, ascending=ascending, limit=limit,
+            quote=quote, symbols=symbols, bars=bars, refresh=refresh, on_batch=report
+        )
+        
+        _progress(f"✅ 스크리너 결과 {len(result)}개")
+        for symbol, score in result['score'].head(10).items():
+            _progress(f"   {symbol}: {score:,.4g}")
+        return result
+        
+    except Exception as e:
+        print(f"❌ 스크리너 실행 실패: {str(e)}")
+        raise
+
 def show_help():
     """간단한 도움말"""
     print("Juppelin Help")
@@ -613,22 +1620,46 @@ __all__ = [
     
     # 데이터 관리
     'load_binance_data',
-    'load_local_data', 
+    'subscribe_stream',
+    'load_stream_data',
+    'build_bars',
+    'import_binance_archives',
+    'resample_ohlcv',
+    'load_local_data',
+    'scan_local_data',
     'save_analysis_result',
     'list_files',
     'get_file_info',
+    'data_coverage',
+    'screen_market',
     
     # 기술 지표
     'calculate_macd',
     'calculate_rsi',
     'calculate_bollinger_bands',
     'calculate_sma',
+    'calculate_correlation',
+    'top_correlations',
     
     # 시각화
     'plot_candlestick',
     'plot_line',
     'plot_technical_analysis',
     'plot_correlation_heatmap',
+    'open_chart',
+    'update_chart',
+    
+    # 백테스트
+    'backtest',
+    'optimize',
+    'walk_forward',
+    'monte_carlo',
+    
+    # 성능
+    'set_performance_mode',
+    'performance_mode',
+    'set_compute_backend',
+    'compute_backend',
     
     # 도움말
     'show_help',